@@ -77,6 +77,7 @@ COMMANDS = {
         False,
     ),
     "work-delete": ("solokit.work_items.delete", None, "main", True),
+    "spec-validate": ("solokit.work_items.spec_batch", None, "main", True),
     # Dependency Graph (uses argparse in main)
     "work-graph": ("solokit.visualization.dependency_graph", None, "main", True),
     # Session Management (standalone main functions)
@@ -96,6 +97,7 @@ COMMANDS = {
     "version": ("solokit.commands.version", None, "main", False),
     "doctor": ("solokit.commands.doctor", None, "main", True),
     "config": ("solokit.commands.config", None, "main", True),
+    "perf": ("solokit.commands.perf", None, "main", True),
 }
 
 
@@ -258,7 +260,7 @@ def route_command(command_name: str, args: list[str]) -> int:
                 elif command_name == "learn-curate":
                     sys.argv = ["learning_curator.py", "curate"] + args
             else:
-                # Other argparse commands (work-graph, start, end, validate)
+                # Other argparse commands (work-graph, start, end, validate, spec-validate)
                 sys.argv = [command_name] + args
 
             func = getattr(module, function_name)
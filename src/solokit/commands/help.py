@@ -24,6 +24,7 @@ COMMAND_CATEGORIES: dict[str, dict[str, str]] = {
         "work-delete": "Delete a work item from the system",
         "work-next": "Get the next recommended work item to start",
         "work-graph": "Generate dependency graph visualization",
+        "spec-validate": "Validate work item specs (one, several, or all in parallel)",
     },
     "Session Management": {
         "start": "Start a new development session with comprehensive briefing",
@@ -45,6 +46,7 @@ COMMAND_CATEGORIES: dict[str, dict[str, str]] = {
         "version": "Show version information",
         "doctor": "Run comprehensive system diagnostics",
         "config": "Display and manage configuration",
+        "perf": "Show quality gate timing history",
     },
 }
 
@@ -124,6 +126,22 @@ COMMAND_DETAILS: dict[str, dict[str, Any]] = {
             "sk work-delete feat_001",
         ],
     },
+    "spec-validate": {
+        "description": "Validate work item specification files. With --all, loads work items once and validates every spec in .session/specs/ across worker processes.",
+        "usage": "sk spec-validate [WORK_ITEM_ID ...] [--all] [--changed] [--jobs N] [--json]",
+        "options": [
+            ("--all", "Validate every spec in .session/specs/"),
+            ("--changed", "Only validate specs with uncommitted changes"),
+            ("--jobs N", "Number of worker processes (default: CPU count)"),
+            ("--json", "Stream results as JSON lines followed by a summary"),
+            ("--errors-only", "Only show specs that failed validation"),
+        ],
+        "examples": [
+            "sk spec-validate feat_001",
+            "sk spec-validate --all",
+            "sk spec-validate --all --changed --jobs 8 --json",
+        ],
+    },
     "work-next": {
         "description": "Get the next recommended work item to start based on dependencies and priority.",
         "usage": "sk work-next",
@@ -163,10 +181,24 @@ COMMAND_DETAILS: dict[str, dict[str, Any]] = {
     },
     "end": {
         "description": "Complete the current development session, running quality gates, capturing learnings, and generating a session summary.",
-        "usage": "sk end",
-        "options": [],
+        "usage": "sk end [--incremental | --full] [--fail-fast | --no-fail-fast] [--no-gate-cache]",
+        "options": [
+            (
+                "--incremental",
+                "Lint, format and scan only files changed this session; run only impacted tests",
+            ),
+            ("--full", "Lint, format, scan and test the whole project"),
+            (
+                "--fail-fast",
+                "Run the cheapest gates first and cancel the rest once a required gate fails",
+            ),
+            ("--no-fail-fast", "Run every gate even after a required gate fails"),
+            ("--no-gate-cache", "Re-run every quality gate instead of reusing cached results"),
+        ],
         "examples": [
             "sk end",
+            "sk end --incremental",
+            "sk end --fail-fast",
         ],
     },
     "status": {
@@ -179,10 +211,16 @@ COMMAND_DETAILS: dict[str, dict[str, Any]] = {
     },
     "validate": {
         "description": "Validate that the current session meets quality standards without ending the session.",
-        "usage": "sk validate",
-        "options": [],
+        "usage": "sk validate [--fix] [--incremental | --full] [--no-gate-cache]",
+        "options": [
+            ("--fix", "Automatically fix linting and formatting issues"),
+            ("--incremental", "Lint and format only changed files; run only impacted tests"),
+            ("--full", "Lint, format and test the whole project"),
+            ("--no-gate-cache", "Re-run every quality gate instead of reusing cached results"),
+        ],
         "examples": [
             "sk validate",
+            "sk validate --fix --incremental",
         ],
     },
     "learn": {
@@ -265,6 +303,19 @@ COMMAND_DETAILS: dict[str, dict[str, Any]] = {
             "sk config show --json",
         ],
     },
+    "perf": {
+        "description": "Show quality gate timings (p50/p95) recorded by 'sk end' over recent sessions.",
+        "usage": "sk perf gates [--sessions N] [--json]",
+        "options": [
+            ("--sessions", "Number of recent sessions to include (default: 10)"),
+            ("--json", "Output timing statistics as JSON"),
+        ],
+        "examples": [
+            "sk perf gates",
+            "sk perf gates --sessions 5",
+            "sk perf gates --json",
+        ],
+    },
 }
 
 
@@ -0,0 +1,106 @@
+"""
+Perf command for Solokit CLI.
+
+Shows quality gate timing history recorded by 'sk end'.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from solokit.core.output import get_output
+from solokit.quality.gate_timings import (
+    DEFAULT_HISTORY_SESSIONS,
+    get_gate_timings_file,
+    load_gate_timings,
+    summarize_gate_timings,
+)
+
+output = get_output()
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Format a duration for the timing table.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Duration such as "850ms", "12.3s" or "2m05s"
+    """
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, rest = divmod(round(seconds), 60)
+    return f"{minutes}m{rest:02d}s"
+
+
+def show_gate_timings(sessions: int = DEFAULT_HISTORY_SESSIONS, as_json: bool = False) -> int:
+    """
+    Display per-gate timing statistics over recent sessions.
+
+    Args:
+        sessions: Number of most recent sessions to include
+        as_json: Whether to output as JSON (vs a table)
+
+    Returns:
+        Exit code (0 for success, 1 if no history is recorded)
+    """
+    project_root = Path.cwd()
+    stats = summarize_gate_timings(load_gate_timings(project_root), sessions)
+
+    if as_json:
+        output.info(json.dumps([asdict(stat) for stat in stats], indent=2))
+        return 0 if stats else 1
+
+    if not stats:
+        output.info("No gate timings recorded yet")
+        output.info(f"Timings are recorded in {get_gate_timings_file(project_root)} by 'sk end'")
+        return 1
+
+    output.info(f"Quality gate timings (last {sessions} sessions, cached runs excluded)")
+    output.info("")
+    width = max(len("Gate"), *(len(stat.gate) for stat in stats))
+    output.info(f"{'Gate':<{width}}  {'Runs':>4}  {'p50':>8}  {'p95':>8}  {'Last':>8}")
+    for stat in stats:
+        output.info(
+            f"{stat.gate:<{width}}  {stat.runs:>4}  {format_seconds(stat.p50):>8}  "
+            f"{format_seconds(stat.p95):>8}  {format_seconds(stat.last):>8}"
+        )
+    return 0
+
+
+def main() -> int:
+    """Main entry point for perf command."""
+    parser = argparse.ArgumentParser(description="Show performance history")
+    parser.add_argument(
+        "subcommand",
+        nargs="?",
+        default="gates",
+        help="Subcommand (currently only 'gates' is supported)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=DEFAULT_HISTORY_SESSIONS,
+        help=f"Number of recent sessions to include (default: {DEFAULT_HISTORY_SESSIONS})",
+    )
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.subcommand != "gates":
+        output.error(f"Unknown subcommand: {args.subcommand}")
+        output.error("Currently only 'sk perf gates' is supported")
+        return 1
+
+    return show_gate_timings(sessions=args.sessions, as_json=args.json)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,24 +2,50 @@
 
 This module provides a unified interface for running subprocess commands
 with standardized timeout handling, error handling, logging, and retry logic.
+
+Long-running commands can be run in streaming mode, which reads output as it is
+produced, keeps only a bounded head and tail in memory, optionally echoes lines
+live and writes the full output to a log file.
+
+Batches of independent commands can be run concurrently with run_many, which
+uses asyncio subprocesses and keeps the timeout, retry and error semantics of run.
 """
 
 import json
 import logging
 import subprocess
+import sys
+import threading
 import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import IO, Any, Optional, Union
 
 from solokit.core.error_handlers import log_errors
 from solokit.core.exceptions import (
     CommandExecutionError,
     TimeoutError,
 )
+from solokit.core.file_ops import ensure_session_directory
 
 logger = logging.getLogger(__name__)
 
+# Output kept in memory per stream in streaming mode
+DEFAULT_STREAM_HEAD_CHARS = 64 * 1024
+DEFAULT_STREAM_TAIL_CHARS = 256 * 1024
+
+# Longest piece of a single line read at once (guards against huge unbroken lines)
+STREAM_READ_CHARS = 64 * 1024
+
+# Time allowed for output readers to drain after the process exits or is killed
+STREAM_DRAIN_TIMEOUT = 5.0
+
+# Commands run at once by run_many unless told otherwise
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 @dataclass
 class CommandResult:
@@ -31,6 +57,8 @@ class CommandResult:
     command: list[str]
     duration_seconds: float
     timed_out: bool = False
+    truncated: bool = False
+    log_file: Optional[Path] = None
 
     @property
     def success(self) -> bool:
@@ -43,6 +71,176 @@ class CommandResult:
         return self.stdout.strip() if self.stdout else self.stderr.strip()
 
 
+@dataclass
+class StreamOptions:
+    """Settings for running a command in streaming mode.
+
+    Attributes:
+        head_chars: Characters kept from the start of each output stream
+        tail_chars: Characters kept from the end of each output stream
+        tee: Echo output lines to the console as they arrive (None: only when
+            debug logging is enabled, i.e. --verbose)
+        log_file: Write the complete output to this file (stdout and stderr
+            interleaved in arrival order)
+        label: Prefix for echoed lines, to tell concurrent commands apart
+    """
+
+    head_chars: int = DEFAULT_STREAM_HEAD_CHARS
+    tail_chars: int = DEFAULT_STREAM_TAIL_CHARS
+    tee: Optional[bool] = None
+    log_file: Optional[Path] = None
+    label: Optional[str] = None
+
+
+class BoundedOutput:
+    """Keeps the first and last characters of a stream, dropping the middle."""
+
+    def __init__(self, head_chars: int, tail_chars: int):
+        """Initialize bounded output buffer.
+
+        Args:
+            head_chars: Characters kept from the start of the stream
+            tail_chars: Characters kept from the end of the stream (ring buffer)
+        """
+        self.head_chars = max(0, head_chars)
+        self.tail_chars = max(0, tail_chars)
+        self.omitted_chars = 0
+        self._head: list[str] = []
+        self._head_size = 0
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any output was dropped."""
+        return self.omitted_chars > 0
+
+    def append(self, text: str) -> None:
+        """Add a chunk of output."""
+        room = self.head_chars - self._head_size
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_size += min(room, len(text))
+            text = text[room:]
+        if not text:
+            return
+
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail_size > self.tail_chars:
+            excess = self._tail_size - self.tail_chars
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                dropped = len(first)
+            else:
+                self._tail[0] = first[excess:]
+                dropped = excess
+            self._tail_size -= dropped
+            self.omitted_chars += dropped
+
+    def getvalue(self) -> str:
+        """Get the retained output, with a marker where output was dropped."""
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if not self.truncated:
+            return head + tail
+        return f"{head}\n... [{self.omitted_chars} characters omitted] ...\n{tail}"
+
+
+class _StreamingProcess:
+    """Runs one command in streaming mode."""
+
+    def __init__(self, options: StreamOptions):
+        self.options = options
+        self.stdout = BoundedOutput(options.head_chars, options.tail_chars)
+        self.stderr = BoundedOutput(options.head_chars, options.tail_chars)
+        self.tee = options.tee if options.tee is not None else logger.isEnabledFor(logging.DEBUG)
+        self._write_lock = threading.Lock()
+        self._log: Optional[IO[str]] = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.stdout.truncated or self.stderr.truncated
+
+    def run(
+        self,
+        command: list[str],
+        timeout: float,
+        cwd: Optional[Path],
+        env: Optional[dict],
+    ) -> "subprocess.CompletedProcess[str]":
+        """Run the command, raising subprocess.TimeoutExpired like subprocess.run."""
+        if self.options.log_file is not None:
+            ensure_session_directory(self.options.log_file.parent)
+            self._log = open(self.options.log_file, "w", encoding="utf-8")
+
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=cwd,
+                env=env,
+            )
+            readers = [
+                threading.Thread(
+                    target=self._pump,
+                    args=(process.stdout, self.stdout, sys.stdout),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._pump,
+                    args=(process.stderr, self.stderr, sys.stderr),
+                    daemon=True,
+                ),
+            ]
+            for reader in readers:
+                reader.start()
+
+            try:
+                returncode = process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                self._join(readers)
+                raise subprocess.TimeoutExpired(
+                    command, timeout, output=self.stdout.getvalue(), stderr=self.stderr.getvalue()
+                ) from None
+
+            self._join(readers)
+            return subprocess.CompletedProcess(
+                command, returncode, self.stdout.getvalue(), self.stderr.getvalue()
+            )
+        finally:
+            if self._log is not None:
+                self._log.close()
+
+    def _join(self, readers: list[threading.Thread]) -> None:
+        # Grandchildren that inherited the pipes can keep them open; don't wait forever
+        for reader in readers:
+            reader.join(STREAM_DRAIN_TIMEOUT)
+
+    def _pump(self, pipe: Optional[IO[str]], buffer: BoundedOutput, console: IO[str]) -> None:
+        if pipe is None:
+            return
+        prefix = f"[{self.options.label}] " if self.options.label else ""
+        with pipe:
+            for chunk in iter(lambda: pipe.readline(STREAM_READ_CHARS), ""):
+                buffer.append(chunk)
+                if not self.tee and self._log is None:
+                    continue
+                with self._write_lock:
+                    if self.tee:
+                        console.write(prefix + chunk)
+                        console.flush()
+                    if self._log is not None:
+                        self._log.write(chunk)
+
+
 class CommandRunner:
     """Centralized command execution with consistent error handling."""
 
@@ -75,6 +273,7 @@ class CommandRunner:
         retry_count: int = 0,
         retry_delay: float = 1.0,
         env: Optional[dict] = None,
+        stream: Optional[StreamOptions] = None,
     ) -> CommandResult:
         """Run a command with consistent error handling.
 
@@ -86,6 +285,8 @@ class CommandRunner:
             retry_count: Number of retries on failure
             retry_delay: Delay between retries in seconds
             env: Environment variables
+            stream: Run in streaming mode with bounded output capture (for commands
+                that may produce large output, e.g. test suites)
 
         Returns:
             CommandResult with output and status
@@ -104,6 +305,7 @@ class CommandRunner:
         max_attempts = retry_count + 1
 
         while attempt < max_attempts:
+            streaming = _StreamingProcess(stream) if stream is not None else None
             try:
                 start_time = time.time()
 
@@ -112,15 +314,18 @@ class CommandRunner:
                     f"(timeout={timeout}s, cwd={cwd}, attempt={attempt + 1}/{max_attempts})"
                 )
 
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    check=False,  # We handle errors ourselves
-                    cwd=cwd,
-                    env=env,
-                )
+                if streaming is not None:
+                    result = streaming.run(command, timeout, cwd, env)
+                else:
+                    result = subprocess.run(
+                        command,
+                        capture_output=True,
+                        text=True,
+                        timeout=timeout,
+                        check=False,  # We handle errors ourselves
+                        cwd=cwd,
+                        env=env,
+                    )
 
                 duration = time.time() - start_time
 
@@ -131,6 +336,9 @@ class CommandRunner:
                     command=command,
                     duration_seconds=duration,
                 )
+                if streaming is not None:
+                    cmd_result.truncated = streaming.truncated
+                    cmd_result.log_file = streaming.options.log_file
 
                 if cmd_result.success:
                     logger.debug(f"Command succeeded in {duration:.2f}s")
@@ -175,6 +383,9 @@ class CommandRunner:
                     duration_seconds=duration,
                     timed_out=True,
                 )
+                if streaming is not None:
+                    cmd_result.truncated = streaming.truncated
+                    cmd_result.log_file = streaming.options.log_file
 
                 if check:
                     raise TimeoutError(
@@ -221,6 +432,229 @@ class CommandRunner:
         # Should never reach here
         raise RuntimeError("Retry logic error")
 
+    async def run_async(
+        self,
+        command: Union[str, list[str]],
+        timeout: Optional[float] = None,
+        check: Optional[bool] = None,
+        working_dir: Optional[Path] = None,
+        retry_count: int = 0,
+        retry_delay: float = 1.0,
+        env: Optional[dict] = None,
+    ) -> CommandResult:
+        """Run a command as an asyncio subprocess, with the same semantics as run().
+
+        Args:
+            command: Command to run (string or list)
+            timeout: Timeout in seconds (None = use default)
+            check: Raise exception on non-zero exit (None = use instance setting)
+            working_dir: Working directory (None = use instance setting)
+            retry_count: Number of retries on failure
+            retry_delay: Delay between retries in seconds
+            env: Environment variables
+
+        Returns:
+            CommandResult with output and status
+
+        Raises:
+            CommandExecutionError: If check=True and command fails
+            TimeoutError: If check=True and command times out
+        """
+        # Imported here: asyncio is slow to import and most commands never need it
+        import asyncio
+
+        if isinstance(command, str):
+            command = command.split()
+
+        timeout = timeout if timeout is not None else self.default_timeout
+        check = check if check is not None else self.raise_on_error
+        cwd = working_dir or self.working_dir
+        max_attempts = retry_count + 1
+
+        for attempt in range(max_attempts):
+            start_time = time.time()
+            logger.debug(
+                f"Running command: {' '.join(command)} "
+                f"(timeout={timeout}s, cwd={cwd}, attempt={attempt + 1}/{max_attempts})"
+            )
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    env=env,
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error running command: {e}")
+
+                if check:
+                    raise CommandExecutionError(
+                        command=" ".join(command),
+                        returncode=-1,
+                        stderr=str(e),
+                        stdout="",
+                    ) from e
+
+                # Don't retry on unexpected errors
+                return CommandResult(
+                    returncode=-1,
+                    stdout="",
+                    stderr=str(e),
+                    command=command,
+                    duration_seconds=time.time() - start_time,
+                )
+
+            communicate = asyncio.ensure_future(process.communicate())
+            try:
+                stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                    asyncio.shield(communicate), timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                # Collect whatever was written before the kill, like subprocess.run does
+                try:
+                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                        communicate, STREAM_DRAIN_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    stdout_bytes, stderr_bytes = b"", b""
+
+                logger.error(f"Command timed out after {timeout}s: {' '.join(command)}")
+
+                stdout_str = stdout_bytes.decode(errors="replace")
+                stderr_str = stderr_bytes.decode(errors="replace")
+                if check:
+                    raise TimeoutError(
+                        operation=" ".join(command),
+                        timeout_seconds=int(timeout),
+                        context={"stdout": stdout_str, "stderr": stderr_str},
+                    ) from None
+
+                if attempt < max_attempts - 1:
+                    logger.info(f"Retrying in {retry_delay}s...")
+                    await asyncio.sleep(retry_delay)
+                    continue
+
+                return CommandResult(
+                    returncode=-1,
+                    stdout=stdout_str,
+                    stderr=stderr_str,
+                    command=command,
+                    duration_seconds=time.time() - start_time,
+                    timed_out=True,
+                )
+
+            duration = time.time() - start_time
+            cmd_result = CommandResult(
+                returncode=process.returncode if process.returncode is not None else -1,
+                stdout=stdout_bytes.decode(errors="replace"),
+                stderr=stderr_bytes.decode(errors="replace"),
+                command=command,
+                duration_seconds=duration,
+            )
+
+            if cmd_result.success:
+                logger.debug(f"Command succeeded in {duration:.2f}s")
+                return cmd_result
+
+            logger.warning(
+                f"Command failed with exit code {cmd_result.returncode}: "
+                f"{' '.join(command)}\nstderr: {cmd_result.stderr[:200]}"
+            )
+
+            if check:
+                raise CommandExecutionError(
+                    command=" ".join(command),
+                    returncode=cmd_result.returncode,
+                    stderr=cmd_result.stderr,
+                    stdout=cmd_result.stdout,
+                )
+
+            if attempt < max_attempts - 1:
+                logger.info(f"Retrying in {retry_delay}s...")
+                await asyncio.sleep(retry_delay)
+                continue
+
+            return cmd_result
+
+        # Should never reach here
+        raise RuntimeError("Retry logic error")
+
+    async def run_many_async(
+        self,
+        commands: Sequence[Union[str, list[str]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
+    ) -> list[CommandResult]:
+        """Run independent commands concurrently.
+
+        Args:
+            commands: Commands to run
+            max_concurrency: Maximum number of commands running at once
+            **kwargs: Additional arguments passed to run_async() for every command
+
+        Returns:
+            Results in the same order as commands
+
+        Raises:
+            CommandExecutionError, TimeoutError: With check=True, the error of the
+                earliest failing command, raised after all commands finished
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(command: Union[str, list[str]]) -> CommandResult:
+            async with semaphore:
+                return await self.run_async(command, **kwargs)
+
+        outcomes = await asyncio.gather(
+            *(run_one(command) for command in commands), return_exceptions=True
+        )
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    def run_many(
+        self,
+        commands: Sequence[Union[str, list[str]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
+    ) -> list[CommandResult]:
+        """Run independent commands concurrently and wait for all of them.
+
+        Synchronous wrapper around run_many_async(); total latency is roughly that
+        of the slowest command rather than the sum.
+
+        Args:
+            commands: Commands to run
+            max_concurrency: Maximum number of commands running at once
+            **kwargs: Additional arguments passed to run_async() for every command
+                (timeout, check, working_dir, retry_count, retry_delay, env)
+
+        Returns:
+            Results in the same order as commands
+        """
+        import asyncio
+
+        if not commands:
+            return []
+
+        coroutine = self.run_many_async(commands, max_concurrency=max_concurrency, **kwargs)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Already inside an event loop (asyncio.run can't nest): use a private loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
     @log_errors()
     def run_json(self, command: Union[str, list[str]], **kwargs: Any) -> Optional[dict[str, Any]]:
         """Run command and parse JSON output.
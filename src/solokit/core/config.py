@@ -27,6 +27,9 @@ class ExecutionConfig:
     enabled: bool = True
     required: bool = True
     coverage_threshold: int = 80
+    impact_analysis: bool = False
+    full_run_every: int = 10
+    workers: int = 1
     commands: dict[str, str] = field(
         default_factory=lambda: {
             "python": "pytest --cov=src/solokit --cov-report=json",
@@ -43,6 +46,8 @@ class LintingConfig:
     enabled: bool = True
     required: bool = False
     auto_fix: bool = True
+    incremental: bool = False
+    daemon: bool = False
     commands: dict[str, str] = field(
         default_factory=lambda: {
             "python": "ruff check .",
@@ -59,6 +64,7 @@ class FormattingConfig:
     enabled: bool = True
     required: bool = False
     auto_fix: bool = True
+    incremental: bool = False
     commands: dict[str, str] = field(
         default_factory=lambda: {
             "python": "ruff format .",
@@ -75,6 +81,7 @@ class SecurityConfig:
     enabled: bool = True
     required: bool = True
     fail_on: str = "high"  # critical, high, medium, low
+    incremental: bool = False
 
 
 @dataclass
@@ -85,6 +92,7 @@ class DocumentationConfig:
     required: bool = False
     check_changelog: bool = True
     check_docstrings: bool = True
+    docstring_checker: str = "builtin"
     check_readme: bool = False
 
 
@@ -129,6 +137,15 @@ class DeploymentConfig:
     security_scans: dict[str, bool] = field(default_factory=lambda: {"enabled": True})
 
 
+@dataclass
+class SchedulerConfig:
+    """Quality gate scheduler configuration."""
+
+    max_parallel: int = 4
+    regression_threshold: float = 2.0
+    fail_fast: bool = False
+
+
 @dataclass
 class QualityGatesConfig:
     """Quality gates configuration."""
@@ -142,6 +159,7 @@ class QualityGatesConfig:
     context7: Context7Config = field(default_factory=Context7Config)
     integration: IntegrationConfig = field(default_factory=IntegrationConfig)
     deployment: DeploymentConfig = field(default_factory=DeploymentConfig)
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
 
 
 @dataclass
@@ -166,6 +184,19 @@ class CurationConfig:
     similarity_threshold: float = 0.7
 
 
+@dataclass
+class BriefingConfig:
+    """Session briefing configuration.
+
+    The budget caps the size of the briefing's context sections; max_tokens is
+    converted at roughly 4 bytes per token, and the smaller limit applies.
+    0 disables a limit.
+    """
+
+    max_bytes: int = 100_000
+    max_tokens: int = 0
+
+
 @dataclass
 class SolokitConfig:
     """Main Solokit configuration."""
@@ -173,6 +204,7 @@ class SolokitConfig:
     quality_gates: QualityGatesConfig = field(default_factory=QualityGatesConfig)
     git_workflow: GitWorkflowConfig = field(default_factory=GitWorkflowConfig)
     curation: CurationConfig = field(default_factory=CurationConfig)
+    briefing: BriefingConfig = field(default_factory=BriefingConfig)
 
 
 class ConfigManager:
@@ -262,6 +294,12 @@ class ConfigManager:
                 else {}
             )
 
+            briefing_data = data.get("briefing", {})
+            valid_briefing_fields = {"max_bytes", "max_tokens"}
+            filtered_briefing_data = {
+                k: v for k, v in briefing_data.items() if k in valid_briefing_fields
+            }
+
             # Create config with parsed data
             self._config = SolokitConfig(
                 quality_gates=quality_gates_data,
@@ -275,6 +313,7 @@ class ConfigManager:
                     if filtered_curation_data
                     else CurationConfig()
                 ),
+                briefing=BriefingConfig(**filtered_briefing_data),
             )
 
             logger.info("Loaded configuration from %s", config_path)
@@ -344,6 +383,7 @@ class ConfigManager:
             context7_data = filter_fields(data.get("context7", {}), Context7Config)
             integration_data = filter_fields(data.get("integration", {}), IntegrationConfig)
             deployment_data = filter_fields(data.get("deployment", {}), DeploymentConfig)
+            scheduler_data = filter_fields(data.get("scheduler", {}), SchedulerConfig)
 
             return QualityGatesConfig(
                 test_execution=(
@@ -373,6 +413,9 @@ class ConfigManager:
                 deployment=(
                     DeploymentConfig(**deployment_data) if deployment_data else DeploymentConfig()
                 ),
+                scheduler=(
+                    SchedulerConfig(**scheduler_data) if scheduler_data else SchedulerConfig()
+                ),
             )
         except TypeError as e:
             # Collect validation errors
@@ -412,6 +455,16 @@ class ConfigManager:
         assert self._config is not None, "Config not initialized"
         return self._config.curation
 
+    @property
+    def briefing(self) -> BriefingConfig:
+        """Get session briefing configuration.
+
+        Returns:
+            Session briefing configuration
+        """
+        assert self._config is not None, "Config not initialized"
+        return self._config.briefing
+
     def get_config(self) -> SolokitConfig:
         """Get full configuration.
 
@@ -22,6 +22,25 @@ CONFIG_DIR_NAME: Final[str] = "config"
 LEARNINGS_DIR_NAME: Final[str] = "learnings"
 BRIEFINGS_DIR_NAME: Final[str] = "briefings"
 STATUS_DIR_NAME: Final[str] = "status"
+CACHE_DIR_NAME: Final[str] = "cache"
+LOGS_DIR_NAME: Final[str] = "logs"
+DAEMONS_DIR_NAME: Final[str] = "daemons"
+HISTORY_DIR_NAME: Final[str] = "history"
+
+# Machine-local state directories; each gets a "*" .gitignore when created
+IGNORED_SESSION_DIR_NAMES: Final[tuple[str, ...]] = (
+    CACHE_DIR_NAME,
+    LOGS_DIR_NAME,
+    DAEMONS_DIR_NAME,
+)
+
+# Directories solokit writes to itself, never reported as uncommitted user changes
+SOLOKIT_SESSION_DIR_NAMES: Final[tuple[str, ...]] = (
+    TRACKING_DIR_NAME,
+    BRIEFINGS_DIR_NAME,
+    HISTORY_DIR_NAME,
+    *IGNORED_SESSION_DIR_NAMES,
+)
 
 # Tracking file names
 WORK_ITEMS_FILE: Final[str] = "work_items.json"
@@ -195,6 +214,9 @@ QUALITY_CHECK_LONG_TIMEOUT: Final[int] = 60
 # Very long quality checks (full formatting, security scans)
 QUALITY_CHECK_VERY_LONG_TIMEOUT: Final[int] = 120
 
+# Linter daemon health checks and shutdown
+LINT_DAEMON_TIMEOUT: Final[int] = 10
+
 # Test runner timeout (20 minutes for full test suites)
 TEST_RUNNER_TIMEOUT: Final[int] = 1200
 
@@ -276,6 +298,21 @@ def get_status_dir(project_root: Path) -> Path:
     return get_session_dir(project_root) / STATUS_DIR_NAME
 
 
+def get_cache_dir(project_root: Path) -> Path:
+    """Get the cache directory path for a project"""
+    return get_session_dir(project_root) / CACHE_DIR_NAME
+
+
+def get_logs_dir(project_root: Path) -> Path:
+    """Get the command logs directory path for a project"""
+    return get_session_dir(project_root) / LOGS_DIR_NAME
+
+
+def get_daemons_dir(project_root: Path) -> Path:
+    """Get the linter daemon state directory path for a project"""
+    return get_session_dir(project_root) / DAEMONS_DIR_NAME
+
+
 def get_work_items_file(project_root: Path) -> Path:
     """Get the work items file path"""
     return get_tracking_dir(project_root) / WORK_ITEMS_FILE
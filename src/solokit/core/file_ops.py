@@ -9,6 +9,7 @@ import shutil
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from solokit.core.constants import IGNORED_SESSION_DIR_NAMES, SESSION_DIR_NAME
 from solokit.core.exceptions import (
     ErrorCode,
     FileOperationError,
@@ -104,7 +105,7 @@ class JSONFileOperations:
     def save_json(
         file_path: Path,
         data: dict[str, Any],
-        indent: int = 2,
+        indent: Optional[int] = 2,
         atomic: bool = True,
         create_dirs: bool = True,
     ) -> None:
@@ -114,7 +115,7 @@ class JSONFileOperations:
         Args:
             file_path: Path to JSON file
             data: Data to save
-            indent: JSON indentation (default 2)
+            indent: JSON indentation (default 2, None for compact)
             atomic: Use atomic write via temp file (default True)
             create_dirs: Create parent directories if needed (default True)
 
@@ -230,6 +231,54 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def ensure_session_directory(path: Path) -> None:
+    """Ensure directory exists, keeping solokit's local state out of git
+
+    If ``path`` is or lies in .session/cache/, .session/logs/ or .session/daemons/,
+    that directory gets a ``*`` .gitignore, so projects whose .gitignore predates
+    it don't see caches, logs or daemon state as uncommitted changes.
+
+    Args:
+        path: Directory to create
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for directory in (path, *path.parents):
+        if (
+            directory.parent.name == SESSION_DIR_NAME
+            and directory.name in IGNORED_SESSION_DIR_NAMES
+        ):
+            gitignore = directory / ".gitignore"
+            if not gitignore.exists():
+                try:
+                    gitignore.write_text("*\n", encoding="utf-8")
+                except OSError as e:
+                    logger.debug(f"Failed to write {gitignore}: {e}")
+            return
+
+
+def save_cache_json(file_path: Path, data: dict[str, Any], indent: Optional[int] = None) -> bool:
+    """Atomically write a solokit cache or state file, best-effort
+
+    Caches can always be rebuilt, so a failed write is logged at debug level
+    and otherwise ignored; it only costs recomputing the data next time.
+
+    Args:
+        file_path: Path to JSON file (its directory is created via ensure_session_directory)
+        data: Data to save
+        indent: JSON indentation (default compact)
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        ensure_session_directory(file_path.parent)
+        JSONFileOperations.save_json(file_path, data, indent=indent, create_dirs=False)
+    except (OSError, FileOperationError) as e:
+        logger.debug(f"Failed to persist {file_path}: {e}")
+        return False
+    return True
+
+
 def backup_file(file_path: Path) -> Path:
     """Create backup of a file
 
@@ -1,6 +1,9 @@
 """User output handler separate from diagnostic logging."""
 
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 
 class OutputHandler:
@@ -14,6 +17,8 @@ class OutputHandler:
             quiet: Suppress all non-error output
         """
         self.quiet = quiet
+        # Per-thread buffer of captured messages (see capture())
+        self._local = threading.local()
 
     def info(self, message: str) -> None:
         """
@@ -23,7 +28,7 @@ class OutputHandler:
             message: Message to display
         """
         if not self.quiet:
-            print(message)
+            self._print(message)
 
     def success(self, message: str) -> None:
         """
@@ -33,7 +38,7 @@ class OutputHandler:
             message: Success message to display
         """
         if not self.quiet:
-            print(f"✅ {message}")
+            self._print(f"✅ {message}")
 
     def warning(self, message: str) -> None:
         """
@@ -43,7 +48,7 @@ class OutputHandler:
             message: Warning message to display
         """
         if not self.quiet:
-            print(f"⚠️  {message}")
+            self._print(f"⚠️  {message}")
 
     def error(self, message: str) -> None:
         """
@@ -62,7 +67,7 @@ class OutputHandler:
             message: Progress message to display
         """
         if not self.quiet:
-            print(f"⏳ {message}")
+            self._print(f"⏳ {message}")
 
     def section(self, title: str) -> None:
         """
@@ -72,7 +77,33 @@ class OutputHandler:
             title: Section title
         """
         if not self.quiet:
-            print(f"\n=== {title} ===\n")
+            self._print(f"\n=== {title} ===\n")
+
+    @contextmanager
+    def capture(self) -> Iterator[list[str]]:
+        """
+        Collect the current thread's non-error messages instead of printing them.
+
+        Lets work running on several threads report in a deterministic order
+        once it finishes. Errors are still printed immediately.
+
+        Yields:
+            List the captured messages are appended to
+        """
+        previous = getattr(self._local, "captured", None)
+        captured: list[str] = []
+        self._local.captured = captured
+        try:
+            yield captured
+        finally:
+            self._local.captured = previous
+
+    def _print(self, message: str) -> None:
+        captured = getattr(self._local, "captured", None)
+        if captured is not None:
+            captured.append(message)
+        else:
+            print(message)
 
 
 # Global output handler
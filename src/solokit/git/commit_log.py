@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Incremental recording of a work item's commits.
+
+Each work item's git info keeps the commits recorded for its branch and the
+SHA of the newest one (``last_recorded_commit``). Recording only asks git for
+commits made since then (``git rev-list <tip> ^<last> ^<parent>``) and checks
+them against a set of the recorded SHAs, so ``sk end`` stays cheap on
+long-lived branches with thousands of commits.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from solokit.core.exceptions import GitError
+from solokit.core.logging_config import get_logger
+from solokit.git.objects import GitObjectReader
+
+logger = get_logger(__name__)
+
+LAST_RECORDED_KEY = "last_recorded_commit"
+
+
+def _entry_sha(entry: Any) -> str:
+    """SHA of a recorded commit, stored as a SHA string or a dict with a "sha" key."""
+    if isinstance(entry, dict):
+        return str(entry.get("sha", ""))
+    return str(entry)
+
+
+class RecordedCommits:
+    """A work item's recorded commits with set-backed lookups by SHA."""
+
+    def __init__(self, git_info: dict[str, Any]):
+        """
+        Initialize recorded commits.
+
+        Args:
+            git_info: The work item's "git" dict; its "commits" list is updated in place
+        """
+        self.git_info = git_info
+        self.entries: list[Any] = git_info.setdefault("commits", [])
+        self._positions: dict[str, int] = {}
+        # Lengths of abbreviated SHAs recorded by older versions (``git log --format=%h``)
+        self._abbrev_lengths: set[int] = set()
+        for position, entry in enumerate(self.entries):
+            self._remember(_entry_sha(entry), position)
+
+    def _remember(self, sha: str, position: int) -> None:
+        """Index a recorded SHA by its position in the list."""
+        if not sha:
+            return
+        self._positions.setdefault(sha, position)
+        if len(sha) < 40:
+            self._abbrev_lengths.add(len(sha))
+
+    def _position(self, sha: str) -> int | None:
+        """Position of a commit in the list, matching abbreviated SHAs too."""
+        position = self._positions.get(sha)
+        if position is None:
+            for length in self._abbrev_lengths:
+                position = self._positions.get(sha[:length])
+                if position is not None:
+                    break
+        return position
+
+    def __contains__(self, sha: object) -> bool:
+        return isinstance(sha, str) and self._position(sha) is not None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: str | dict[str, Any]) -> bool:
+        """
+        Record a commit unless it's already recorded.
+
+        A dict entry replaces an already recorded bare SHA of the same commit,
+        so commits listed by ``complete_work_item`` gain their messages.
+
+        Args:
+            entry: Commit SHA, or a dict with "sha", "message" and "timestamp"
+
+        Returns:
+            True if the commit was new
+        """
+        sha = _entry_sha(entry)
+        position = self._position(sha)
+        if position is None:
+            self._remember(sha, len(self.entries))
+            self.entries.append(entry)
+            return True
+        if isinstance(entry, dict) and not isinstance(self.entries[position], dict):
+            self.entries[position] = entry
+            self._remember(sha, position)
+        return False
+
+    @property
+    def last_recorded(self) -> str | None:
+        """SHA of the newest commit recorded from the branch."""
+        return self.git_info.get(LAST_RECORDED_KEY)
+
+    def list_new(self, reader: GitObjectReader, branch_tip: str) -> list[str]:
+        """
+        List branch commits made since the last recorded one.
+
+        Falls back to the whole branch when nothing was recorded yet or the
+        last recorded commit no longer exists (e.g. garbage collected after a
+        rebase).
+
+        Args:
+            reader: Object reader of the repository
+            branch_tip: Branch name or SHA of its tip
+
+        Returns:
+            SHAs not on the parent branch, oldest first
+
+        Raises:
+            GitError: If the branch or its parent can't be listed
+        """
+        exclude = [f"^{self.git_info.get('parent_branch', 'main')}"]
+        last = self.last_recorded
+        if last:
+            try:
+                return reader.rev_list("--reverse", branch_tip, *exclude, f"^{last}")
+            except GitError as e:
+                logger.debug(f"Listing whole branch, last recorded commit {last} unusable: {e}")
+        return reader.rev_list("--reverse", branch_tip, *exclude)
+
+    def mark_recorded(self, shas: list[str]) -> None:
+        """Remember the newest of the listed SHAs as the last recorded commit."""
+        if shas:
+            self.git_info[LAST_RECORDED_KEY] = shas[-1]
@@ -37,6 +37,9 @@ from solokit.core.exceptions import (
     WorkingDirNotCleanError,
 )
 from solokit.core.types import GitStatus, WorkItemStatus, WorkItemType
+from solokit.git.commit_log import RecordedCommits
+from solokit.git.objects import get_object_reader
+from solokit.git.snapshot import get_git_snapshot, invalidate_git_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -67,21 +70,18 @@ class GitWorkflow:
             WorkingDirNotCleanError: If working directory has uncommitted changes
             CommandExecutionError: If git command times out or fails
         """
-        result = self.runner.run(["git", "status", "--porcelain"], timeout=GIT_QUICK_TIMEOUT)
+        snapshot = get_git_snapshot(self.project_root, self.runner)
 
-        if not result.success:
-            if result.timed_out:
-                raise CommandExecutionError("git status", -1, "Command timed out")
-            raise NotAGitRepoError("Not a git repository")
-
-        if result.stdout.strip():
-            changes = result.stdout.strip().split("\n")
-            raise WorkingDirNotCleanError(changes=changes)
+        if not snapshot.is_clean:
+            raise WorkingDirNotCleanError(changes=snapshot.status_lines)
 
     def get_current_branch(self) -> str | None:
-        """Get current git branch name."""
-        result = self.runner.run(["git", "branch", "--show-current"], timeout=GIT_QUICK_TIMEOUT)
-        return result.stdout.strip() if result.success else None
+        """Get current git branch name ("" when HEAD is detached, None outside a repo)."""
+        try:
+            snapshot = get_git_snapshot(self.project_root, self.runner)
+        except (NotAGitRepoError, CommandExecutionError):
+            return None
+        return snapshot.branch or ""
 
     @convert_subprocess_errors
     def create_branch(self, work_item_id: str, session_num: int) -> tuple[str, str | None]:
@@ -104,6 +104,7 @@ class GitWorkflow:
 
         # Create and checkout branch
         result = self.runner.run(["git", "checkout", "-b", branch_name], timeout=GIT_QUICK_TIMEOUT)
+        invalidate_git_snapshot(self.project_root)
 
         if not result.success:
             raise GitError(
@@ -124,6 +125,7 @@ class GitWorkflow:
             CommandExecutionError: If git command fails
         """
         result = self.runner.run(["git", "checkout", branch_name], timeout=GIT_QUICK_TIMEOUT)
+        invalidate_git_snapshot(self.project_root)
 
         if not result.success:
             raise GitError(
@@ -146,11 +148,13 @@ class GitWorkflow:
         """
         # Stage all changes
         stage_result = self.runner.run(["git", "add", "."], timeout=GIT_STANDARD_TIMEOUT)
+        invalidate_git_snapshot(self.project_root)
         if not stage_result.success:
             raise GitError(f"Staging failed: {stage_result.stderr}", ErrorCode.GIT_COMMAND_FAILED)
 
         # Commit
         result = self.runner.run(["git", "commit", "-m", message], timeout=GIT_STANDARD_TIMEOUT)
+        invalidate_git_snapshot(self.project_root)
 
         if not result.success:
             raise GitError(f"Commit failed: {result.stderr}", ErrorCode.GIT_COMMAND_FAILED)
@@ -285,7 +289,7 @@ class GitWorkflow:
         if "git" in work_item and "commits" in work_item["git"]:
             commits = work_item["git"]["commits"]
             if commits:
-                commit_messages = "\n".join([f"- {c}" for c in commits])
+                commit_messages = "\n".join(self._format_commit_lines(commits))
 
         return template.format(
             work_item_id=work_item_id,
@@ -296,6 +300,30 @@ class GitWorkflow:
             commit_messages=commit_messages if commit_messages else "See commits for details",
         )
 
+    def _format_commit_lines(self, commits: list) -> list[str]:
+        """Format recorded commits as "- <sha> <subject>" list items.
+
+        Commits recorded as bare SHAs get their subjects from the shared git
+        object reader; if git can't provide them only the SHA is listed.
+        """
+        subjects: dict[str, str] = {}
+        shas = [c for c in commits if isinstance(c, str)]
+        if shas:
+            try:
+                reader = get_object_reader(self.project_root, self.runner)
+                subjects = {sha: commit.subject for sha in shas if (commit := reader.commit(sha))}
+            except GitError as e:
+                logger.debug(f"Could not read commit subjects: {e}")
+
+        lines = []
+        for commit in commits:
+            if isinstance(commit, dict):
+                sha, subject = commit.get("sha", "")[:7], commit.get("message", "")
+            else:
+                sha, subject = commit, subjects.get(commit, "")
+            lines.append(f"- {sha} {subject}".rstrip())
+        return lines
+
     @convert_subprocess_errors
     def merge_to_parent(self, branch_name: str, parent_branch: str = "main") -> None:
         """Merge branch to parent branch and delete branch.
@@ -312,6 +340,7 @@ class GitWorkflow:
         checkout_result = self.runner.run(
             ["git", "checkout", parent_branch], timeout=GIT_QUICK_TIMEOUT
         )
+        invalidate_git_snapshot(self.project_root)
         if not checkout_result.success:
             raise GitError(
                 f"Failed to checkout {parent_branch}: {checkout_result.stderr}",
@@ -322,6 +351,7 @@ class GitWorkflow:
         result = self.runner.run(
             ["git", "merge", "--no-ff", branch_name], timeout=GIT_STANDARD_TIMEOUT
         )
+        invalidate_git_snapshot(self.project_root)
 
         if not result.success:
             raise GitError(f"Merge failed: {result.stderr}", ErrorCode.GIT_COMMAND_FAILED)
@@ -461,43 +491,33 @@ class GitWorkflow:
         workflow_mode = self.config.mode
 
         # Step 1: Commit changes (if there are any)
+        recorded = RecordedCommits(work_item["git"])
         try:
             commit_sha = self.commit_changes(commit_message)
             # Update work item commits with the new commit
-            if commit_sha not in work_item["git"]["commits"]:
-                work_item["git"]["commits"].append(commit_sha)
+            recorded.add(commit_sha)
         except GitError as e:
             # If commit fails because there's nothing to commit, extract existing commits
             if "nothing to commit" in str(e).lower():
-                # No new changes to commit - extract existing commits from git log
-                result = self.runner.run(
-                    [
-                        "git",
-                        "log",
-                        "--format=%h",
-                        branch_name,
-                        f"^{work_item['git'].get('parent_branch', 'main')}",
-                    ],
-                    timeout=GIT_STANDARD_TIMEOUT,
-                )
-
-                if result.success and result.stdout.strip():
-                    existing_commits = result.stdout.strip().split("\n")
-                    # Update commits array with any new commits not already tracked
-                    for commit in reversed(existing_commits):  # Oldest to newest
-                        if commit not in work_item["git"]["commits"]:
-                            work_item["git"]["commits"].append(commit)
-
-                    # If we found commits, treat this as success
-                    if existing_commits:
-                        commit_sha = f"Found {len(existing_commits)} existing commit(s)"
-                    else:
-                        return {"success": False, "message": "No commits found for this work item"}
-                else:
+                # No new changes to commit - list branch commits since the last recorded one
+                try:
+                    reader = get_object_reader(self.project_root, self.runner)
+                    new_commits = recorded.list_new(reader, branch_name)
+                except GitError:
                     return {
                         "success": False,
                         "message": f"Failed to retrieve commits: {str(e)}",
                     }
+
+                for sha in new_commits:
+                    recorded.add(sha)
+                recorded.mark_recorded(new_commits)
+
+                # If we found commits, treat this as success
+                if recorded:
+                    commit_sha = f"Found {len(recorded)} existing commit(s)"
+                else:
+                    return {"success": False, "message": "No commits found for this work item"}
             else:
                 return {"success": False, "message": f"Commit failed: {str(e)}"}
 
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Persistent git object access.
+
+Learning extraction, PR body formatting, commit recording and branch status
+checks read commits and refs one small git command at a time. The reader keeps
+one ``git cat-file --batch`` process per repository for the rest of the command
+and answers object reads (commit messages, parents, tree entries, ref
+resolution) over its pipes, so hundreds of reads cost a single process spawn.
+Commit lists come from one ``git rev-list`` call whose SHAs are then read in
+pipelined batches.
+
+Objects are immutable, so parsed commits are cached by SHA. Ref names are
+resolved by git on every request and always reflect the current repository.
+"""
+
+from __future__ import annotations
+
+import atexit
+import subprocess
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import GIT_QUICK_TIMEOUT, GIT_STANDARD_TIMEOUT
+from solokit.core.exceptions import ErrorCode, GitError
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_COMMAND = ["git", "cat-file", "--batch"]
+
+# Requests written before reading their responses; keeps the request bytes well
+# below the pipe buffer so neither side can block on a full pipe
+BATCH_CHUNK_SIZE = 128
+
+_readers: dict[Path, GitObjectReader] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    """A parsed commit object."""
+
+    sha: str
+    tree: str
+    parents: tuple[str, ...]
+    author: str  # "Name <email>"
+    author_date: datetime
+    message: str
+
+    @property
+    def subject(self) -> str:
+        """First line of the commit message."""
+        return self.message.split("\n", 1)[0]
+
+    @property
+    def timestamp(self) -> str:
+        """Author date as shown by ``git log --format=%ai``."""
+        return self.author_date.strftime("%Y-%m-%d %H:%M:%S %z")
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """One entry of a tree object."""
+
+    mode: str
+    type: str  # "blob", "tree" or "commit" (submodule)
+    sha: str
+    name: str
+
+
+def parse_commit(sha: str, content: bytes) -> CommitInfo:
+    """
+    Parse the raw contents of a commit object.
+
+    Args:
+        sha: SHA of the commit
+        content: Object contents as printed by ``git cat-file commit``
+
+    Returns:
+        The parsed commit
+    """
+    header, _, message = content.partition(b"\n\n")
+    tree = ""
+    parents: list[str] = []
+    author = ""
+    author_date = datetime.fromtimestamp(0, timezone.utc)
+
+    for line in header.decode("utf-8", errors="replace").split("\n"):
+        key, _, value = line.partition(" ")
+        if key == "tree":
+            tree = value
+        elif key == "parent":
+            parents.append(value)
+        elif key == "author":
+            author, author_date = _parse_ident(value)
+
+    return CommitInfo(
+        sha=sha,
+        tree=tree,
+        parents=tuple(parents),
+        author=author,
+        author_date=author_date,
+        message=message.decode("utf-8", errors="replace").rstrip("\n"),
+    )
+
+
+def _parse_ident(value: str) -> tuple[str, datetime]:
+    """Split an author line value into identity and date."""
+    ident, _, date = value.rpartition("> ")
+    seconds, _, offset = date.partition(" ")
+    try:
+        sign = -1 if offset.startswith("-") else 1
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tz = timezone(sign * timedelta(minutes=minutes))
+        return f"{ident}>", datetime.fromtimestamp(int(seconds), tz)
+    except ValueError:
+        return f"{ident}>", datetime.fromtimestamp(0, timezone.utc)
+
+
+def parse_tree(content: bytes, hash_size: int) -> list[TreeEntry]:
+    """
+    Parse the raw contents of a tree object.
+
+    Args:
+        content: Object contents as printed by ``git cat-file tree``
+        hash_size: Size of a binary object ID (20 for SHA-1, 32 for SHA-256)
+
+    Returns:
+        Entries in tree order
+    """
+    entries = []
+    pos = 0
+    while pos < len(content):
+        space = content.index(b" ", pos)
+        nul = content.index(b"\0", space)
+        mode = content[pos:space].decode()
+        name = content[space + 1 : nul].decode("utf-8", errors="replace")
+        sha = content[nul + 1 : nul + 1 + hash_size].hex()
+        if mode == "40000":
+            entry_type = "tree"
+        elif mode == "160000":
+            entry_type = "commit"
+        else:
+            entry_type = "blob"
+        entries.append(TreeEntry(mode, entry_type, sha, name))
+        pos = nul + 1 + hash_size
+    return entries
+
+
+class GitObjectReader:
+    """Reads git objects through a long-lived ``git cat-file --batch`` process."""
+
+    def __init__(self, project_root: Path, runner: CommandRunner | None = None):
+        """
+        Initialize git object reader.
+
+        Args:
+            project_root: Repository to read from
+            runner: Runner for one-off commands such as rev-list and merge-base
+        """
+        self.project_root = project_root
+        self.runner = runner or CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT)
+        self._process: subprocess.Popen[bytes] | None = None
+        self._commits: dict[str, CommitInfo] = {}
+        self._merge_bases: dict[tuple[str, str], str | None] = {}
+        self._lock = threading.Lock()
+
+    def _pipes(self) -> tuple[IO[bytes], IO[bytes]]:
+        """Start the batch process on first use and return its stdin and stdout."""
+        if self._process is None or self._process.poll() is not None:
+            try:
+                self._process = subprocess.Popen(
+                    BATCH_COMMAND,
+                    cwd=self.project_root,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                raise GitError(
+                    message=f"Failed to start git cat-file: {e}",
+                    code=ErrorCode.GIT_COMMAND_FAILED,
+                    context={"command": " ".join(BATCH_COMMAND)},
+                    cause=e,
+                ) from e
+            logger.debug(f"Started git cat-file batch process in {self.project_root}")
+        assert self._process.stdin is not None and self._process.stdout is not None
+        return self._process.stdin, self._process.stdout
+
+    def read_objects(self, revs: list[str]) -> list[tuple[str, str, bytes] | None]:
+        """
+        Read objects by SHA or revision expression.
+
+        Args:
+            revs: Object names, e.g. SHAs, ``refs/heads/main`` or ``HEAD^{tree}``
+
+        Returns:
+            (sha, type, contents) per name, or None for names that don't resolve
+
+        Raises:
+            GitError: If the batch process can't be started or exits
+                (e.g. outside a git repository)
+        """
+        results: list[tuple[str, str, bytes] | None] = []
+        if not revs:
+            return results
+        with self._lock:
+            try:
+                stdin, stdout = self._pipes()
+                for start in range(0, len(revs), BATCH_CHUNK_SIZE):
+                    chunk = revs[start : start + BATCH_CHUNK_SIZE]
+                    stdin.write(b"".join(rev.encode() + b"\n" for rev in chunk))
+                    stdin.flush()
+                    results.extend(self._read_response(stdout) for _ in chunk)
+            except (OSError, ValueError, EOFError) as e:
+                self._close()
+                raise GitError(
+                    message=f"git cat-file failed in {self.project_root}: {e}",
+                    code=ErrorCode.GIT_COMMAND_FAILED,
+                    context={"command": " ".join(BATCH_COMMAND)},
+                    remediation="Check that the directory is a git repository",
+                    cause=e,
+                ) from e
+        return results
+
+    @staticmethod
+    def _read_response(stdout: IO[bytes]) -> tuple[str, str, bytes] | None:
+        """Read one object (or missing marker) from the batch output."""
+        header = stdout.readline()
+        if not header:
+            raise EOFError("git cat-file exited")
+        parts = header.split()
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None  # "<name> missing" or "<name> ambiguous"
+        content = stdout.read(int(parts[2]))
+        stdout.read(1)  # Trailing newline
+        return parts[0].decode(), parts[1].decode(), content
+
+    def resolve(self, rev: str) -> str | None:
+        """
+        Resolve a revision or ref name to an object SHA.
+
+        Args:
+            rev: Revision expression, e.g. ``refs/heads/feature``
+
+        Returns:
+            The SHA, or None if the name doesn't resolve
+        """
+        obj = self.read_objects([rev])[0]
+        return obj[0] if obj else None
+
+    def commits(self, revs: list[str]) -> list[CommitInfo]:
+        """
+        Read several commits in pipelined batches.
+
+        Args:
+            revs: Commit SHAs or revision expressions
+
+        Returns:
+            Parsed commits in the given order, skipping names that aren't commits
+        """
+        # Only SHAs are cached; ref names are resolved again on every read
+        found: dict[str, CommitInfo] = {}
+        unread = [rev for rev in revs if rev not in self._commits]
+        for rev, obj in zip(unread, self.read_objects(unread)):
+            if obj and obj[1] == "commit":
+                if obj[0] not in self._commits:
+                    self._commits[obj[0]] = parse_commit(obj[0], obj[2])
+                found[rev] = self._commits[obj[0]]
+
+        commits = []
+        for rev in revs:
+            commit = self._commits.get(rev) or found.get(rev)
+            if commit:
+                commits.append(commit)
+        return commits
+
+    def commit(self, rev: str) -> CommitInfo | None:
+        """
+        Read one commit.
+
+        Args:
+            rev: Commit SHA or revision expression
+
+        Returns:
+            The parsed commit, or None if it isn't a commit
+        """
+        found = self.commits([rev])
+        return found[0] if found else None
+
+    def commit_message(self, rev: str) -> str | None:
+        """Full message of a commit, or None if it isn't a commit."""
+        commit = self.commit(rev)
+        return commit.message if commit else None
+
+    def commit_parents(self, rev: str) -> tuple[str, ...] | None:
+        """Parent SHAs of a commit, or None if it isn't a commit."""
+        commit = self.commit(rev)
+        return commit.parents if commit else None
+
+    def tree_entries(self, rev: str) -> list[TreeEntry] | None:
+        """
+        List the entries of a tree.
+
+        Args:
+            rev: Tree SHA, or a commit whose root tree is listed
+
+        Returns:
+            Entries in tree order, or None if the name doesn't resolve to a tree
+        """
+        obj = self.read_objects([f"{rev}^{{tree}}"])[0]
+        if obj is None or obj[1] != "tree":
+            return None
+        return parse_tree(obj[2], len(obj[0]) // 2)
+
+    def rev_list(self, *args: str) -> list[str]:
+        """
+        List commit SHAs with ``git rev-list``.
+
+        Args:
+            *args: Revision ranges and options, e.g. ``"main..feature"``
+
+        Returns:
+            SHAs in rev-list order
+
+        Raises:
+            GitError: If rev-list fails (e.g. an unknown revision)
+        """
+        command = ["git", "rev-list", *args]
+        result = self.runner.run(
+            command, timeout=GIT_STANDARD_TIMEOUT, working_dir=self.project_root
+        )
+        if not result.success:
+            raise GitError(
+                message=f"git rev-list failed: {result.stderr.strip()}",
+                code=ErrorCode.GIT_COMMAND_FAILED,
+                context={"command": " ".join(command)},
+            )
+        return result.stdout.split()
+
+    def log(self, *args: str) -> list[CommitInfo]:
+        """
+        List commits like ``git log``, reading them over the batch process.
+
+        Args:
+            *args: Revision ranges and options passed to rev-list
+
+        Returns:
+            Parsed commits in rev-list order
+
+        Raises:
+            GitError: If rev-list fails
+        """
+        return self.commits(self.rev_list(*args))
+
+    def merge_base(self, first: str, second: str) -> str | None:
+        """
+        Find the best common ancestor of two commits.
+
+        Args:
+            first: Commit SHA or revision expression
+            second: Commit SHA or revision expression
+
+        Returns:
+            The merge base SHA, or None if either side doesn't resolve or the
+            histories are unrelated
+        """
+        first_sha, second_sha = (
+            obj[0] if obj else None for obj in self.read_objects([first, second])
+        )
+        if first_sha is None or second_sha is None:
+            return None
+
+        key = (first_sha, second_sha)
+        if key not in self._merge_bases:
+            result = self.runner.run(
+                ["git", "merge-base", first_sha, second_sha],
+                timeout=GIT_QUICK_TIMEOUT,
+                working_dir=self.project_root,
+            )
+            self._merge_bases[key] = result.stdout.strip() if result.success else None
+        return self._merge_bases[key]
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Whether ``ancestor`` is reachable from ``descendant``."""
+        ancestor_sha = self.resolve(ancestor)
+        return (
+            ancestor_sha is not None and self.merge_base(ancestor_sha, descendant) == ancestor_sha
+        )
+
+    def _close(self) -> None:
+        """Stop the batch process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=GIT_QUICK_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+    def close(self) -> None:
+        """Stop the batch process; it's restarted if the reader is used again."""
+        with self._lock:
+            self._close()
+
+
+def get_object_reader(
+    project_root: Path | None = None, runner: CommandRunner | None = None
+) -> GitObjectReader:
+    """
+    Get the object reader of a repository, shared for the rest of the process.
+
+    Args:
+        project_root: Repository root (defaults to the current directory)
+        runner: Runner for one-off git commands (defaults to a new CommandRunner)
+
+    Returns:
+        The shared reader
+    """
+    root = (project_root or Path.cwd()).resolve()
+    with _lock:
+        reader = _readers.get(root)
+        if reader is None:
+            reader = _readers[root] = GitObjectReader(root, runner)
+        return reader
+
+
+def close_object_readers() -> None:
+    """Stop every batch process and forget the readers."""
+    with _lock:
+        readers = list(_readers.values())
+        _readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+atexit.register(close_object_readers)
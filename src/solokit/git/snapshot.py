@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Per-invocation git state snapshot.
+
+A single ``sk end`` or ``sk validate`` asks git about the same working tree from
+several places (session validation, the git workflow, the briefing, the
+documentation gate, commit recording). The snapshot gathers branch, HEAD,
+upstream ahead/behind and the working tree status with one
+``git status --porcelain=v2 --branch -z`` call and shares it across those
+consumers for the rest of the process. Files changed by the last commit are
+fetched lazily with a second call when first asked for.
+
+Anything that moves HEAD or the index (commits, checkouts, merges) must call
+invalidate_git_snapshot() so later consumers see the new state.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import GIT_QUICK_TIMEOUT
+from solokit.core.exceptions import CommandExecutionError, NotAGitRepoError
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STATUS_COMMAND = ["git", "status", "--porcelain=v2", "--branch", "-z"]
+LAST_COMMIT_FILES_COMMAND = ["git", "diff", "--name-only", "HEAD~1..HEAD"]
+
+_snapshots: dict[Path, GitSnapshot] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class StatusEntry:
+    """One changed path from ``git status``."""
+
+    xy: str  # Index and worktree status as in short format (" M", "A ", "??", ...)
+    path: str
+    orig_path: str | None = None  # Source path of a rename or copy
+
+    @property
+    def untracked(self) -> bool:
+        """Whether the path is untracked."""
+        return self.xy == "??"
+
+    @property
+    def code(self) -> str:
+        """Single-letter status as shown by ``git diff --name-status HEAD``."""
+        if self.xy[0] == "U" or self.xy[1] == "U" or self.xy in ("AA", "DD"):
+            return "U"
+        return self.xy[0] if self.xy[0] != " " else self.xy[1]
+
+    @property
+    def line(self) -> str:
+        """The entry as a ``git status --porcelain`` line."""
+        if self.orig_path:
+            return f"{self.xy} {self.orig_path} -> {self.path}"
+        return f"{self.xy} {self.path}"
+
+
+class GitSnapshot:
+    """Branch, HEAD and working tree status of a repository at one point in time."""
+
+    def __init__(
+        self,
+        head: str | None,
+        branch: str | None,
+        upstream: str | None,
+        ahead: int,
+        behind: int,
+        entries: list[StatusEntry],
+        project_root: Path,
+        runner: CommandRunner,
+    ):
+        """
+        Initialize git snapshot.
+
+        Args:
+            head: Commit SHA of HEAD (None before the first commit)
+            branch: Current branch (None when HEAD is detached)
+            upstream: Upstream branch, if configured
+            ahead: Commits ahead of upstream
+            behind: Commits behind upstream
+            entries: Changed, staged and untracked paths
+            project_root: Repository the snapshot was taken in
+            runner: Runner used for lazily fetched details
+        """
+        self.head = head
+        self.branch = branch
+        self.upstream = upstream
+        self.ahead = ahead
+        self.behind = behind
+        self.entries = entries
+        self.project_root = project_root
+        self.runner = runner
+        self._last_commit_files: list[str] | None = None
+
+    @property
+    def is_clean(self) -> bool:
+        """Whether there are no changed or untracked paths."""
+        return not self.entries
+
+    @property
+    def status_lines(self) -> list[str]:
+        """Entries as ``git status --porcelain`` lines."""
+        return [entry.line for entry in self.entries]
+
+    @property
+    def tracked_changes(self) -> list[StatusEntry]:
+        """Entries for tracked paths (staged or not), excluding untracked ones."""
+        return [entry for entry in self.entries if not entry.untracked]
+
+    @property
+    def changed_files(self) -> list[str]:
+        """Tracked paths that differ from HEAD (as ``git diff --name-only HEAD``)."""
+        return [entry.path for entry in self.tracked_changes]
+
+    def last_commit_files(self) -> list[str] | None:
+        """
+        List the files changed by the last commit.
+
+        Returns:
+            Paths changed between HEAD~1 and HEAD, or None if git can't tell
+            (e.g. a repository with a single commit)
+        """
+        if self._last_commit_files is None:
+            result = self.runner.run(
+                LAST_COMMIT_FILES_COMMAND, timeout=GIT_QUICK_TIMEOUT, working_dir=self.project_root
+            )
+            if not result.success:
+                return None
+            self._last_commit_files = [line for line in result.stdout.split("\n") if line]
+        return self._last_commit_files
+
+
+def parse_porcelain_v2(
+    output: str,
+) -> tuple[str | None, str | None, str | None, int, int, list[StatusEntry]]:
+    """
+    Parse ``git status --porcelain=v2 --branch -z`` output.
+
+    Args:
+        output: NUL-separated status output
+
+    Returns:
+        tuple: head, branch, upstream, ahead, behind and status entries
+    """
+    head = branch = upstream = None
+    ahead = behind = 0
+    entries: list[StatusEntry] = []
+
+    records = iter(output.split("\0"))
+    for record in records:
+        if record.startswith("# "):
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.oid":
+                head = None if value == "(initial)" else value
+            elif key == "branch.head":
+                branch = None if value == "(detached)" else value
+            elif key == "branch.upstream":
+                upstream = value
+            elif key == "branch.ab":
+                ahead_text, _, behind_text = value.partition(" ")
+                ahead, behind = int(ahead_text), abs(int(behind_text))
+            continue
+
+        kind, _, rest = record.partition(" ")
+        if kind == "1":
+            fields = rest.split(" ", 7)
+            entries.append(StatusEntry(_short_xy(fields[0]), fields[7]))
+        elif kind == "2":
+            # The source path follows as the next record
+            fields = rest.split(" ", 8)
+            entries.append(StatusEntry(_short_xy(fields[0]), fields[8], next(records, "")))
+        elif kind == "u":
+            fields = rest.split(" ", 9)
+            entries.append(StatusEntry(fields[0], fields[9]))
+        elif kind == "?":
+            entries.append(StatusEntry("??", rest))
+
+    return head, branch, upstream, ahead, behind, entries
+
+
+def _short_xy(xy: str) -> str:
+    """Convert a porcelain v2 XY field ("." for unchanged) to short format."""
+    return xy.replace(".", " ")
+
+
+def get_git_snapshot(
+    project_root: Path | None = None, runner: CommandRunner | None = None
+) -> GitSnapshot:
+    """
+    Get the git state of a repository, taking a snapshot on first use.
+
+    Args:
+        project_root: Repository root (defaults to the current directory)
+        runner: Runner for the git calls (defaults to a new CommandRunner)
+
+    Returns:
+        The snapshot shared by all callers until invalidated
+
+    Raises:
+        NotAGitRepoError: If git status fails (e.g. not a git repository)
+        CommandExecutionError: If git status times out
+    """
+    root = (project_root or Path.cwd()).resolve()
+    with _lock:
+        snapshot = _snapshots.get(root)
+        if snapshot is not None:
+            return snapshot
+
+        runner = runner or CommandRunner(default_timeout=GIT_QUICK_TIMEOUT)
+        result = runner.run(STATUS_COMMAND, timeout=GIT_QUICK_TIMEOUT, working_dir=root)
+        if not result.success:
+            if result.timed_out:
+                raise CommandExecutionError("git status", -1, "Command timed out")
+            raise NotAGitRepoError(path=str(root))
+
+        snapshot = GitSnapshot(*parse_porcelain_v2(result.stdout), root, runner)
+        _snapshots[root] = snapshot
+        logger.debug(
+            f"Git snapshot of {root}: branch {snapshot.branch}, {len(snapshot.entries)} changes"
+        )
+        return snapshot
+
+
+def invalidate_git_snapshot(project_root: Path | None = None) -> None:
+    """
+    Drop snapshots after HEAD, the index or the working tree changed.
+
+    Args:
+        project_root: Repository whose snapshot is stale (None drops all)
+    """
+    with _lock:
+        if project_root is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(project_root.resolve(), None)
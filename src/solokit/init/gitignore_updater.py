@@ -28,6 +28,9 @@ def get_stack_specific_gitignore_entries(template_id: str) -> list[str]:
     common_entries = [
         ".session/briefings/",
         ".session/history/",
+        ".session/cache/",
+        ".session/logs/",
+        ".session/daemons/",
         "coverage/",
         "coverage.json",
     ]
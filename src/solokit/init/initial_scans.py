@@ -7,11 +7,11 @@ Runs initial stack and tree scans to populate .session/tracking/.
 from __future__ import annotations
 
 import logging
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from solokit.core.command_runner import CommandRunner
-from solokit.core.constants import GIT_STANDARD_TIMEOUT
+from solokit.project.stack import StackGenerator
+from solokit.project.tree import TreeGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -29,27 +29,10 @@ def run_stack_scan(project_root: Path | None = None) -> bool:
     if project_root is None:
         project_root = Path.cwd()
 
-    # Get Solokit installation directory
-    script_dir = Path(__file__).parent.parent / "project"
-    stack_script = script_dir / "stack.py"
-
-    if not stack_script.exists():
-        logger.warning(f"Stack script not found: {stack_script}")
-        return False
-
-    runner = CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT, working_dir=project_root)
-
     try:
-        # Use sys.executable to ensure we use the same Python interpreter
-        result = runner.run([sys.executable, str(stack_script)], check=True)
-        if result.success:
-            logger.info("Generated stack.txt")
-            return True
-        else:
-            logger.warning("Could not generate stack.txt")
-            if result.stderr:
-                logger.warning(f"Error: {result.stderr.strip()}")
-            return False
+        StackGenerator(project_root).update_stack()
+        logger.info("Generated stack.txt")
+        return True
     except Exception as e:
         logger.warning(f"Stack generation failed: {e}")
         return False
@@ -68,27 +51,10 @@ def run_tree_scan(project_root: Path | None = None) -> bool:
     if project_root is None:
         project_root = Path.cwd()
 
-    # Get Solokit installation directory
-    script_dir = Path(__file__).parent.parent / "project"
-    tree_script = script_dir / "tree.py"
-
-    if not tree_script.exists():
-        logger.warning(f"Tree script not found: {tree_script}")
-        return False
-
-    runner = CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT, working_dir=project_root)
-
     try:
-        # Use sys.executable to ensure we use the same Python interpreter
-        result = runner.run([sys.executable, str(tree_script)], check=True)
-        if result.success:
-            logger.info("Generated tree.txt")
-            return True
-        else:
-            logger.warning("Could not generate tree.txt")
-            if result.stderr:
-                logger.warning(f"Error: {result.stderr.strip()}")
-            return False
+        TreeGenerator(project_root).update_tree()
+        logger.info("Generated tree.txt")
+        return True
     except Exception as e:
         logger.warning(f"Tree generation failed: {e}")
         return False
@@ -98,6 +64,8 @@ def run_initial_scans(project_root: Path | None = None) -> dict[str, bool]:
     """
     Run initial stack and tree scans.
 
+    Both scans walk the project tree, so they run concurrently.
+
     Args:
         project_root: Project root directory
 
@@ -106,7 +74,8 @@ def run_initial_scans(project_root: Path | None = None) -> dict[str, bool]:
     """
     logger.info("Generating project context...")
 
-    stack_success = run_stack_scan(project_root)
-    tree_success = run_tree_scan(project_root)
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="initial-scan") as pool:
+        stack = pool.submit(run_stack_scan, project_root)
+        tree = pool.submit(run_tree_scan, project_root)
 
-    return {"stack": stack_success, "tree": tree_success}
+    return {"stack": stack.result(), "tree": tree.result()}
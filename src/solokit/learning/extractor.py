@@ -9,9 +9,10 @@ from typing import Any
 from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import GIT_STANDARD_TIMEOUT
 from solokit.core.error_handlers import log_errors
-from solokit.core.exceptions import FileOperationError
+from solokit.core.exceptions import FileOperationError, GitError
 from solokit.core.file_ops import load_json
 from solokit.core.logging_config import get_logger
+from solokit.git.objects import get_object_reader
 
 logger = get_logger(__name__)
 
@@ -171,10 +172,12 @@ class LearningExtractor:
             List of learning dictionaries extracted from commit messages
         """
         try:
-            # Get recent commits
-            result = self.runner.run(["git", "log", "--format=%H|||%B", "-n", "100"])
-
-            if not result.success:
+            # Get recent commits, read over the shared cat-file batch process
+            reader = get_object_reader(self.project_root, self.runner)
+            try:
+                commits = reader.log("--max-count=100", "HEAD")
+            except GitError as e:
+                logger.debug(f"No commits to extract learnings from: {e}")
                 return []
 
             learnings = []
@@ -182,19 +185,8 @@ class LearningExtractor:
             # Captures until: double newline (blank line) OR end of string
             learning_pattern = r"LEARNING:\s*([\s\S]+?)(?=\n\n|\Z)"
 
-            # Parse commit messages
-            commits_raw = result.stdout.strip()
-            if not commits_raw:
-                return []
-
-            # Each commit starts with hash|||, split on newline followed by hash pattern
-            commit_blocks = re.split(r"\n(?=[a-f0-9]{40}\|\|\|)", commits_raw)
-
-            for commit_block in commit_blocks:
-                if "|||" not in commit_block:
-                    continue
-
-                commit_hash, message = commit_block.split("|||", 1)
+            for commit in commits:
+                commit_hash, message = commit.sha, commit.message
 
                 # Find LEARNING: annotations
                 for match in re.finditer(learning_pattern, message, re.MULTILINE):
@@ -51,6 +51,7 @@ class StackGenerator:
             ".c": ("C", "c"),
         }
 
+        detected = {}
         for ext, (name, key) in extensions.items():
             files = list(self.project_root.rglob(f"*{ext}"))
             # Exclude common non-source directories
@@ -71,14 +72,21 @@ class StackGenerator:
             ]
 
             if files:
-                # Try to detect version
-                version = self._detect_language_version(key)
-                languages[name] = version or "detected"
+                detected[name] = key
+
+        # Probe all detected languages' versions concurrently
+        versions = self._detect_language_versions(list(detected.values()))
+        for name, key in detected.items():
+            languages[name] = versions.get(key) or "detected"
 
         return languages
 
     def _detect_language_version(self, language: str) -> str:
         """Detect language version from environment."""
+        return self._detect_language_versions([language]).get(language, "")
+
+    def _detect_language_versions(self, languages: list[str]) -> dict[str, str]:
+        """Detect several language versions from environment, running probes concurrently."""
         import shutil
 
         from solokit.core.command_runner import CommandRunner
@@ -92,28 +100,34 @@ class StackGenerator:
             "go": ["go", "version"],
         }
 
-        if language in version_commands:
+        versions = dict.fromkeys(languages, "")
+        probes: dict[str, list[str]] = {}
+        for language in languages:
+            if language not in version_commands:
+                continue
             # For Python, try python3 first, fall back to python
             if language == "python":
                 python_cmd = shutil.which("python3") or shutil.which("python")
                 if not python_cmd:
-                    return ""
+                    continue
                 version_commands["python"] = [python_cmd, "--version"]
+            probes[language] = version_commands[language]
+
+        if not probes:
+            return versions
 
-            def detect_version() -> str:
-                runner = CommandRunner(default_timeout=STACK_DETECTION_TIMEOUT)
-                result = runner.run(version_commands[language])
+        def detect_versions() -> dict[str, str]:
+            runner = CommandRunner(default_timeout=STACK_DETECTION_TIMEOUT)
+            results = runner.run_many(list(probes.values()))
+            for language, result in zip(probes, results):
                 if result.success:
                     # Extract version number
                     version_match = re.search(r"(\d+\.\d+(?:\.\d+)?)", result.stdout)
                     if version_match:
-                        return version_match.group(1)
-                return ""
+                        versions[language] = version_match.group(1)
+            return versions
 
-            result = safe_execute(detect_version, default="", log_errors=False)
-            return result or ""
-
-        return ""
+        return safe_execute(detect_versions, default=versions, log_errors=False) or versions
 
     def detect_frameworks(self) -> dict[str, list[str]]:
         """Detect frameworks from imports and config files."""
@@ -8,6 +8,7 @@ Tracks structural changes to the project with reasoning.
 from __future__ import annotations
 
 import json
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -83,6 +84,10 @@ class TreeGenerator:
         Raises:
             FileOperationError: If tree generation fails completely
         """
+        if shutil.which("tree") is None:
+            # Checked up front: a failed launch is logged as an error by CommandRunner
+            return self._generate_tree_fallback()
+
         try:
             # Build ignore arguments
             ignore_args = []
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Dependency audit cache.
+
+Dependency audits (safety, npm audit) only depend on the project's dependency
+manifests and lockfiles and on the advisory database, not on source code. Their
+parsed results are cached under .session/cache/audits/ keyed by a hash of every
+manifest and lockfile plus the version of the audit tool, so editing source files
+does not re-run a slow, network-bound audit.
+
+Neither tool exposes a local advisory database version, so entries expire after
+ADVISORY_DB_MAX_AGE_SECONDS instead: a new advisory shows up within a day.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from solokit.core.logging_config import get_logger
+from solokit.quality.gate_cache import CacheEntryStore
+
+logger = get_logger(__name__)
+
+# Bump when the key inputs or stored results change shape
+AUDIT_CACHE_SCHEMA_VERSION = 1
+
+# Advisory databases change independently of the project, so cached audits expire
+ADVISORY_DB_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Audit results kept per tool (e.g. switching back and forth between branches)
+MAX_ENTRIES_PER_TOOL = 8
+
+# Files that declare or pin Python dependencies
+PYTHON_DEPENDENCY_FILES = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "Pipfile",
+    "Pipfile.lock",
+    "poetry.lock",
+    "pdm.lock",
+    "uv.lock",
+)
+
+# Glob for pip requirements files (requirements.txt, requirements-dev.txt, ...)
+PYTHON_REQUIREMENTS_GLOB = "requirements*.txt"
+
+# Files that declare or pin JavaScript dependencies
+JAVASCRIPT_DEPENDENCY_FILES = (
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+)
+
+
+def get_dependency_files(project_root: Path, language: str) -> list[Path]:
+    """
+    Get the dependency manifests and lockfiles present in a project.
+
+    Args:
+        project_root: Project root directory
+        language: Programming language (python, javascript, typescript)
+
+    Returns:
+        Existing manifest and lockfile paths, sorted
+    """
+    if language == "python":
+        names = list(PYTHON_DEPENDENCY_FILES)
+        names.extend(path.name for path in project_root.glob(PYTHON_REQUIREMENTS_GLOB))
+    else:
+        names = list(JAVASCRIPT_DEPENDENCY_FILES)
+    return sorted({project_root / name for name in names if (project_root / name).is_file()})
+
+
+class DependencyAuditCache:
+    """Disk cache of dependency audit results keyed by manifest and lockfile contents."""
+
+    def __init__(self, project_root: Path, enabled: bool = True):
+        """
+        Initialize dependency audit cache.
+
+        Args:
+            project_root: Project root directory
+            enabled: Whether cached audits may be used (False for --no-gate-cache)
+        """
+        self.project_root = project_root
+        self.store = CacheEntryStore(
+            project_root, "audits", AUDIT_CACHE_SCHEMA_VERSION, MAX_ENTRIES_PER_TOOL, enabled
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is active (requires an initialized project)."""
+        return self.store.enabled
+
+    def key(self, files: list[Path], tool_version: str | None) -> str | None:
+        """
+        Compute the cache key of an audit.
+
+        Args:
+            files: Dependency manifests and lockfiles the audit reads
+            tool_version: Version of the audit tool
+
+        Returns:
+            SHA-256 key, or None if a file could not be read
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{AUDIT_CACHE_SCHEMA_VERSION}\0{tool_version}\0".encode())
+        for path in sorted(files):
+            try:
+                content = path.read_bytes()
+            except OSError as e:
+                logger.debug(f"Cannot hash dependency file {path}: {e}")
+                return None
+            name = path.relative_to(self.project_root).as_posix()
+            digest.update(f"{name}\0{hashlib.sha256(content).hexdigest()}\0".encode())
+        return digest.hexdigest()
+
+    def get(self, tool: str, key: str) -> Any | None:
+        """
+        Look up a cached audit result.
+
+        Args:
+            tool: Audit tool name (e.g. "safety", "npm-audit")
+            key: Key from key()
+
+        Returns:
+            The cached parsed audit result, or None on a miss or expired entry
+        """
+        entry = self.store.get(tool, key, ADVISORY_DB_MAX_AGE_SECONDS)
+        if entry is None or "result" not in entry:
+            return None
+        logger.debug(f"Using cached {tool} result from {entry.get('cached_at')}")
+        return entry["result"]
+
+    def set(self, tool: str, key: str, result: Any) -> None:
+        """
+        Store an audit result.
+
+        Args:
+            tool: Audit tool name
+            key: Key of the inputs the result was produced from
+            result: Parsed audit result (JSON-serializable)
+        """
+        self.store.set(tool, key, {"result": result})
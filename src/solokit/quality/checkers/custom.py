@@ -2,19 +2,22 @@
 """
 Custom validation checker.
 
-Runs user-defined validation rules.
+Runs user-defined validation rules. Command rules run concurrently, and all grep
+rules are evaluated together in-process by the grep engine.
 """
 
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Union, cast
 
-from solokit.core.command_runner import CommandRunner
-from solokit.core.constants import QUALITY_CHECK_LONG_TIMEOUT, QUALITY_CHECK_STANDARD_TIMEOUT
+from solokit.core.command_runner import DEFAULT_MAX_CONCURRENCY, CommandRunner
+from solokit.core.constants import QUALITY_CHECK_LONG_TIMEOUT
 from solokit.core.logging_config import get_logger
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.grep_engine import GrepEngine, GrepQuery
 
 logger = get_logger(__name__)
 
@@ -70,20 +73,40 @@ class CustomValidationChecker(QualityChecker):
 
         logger.info(f"Running {len(all_rules)} custom validation rules")
 
+        # Independent command rules run concurrently while the grep rules are evaluated
+        command_rules = {
+            index: rule for index, rule in enumerate(all_rules) if rule.get("type") == "command"
+        }
+        grep_rules = {
+            index: rule for index, rule in enumerate(all_rules) if rule.get("type") == "grep"
+        }
+        outcomes: dict[int, bool] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(command_rules), DEFAULT_MAX_CONCURRENCY)),
+            thread_name_prefix="custom-validation",
+        ) as executor:
+            futures = {
+                index: executor.submit(self._run_command_validation, rule)
+                for index, rule in command_rules.items()
+            }
+            if grep_rules:
+                matched = self._run_grep_validations(list(grep_rules.values()))
+                outcomes.update(zip(grep_rules, matched))
+            for index, future in futures.items():
+                outcomes[index] = future.result()
+
         validations = []
         passed = True
 
-        for rule in all_rules:
+        for index, rule in enumerate(all_rules):
             rule_type = rule.get("type")
             required = rule.get("required", False)
 
             # Execute rule based on type
-            if rule_type == "command":
-                rule_passed = self._run_command_validation(rule)
+            if index in outcomes:
+                rule_passed = outcomes[index]
             elif rule_type == "file_exists":
                 rule_passed = self._check_file_exists(rule)
-            elif rule_type == "grep":
-                rule_passed = self._run_grep_validation(rule)
             else:
                 logger.warning(f"Unknown validation rule type: {rule_type}")
                 rule_passed = True
@@ -147,16 +170,31 @@ class CustomValidationChecker(QualityChecker):
 
     def _run_grep_validation(self, rule: dict[str, Any]) -> bool:
         """Run grep validation rule."""
-        pattern = rule.get("pattern")
-        files = rule.get("files", ".")
+        return self._run_grep_validations([rule])[0]
 
-        if not pattern:
-            logger.warning("Grep validation missing 'pattern' field")
-            return True
+    def _run_grep_validations(self, rules: list[dict[str, Any]]) -> list[bool]:
+        """Run grep validation rules with a single tree walk.
 
-        logger.debug(f"Running grep validation: pattern={pattern}, files={files}")
-        result = self.runner.run(
-            ["grep", "-r", pattern, files], timeout=QUALITY_CHECK_STANDARD_TIMEOUT
-        )
-        # grep returns 0 if pattern found
-        return result.success
+        A rule passes when its pattern (grep syntax) matches a line in its
+        ``files`` (a path or list of paths, default "."), like ``grep -r``.
+
+        Returns:
+            Whether each rule passed, in rule order
+        """
+        results = [True] * len(rules)
+        queries: dict[int, GrepQuery] = {}
+        for index, rule in enumerate(rules):
+            pattern = rule.get("pattern")
+            files = rule.get("files", ".")
+            if not pattern:
+                logger.warning("Grep validation missing 'pattern' field")
+                continue
+            logger.debug(f"Running grep validation: pattern={pattern}, files={files}")
+            paths = [files] if isinstance(files, str) else list(files)
+            queries[index] = GrepQuery(pattern, paths)
+
+        if queries:
+            matched = GrepEngine(self.project_root).search(list(queries.values()))
+            results_by_rule = dict(zip(queries, matched))
+            results = [results_by_rule.get(index, True) for index in range(len(rules))]
+        return results
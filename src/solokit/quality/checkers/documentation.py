@@ -2,7 +2,9 @@
 """
 Documentation validation checker.
 
-Validates CHANGELOG updates, docstrings, and README currency.
+Validates CHANGELOG updates, docstrings, and README currency. Docstrings are
+checked in-process with ``ast`` by default, or with pydocstyle from the project's
+virtualenv when ``docstring_checker`` is "pydocstyle".
 """
 
 from __future__ import annotations
@@ -16,11 +18,17 @@ from solokit.core.constants import (
     GIT_STANDARD_TIMEOUT,
     QUALITY_CHECK_STANDARD_TIMEOUT,
 )
+from solokit.core.exceptions import CommandExecutionError, NotAGitRepoError
 from solokit.core.logging_config import get_logger
+from solokit.git.snapshot import get_git_snapshot
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.docstrings import DocstringIssue, DocstringScanner
 
 logger = get_logger(__name__)
 
+# Missing docstring locations included in the results (the count covers the rest)
+MAX_REPORTED_LOCATIONS = 20
+
 
 class DocumentationChecker(QualityChecker):
     """Documentation requirements validation."""
@@ -31,6 +39,7 @@ class DocumentationChecker(QualityChecker):
         project_root: Path | None = None,
         work_item: dict[str, Any] | None = None,
         runner: CommandRunner | None = None,
+        docstring_scanner: DocstringScanner | None = None,
     ):
         """Initialize documentation checker.
 
@@ -39,6 +48,8 @@ class DocumentationChecker(QualityChecker):
             project_root: Project root directory
             work_item: Work item dictionary (optional, for README check)
             runner: Optional CommandRunner instance (for testing)
+            docstring_scanner: Built-in docstring checker (defaults to one with the
+                per-file cache enabled)
         """
         super().__init__(config, project_root)
         self.runner = (
@@ -47,6 +58,8 @@ class DocumentationChecker(QualityChecker):
             else CommandRunner(default_timeout=QUALITY_CHECK_STANDARD_TIMEOUT)
         )
         self.work_item = work_item or {}
+        self.docstring_scanner = docstring_scanner or DocstringScanner(self.project_root)
+        self._docstring_issues: list[DocstringIssue] = []
 
     def name(self) -> str:
         """Return checker name."""
@@ -78,7 +91,13 @@ class DocumentationChecker(QualityChecker):
         # Check docstrings for Python
         if self.config.get("check_docstrings", False):
             docstrings_passed = self._check_python_docstrings()
-            checks.append({"name": "Docstrings present", "passed": docstrings_passed})
+            check: dict[str, Any] = {"name": "Docstrings present", "passed": docstrings_passed}
+            if self._docstring_issues:
+                check["missing"] = len(self._docstring_issues)
+                check["locations"] = [
+                    str(issue) for issue in self._docstring_issues[:MAX_REPORTED_LOCATIONS]
+                ]
+            checks.append(check)
             if not docstrings_passed:
                 passed = False
 
@@ -109,14 +128,13 @@ class DocumentationChecker(QualityChecker):
     def _check_changelog_updated(self) -> bool:
         """Check if CHANGELOG was updated in the current branch."""
         # Get the current branch name
-        result = self.runner.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], timeout=GIT_STANDARD_TIMEOUT
-        )
-        if not result.success:
+        try:
+            snapshot = get_git_snapshot(self.project_root, self.runner)
+        except (NotAGitRepoError, CommandExecutionError):
             logger.debug("Could not check CHANGELOG: git not available")
             return True  # Skip check if git not available
 
-        current_branch = result.stdout.strip()
+        current_branch = snapshot.branch or "HEAD"
 
         # Don't check if we're on main/master
         if current_branch in ["main", "master"]:
@@ -145,6 +163,9 @@ class DocumentationChecker(QualityChecker):
         ):
             return True
 
+        if self.config.get("docstring_checker", "builtin") != "pydocstyle":
+            return self._check_docstrings_builtin()
+
         # Use venv Python if available, otherwise skip check
         venv_python = self.project_root / "venv" / "bin" / "python"
         venv_python_win = self.project_root / "venv" / "Scripts" / "python.exe"
@@ -176,17 +197,27 @@ class DocumentationChecker(QualityChecker):
         # If no issues found, return True
         return result.returncode == 0
 
+    def _check_docstrings_builtin(self) -> bool:
+        """Check for missing public docstrings in-process (no venv needed)."""
+        scan = self.docstring_scanner.scan()
+        logger.debug(
+            f"Checked docstrings in {scan.files_checked} file(s), "
+            f"{scan.files_parsed} parsed, {scan.files_checked - scan.files_parsed} cached"
+        )
+        self._docstring_issues = scan.issues
+        return not scan.issues
+
     def _check_readme_current(self) -> bool:
         """Check if README was updated (optional check)."""
-        result = self.runner.run(
-            ["git", "diff", "--name-only", "HEAD~1..HEAD"], timeout=GIT_STANDARD_TIMEOUT
-        )
+        try:
+            changed_files = get_git_snapshot(self.project_root, self.runner).last_commit_files()
+        except (NotAGitRepoError, CommandExecutionError):
+            changed_files = None
 
-        if not result.success:
+        if changed_files is None:
             logger.debug("Could not check README: git not available")
             return True  # Skip check if git not available
 
-        changed_files = result.stdout.strip().split("\n")
         readme_updated = any("README" in f.upper() for f in changed_files)
 
         if readme_updated:
@@ -15,6 +15,12 @@ from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import QUALITY_CHECK_VERY_LONG_TIMEOUT
 from solokit.core.logging_config import get_logger
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.incremental import (
+    FORMAT_EXTENSIONS,
+    IncrementalScope,
+    resolve_incremental_scope,
+    scope_command,
+)
 
 logger = get_logger(__name__)
 
@@ -29,6 +35,8 @@ class FormattingChecker(QualityChecker):
         language: str | None = None,
         auto_fix: bool | None = None,
         runner: CommandRunner | None = None,
+        incremental: bool | None = None,
+        incremental_scope: IncrementalScope | None = None,
     ):
         """Initialize formatting checker.
 
@@ -38,6 +46,8 @@ class FormattingChecker(QualityChecker):
             language: Programming language (python, javascript, typescript)
             auto_fix: Whether to automatically format (overrides config)
             runner: Optional CommandRunner instance (for testing)
+            incremental: Whether to check only changed files (overrides config)
+            incremental_scope: Precomputed changed-file scope (computed on demand if None)
         """
         super().__init__(config, project_root)
         self.runner = (
@@ -47,6 +57,10 @@ class FormattingChecker(QualityChecker):
         )
         self.language = language or self._detect_language()
         self.auto_fix = auto_fix if auto_fix is not None else self.config.get("auto_fix", False)
+        self.incremental = (
+            incremental if incremental is not None else self.config.get("incremental", False)
+        )
+        self.incremental_scope = incremental_scope
 
     def name(self) -> str:
         """Return checker name."""
@@ -90,19 +104,43 @@ class FormattingChecker(QualityChecker):
             logger.warning(f"No formatting command configured for language: {self.language}")
             return self._create_skipped_result(reason=f"no command for {self.language}")
 
+        command_parts = command.split()
+
+        # Restrict to changed files in incremental mode
+        incremental_info: dict[str, Any] = {}
+        if self.incremental:
+            if self.incremental_scope is None:
+                self.incremental_scope = resolve_incremental_scope(self.project_root)
+            command_parts, incremental_info = scope_command(
+                command_parts,
+                self.incremental_scope,
+                FORMAT_EXTENSIONS.get(self.language, ()),
+                self.project_root,
+            )
+            if not command_parts:
+                logger.info("No changed files to check formatting")
+                return CheckResult(
+                    checker_name=self.name(),
+                    passed=True,
+                    status="passed",
+                    errors=[],
+                    warnings=[],
+                    info={"formatted": False, **incremental_info},
+                    execution_time=time.time() - start_time,
+                )
+
         # Add appropriate flags based on auto_fix and language
         if self.language == "python":
             if not self.auto_fix:
-                command += " --check"
+                command_parts.append("--check")
         elif self.language in ["javascript", "typescript"]:
             if self.auto_fix:
-                command += " --write"
+                command_parts.append("--write")
             else:
-                command += " --check"
+                command_parts.append("--check")
 
         # For Python projects, use venv executables if available
         # Skip venv auto-detection for solokit itself (development tool)
-        command_parts = command.split()
         if (
             self.language == "python"
             and command_parts[0] in ["ruff", "black", "autopep8", "yapf"]
@@ -180,6 +218,7 @@ class FormattingChecker(QualityChecker):
             info={
                 "formatted": self.auto_fix,
                 "output": result.stdout[:1000] if result.stdout else "",
+                **incremental_info,
             },
             execution_time=execution_time,
         )
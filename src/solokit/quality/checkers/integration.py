@@ -197,18 +197,19 @@ class IntegrationChecker(QualityChecker):
 
         errors = []
 
-        # Check Docker available
-        result = self.runner.run(["docker", "--version"], timeout=DOCKER_COMMAND_TIMEOUT)
-        results["docker_available"] = result.success
+        # Check Docker and Docker Compose available (probed concurrently)
+        docker_result, compose_result = self.runner.run_many(
+            [["docker", "--version"], ["docker-compose", "--version"]],
+            timeout=DOCKER_COMMAND_TIMEOUT,
+        )
+        results["docker_available"] = docker_result.success
 
-        if not result.success:
+        if not docker_result.success:
             errors.append({"message": "Docker not available"})
 
-        # Check Docker Compose available
-        result = self.runner.run(["docker-compose", "--version"], timeout=DOCKER_COMMAND_TIMEOUT)
-        results["docker_compose_available"] = result.success
+        results["docker_compose_available"] = compose_result.success
 
-        if not result.success:
+        if not compose_result.success:
             errors.append({"message": "Docker Compose not available"})
 
         # Check compose file exists
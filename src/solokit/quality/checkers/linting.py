@@ -15,6 +15,13 @@ from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import QUALITY_CHECK_VERY_LONG_TIMEOUT
 from solokit.core.logging_config import get_logger
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.incremental import (
+    LINT_EXTENSIONS,
+    IncrementalScope,
+    resolve_incremental_scope,
+    scope_command,
+)
+from solokit.quality.lint_daemons import LintDaemonManager
 
 logger = get_logger(__name__)
 
@@ -29,6 +36,9 @@ class LintingChecker(QualityChecker):
         language: str | None = None,
         auto_fix: bool | None = None,
         runner: CommandRunner | None = None,
+        incremental: bool | None = None,
+        incremental_scope: IncrementalScope | None = None,
+        daemons: LintDaemonManager | None = None,
     ):
         """Initialize linting checker.
 
@@ -38,6 +48,9 @@ class LintingChecker(QualityChecker):
             language: Programming language (python, javascript, typescript)
             auto_fix: Whether to automatically fix issues (overrides config)
             runner: Optional CommandRunner instance (for testing)
+            incremental: Whether to lint only changed files (overrides config)
+            incremental_scope: Precomputed changed-file scope (computed on demand if None)
+            daemons: Optional LintDaemonManager (created on demand in daemon mode)
         """
         super().__init__(config, project_root)
         self.runner = (
@@ -47,6 +60,12 @@ class LintingChecker(QualityChecker):
         )
         self.language = language or self._detect_language()
         self.auto_fix = auto_fix if auto_fix is not None else self.config.get("auto_fix", False)
+        self.incremental = (
+            incremental if incremental is not None else self.config.get("incremental", False)
+        )
+        self.incremental_scope = incremental_scope
+        self.daemon = bool(self.config.get("daemon", False))
+        self.daemons = daemons
 
     def name(self) -> str:
         """Return checker name."""
@@ -90,16 +109,40 @@ class LintingChecker(QualityChecker):
             logger.warning(f"No linting command configured for language: {self.language}")
             return self._create_skipped_result(reason=f"no command for {self.language}")
 
+        command_parts = command.split()
+
+        # Restrict to changed files in incremental mode
+        incremental_info: dict[str, Any] = {}
+        if self.incremental:
+            if self.incremental_scope is None:
+                self.incremental_scope = resolve_incremental_scope(self.project_root)
+            command_parts, incremental_info = scope_command(
+                command_parts,
+                self.incremental_scope,
+                LINT_EXTENSIONS.get(self.language, ()),
+                self.project_root,
+            )
+            if not command_parts:
+                logger.info("No changed files to lint")
+                return CheckResult(
+                    checker_name=self.name(),
+                    passed=True,
+                    status="passed",
+                    errors=[],
+                    warnings=[],
+                    info={"issues_found": 0, "auto_fixed": False, **incremental_info},
+                    execution_time=time.time() - start_time,
+                )
+
         # Add auto-fix flag if supported
         if self.auto_fix:
             if self.language == "python":
-                command += " --fix"
+                command_parts.append("--fix")
             elif self.language in ["javascript", "typescript"]:
-                command += " --fix"
+                command_parts.append("--fix")
 
         # For Python projects, use venv executables if available
         # Skip venv auto-detection for solokit itself (development tool)
-        command_parts = command.split()
         if (
             self.language == "python"
             and command_parts[0] in ["ruff", "pylint", "flake8", "mypy", "pyright"]
@@ -115,8 +158,13 @@ class LintingChecker(QualityChecker):
                 command_parts[0] = str(venv_scripts)
                 logger.debug(f"Using venv executable: {venv_scripts}")
 
-        # Run linter
-        result = self.runner.run(command_parts, timeout=QUALITY_CHECK_VERY_LONG_TIMEOUT)
+        # Run linter, through a persistent daemon (dmypy, eslint_d) in daemon mode
+        if self.daemon:
+            if self.daemons is None:
+                self.daemons = LintDaemonManager(self.project_root, self.runner)
+            result = self.daemons.run(command_parts, timeout=QUALITY_CHECK_VERY_LONG_TIMEOUT)
+        else:
+            result = self.runner.run(command_parts, timeout=QUALITY_CHECK_VERY_LONG_TIMEOUT)
 
         execution_time = time.time() - start_time
 
@@ -178,6 +226,7 @@ class LintingChecker(QualityChecker):
                 "issues_found": result.returncode,
                 "auto_fixed": self.auto_fix,
                 "output": result.stdout[:1000] if result.stdout else "",
+                **incremental_info,
             },
             execution_time=execution_time,
         )
@@ -3,7 +3,8 @@
 Security vulnerability scanner.
 
 Runs security scans using Bandit (Python) and Safety (Python dependencies),
-or npm audit (JavaScript/TypeScript).
+or npm audit (JavaScript/TypeScript). Bandit and Safety run concurrently, and
+dependency audit results are cached by manifest and lockfile contents.
 """
 
 from __future__ import annotations
@@ -12,13 +13,17 @@ import json
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import QUALITY_CHECK_LONG_TIMEOUT
 from solokit.core.logging_config import get_logger
+from solokit.quality.audit_cache import DependencyAuditCache, get_dependency_files
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.gate_cache import get_command_version
+from solokit.quality.incremental import IncrementalScope, resolve_incremental_scope
 
 logger = get_logger(__name__)
 
@@ -32,6 +37,9 @@ class SecurityChecker(QualityChecker):
         project_root: Path | None = None,
         language: str | None = None,
         runner: CommandRunner | None = None,
+        incremental: bool | None = None,
+        incremental_scope: IncrementalScope | None = None,
+        audit_cache: DependencyAuditCache | None = None,
     ):
         """Initialize security checker.
 
@@ -40,6 +48,10 @@ class SecurityChecker(QualityChecker):
             project_root: Project root directory
             language: Programming language (python, javascript, typescript)
             runner: Optional CommandRunner instance (for testing)
+            incremental: Whether to scan only changed source files (overrides config).
+                Dependency audits always cover the full manifest.
+            incremental_scope: Precomputed changed-file scope (computed on demand if None)
+            audit_cache: Dependency audit cache (defaults to one under .session/cache/)
         """
         super().__init__(config, project_root)
         self.runner = (
@@ -48,6 +60,13 @@ class SecurityChecker(QualityChecker):
             else CommandRunner(default_timeout=QUALITY_CHECK_LONG_TIMEOUT)
         )
         self.language = language or self._detect_language()
+        self.incremental = (
+            incremental if incremental is not None else self.config.get("incremental", False)
+        )
+        self.incremental_scope = incremental_scope
+        self._incremental_info: dict[str, Any] = {}
+        self.audit_cache = audit_cache or DependencyAuditCache(self.project_root)
+        self._cached_audits: list[str] = []
 
     def name(self) -> str:
         """Return checker name."""
@@ -116,6 +135,8 @@ class SecurityChecker(QualityChecker):
                 "by_severity": results.get("by_severity", {}),
                 "fail_threshold": fail_on,
                 "language": self.language,
+                **self._incremental_info,
+                **({"cached_audits": self._cached_audits} if self._cached_audits else {}),
             },
             execution_time=execution_time,
         )
@@ -124,8 +145,13 @@ class SecurityChecker(QualityChecker):
         """Run Python security scans (Bandit + Safety)."""
         results: dict[str, Any] = {"vulnerabilities": [], "by_severity": {}}
 
-        # Run Bandit
-        bandit_results = self._run_bandit()
+        # Bandit scans source and Safety scans dependencies; neither waits on the other
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="security") as executor:
+            bandit_future = executor.submit(self._run_bandit)
+            safety_future = executor.submit(self._run_safety)
+            bandit_results = bandit_future.result()
+            safety_results = safety_future.result()
+
         if bandit_results:
             results["bandit"] = bandit_results
             # Count by severity
@@ -144,14 +170,46 @@ class SecurityChecker(QualityChecker):
                     }
                 )
 
-        # Run Safety
-        safety_results = self._run_safety()
         if safety_results:
             results["safety"] = safety_results
             results["vulnerabilities"].extend(safety_results)
 
         return results
 
+    def _bandit_targets(self, src_dir: Path) -> list[str] | None:
+        """Get Bandit scan targets: changed files under src/ in incremental mode.
+
+        Returns:
+            Bandit target arguments, or None if there is nothing to scan
+        """
+        if not self.incremental:
+            return ["-r", str(src_dir)]
+
+        if self.incremental_scope is None:
+            self.incremental_scope = resolve_incremental_scope(self.project_root)
+        scope = self.incremental_scope
+        if scope.is_full_run:
+            self._incremental_info = {
+                "incremental": False,
+                "full_run_reason": scope.full_run_reason,
+            }
+            return ["-r", str(src_dir)]
+
+        resolved_src = src_dir.resolve()
+        files = [
+            str(self.project_root / path)
+            for path in scope.files
+            if path.endswith(".py")
+            and (self.project_root / path).is_file()
+            and resolved_src in (self.project_root / path).resolve().parents
+        ]
+        self._incremental_info = {
+            "incremental": True,
+            "base_ref": scope.base_ref,
+            "files_checked": len(files),
+        }
+        return files or None
+
     def _run_bandit(self) -> dict[str, Any] | None:
         """Run Bandit security scanner."""
         try:
@@ -165,11 +223,15 @@ class SecurityChecker(QualityChecker):
                     logger.debug("No src/ directory found, skipping Bandit")
                     return None
 
+                targets = self._bandit_targets(src_dir)
+                if targets is None:
+                    logger.debug("No changed source files, skipping Bandit")
+                    return None
+
                 self.runner.run(
                     [
                         "bandit",
-                        "-r",
-                        str(src_dir),
+                        *targets,
                         "-f",
                         "json",
                         "-o",
@@ -207,6 +269,13 @@ class SecurityChecker(QualityChecker):
             logger.debug("No requirements.txt found, skipping Safety")
             return []
 
+        key = self._audit_key("python", ["safety", "--version"])
+        if key is not None:
+            cached = self.audit_cache.get("safety", key)
+            if isinstance(cached, list):
+                self._cached_audits.append("safety")
+                return cached
+
         result = self.runner.run(
             ["safety", "check", "--file", str(requirements_file), "--json"],
             timeout=QUALITY_CHECK_LONG_TIMEOUT,
@@ -223,15 +292,34 @@ class SecurityChecker(QualityChecker):
                     ),
                     default=-1,
                 )
-                if json_start != -1:
-                    return json.loads(result.stdout[json_start:])  # type: ignore[no-any-return]
-                return json.loads(result.stdout)  # type: ignore[no-any-return]
+                vulnerabilities = json.loads(result.stdout[max(json_start, 0) :])
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse safety output: {e}")
                 logger.debug(f"Safety output: {result.stdout[:200]}")
+            else:
+                if key is not None and isinstance(vulnerabilities, list):
+                    self.audit_cache.set("safety", key, vulnerabilities)
+                return vulnerabilities  # type: ignore[no-any-return]
 
         return []
 
+    def _audit_key(self, language: str, version_command: list[str]) -> str | None:
+        """Get the audit cache key for the project's dependency files.
+
+        Args:
+            language: Language whose manifests and lockfiles the audit reads
+            version_command: Command printing the audit tool's version
+
+        Returns:
+            Cache key, or None if the cache is disabled or the tool is unavailable
+        """
+        if not self.audit_cache.enabled:
+            return None
+        version = get_command_version(version_command, self.project_root)
+        if version == "unavailable":
+            return None
+        return self.audit_cache.key(get_dependency_files(self.project_root, language), version)
+
     def _scan_javascript(self) -> dict[str, Any]:
         """Run JavaScript/TypeScript security scans (npm audit)."""
         results: dict[str, Any] = {"vulnerabilities": [], "by_severity": {}}
@@ -241,21 +329,30 @@ class SecurityChecker(QualityChecker):
             logger.debug("No package.json found, skipping npm audit")
             return results
 
-        audit_result = self.runner.run(
-            ["npm", "audit", "--json"], timeout=QUALITY_CHECK_LONG_TIMEOUT
-        )
-
-        if audit_result.success and audit_result.stdout:
-            try:
-                audit_data = json.loads(audit_result.stdout)
-                results["npm_audit"] = audit_data
+        key = self._audit_key("javascript", ["npm", "--version"])
+        audit_data = self.audit_cache.get("npm-audit", key) if key is not None else None
+        if isinstance(audit_data, dict):
+            self._cached_audits.append("npm-audit")
+        else:
+            audit_data = None
+            audit_result = self.runner.run(
+                ["npm", "audit", "--json"], timeout=QUALITY_CHECK_LONG_TIMEOUT
+            )
+            if audit_result.success and audit_result.stdout:
+                try:
+                    audit_data = json.loads(audit_result.stdout)
+                except json.JSONDecodeError:
+                    logger.warning("Failed to parse npm audit output")
+                else:
+                    if key is not None and isinstance(audit_data, dict):
+                        self.audit_cache.set("npm-audit", key, audit_data)
 
-                # Count by severity
-                for vuln in audit_data.get("vulnerabilities", {}).values():
-                    severity = vuln.get("severity", "low").upper()
-                    results["by_severity"][severity] = results["by_severity"].get(severity, 0) + 1
+        if isinstance(audit_data, dict):
+            results["npm_audit"] = audit_data
 
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse npm audit output")
+            # Count by severity
+            for vuln in audit_data.get("vulnerabilities", {}).values():
+                severity = vuln.get("severity", "low").upper()
+                results["by_severity"][severity] = results["by_severity"].get(severity, 0) + 1
 
         return results
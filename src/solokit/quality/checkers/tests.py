@@ -8,17 +8,23 @@ Runs tests using pytest, Jest, or other test frameworks and validates coverage.
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any, Union, cast
 
-from solokit.core.command_runner import CommandRunner
-from solokit.core.constants import TEST_RUNNER_TIMEOUT
+from solokit.core.command_runner import CommandRunner, StreamOptions
+from solokit.core.constants import SESSION_DIR_NAME, TEST_RUNNER_TIMEOUT, get_logs_dir
 from solokit.core.logging_config import get_logger
 from solokit.quality.checkers.base import CheckResult, QualityChecker
+from solokit.quality.test_impact import DEFAULT_FULL_RUN_EVERY, ImpactPlan, TestImpactAnalyzer
+from solokit.quality.test_sharding import ShardedTestRunner
 
 logger = get_logger(__name__)
 
+# Full output of the last test gate run, kept under .session/logs/
+TEST_LOG_FILE = "tests.log"
+
 
 class ExecutionChecker(QualityChecker):
     """Test execution and coverage validation."""
@@ -29,6 +35,7 @@ class ExecutionChecker(QualityChecker):
         project_root: Path | None = None,
         language: str | None = None,
         runner: CommandRunner | None = None,
+        impact_analysis: bool | None = None,
     ):
         """Initialize test runner.
 
@@ -37,12 +44,15 @@ class ExecutionChecker(QualityChecker):
             project_root: Project root directory
             language: Programming language (python, javascript, typescript)
             runner: Optional CommandRunner instance (for testing)
+            impact_analysis: Run only tests impacted by changes (True) or force a
+                full run (False), overriding config
         """
         super().__init__(config, project_root)
         self.runner = (
             runner if runner is not None else CommandRunner(default_timeout=TEST_RUNNER_TIMEOUT)
         )
         self.language = language or self._detect_language()
+        self.impact_analysis = impact_analysis
 
     def name(self) -> str:
         """Return checker name."""
@@ -104,8 +114,33 @@ class ExecutionChecker(QualityChecker):
                 command_parts[0] = str(venv_scripts)
                 logger.debug(f"Using venv executable: {venv_scripts}")
 
-        # Run tests
-        result = self.runner.run(command_parts, timeout=TEST_RUNNER_TIMEOUT)
+        # Select impacted tests only, when test impact analysis is on
+        analyzer = self._impact_analyzer()
+        plan: ImpactPlan | None = None
+        if analyzer is not None:
+            plan = analyzer.plan(command_parts, force_full=self.impact_analysis is False)
+            command_parts = plan.command
+            if plan.impacted and not plan.selected:
+                analyzer.record(plan, passed=True)
+                return CheckResult(
+                    checker_name=self.name(),
+                    passed=True,
+                    status="skipped",
+                    errors=[],
+                    warnings=[],
+                    info={"reason": "no impacted tests", "test_impact": plan.summary()},
+                    execution_time=time.time() - start_time,
+                )
+
+        # Run tests, streaming output so large suites don't accumulate in memory
+        stream = self._stream_options()
+        workers = self._worker_count()
+        if workers > 1 and self.language == "python":
+            result = ShardedTestRunner(
+                self.project_root, workers, runner=self.runner, log_file=stream.log_file
+            ).run(command_parts, timeout=TEST_RUNNER_TIMEOUT, stream=stream)
+        else:
+            result = self.runner.run(command_parts, timeout=TEST_RUNNER_TIMEOUT, stream=stream)
 
         # pytest exit codes:
         # 0 = all tests passed
@@ -144,9 +179,13 @@ class ExecutionChecker(QualityChecker):
                 execution_time=execution_time,
             )
 
-        # Parse coverage
-        coverage = self._parse_coverage()
         passed = result.returncode == 0
+        if analyzer is not None and plan is not None:
+            analyzer.record(plan, passed=passed)
+
+        # Coverage of a subset of the tests says nothing about the threshold
+        impacted = plan is not None and plan.impacted
+        coverage = None if impacted else self._parse_coverage()
 
         # Check coverage threshold
         threshold = self.config.get("coverage_threshold", 80)
@@ -178,10 +217,39 @@ class ExecutionChecker(QualityChecker):
                 "threshold": threshold,
                 "returncode": result.returncode,
                 "output": result.stdout[:1000] if result.stdout else "",  # Limit output
+                "log_file": str(result.log_file) if result.log_file else None,
+                **({"test_impact": plan.summary()} if plan is not None else {}),
             },
             execution_time=execution_time,
         )
 
+    def _worker_count(self) -> int:
+        """Number of parallel test workers (config ``workers``; 0 means one per CPU)."""
+        workers = int(self.config.get("workers", 1))
+        return (os.cpu_count() or 1) if workers == 0 else workers
+
+    def _impact_analyzer(self) -> TestImpactAnalyzer | None:
+        """Get the test impact analyzer if impact analysis is on for this run."""
+        enabled = self.config.get("impact_analysis", False)
+        if self.impact_analysis is not None:
+            # --incremental turns selection on; --full forces a full run that refreshes the map
+            enabled = enabled or self.impact_analysis
+        if not enabled:
+            return None
+        return TestImpactAnalyzer(
+            self.project_root,
+            self.language,
+            full_run_every=self.config.get("full_run_every", DEFAULT_FULL_RUN_EVERY),
+            runner=self.runner,
+        )
+
+    def _stream_options(self) -> StreamOptions:
+        """Streaming capture for the test command, logging full output when possible."""
+        log_file = None
+        if (self.project_root / SESSION_DIR_NAME).is_dir():
+            log_file = get_logs_dir(self.project_root) / TEST_LOG_FILE
+        return StreamOptions(log_file=log_file, label="tests")
+
     def _parse_coverage(self) -> float | None:
         """Parse coverage from test results."""
         try:
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+In-process docstring checker.
+
+Finds public modules, classes and functions without docstrings by parsing Python
+files with ``ast``, without spawning pydocstyle or needing a project virtualenv.
+Results are cached per file in .session/cache/docstrings.json, keyed by a hash of
+the file's contents, so only files edited since the last check are parsed again.
+Large batches of changed files are parsed across worker processes.
+
+Public follows pydocstyle's conventions: names not starting with an underscore,
+plus methods like ``__init__`` and ``__eq__`` in public classes (D105/D107),
+limited to ``__all__`` when a module defines it, excluding functions nested in
+functions, ``@overload`` stubs and property setters/deleters. Like pydocstyle's
+default ``--match``, files named ``test_*.py`` are not checked, and like grep
+rules, dependency directories and git-ignored files are skipped.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Union
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import GIT_LONG_TIMEOUT, SESSION_DIR_NAME, get_cache_dir
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+from solokit.quality.gate_cache import is_cache_disabled_by_env
+from solokit.quality.grep_engine import IGNORED_SEARCH_DIRS
+
+logger = get_logger(__name__)
+
+DOCSTRING_CACHE_FILE = "docstrings.json"
+
+# Bump when the rules change so cached results are recomputed
+DOCSTRING_CACHE_SCHEMA_VERSION = 2
+
+# Below this many files to parse, worker process startup costs more than it saves
+# (spawning a worker takes about as long as parsing a few hundred files)
+PROCESS_POOL_MIN_FILES = 500
+
+# Files parsed per worker task
+FILES_PER_TASK = 16
+
+# Default number of worker processes
+DEFAULT_MAX_WORKERS = 4
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+@dataclass
+class DocstringIssue:
+    """A public definition without a docstring.
+
+    Attributes:
+        path: File path relative to the project root
+        line: Line of the definition (1 for modules)
+        kind: "module", "class", "function" or "method"
+        name: Qualified name of the definition (empty for modules)
+    """
+
+    path: str
+    line: int
+    kind: str
+    name: str = ""
+
+    def __str__(self) -> str:
+        if self.kind == "module":
+            return f"{self.path}:{self.line}: public module has no docstring"
+        return f"{self.path}:{self.line}: public {self.kind} '{self.name}' has no docstring"
+
+
+@dataclass
+class DocstringScan:
+    """Result of a docstring check over a project.
+
+    Attributes:
+        issues: Missing docstrings, ordered by path and line
+        files_checked: Number of Python files checked
+        files_parsed: Number of files parsed (the rest came from the cache)
+    """
+
+    issues: list[DocstringIssue] = field(default_factory=list)
+    files_checked: int = 0
+    files_parsed: int = 0
+
+
+def _public_names(tree: ast.Module) -> set[str] | None:
+    """Names listed in a literal module-level __all__, or None if not defined."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            targets = [node.target]
+        else:
+            continue
+        if not any(isinstance(target, ast.Name) and target.id == "__all__" for target in targets):
+            continue
+        if isinstance(node.value, (ast.List, ast.Tuple)):
+            return {
+                element.value
+                for element in node.value.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            }
+        # A computed __all__ can't be resolved statically; treat names as usual
+        return None
+    return None
+
+
+def _has_public_name(node: FunctionNode | ast.ClassDef, in_class: bool) -> bool:
+    """Whether a definition's name is public (dunder methods are, like in pydocstyle)."""
+    name = node.name
+    if not name.startswith("_"):
+        return True
+    is_method = in_class and not isinstance(node, ast.ClassDef)
+    return is_method and name.startswith("__") and name.endswith("__")
+
+
+def _is_exempt_function(node: FunctionNode) -> bool:
+    """Whether a function needs no docstring of its own (overloads, setters, deleters)."""
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        # e.g. "overload", "typing.overload", "value.setter"
+        if ast.unparse(target).split(".")[-1] in ("overload", "setter", "deleter"):
+            return True
+    return False
+
+
+def find_missing_docstrings(source: str | bytes, path: str) -> list[DocstringIssue]:
+    """
+    Find public definitions without docstrings in Python source.
+
+    Args:
+        source: Python source code
+        path: File path reported in the issues
+
+    Returns:
+        Missing docstrings, in source order
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = ast.parse(source, filename=path)
+    issues: list[DocstringIssue] = []
+
+    stem = Path(path).stem
+    module_public = not stem.startswith("_") or stem == "__init__"
+    if module_public and tree.body and ast.get_docstring(tree) is None:
+        issues.append(DocstringIssue(path, 1, "module"))
+
+    exported = _public_names(tree)
+
+    def visit(body: list[ast.stmt], prefix: str, in_class: bool) -> None:
+        for node in body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+            if not _has_public_name(node, in_class):
+                continue
+            if not prefix and exported is not None and node.name not in exported:
+                continue
+            qualified = f"{prefix}{node.name}"
+            if isinstance(node, ast.ClassDef):
+                if ast.get_docstring(node) is None:
+                    issues.append(DocstringIssue(path, node.lineno, "class", qualified))
+                visit(node.body, f"{qualified}.", in_class=True)
+            elif not _is_exempt_function(node) and ast.get_docstring(node) is None:
+                kind = "method" if in_class else "function"
+                issues.append(DocstringIssue(path, node.lineno, kind, qualified))
+            # Functions nested in functions are never public, so they aren't visited
+
+    if module_public:
+        visit(tree.body, "", in_class=False)
+    return issues
+
+
+def _check_sources(batch: list[tuple[str, bytes]]) -> list[list[tuple[int, str, str]]]:
+    """Check a batch of (path, source) pairs (runs in worker processes)."""
+    results = []
+    for path, source in batch:
+        try:
+            issues = find_missing_docstrings(source, path)
+        except (SyntaxError, ValueError) as e:
+            # Unparseable files are the linting gate's concern
+            logger.debug(f"Cannot parse {path} for docstrings: {e}")
+            issues = []
+        results.append([(issue.line, issue.kind, issue.name) for issue in issues])
+    return results
+
+
+class DocstringScanner:
+    """Checks a project's Python files for missing docstrings with per-file caching."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        enabled: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        runner: CommandRunner | None = None,
+    ):
+        """
+        Initialize docstring scanner.
+
+        Args:
+            project_root: Project root directory
+            enabled: Whether cached per-file results may be used
+            max_workers: Maximum number of worker processes for large batches
+            runner: Optional CommandRunner for git (for testing)
+        """
+        self.project_root = project_root
+        self._enabled = enabled
+        self.max_workers = max(1, max_workers)
+        self.runner = runner or CommandRunner(
+            default_timeout=GIT_LONG_TIMEOUT, working_dir=project_root
+        )
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether the per-file cache is active (requires an initialized project)."""
+        return (
+            self._enabled
+            and not is_cache_disabled_by_env()
+            and (self.project_root / SESSION_DIR_NAME).is_dir()
+        )
+
+    def _cache_file(self) -> Path:
+        return get_cache_dir(self.project_root) / DOCSTRING_CACHE_FILE
+
+    def scan(self) -> DocstringScan:
+        """
+        Check every Python file in the project.
+
+        Returns:
+            DocstringScan with the missing docstrings and file counts
+        """
+        cache_enabled = self.cache_enabled
+        cached = self._load_cache() if cache_enabled else {}
+
+        entries: dict[str, dict[str, Any]] = {}
+        to_parse: list[tuple[str, str, bytes]] = []
+        for path in self.python_files():
+            try:
+                source = (self.project_root / path).read_bytes()
+            except OSError as e:
+                logger.debug(f"Cannot read {path}: {e}")
+                continue
+            digest = hashlib.sha256(source).hexdigest()
+            entry = cached.get(path)
+            if isinstance(entry, dict) and entry.get("hash") == digest:
+                entries[path] = entry
+            else:
+                to_parse.append((path, digest, source))
+
+        parsed = self._check([(path, source) for path, _, source in to_parse])
+        for (path, digest, _), found in zip(to_parse, parsed):
+            entries[path] = {"hash": digest, "issues": found}
+
+        if cache_enabled and to_parse:
+            # Rewriting the whole map also drops files that no longer exist
+            self._save_cache(entries)
+
+        issues = [
+            DocstringIssue(path, int(line), str(kind), str(name))
+            for path in sorted(entries)
+            for line, kind, name in entries[path].get("issues", [])
+        ]
+        return DocstringScan(issues, files_checked=len(entries), files_parsed=len(to_parse))
+
+    def python_files(self) -> list[str]:
+        """List the project's Python files to check, relative to the project root."""
+        result = self.runner.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*.py"],
+            working_dir=self.project_root,
+        )
+        if result.success:
+            candidates = [path for path in result.stdout.split("\0") if path]
+        else:
+            # Not a git repository: walk the tree, pruning dependency directories
+            candidates = []
+            for current, dirnames, filenames in os.walk(self.project_root):
+                dirnames[:] = sorted(name for name in dirnames if name not in IGNORED_SEARCH_DIRS)
+                base = Path(current).relative_to(self.project_root)
+                candidates.extend(
+                    (base / name).as_posix() for name in filenames if name.endswith(".py")
+                )
+
+        files = []
+        for path in sorted(set(candidates)):
+            parts = Path(path).parts
+            if parts[-1].startswith("test_") or any(part in IGNORED_SEARCH_DIRS for part in parts):
+                continue
+            # Tracked files deleted from the working tree are still listed by git
+            if (self.project_root / path).is_file():
+                files.append(path)
+        return files
+
+    def _check(self, sources: list[tuple[str, bytes]]) -> list[list[tuple[int, str, str]]]:
+        """Check sources, across worker processes for large batches."""
+        if len(sources) < PROCESS_POOL_MIN_FILES or self.max_workers == 1:
+            return _check_sources(sources)
+
+        batches = [sources[i : i + FILES_PER_TASK] for i in range(0, len(sources), FILES_PER_TASK)]
+        workers = min(self.max_workers, len(batches))
+        try:
+            # Gates run on scheduler threads, and forking a threaded process can deadlock
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.debug(f"Process pool unavailable, checking docstrings serially: {e}")
+            return _check_sources(sources)
+
+        with executor:
+            results = []
+            for batch_result in executor.map(_check_sources, batches):
+                results.extend(batch_result)
+        return results
+
+    def _load_cache(self) -> dict[str, Any]:
+        cache_file = self._cache_file()
+        if not cache_file.exists():
+            return {}
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable docstring cache {cache_file}: {e}")
+            return {}
+        if data.get("schema_version") != DOCSTRING_CACHE_SCHEMA_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self, entries: dict[str, dict[str, Any]]) -> None:
+        cache_file = self._cache_file()
+        data = {"schema_version": DOCSTRING_CACHE_SCHEMA_VERSION, "files": entries}
+        save_cache_json(cache_file, data)
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Quality gate result cache.
+
+Gate results are cached under .session/cache/gates/ keyed by a fingerprint of
+everything that can change them: the project's working tree (tracked files plus
+non-ignored untracked files, hashed with git into a tree object), the versions
+of the tools a gate runs, the gate configuration and any gate-specific inputs.
+When nothing changed since a gate last passed, the cached result is returned
+instead of re-running the gate.
+
+Only passing results are cached: failures are often environmental (timeouts,
+missing tools, network) and fixing them changes the tree anyway.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from solokit.__version__ import __version__
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import (
+    GIT_LONG_TIMEOUT,
+    QUALITY_CHECK_QUICK_TIMEOUT,
+    SESSION_DIR_NAME,
+    get_cache_dir,
+)
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when fingerprint inputs or stored results change shape
+GATE_CACHE_SCHEMA_VERSION = 1
+
+# Setting this environment variable to any non-empty value disables the cache
+GATE_CACHE_DISABLE_ENV = "SOLOKIT_NO_GATE_CACHE"
+
+# Fingerprints kept per gate (e.g. switching back and forth between branches)
+MAX_ENTRIES_PER_GATE = 8
+
+# Gate outputs and session state that must not invalidate the fingerprint
+FINGERPRINT_EXCLUDES = (
+    SESSION_DIR_NAME,
+    ".coverage",
+    "coverage.json",
+    "coverage.xml",
+    "htmlcov",
+    "junit.xml",
+    ".pytest_cache",
+)
+
+# Launchers whose tool version is pinned by the project's lockfile (part of the tree)
+LOCKFILE_LAUNCHERS = frozenset({"npx", "pnpx", "npm", "yarn", "pnpm"})
+
+
+def is_cache_disabled_by_env() -> bool:
+    """Check whether the gate cache is disabled through the environment."""
+    return bool(os.environ.get(GATE_CACHE_DISABLE_ENV))
+
+
+def compute_tree_hash(project_root: Path, runner: CommandRunner | None = None) -> str | None:
+    """
+    Hash the project's working tree with git, without touching the real index.
+
+    Stages tracked and non-ignored untracked files into a temporary copy of the
+    index and writes it as a tree object. Copying the index keeps git's stat
+    cache, so unchanged files are not re-read.
+
+    Args:
+        project_root: Project root directory
+        runner: Optional CommandRunner instance (for testing)
+
+    Returns:
+        Tree object SHA, or None if the project is not a git repository
+    """
+    runner = runner or CommandRunner(default_timeout=GIT_LONG_TIMEOUT, working_dir=project_root)
+
+    index = runner.run(["git", "rev-parse", "--git-path", "index"])
+    if not index.success or not index.stdout.strip():
+        return None
+    index_path = Path(index.stdout.strip())
+    if not index_path.is_absolute():
+        index_path = project_root / index_path
+
+    with tempfile.TemporaryDirectory(prefix="solokit-gate-index-") as temp_dir:
+        temp_index = Path(temp_dir) / "index"
+        if index_path.exists():
+            shutil.copyfile(index_path, temp_index)
+        env = {**os.environ, "GIT_INDEX_FILE": str(temp_index)}
+
+        excludes = [f":(exclude){path}" for path in FINGERPRINT_EXCLUDES]
+        added = runner.run(["git", "add", "-A", "--", ".", *excludes], env=env)
+        removed = runner.run(
+            ["git", "rm", "-r", "-q", "--cached", "--ignore-unmatch", "--", *FINGERPRINT_EXCLUDES],
+            env=env,
+        )
+        if not added.success or not removed.success:
+            logger.debug(f"Could not stage working tree for gate fingerprint: {added.stderr}")
+            return None
+
+        tree = runner.run(["git", "write-tree"], env=env)
+        if not tree.success or not tree.stdout.strip():
+            return None
+        return tree.stdout.strip()
+
+
+def _version_command(command: str) -> list[str] | None:
+    """Build the command that reports the version of a gate command's tool."""
+    try:
+        parts = shlex.split(command)
+    except ValueError:
+        return None
+    if not parts or Path(parts[0]).name in LOCKFILE_LAUNCHERS:
+        return None
+    if len(parts) > 2 and parts[1] == "-m":
+        return [*parts[:3], "--version"]
+    return [parts[0], "--version"]
+
+
+@lru_cache(maxsize=64)
+def _probe_version(version_command: tuple[str, ...], project_root: str) -> str:
+    """Run a version command once per process and return its first output line."""
+    runner = CommandRunner(
+        default_timeout=QUALITY_CHECK_QUICK_TIMEOUT, working_dir=Path(project_root)
+    )
+    result = runner.run(list(version_command))
+    if not result.success:
+        return "unavailable"
+    lines = (result.stdout or result.stderr).strip().splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def get_tool_version(command: str, project_root: Path) -> str | None:
+    """
+    Get the version of the tool a gate command runs.
+
+    Args:
+        command: Gate command (e.g. "ruff check .")
+        project_root: Project root directory
+
+    Returns:
+        First line of the tool's --version output, "unavailable" if the tool could
+        not be run, or None if the version is pinned by the project's lockfile
+    """
+    version_command = _version_command(command)
+    if version_command is None:
+        return None
+    return get_command_version(version_command, project_root)
+
+
+def get_command_version(version_command: Sequence[str], project_root: Path) -> str:
+    """
+    Run a version command once per process.
+
+    Args:
+        version_command: Command printing a version (e.g. ["npm", "--version"])
+        project_root: Project root directory
+
+    Returns:
+        First line of the command's output, or "unavailable" if it could not be run
+    """
+    return _probe_version(tuple(version_command), str(project_root))
+
+
+class CacheEntryStore:
+    """Per-name JSON files of cache entries keyed by input fingerprints.
+
+    Each name (a gate, an audit tool) gets one file under the cache
+    subdirectory holding its most recent entries, oldest first.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        subdirectory: str,
+        schema_version: int,
+        max_entries: int,
+        enabled: bool = True,
+    ):
+        """
+        Initialize cache entry store.
+
+        Args:
+            project_root: Project root directory
+            subdirectory: Directory under .session/cache/ holding the entry files
+            schema_version: Version of the stored entries; other versions are ignored
+            max_entries: Entries kept per name
+            enabled: Whether cached entries may be used (False for --no-gate-cache)
+        """
+        self.project_root = project_root
+        self.subdirectory = subdirectory
+        self.schema_version = schema_version
+        self.max_entries = max_entries
+        self._enabled = enabled
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is active (requires an initialized project)."""
+        return (
+            self._enabled
+            and not is_cache_disabled_by_env()
+            and (self.project_root / SESSION_DIR_NAME).is_dir()
+        )
+
+    def _cache_file(self, name: str) -> Path:
+        return get_cache_dir(self.project_root) / self.subdirectory / f"{name}.json"
+
+    def get(
+        self, name: str, key: str, max_age_seconds: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Look up a cache entry.
+
+        Args:
+            name: Entry file name (e.g. gate or audit tool)
+            key: Fingerprint of the inputs
+            max_age_seconds: Ignore entries older than this (None: no limit)
+
+        Returns:
+            The stored entry with its "cached_at" timestamp, or None on a miss
+        """
+        with self._lock:
+            entry = self._load_entries(name).get(key)
+        if not isinstance(entry, dict):
+            return None
+        if max_age_seconds is not None:
+            try:
+                cached_at = datetime.fromisoformat(entry.get("cached_at", ""))
+            except (TypeError, ValueError):
+                return None
+            if (datetime.now() - cached_at).total_seconds() > max_age_seconds:
+                return None
+        return entry
+
+    def set(self, name: str, key: str, entry: dict[str, Any]) -> None:
+        """
+        Store a cache entry, evicting the oldest beyond max_entries.
+
+        Args:
+            name: Entry file name
+            key: Fingerprint of the inputs the entry was produced from
+            entry: JSON-serializable entry (a "cached_at" timestamp is added)
+        """
+        with self._lock:
+            entries = self._load_entries(name)
+            entries.pop(key, None)
+            entries[key] = {**entry, "cached_at": datetime.now().isoformat()}
+            # Entries are kept in insertion order; drop the oldest beyond the limit
+            for stale in list(entries)[: -self.max_entries]:
+                del entries[stale]
+            self._save_entries(name, entries)
+
+    def _load_entries(self, name: str) -> dict[str, Any]:
+        cache_file = self._cache_file(name)
+        if not cache_file.exists():
+            return {}
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return {}
+        if data.get("schema_version") != self.schema_version:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_entries(self, name: str, entries: dict[str, Any]) -> None:
+        cache_file = self._cache_file(name)
+        data = {"schema_version": self.schema_version, "entries": entries}
+        save_cache_json(cache_file, data, indent=2)
+
+
+class GateResultCache:
+    """Disk cache of passing quality gate results keyed by input fingerprints."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        enabled: bool = True,
+        runner: CommandRunner | None = None,
+    ):
+        """
+        Initialize gate result cache.
+
+        Args:
+            project_root: Project root directory
+            enabled: Whether cached results may be used (False for --no-gate-cache)
+            runner: Optional CommandRunner for git operations (for testing)
+        """
+        self.project_root = project_root
+        self.store = CacheEntryStore(
+            project_root, "gates", GATE_CACHE_SCHEMA_VERSION, MAX_ENTRIES_PER_GATE, enabled
+        )
+        self.runner = runner or CommandRunner(
+            default_timeout=GIT_LONG_TIMEOUT, working_dir=project_root
+        )
+        self._lock = threading.Lock()
+        # Working tree hash shared by the gates of one run, recomputed only after
+        # a gate rewrote files; the generation counts rewrites started and ended
+        self._tree_hash: str | None = None
+        self._tree_hash_lock = threading.Lock()
+        self._tree_generation = 0
+        self._tree_writers = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is active (requires an initialized project)."""
+        return self.store.enabled
+
+    def fingerprint(
+        self,
+        gate: str,
+        config: dict[str, Any],
+        commands: Sequence[str] = (),
+        extra: dict[str, Any] | None = None,
+    ) -> str | None:
+        """
+        Compute the fingerprint of a gate's inputs.
+
+        Args:
+            gate: Gate name
+            config: Effective gate configuration
+            commands: Commands the gate runs (their tool versions are included)
+            extra: Other gate-specific inputs (language, base commit, HEAD, ...)
+
+        Returns:
+            Hex SHA-256 fingerprint, or None if the working tree cannot be hashed
+        """
+        tree_hash = self.tree_hash()
+        if tree_hash is None:
+            return None
+
+        inputs = {
+            "schema_version": GATE_CACHE_SCHEMA_VERSION,
+            "solokit_version": __version__,
+            "gate": gate,
+            "tree": tree_hash,
+            "config": config,
+            "tools": {
+                command: get_tool_version(command, self.project_root) for command in commands
+            },
+            "extra": extra or {},
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def tree_hash(self) -> str | None:
+        """
+        Hash the working tree once and share it until files are rewritten.
+
+        Returns:
+            Tree object SHA, or None if the working tree cannot be hashed
+        """
+        with self._tree_hash_lock:
+            if self._tree_hash is None:
+                generation = self.tree_generation
+                tree_hash = compute_tree_hash(self.project_root, self.runner)
+                if self.tree_unchanged_since(generation):
+                    self._tree_hash = tree_hash
+                return tree_hash
+            return self._tree_hash
+
+    @property
+    def tree_generation(self) -> int:
+        """Counter advanced whenever a gate starts or stops rewriting files."""
+        with self._lock:
+            return self._tree_generation
+
+    def tree_unchanged_since(self, generation: int) -> bool:
+        """
+        Check that no gate rewrote files since ``generation`` was read.
+
+        Args:
+            generation: Value of tree_generation read earlier
+
+        Returns:
+            True if no rewrite started, ended or is still running since then
+        """
+        with self._lock:
+            return generation == self._tree_generation and not self._tree_writers
+
+    def tree_changed(self) -> None:
+        """Drop the shared tree hash, e.g. after files were changed outside a gate."""
+        with self._lock:
+            self._tree_generation += 1
+            self._tree_hash = None
+
+    @contextmanager
+    def rewriting_tree(self) -> Iterator[None]:
+        """Mark a gate that may rewrite files (auto-fix) as running."""
+        with self._lock:
+            self._tree_writers += 1
+            self._tree_generation += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._tree_writers -= 1
+            self.tree_changed()
+
+    def get(
+        self, gate: str, fingerprint: str, max_age_seconds: float | None = None
+    ) -> tuple[bool, dict[str, Any]] | None:
+        """
+        Look up a cached gate result.
+
+        Args:
+            gate: Gate name
+            fingerprint: Fingerprint from fingerprint()
+            max_age_seconds: Ignore entries older than this (None: no limit)
+
+        Returns:
+            (passed, results) with results marked "cached", or None on miss
+        """
+        entry = self.store.get(gate, fingerprint, max_age_seconds)
+        if entry is None or not isinstance(entry.get("results"), dict):
+            return None
+
+        results = copy.deepcopy(entry["results"])
+        results["cached"] = True
+        results["cached_at"] = entry.get("cached_at", "")
+        return bool(entry.get("passed")), results
+
+    def set(self, gate: str, fingerprint: str, passed: bool, results: dict[str, Any]) -> None:
+        """
+        Store a gate result (only passing results are kept).
+
+        Args:
+            gate: Gate name
+            fingerprint: Fingerprint of the inputs the result was produced from
+            passed: Whether the gate passed
+            results: Gate results dict
+        """
+        if passed:
+            self.store.set(gate, fingerprint, {"passed": passed, "results": results})
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Historical quality gate timings.
+
+Every quality gate run by ``sk end`` appends one line per gate to the append-only
+.session/tracking/gate_timings.jsonl: how long the gate took, whether it passed
+or came from the gate cache, the session number, the versions of the tools it
+ran and how many files it checked. The history feeds ``sk perf gates`` (p50/p95
+per gate), slow-gate regression warnings in the gate report, and the scheduler,
+which starts historically slow gates first.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from solokit.core.constants import SESSION_DIR_NAME, get_tracking_dir
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GATE_TIMINGS_FILE = "gate_timings.jsonl"
+
+# Sessions of history used for statistics and regression baselines
+DEFAULT_HISTORY_SESSIONS = 10
+
+# Warn when a gate takes this many times its median duration (0 disables)
+DEFAULT_REGRESSION_THRESHOLD = 2.0
+
+# Gates faster than this are never reported as regressed (noise dominates)
+MIN_REGRESSION_SECONDS = 5.0
+
+# Past runs needed before a gate's median is trusted as a baseline
+MIN_BASELINE_RUNS = 3
+
+
+@dataclass
+class GateTiming:
+    """One quality gate run.
+
+    Attributes:
+        gate: Gate name (e.g. "linting")
+        duration_seconds: Wall-clock time the gate took
+        passed: Whether the gate passed
+        cached: Whether the result came from the gate cache (no real work done)
+        session: Session number the gate ran in
+        recorded_at: ISO timestamp of the run
+        tool_versions: Versions of the tools the gate ran, keyed by command
+        files_checked: Number of files checked, when the gate reports it
+    """
+
+    gate: str
+    duration_seconds: float
+    passed: bool
+    cached: bool = False
+    session: int | None = None
+    recorded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    tool_versions: dict[str, str] = field(default_factory=dict)
+    files_checked: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+
+@dataclass
+class GateStats:
+    """Timing statistics of a gate over recent sessions.
+
+    Attributes:
+        gate: Gate name
+        runs: Number of (uncached) runs included
+        p50: Median duration in seconds
+        p95: 95th percentile duration in seconds
+        last: Duration of the most recent run in seconds
+    """
+
+    gate: str
+    runs: int
+    p50: float
+    p95: float
+    last: float
+
+
+@dataclass
+class GateRegression:
+    """A gate that ran much slower than its history.
+
+    Attributes:
+        gate: Gate name
+        duration_seconds: Duration of this run
+        baseline_seconds: Median duration over recent sessions
+    """
+
+    gate: str
+    duration_seconds: float
+    baseline_seconds: float
+
+    @property
+    def factor(self) -> float:
+        """How many times slower than the baseline this run was."""
+        return self.duration_seconds / self.baseline_seconds
+
+
+def get_gate_timings_file(project_root: Path) -> Path:
+    """Path of the gate timing history file."""
+    return get_tracking_dir(project_root) / GATE_TIMINGS_FILE
+
+
+def record_gate_timings(project_root: Path, timings: Iterable[GateTiming]) -> None:
+    """
+    Append gate timings to the history (only in initialized projects).
+
+    Args:
+        project_root: Project root directory
+        timings: Gate runs to record
+    """
+    if not (project_root / SESSION_DIR_NAME).is_dir():
+        return
+    lines = "".join(json.dumps(timing.to_dict(), default=str) + "\n" for timing in timings)
+    if not lines:
+        return
+    timings_file = get_gate_timings_file(project_root)
+    try:
+        timings_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(timings_file, "a", encoding="utf-8") as f:
+            f.write(lines)
+    except OSError as e:
+        # Timing history is diagnostic; never fail a session over it
+        logger.debug(f"Failed to record gate timings in {timings_file}: {e}")
+
+
+def load_gate_timings(project_root: Path) -> list[GateTiming]:
+    """
+    Load the gate timing history, oldest first.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Recorded gate runs (unreadable lines are skipped)
+    """
+    timings_file = get_gate_timings_file(project_root)
+    if not timings_file.exists():
+        return []
+    try:
+        lines = timings_file.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        logger.debug(f"Cannot read gate timings from {timings_file}: {e}")
+        return []
+
+    timings = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            timings.append(
+                GateTiming(
+                    gate=str(data["gate"]),
+                    duration_seconds=float(data["duration_seconds"]),
+                    passed=bool(data.get("passed", False)),
+                    cached=bool(data.get("cached", False)),
+                    session=data.get("session"),
+                    recorded_at=str(data.get("recorded_at", "")),
+                    tool_versions=dict(data.get("tool_versions") or {}),
+                    files_checked=data.get("files_checked"),
+                )
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping malformed gate timing line: {e}")
+    return timings
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Percentile of values with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (non-empty)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The interpolated percentile
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def recent_timings(
+    timings: Sequence[GateTiming], sessions: int = DEFAULT_HISTORY_SESSIONS
+) -> list[GateTiming]:
+    """
+    Select uncached runs from the most recent sessions.
+
+    Cached results did no work, so they are excluded. Runs without a session
+    number only count when no session numbers are recorded at all.
+
+    Args:
+        timings: Gate timing history, oldest first
+        sessions: Number of most recent sessions to include
+
+    Returns:
+        Uncached runs from the last ``sessions`` sessions, oldest first
+    """
+    real = [timing for timing in timings if not timing.cached]
+    numbered = sorted({timing.session for timing in real if timing.session is not None})
+    if not numbered:
+        return real
+    keep = set(numbered[-sessions:]) if sessions > 0 else set()
+    return [timing for timing in real if timing.session in keep]
+
+
+def summarize_gate_timings(
+    timings: Sequence[GateTiming], sessions: int = DEFAULT_HISTORY_SESSIONS
+) -> list[GateStats]:
+    """
+    Compute per-gate timing statistics over recent sessions.
+
+    Args:
+        timings: Gate timing history, oldest first
+        sessions: Number of most recent sessions to include
+
+    Returns:
+        Statistics per gate, slowest median first
+    """
+    durations: dict[str, list[float]] = {}
+    for timing in recent_timings(timings, sessions):
+        durations.setdefault(timing.gate, []).append(timing.duration_seconds)
+
+    stats = [
+        GateStats(
+            gate=gate,
+            runs=len(values),
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            last=values[-1],
+        )
+        for gate, values in durations.items()
+    ]
+    return sorted(stats, key=lambda stat: stat.p50, reverse=True)
+
+
+def expected_gate_durations(
+    project_root: Path, sessions: int = DEFAULT_HISTORY_SESSIONS
+) -> dict[str, float]:
+    """
+    Median duration of each gate over recent sessions (for scheduling).
+
+    Args:
+        project_root: Project root directory
+        sessions: Number of most recent sessions to include
+
+    Returns:
+        Median seconds keyed by gate name (gates without history are absent)
+    """
+    stats = summarize_gate_timings(load_gate_timings(project_root), sessions)
+    return {stat.gate: stat.p50 for stat in stats}
+
+
+def detect_regressions(
+    history: Sequence[GateTiming],
+    current: Sequence[GateTiming],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    sessions: int = DEFAULT_HISTORY_SESSIONS,
+) -> list[GateRegression]:
+    """
+    Find gates in the current run that are much slower than their history.
+
+    Args:
+        history: Gate timing history before the current run, oldest first
+        current: Gate runs of the current session
+        threshold: Report gates slower than this multiple of their median (0 disables)
+        sessions: Number of most recent sessions forming the baseline
+
+    Returns:
+        Regressed gates, in current run order
+    """
+    if threshold <= 0:
+        return []
+
+    baseline: dict[str, list[float]] = {}
+    for timing in recent_timings(history, sessions):
+        baseline.setdefault(timing.gate, []).append(timing.duration_seconds)
+
+    regressions = []
+    for timing in current:
+        past = baseline.get(timing.gate, [])
+        if timing.cached or len(past) < MIN_BASELINE_RUNS:
+            continue
+        median = percentile(past, 50)
+        if (
+            timing.duration_seconds >= MIN_REGRESSION_SECONDS
+            and median > 0
+            and timing.duration_seconds > median * threshold
+        ):
+            regressions.append(GateRegression(timing.gate, timing.duration_seconds, median))
+    return regressions
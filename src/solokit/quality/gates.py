@@ -17,17 +17,20 @@ Updated to use modular checker architecture while maintaining backward compatibi
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
 
 from solokit.core.command_runner import CommandRunner
 from solokit.core.config import get_config_manager
-from solokit.core.constants import QUALITY_CHECK_VERY_LONG_TIMEOUT
+from solokit.core.constants import GIT_QUICK_TIMEOUT, QUALITY_CHECK_VERY_LONG_TIMEOUT
 from solokit.core.error_handlers import log_errors
 from solokit.core.exceptions import (
     FileOperationError,
 )
 from solokit.core.logging_config import get_logger
+from solokit.quality.audit_cache import DependencyAuditCache
 from solokit.quality.checkers import (
     CustomValidationChecker,
     DocumentationChecker,
@@ -37,11 +40,18 @@ from solokit.quality.checkers import (
     SecurityChecker,
     SpecCompletenessChecker,
 )
+from solokit.quality.docstrings import DocstringScanner
+from solokit.quality.gate_cache import GateResultCache, get_tool_version
+from solokit.quality.gate_timings import GateRegression
+from solokit.quality.incremental import IncrementalScope, resolve_incremental_scope
 from solokit.quality.reporters import ConsoleReporter
 from solokit.quality.results import ResultAggregator
 
 logger = get_logger(__name__)
 
+# Advisory databases change independently of the project, so cached scans expire
+SECURITY_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
 # Import spec validator for spec completeness quality gate
 try:
     from solokit.core.exceptions import SpecValidationError
@@ -51,6 +61,57 @@ except ImportError:
     SpecValidationError = None  # type: ignore[assignment, misc]
 
 
+def _incremental_summary(info: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract the incremental-run details from a checker's info dict.
+
+    Returns:
+        Dict with incremental, files_checked and full_run_reason, or None if the
+        gate was not asked to run incrementally
+    """
+    if "incremental" not in info:
+        return None
+    return {
+        "incremental": info["incremental"],
+        "files_checked": info.get("files_checked"),
+        "full_run_reason": info.get("full_run_reason"),
+    }
+
+
+def _incremental_report_line(gate_results: dict[str, Any]) -> str | None:
+    """Format the incremental-run line for a gate in the report, if any."""
+    summary = gate_results.get("incremental")
+    if not summary:
+        return None
+    if summary.get("incremental"):
+        return f"  Incremental: {summary.get('files_checked', 0)} changed file(s) checked"
+    return f"  Full run: {summary.get('full_run_reason')}"
+
+
+def _test_impact_report_line(test_results: dict[str, Any]) -> str | None:
+    """Format the test selection line for the tests gate in the report, if any."""
+    summary = test_results.get("test_impact")
+    if not summary:
+        return None
+    if summary.get("impacted"):
+        return (
+            f"  Impacted tests: {summary.get('selected', 0)} test file(s) selected, "
+            f"{summary.get('skipped', 0)} skipped"
+        )
+    return f"  Full run: {summary.get('full_run_reason')}"
+
+
+def _scope_key(scope: IncrementalScope | None) -> dict[str, Any] | None:
+    """Fingerprint input describing which files an incremental gate checks."""
+    if scope is None:
+        return None
+    return {"base_ref": scope.base_ref, "full_run_reason": scope.full_run_reason}
+
+
+def _cached_suffix(gate_results: dict[str, Any]) -> str:
+    """Marker appended to a gate's report status when its result came from the cache."""
+    return " (cached)" if gate_results.get("cached") else ""
+
+
 class QualityGates:
     """Quality gate validation using modular checker architecture.
 
@@ -58,8 +119,21 @@ class QualityGates:
     while delegating to specialized checker classes internally.
     """
 
-    def __init__(self, config_path: Path | None = None):
-        """Initialize quality gates with configuration."""
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        incremental: bool | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize quality gates with configuration.
+
+        Args:
+            config_path: Path to config file (defaults to .session/config.json)
+            incremental: Force changed-files-only (True) or full (False) runs for
+                linting, formatting and security, overriding per-gate config
+            use_cache: Reuse passing results of gates whose inputs are unchanged
+                (False for --no-gate-cache)
+        """
         if config_path is None:
             config_path = Path(".session/config.json")
         self._config_path = config_path
@@ -79,6 +153,16 @@ class QualityGates:
         self.aggregator = ResultAggregator()
         self.reporter = ConsoleReporter()
 
+        # Changed-file scope shared by incremental gates (resolved once, on first use)
+        self.incremental = incremental
+        self._incremental_scope: IncrementalScope | None = None
+        self._scope_lock = threading.Lock()
+
+        # Passing results keyed by working tree, tool versions and gate config
+        self.cache = GateResultCache(self.project_root, enabled=use_cache)
+        # Commands each gate ran, for the tool versions recorded with gate timings
+        self._gate_commands: dict[str, list[str]] = {}
+
     @log_errors()
     def _load_full_config(self) -> dict[str, Any]:
         """Load full configuration file for optional sections (context7, custom_validations, etc.)."""
@@ -102,6 +186,108 @@ class QualityGates:
                 ) from e
         return {}
 
+    def _get_incremental_scope(self, enabled: bool) -> IncrementalScope | None:
+        """Get the shared changed-file scope if a gate runs incrementally.
+
+        Args:
+            enabled: Whether the gate is configured for incremental runs
+
+        Returns:
+            IncrementalScope, or None if the gate runs on the whole project
+        """
+        if not (self.incremental if self.incremental is not None else enabled):
+            return None
+        with self._scope_lock:
+            if self._incremental_scope is None:
+                self._incremental_scope = resolve_incremental_scope(self.project_root)
+            return self._incremental_scope
+
+    def _run_cached(
+        self,
+        gate: str,
+        run: Callable[[], tuple[bool, dict[str, Any]]],
+        config: dict[str, Any],
+        commands: Sequence[str] = (),
+        extra: dict[str, Any] | None = None,
+        writes_files: bool = False,
+        max_age_seconds: float | None = None,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Run a gate, reusing its cached result when the inputs are unchanged.
+
+        Args:
+            gate: Gate name (cache key)
+            run: Callable that runs the gate and returns (passed, results)
+            config: Effective gate configuration
+            commands: Commands the gate runs (their tool versions are fingerprinted)
+            extra: Other inputs that affect the result
+            writes_files: Whether the gate may rewrite files (auto-fix); its result
+                is stored for the tree it leaves behind
+            max_age_seconds: Ignore cached results older than this
+
+        Returns:
+            (passed: bool, results: dict)
+        """
+        self._gate_commands[gate] = [command for command in commands if command]
+        if not config.get("enabled", True) or not self.cache.enabled:
+            return run()
+
+        # The working tree is hashed once and shared by all gates of this run
+        generation = self.cache.tree_generation
+        fingerprint = self.cache.fingerprint(gate, config, commands, extra)
+        if fingerprint is None:
+            return run()
+
+        cached = self.cache.get(gate, fingerprint, max_age_seconds)
+        if cached is not None:
+            logger.info(f"Using cached result for {gate} quality gate")
+            return cached
+
+        if writes_files:
+            # Store the result for the tree the gate leaves behind (rehashed once)
+            with self.cache.rewriting_tree():
+                passed, results = run()
+            after = self.cache.fingerprint(gate, config, commands, extra)
+            if after is not None:
+                self.cache.set(gate, after, passed, results)
+            return passed, results
+
+        passed, results = run()
+
+        # Only store results that match the tree they were produced from; another
+        # gate (e.g. auto-format) may have rewritten files while this one ran
+        if self.cache.tree_unchanged_since(generation):
+            self.cache.set(gate, fingerprint, passed, results)
+        return passed, results
+
+    def gate_tool_versions(self, gate: str) -> dict[str, str]:
+        """Get the versions of the tools a gate ran.
+
+        Args:
+            gate: Gate name
+
+        Returns:
+            Tool version keyed by command (tools pinned by a lockfile are omitted)
+        """
+        versions = {}
+        for command in self._gate_commands.get(gate, []):
+            version = get_tool_version(command, self.project_root)
+            if version is not None:
+                versions[command] = version
+        return versions
+
+    def _git_head_state(self) -> dict[str, str]:
+        """Current branch and commits that history-based checks depend on."""
+        runner = CommandRunner(default_timeout=GIT_QUICK_TIMEOUT, working_dir=self.project_root)
+        state = {}
+        for key, command in (
+            ("branch", ["git", "rev-parse", "--abbrev-ref", "HEAD"]),
+            ("head", ["git", "rev-parse", "HEAD"]),
+            ("main", ["git", "rev-parse", "--verify", "-q", "main"]),
+        ):
+            result = runner.run(command)
+            state[key] = result.stdout.strip() if result.success else ""
+        return state
+
     def _detect_language(self) -> str:
         """Detect primary project language."""
         # Check for common files
@@ -132,34 +318,53 @@ class QualityGates:
             "enabled": self.config.test_execution.enabled,
             "commands": self.config.test_execution.commands,
             "coverage_threshold": self.config.test_execution.coverage_threshold,
+            "impact_analysis": self.config.test_execution.impact_analysis,
+            "full_run_every": self.config.test_execution.full_run_every,
+            "workers": self.config.test_execution.workers,
         }
 
-        # Create and run test checker (pass runner for test compatibility)
-        checker = ExecutionChecker(
-            test_config, self.project_root, language=language, runner=self.runner
-        )
-        result = checker.run()
-
-        # Convert CheckResult to legacy format
-        # Extract reason from errors if present (for coverage failures)
-        reason = result.info.get("reason")
-        if not reason and result.errors:
-            # Check if any error is about coverage
-            for error in result.errors:
-                if isinstance(error, dict):
-                    msg = error.get("message", "")
-                    if "coverage" in msg.lower() and "threshold" in msg.lower():
-                        reason = msg
-                        break
+        def run() -> tuple[bool, dict[str, Any]]:
+            # Create and run test checker (pass runner for test compatibility)
+            checker = ExecutionChecker(
+                test_config,
+                self.project_root,
+                language=language,
+                runner=self.runner,
+                impact_analysis=self.incremental,
+            )
+            result = checker.run()
+
+            # Convert CheckResult to legacy format
+            # Extract reason from errors if present (for coverage failures)
+            reason = result.info.get("reason")
+            if not reason and result.errors:
+                # Check if any error is about coverage
+                for error in result.errors:
+                    if isinstance(error, dict):
+                        msg = error.get("message", "")
+                        if "coverage" in msg.lower() and "threshold" in msg.lower():
+                            reason = msg
+                            break
+
+            return result.passed, {
+                "status": result.status,
+                "coverage": result.info.get("coverage"),
+                "returncode": result.info.get("returncode", 0),
+                "output": result.info.get("output", ""),
+                "errors": "\n".join(str(e) for e in result.errors) if result.errors else "",
+                "reason": reason,
+                "log_file": result.info.get("log_file"),
+                "test_impact": result.info.get("test_impact"),
+            }
 
-        return result.passed, {
-            "status": result.status,
-            "coverage": result.info.get("coverage"),
-            "returncode": result.info.get("returncode", 0),
-            "output": result.info.get("output", ""),
-            "errors": "\n".join(str(e) for e in result.errors) if result.errors else "",
-            "reason": reason,
-        }
+        cache_language = language or self._detect_language()
+        return self._run_cached(
+            "tests",
+            run,
+            test_config,
+            commands=[self.config.test_execution.commands.get(cache_language, "")],
+            extra={"language": cache_language, "impact_analysis": self.incremental},
+        )
 
     def run_security_scan(self, language: str | None = None) -> tuple[bool, dict[str, Any]]:
         """
@@ -178,19 +383,38 @@ class QualityGates:
             "enabled": self.config.security.enabled,
             "fail_on": self.config.security.fail_on,
         }
+        scope = self._get_incremental_scope(self.config.security.incremental)
+
+        def run() -> tuple[bool, dict[str, Any]]:
+            # Create and run security checker (pass runner for test compatibility)
+            checker = SecurityChecker(
+                security_config,
+                self.project_root,
+                language=language,
+                runner=self.runner,
+                incremental=scope is not None,
+                incremental_scope=scope,
+                audit_cache=DependencyAuditCache(self.project_root, enabled=self.cache.enabled),
+            )
+            result = checker.run()
+
+            # Convert CheckResult to legacy format
+            return result.passed, {
+                "status": result.status,
+                "vulnerabilities": result.errors,
+                "by_severity": result.info.get("by_severity", {}),
+                "incremental": _incremental_summary(result.info),
+            }
 
-        # Create and run security checker (pass runner for test compatibility)
-        checker = SecurityChecker(
-            security_config, self.project_root, language=language, runner=self.runner
+        cache_language = language or self._detect_language()
+        return self._run_cached(
+            "security",
+            run,
+            security_config,
+            commands=["bandit", "safety"] if cache_language == "python" else ["npm"],
+            extra={"language": cache_language, "scope": _scope_key(scope)},
+            max_age_seconds=SECURITY_CACHE_MAX_AGE_SECONDS,
         )
-        result = checker.run()
-
-        # Convert CheckResult to legacy format
-        return result.passed, {
-            "status": result.status,
-            "vulnerabilities": result.errors,
-            "by_severity": result.info.get("by_severity", {}),
-        }
 
     def run_linting(
         self, language: str | None = None, auto_fix: bool | None = None
@@ -212,26 +436,43 @@ class QualityGates:
             "commands": self.config.linting.commands,
             "auto_fix": self.config.linting.auto_fix,
             "required": self.config.linting.required,
+            "daemon": self.config.linting.daemon,
         }
+        scope = self._get_incremental_scope(self.config.linting.incremental)
+
+        def run() -> tuple[bool, dict[str, Any]]:
+            # Create and run linting checker (pass runner for test compatibility)
+            checker = LintingChecker(
+                linting_config,
+                self.project_root,
+                language=language,
+                auto_fix=auto_fix,
+                runner=self.runner,
+                incremental=scope is not None,
+                incremental_scope=scope,
+            )
+            result = checker.run()
+
+            # Convert CheckResult to legacy format
+            return result.passed, {
+                "status": result.status,
+                "issues_found": result.info.get("issues_found", 0),
+                "output": result.info.get("output", ""),
+                "fixed": result.info.get("auto_fixed", False),
+                "reason": result.info.get("reason"),
+                "incremental": _incremental_summary(result.info),
+            }
 
-        # Create and run linting checker (pass runner for test compatibility)
-        checker = LintingChecker(
-            linting_config,
-            self.project_root,
-            language=language,
-            auto_fix=auto_fix,
-            runner=self.runner,
+        fix = self.config.linting.auto_fix if auto_fix is None else auto_fix
+        cache_language = language or self._detect_language()
+        return self._run_cached(
+            "linting",
+            run,
+            {**linting_config, "auto_fix": fix},
+            commands=[self.config.linting.commands.get(cache_language, "")],
+            extra={"language": cache_language, "scope": _scope_key(scope)},
+            writes_files=fix,
         )
-        result = checker.run()
-
-        # Convert CheckResult to legacy format
-        return result.passed, {
-            "status": result.status,
-            "issues_found": result.info.get("issues_found", 0),
-            "output": result.info.get("output", ""),
-            "fixed": result.info.get("auto_fixed", False),
-            "reason": result.info.get("reason"),
-        }
 
     def run_formatting(
         self, language: str | None = None, auto_fix: bool | None = None
@@ -254,23 +495,39 @@ class QualityGates:
             "auto_fix": self.config.formatting.auto_fix,
             "required": self.config.formatting.required,
         }
+        scope = self._get_incremental_scope(self.config.formatting.incremental)
+
+        def run() -> tuple[bool, dict[str, Any]]:
+            # Create and run formatting checker (pass runner for test compatibility)
+            checker = FormattingChecker(
+                formatting_config,
+                self.project_root,
+                language=language,
+                auto_fix=auto_fix,
+                runner=self.runner,
+                incremental=scope is not None,
+                incremental_scope=scope,
+            )
+            result = checker.run()
+
+            # Convert CheckResult to legacy format
+            return result.passed, {
+                "status": result.status,
+                "formatted": result.info.get("formatted", False),
+                "output": result.info.get("output", ""),
+                "incremental": _incremental_summary(result.info),
+            }
 
-        # Create and run formatting checker (pass runner for test compatibility)
-        checker = FormattingChecker(
-            formatting_config,
-            self.project_root,
-            language=language,
-            auto_fix=auto_fix,
-            runner=self.runner,
+        fix = self.config.formatting.auto_fix if auto_fix is None else auto_fix
+        cache_language = language or self._detect_language()
+        return self._run_cached(
+            "formatting",
+            run,
+            {**formatting_config, "auto_fix": fix},
+            commands=[self.config.formatting.commands.get(cache_language, "")],
+            extra={"language": cache_language, "scope": _scope_key(scope)},
+            writes_files=fix,
         )
-        result = checker.run()
-
-        # Convert CheckResult to legacy format
-        return result.passed, {
-            "status": result.status,
-            "formatted": result.info.get("formatted", False),
-            "output": result.info.get("output", ""),
-        }
 
     def validate_documentation(self, work_item: dict | None = None) -> tuple[bool, dict[str, Any]]:
         """Validate documentation requirements.
@@ -288,21 +545,40 @@ class QualityGates:
             "enabled": self.config.documentation.enabled,
             "check_changelog": self.config.documentation.check_changelog,
             "check_docstrings": self.config.documentation.check_docstrings,
+            "docstring_checker": self.config.documentation.docstring_checker,
             "check_readme": self.config.documentation.check_readme,
         }
 
-        # Create and run documentation checker (pass runner for test compatibility)
-        checker = DocumentationChecker(
-            doc_config, self.project_root, work_item=work_item, runner=self.runner
-        )
-        result = checker.run()
+        def run() -> tuple[bool, dict[str, Any]]:
+            # Create and run documentation checker (pass runner for test compatibility)
+            checker = DocumentationChecker(
+                doc_config,
+                self.project_root,
+                work_item=work_item,
+                runner=self.runner,
+                docstring_scanner=DocstringScanner(self.project_root, enabled=self.cache.enabled),
+            )
+            result = checker.run()
+
+            # Convert CheckResult to legacy format
+            return result.passed, {
+                "status": result.status,
+                "checks": result.info.get("checks", []),
+                "passed": result.passed,
+            }
 
-        # Convert CheckResult to legacy format
-        return result.passed, {
-            "status": result.status,
-            "checks": result.info.get("checks", []),
-            "passed": result.passed,
-        }
+        if not self.cache.enabled:
+            return run()
+        # CHANGELOG and README checks inspect commit history, not just the tree
+        return self._run_cached(
+            "documentation",
+            run,
+            doc_config,
+            extra={
+                "work_item": (work_item or {}).get("id"),
+                "git": self._git_head_state(),
+            },
+        )
 
     def validate_spec_completeness(self, work_item: dict) -> tuple[bool, dict[str, Any]]:
         """
@@ -472,15 +748,24 @@ class QualityGates:
     # Report Generation
     # ========================================================================
 
-    def generate_report(self, all_results: dict) -> str:
+    def generate_report(self, all_results: dict, regressions: Sequence[GateRegression] = ()) -> str:
         """Generate comprehensive quality gate report.
 
         Args:
             all_results: Dictionary of results from all quality gates
+            regressions: Gates that ran much slower than in recent sessions
 
         Returns:
             Formatted report string
         """
+        # Gates cancelled by fail-fast never ran; list them separately
+        cancelled = [
+            name for name, results in all_results.items() if results.get("status") == "cancelled"
+        ]
+        all_results = {
+            name: results for name, results in all_results.items() if name not in cancelled
+        }
+
         report = []
         report.append("=" * 60)
         report.append("QUALITY GATE RESULTS")
@@ -489,16 +774,29 @@ class QualityGates:
         # Test results
         if "tests" in all_results:
             test_results = all_results["tests"]
-            status = "✓ PASSED" if test_results.get("status") == "passed" else "✗ FAILED"
-            report.append(f"\nTests: {status}")
+            if test_results.get("status") == "passed":
+                status = "✓ PASSED"
+            elif test_results.get("status") == "skipped":
+                status = "⊘ SKIPPED"
+            else:
+                status = "✗ FAILED"
+            report.append(f"\nTests: {status}{_cached_suffix(test_results)}")
+            impact_line = _test_impact_report_line(test_results)
+            if impact_line:
+                report.append(impact_line)
             if test_results.get("coverage"):
                 report.append(f"  Coverage: {test_results['coverage']}%")
+            if test_results.get("status") == "failed" and test_results.get("log_file"):
+                report.append(f"  Full output: {test_results['log_file']}")
 
         # Security results
         if "security" in all_results:
             sec_results = all_results["security"]
             status = "✓ PASSED" if sec_results.get("status") == "passed" else "✗ FAILED"
-            report.append(f"\nSecurity: {status}")
+            report.append(f"\nSecurity: {status}{_cached_suffix(sec_results)}")
+            incremental_line = _incremental_report_line(sec_results)
+            if incremental_line:
+                report.append(incremental_line)
             if sec_results.get("by_severity"):
                 for severity, count in sec_results["by_severity"].items():
                     report.append(f"  {severity}: {count}")
@@ -512,8 +810,12 @@ class QualityGates:
                 status = "⊘ SKIPPED"
             else:
                 status = "✗ FAILED"
-            report.append(f"\nLinting: {status}")
-            if lint_results.get("fixed"):
+            report.append(f"\nLinting: {status}{_cached_suffix(lint_results)}")
+            incremental_line = _incremental_report_line(lint_results)
+            if incremental_line:
+                report.append(incremental_line)
+            # A cached result's fix was applied by an earlier run
+            if lint_results.get("fixed") and not lint_results.get("cached"):
                 report.append("  Auto-fix applied")
 
         # Formatting results
@@ -525,18 +827,27 @@ class QualityGates:
                 status = "⊘ SKIPPED"
             else:
                 status = "✗ FAILED"
-            report.append(f"\nFormatting: {status}")
-            if fmt_results.get("formatted"):
+            report.append(f"\nFormatting: {status}{_cached_suffix(fmt_results)}")
+            incremental_line = _incremental_report_line(fmt_results)
+            if incremental_line:
+                report.append(incremental_line)
+            # A cached result's fix was applied by an earlier run
+            if fmt_results.get("formatted") and not fmt_results.get("cached"):
                 report.append("  Auto-format applied")
 
         # Documentation results
         if "documentation" in all_results:
             doc_results = all_results["documentation"]
             status = "✓ PASSED" if doc_results.get("status") == "passed" else "✗ FAILED"
-            report.append(f"\nDocumentation: {status}")
+            report.append(f"\nDocumentation: {status}{_cached_suffix(doc_results)}")
             for check in doc_results.get("checks", []):
                 check_status = "✓" if check["passed"] else "✗"
                 report.append(f"  {check_status} {check['name']}")
+                locations = check.get("locations", [])
+                for location in locations:
+                    report.append(f"    {location}")
+                if check.get("missing", 0) > len(locations):
+                    report.append(f"    ... and {check['missing'] - len(locations)} more")
 
         # Context7 results
         if "context7" in all_results:
@@ -562,6 +873,20 @@ class QualityGates:
                 required_mark = " (required)" if validation["required"] else ""
                 report.append(f"  {val_status} {validation['name']}{required_mark}")
 
+        if cancelled:
+            report.append("\nCancelled after a required gate failed (fail-fast):")
+            for name in cancelled:
+                report.append(f"  {name.title()}: ⊘ CANCELLED")
+
+        if regressions:
+            report.append("\n⚠ Slow gates (compared with recent sessions):")
+            for regression in regressions:
+                report.append(
+                    f"  {regression.gate}: {regression.duration_seconds:.1f}s "
+                    f"(median {regression.baseline_seconds:.1f}s, {regression.factor:.1f}x slower)"
+                )
+            report.append("  Run 'sk perf gates' for timing history")
+
         report.append("\n" + "=" * 60)
 
         return "\n".join(report)
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+In-process grep engine for custom validation rules.
+
+Evaluates ``grep -r PATTERN PATH`` style queries without spawning grep. Patterns
+use grep's default syntax (POSIX basic regular expressions with GNU extensions)
+and are translated to Python regular expressions once. The project tree is walked
+a single time for all queries, pruning dependency and tool directories and
+skipping files ignored by git, and every file is read once and checked against
+all queries that cover it on a thread pool.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import string
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import GIT_LONG_TIMEOUT
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Directories never searched while walking (searched only when named explicitly)
+IGNORED_SEARCH_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
+# Files read per thread pool task
+FILES_PER_TASK = 32
+
+# POSIX character classes and their Python character set equivalents
+POSIX_CLASSES = {
+    "alpha": "a-zA-Z",
+    "digit": "0-9",
+    "alnum": "a-zA-Z0-9",
+    "upper": "A-Z",
+    "lower": "a-z",
+    "space": " \\t\\n\\r\\f\\v",
+    "blank": " \\t",
+    "xdigit": "0-9A-Fa-f",
+    "punct": "".join(f"\\{char}" for char in string.punctuation),
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "print": "\\x20-\\x7e",
+    "graph": "\\x21-\\x7e",
+}
+
+# Characters that must be escaped inside a Python character set
+_SET_SPECIAL = set("\\]^[&~|")
+
+
+@dataclass
+class GrepQuery:
+    """A grep validation: does PATTERN match any line under PATHS?
+
+    Attributes:
+        pattern: grep (basic regular expression) pattern
+        paths: Files or directories to search, relative to the project root
+    """
+
+    pattern: str
+    paths: Sequence[str] = (".",)
+
+
+def _translate_bracket(pattern: str, start: int) -> tuple[str, int]:
+    """Translate the bracket expression starting at pattern[start] ("[").
+
+    Returns:
+        (Python character set, index after the closing "]")
+
+    Raises:
+        re.error: If the bracket expression is unterminated or invalid
+    """
+    index = start + 1
+    negate = index < len(pattern) and pattern[index] == "^"
+    if negate:
+        index += 1
+
+    items: list[str] = []
+    first = True
+    while True:
+        if index >= len(pattern):
+            raise re.error("unmatched [", pattern, start)
+        char = pattern[index]
+        if char == "]" and not first:
+            index += 1
+            break
+        if char == "[" and index + 1 < len(pattern) and pattern[index + 1] in ":.=":
+            kind = pattern[index + 1]
+            close = pattern.find(f"{kind}]", index + 2)
+            if close == -1:
+                raise re.error("unmatched [", pattern, index)
+            name = pattern[index + 2 : close]
+            if kind == ":":
+                if name not in POSIX_CLASSES:
+                    raise re.error(f"invalid character class {name}", pattern, index)
+                items.append(POSIX_CLASSES[name])
+            else:
+                # Collating symbols and equivalence classes: the characters themselves
+                items.extend(f"\\{c}" if c in _SET_SPECIAL else c for c in name)
+            index = close + 2
+        elif char == "-":
+            # A range operator between two characters; a literal at either end
+            is_range = not first and index + 1 < len(pattern) and pattern[index + 1] != "]"
+            items.append("-" if is_range else "\\-")
+            index += 1
+        else:
+            # Backslash is an ordinary character inside POSIX brackets
+            items.append(f"\\{char}" if char in _SET_SPECIAL else char)
+            index += 1
+        first = False
+
+    return f"[{'^' if negate else ''}{''.join(items)}]", index
+
+
+def _translate_bre(pattern: str) -> str:
+    """Translate one GNU basic regular expression to Python syntax."""
+    out: list[str] = []
+    index = 0
+    # At the start of an expression "^" anchors and "*" is a literal
+    at_start = True
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if index + 1 >= len(pattern):
+                raise re.error("trailing backslash", pattern, index)
+            escaped = pattern[index + 1]
+            index += 2
+            if escaped in "(|":
+                out.append(escaped)
+                at_start = True
+                continue
+            if escaped in "){}+?":
+                out.append(escaped)
+            elif escaped in "<>":
+                out.append("\\b")
+            elif escaped == "`":
+                out.append("^")
+            elif escaped == "'":
+                out.append("$")
+            elif escaped in "wWsSbB" or escaped.isdigit():
+                out.append(f"\\{escaped}")
+            else:
+                out.append(re.escape(escaped))
+            at_start = False
+            continue
+
+        index += 1
+        if char == "[":
+            translated, index = _translate_bracket(pattern, index - 1)
+            out.append(translated)
+        elif char == "^" and at_start:
+            out.append("^")
+            continue
+        elif char == "*":
+            out.append("\\*" if at_start else "*")
+        elif char == "$":
+            rest = pattern[index:]
+            at_end = not rest or rest.startswith("\\)") or rest.startswith("\\|")
+            out.append("$" if at_end else "\\$")
+        elif char == ".":
+            out.append(".")
+        else:
+            out.append(re.escape(char))
+        at_start = False
+    return "".join(out)
+
+
+def translate_grep_pattern(pattern: str) -> str:
+    """
+    Translate a grep pattern to a Python regular expression.
+
+    Handles grep's default syntax (POSIX basic regular expressions with GNU
+    extensions such as ``\\|``, ``\\+``, ``\\?``, ``\\<``/``\\>`` and ``\\w``).
+    Like grep, a pattern containing newlines matches any of its lines.
+
+    Args:
+        pattern: grep pattern
+
+    Returns:
+        Equivalent Python regular expression
+
+    Raises:
+        re.error: If grep would reject the pattern
+    """
+    parts = [_translate_bre(part) for part in pattern.split("\n")]
+    if len(parts) == 1:
+        return parts[0]
+    return "|".join(f"(?:{part})" for part in parts)
+
+
+def _matches(regex: re.Pattern[str], text: str) -> bool:
+    """Check whether any line of text matches (grep's line-by-line semantics)."""
+    if not text:
+        return False
+    # A final newline terminates the last line rather than starting an empty one
+    if text.endswith("\n"):
+        text = text[:-1]
+    match = regex.search(text)
+    if match is None:
+        # Every per-line match is also a match in the whole text
+        return False
+    if "\n" not in match.group():
+        return True
+    # The match spans lines (e.g. through a negated set); check line by line
+    return any(regex.search(line) for line in text.split("\n"))
+
+
+class GrepEngine:
+    """Evaluates many grep queries with one tree walk and one read per file."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        max_workers: int | None = None,
+        runner: CommandRunner | None = None,
+    ):
+        """
+        Initialize grep engine.
+
+        Args:
+            project_root: Project root directory (relative query paths resolve here)
+            max_workers: Thread pool size (None: ThreadPoolExecutor's default)
+            runner: Optional CommandRunner for git (for testing)
+        """
+        self.project_root = project_root
+        self.max_workers = max_workers
+        self.runner = runner or CommandRunner(
+            default_timeout=GIT_LONG_TIMEOUT, working_dir=project_root
+        )
+
+    def search(self, queries: Sequence[GrepQuery]) -> list[bool]:
+        """
+        Evaluate grep queries.
+
+        A query matches like ``grep -r PATTERN PATH`` exiting 0: some line of some
+        searched file matches. Invalid patterns and missing paths don't match.
+
+        Args:
+            queries: Queries to evaluate
+
+        Returns:
+            Whether each query matched, in query order
+        """
+        results = [False] * len(queries)
+        regexes: dict[int, re.Pattern[str]] = {}
+        for position, query in enumerate(queries):
+            try:
+                regexes[position] = re.compile(translate_grep_pattern(query.pattern), re.MULTILINE)
+            except re.error as e:
+                logger.warning(f"Invalid grep pattern {query.pattern!r}: {e}")
+
+        root = self.project_root.resolve()
+        # (all walked files, files not ignored by git), relative to the root; walked once
+        tree: tuple[list[str], list[str]] | None = None
+        files_by_query: dict[int, set[Path]] = {}
+        for position in regexes:
+            files: set[Path] = set()
+            for raw_path in queries[position].paths:
+                target = (root / raw_path).resolve()
+                if target.is_file():
+                    files.add(target)
+                    continue
+                if not target.is_dir():
+                    logger.warning(f"Grep path not found: {raw_path}")
+                    continue
+                relative = self._relative_to_root(target)
+                if relative is None or any(part in IGNORED_SEARCH_DIRS for part in relative.parts):
+                    # Outside the walked tree: an explicitly named directory is searched
+                    files.update(self._walk(target))
+                    continue
+                if tree is None:
+                    walked = [path.relative_to(root).as_posix() for path in self._walk(root)]
+                    tree = (walked, self._filter_ignored(walked))
+                walked, visible = tree
+                under = _under(visible, relative)
+                if not under and relative != Path("."):
+                    # An explicitly named directory is searched even if git ignores it
+                    under = _under(walked, relative)
+                files.update(root / path for path in under)
+            files_by_query[position] = files
+
+        queries_by_file: dict[Path, list[int]] = {}
+        for position, files in files_by_query.items():
+            for path in files:
+                queries_by_file.setdefault(path, []).append(position)
+        if not queries_by_file:
+            return results
+
+        matched: set[int] = set()
+
+        def scan(batch: list[tuple[Path, list[int]]]) -> None:
+            for path, positions in batch:
+                pending = [position for position in positions if position not in matched]
+                if not pending:
+                    continue
+                try:
+                    text = path.read_bytes().decode("utf-8", "surrogateescape")
+                except OSError as e:
+                    logger.debug(f"Cannot read {path}: {e}")
+                    continue
+                for position in pending:
+                    if _matches(regexes[position], text):
+                        matched.add(position)
+
+        items = sorted(queries_by_file.items())
+        batches = [items[i : i + FILES_PER_TASK] for i in range(0, len(items), FILES_PER_TASK)]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="grep") as pool:
+            list(pool.map(scan, batches))
+
+        for position in matched:
+            results[position] = True
+        return results
+
+    def _relative_to_root(self, path: Path) -> Path | None:
+        try:
+            return path.relative_to(self.project_root.resolve())
+        except ValueError:
+            return None
+
+    def _walk(self, directory: Path) -> list[Path]:
+        """List files under a directory, pruning ignored directories and symlinks."""
+        files = []
+        for current, dirnames, filenames in os.walk(directory):
+            dirnames[:] = sorted(name for name in dirnames if name not in IGNORED_SEARCH_DIRS)
+            base = Path(current)
+            for name in filenames:
+                path = base / name
+                # grep -r does not follow symlinks found while recursing
+                if not path.is_symlink():
+                    files.append(path)
+        return files
+
+    def _filter_ignored(self, files: list[str]) -> list[str]:
+        """Drop files git ignores (.gitignore, .git/info/exclude, global excludes)."""
+        result = self.runner.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            working_dir=self.project_root,
+        )
+        if not result.success:
+            # Not a git repository: only directory pruning applies
+            return files
+        listed = set(result.stdout.split("\0"))
+        return [path for path in files if path in listed]
+
+
+def _under(files: list[str], directory: Path) -> list[str]:
+    """Select the files inside a directory (relative paths; "." is everything)."""
+    if directory == Path("."):
+        return files
+    prefix = f"{directory.as_posix()}/"
+    return [path for path in files if path.startswith(prefix)]
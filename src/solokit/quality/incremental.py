@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Incremental (changed-files-only) scope for quality gates.
+
+Computes the set of files changed since a base commit so linting, formatting and
+security gates can check only those paths instead of the whole project. The base
+is the merge-base with the work item's parent branch when working on a work item
+branch, otherwise the last commit that passed all quality gates. Any situation
+where the changed set cannot be trusted (no base, git failure, tool or gate
+configuration changed) falls back to a full run.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import (
+    GIT_QUICK_TIMEOUT,
+    SESSION_DIR_NAME,
+    STATUS_UPDATE_FILE,
+    get_cache_dir,
+    get_tracking_dir,
+    get_work_items_file,
+)
+from solokit.core.file_ops import ensure_session_directory, load_json
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GATE_STATE_FILE = "gate_state.json"
+
+# Files whose changes can alter tool results for unchanged files
+CONFIG_FILE_NAMES = frozenset(
+    {
+        "pyproject.toml",
+        "setup.cfg",
+        "tox.ini",
+        "ruff.toml",
+        ".ruff.toml",
+        ".flake8",
+        ".pylintrc",
+        "pylintrc",
+        ".bandit",
+        ".isort.cfg",
+        "package.json",
+        "tsconfig.json",
+        ".eslintignore",
+        ".prettierignore",
+        ".editorconfig",
+    }
+)
+# Project-relative paths of configuration files matched exactly (gate configuration)
+CONFIG_FILE_PATHS = frozenset({f"{SESSION_DIR_NAME}/config.json"})
+CONFIG_FILE_PREFIXES = (".eslintrc", "eslint.config.", ".prettierrc", "prettier.config.")
+
+# Tools that accept explicit file paths on the command line
+PATH_AWARE_TOOLS = frozenset(
+    {"ruff", "flake8", "pylint", "black", "isort", "autopep8", "yapf", "eslint", "prettier"}
+)
+
+# Tools that ignore their exclude settings for explicit paths unless told otherwise
+FORCE_EXCLUDE_TOOLS = frozenset({"ruff", "black"})
+
+JS_EXTENSIONS = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".mts", ".cts")
+
+LINT_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "python": (".py", ".pyi"),
+    "javascript": JS_EXTENSIONS,
+    "typescript": JS_EXTENSIONS,
+}
+
+FORMAT_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "python": (".py", ".pyi"),
+    "javascript": JS_EXTENSIONS + (".json", ".css", ".scss", ".md", ".html", ".yml", ".yaml"),
+    "typescript": JS_EXTENSIONS + (".json", ".css", ".scss", ".md", ".html", ".yml", ".yaml"),
+}
+
+
+@dataclass
+class IncrementalScope:
+    """Changed files for an incremental quality gate run.
+
+    Attributes:
+        base_ref: Commit the changes are measured against (None on full run)
+        files: Changed file paths relative to the project root
+        full_run_reason: Why an incremental run is not possible (None if it is)
+    """
+
+    base_ref: str | None
+    files: list[str] = field(default_factory=list)
+    full_run_reason: str | None = None
+
+    @property
+    def is_full_run(self) -> bool:
+        """Whether gates must check the whole project."""
+        return self.full_run_reason is not None
+
+
+def is_config_file(path: str) -> bool:
+    """Check whether a changed path is a tool or gate configuration file."""
+    name = Path(path).name
+    return (
+        path in CONFIG_FILE_PATHS
+        or name in CONFIG_FILE_NAMES
+        or name.startswith(CONFIG_FILE_PREFIXES)
+    )
+
+
+def get_gate_state_file(project_root: Path) -> Path:
+    """Get the quality gate state file path."""
+    return get_cache_dir(project_root) / GATE_STATE_FILE
+
+
+def get_last_gated_commit(project_root: Path) -> str | None:
+    """
+    Get the last commit that passed all quality gates.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Commit SHA, or None if no gated commit has been recorded
+    """
+    state_file = get_gate_state_file(project_root)
+    if not state_file.exists():
+        return None
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Ignoring unreadable gate state file: {e}")
+        return None
+    commit = state.get("last_gated_commit")
+    return commit if isinstance(commit, str) and commit else None
+
+
+def record_gated_commit(project_root: Path, runner: CommandRunner | None = None) -> str | None:
+    """
+    Record HEAD as the last commit that passed all quality gates.
+
+    Args:
+        project_root: Project root directory
+        runner: Optional CommandRunner instance (for testing)
+
+    Returns:
+        Recorded commit SHA, or None if nothing was recorded
+    """
+    if not (project_root / SESSION_DIR_NAME).is_dir():
+        return None
+
+    runner = runner or CommandRunner(default_timeout=GIT_QUICK_TIMEOUT, working_dir=project_root)
+    result = runner.run(["git", "rev-parse", "HEAD"])
+    if not result.success or not result.stdout.strip():
+        return None
+
+    commit = result.stdout.strip()
+    state_file = get_gate_state_file(project_root)
+    try:
+        ensure_session_directory(state_file.parent)
+        state_file.write_text(
+            json.dumps(
+                {"last_gated_commit": commit, "recorded_at": datetime.now().isoformat()},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        # Best-effort: without a gated commit the next incremental run falls back to full
+        logger.debug(f"Failed to record gated commit: {e}")
+        return None
+    return commit
+
+
+def _get_parent_branch(project_root: Path) -> str | None:
+    """Get the parent branch of the current session's work item, if any."""
+    status_file = get_tracking_dir(project_root) / STATUS_UPDATE_FILE
+    work_items_file = get_work_items_file(project_root)
+    if not status_file.exists() or not work_items_file.exists():
+        return None
+    try:
+        work_item_id = load_json(status_file).get("current_work_item")
+        work_items = load_json(work_items_file).get("work_items", {})
+    except Exception as e:
+        logger.debug(f"Could not load session state for incremental scope: {e}")
+        return None
+    if not work_item_id or work_item_id not in work_items:
+        return None
+    parent = work_items[work_item_id].get("git", {}).get("parent_branch")
+    return parent if isinstance(parent, str) and parent else None
+
+
+def resolve_base_ref(project_root: Path, runner: CommandRunner) -> str | None:
+    """
+    Resolve the commit that changes should be measured against.
+
+    Args:
+        project_root: Project root directory
+        runner: CommandRunner with project_root as its working directory
+
+    Returns:
+        Base commit SHA, or None if no trustworthy base exists
+    """
+    parent_branch = _get_parent_branch(project_root)
+    if parent_branch:
+        current = runner.run(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+        # On the parent branch itself (direct mode) the merge-base is HEAD, which hides
+        # the session's commits, so use the last gated commit instead
+        if current.success and current.stdout.strip() != parent_branch:
+            merge_base = runner.run(["git", "merge-base", "HEAD", parent_branch])
+            if merge_base.success and merge_base.stdout.strip():
+                return merge_base.stdout.strip()
+
+    last_gated = get_last_gated_commit(project_root)
+    if last_gated:
+        # A rebased or reset history makes the recorded commit meaningless
+        ancestor = runner.run(["git", "merge-base", "--is-ancestor", last_gated, "HEAD"])
+        if ancestor.success:
+            return last_gated
+
+    return None
+
+
+def get_changed_files(base_ref: str, runner: CommandRunner) -> list[str] | None:
+    """
+    List files changed since a base commit, including uncommitted and untracked files.
+
+    Args:
+        base_ref: Base commit
+        runner: CommandRunner with the project root as its working directory
+
+    Returns:
+        Sorted project-relative paths (deleted files excluded), or None if git failed
+    """
+    diff = runner.run(
+        ["git", "diff", "--name-only", "--diff-filter=d", "--relative", "-z", base_ref, "--"]
+    )
+    untracked = runner.run(["git", "ls-files", "--others", "--exclude-standard", "-z"])
+    if not diff.success or not untracked.success:
+        return None
+
+    paths = {path for path in (diff.stdout + "\0" + untracked.stdout).split("\0") if path}
+    return sorted(paths)
+
+
+def resolve_incremental_scope(
+    project_root: Path, runner: CommandRunner | None = None
+) -> IncrementalScope:
+    """
+    Compute the changed-file scope for incremental quality gates.
+
+    Args:
+        project_root: Project root directory
+        runner: Optional CommandRunner instance (for testing)
+
+    Returns:
+        IncrementalScope; is_full_run is True when gates must check everything
+    """
+    runner = runner or CommandRunner(default_timeout=GIT_QUICK_TIMEOUT, working_dir=project_root)
+
+    base_ref = resolve_base_ref(project_root, runner)
+    if base_ref is None:
+        return IncrementalScope(None, full_run_reason="no parent branch or gated commit")
+
+    files = get_changed_files(base_ref, runner)
+    if files is None:
+        return IncrementalScope(base_ref, full_run_reason="could not list changed files")
+
+    changed_config = [path for path in files if is_config_file(path)]
+    if changed_config:
+        return IncrementalScope(
+            base_ref, files, full_run_reason=f"configuration changed: {changed_config[0]}"
+        )
+
+    logger.debug(f"Incremental scope: {len(files)} changed file(s) since {base_ref[:8]}")
+    return IncrementalScope(base_ref, files)
+
+
+def _tool_index(command_parts: Sequence[str]) -> int:
+    """Index of the tool name in a command (skipping npx-style launchers)."""
+    if len(command_parts) > 1 and Path(command_parts[0]).name in ("npx", "pnpx"):
+        return 1
+    return 0
+
+
+def scope_command(
+    command_parts: list[str],
+    scope: IncrementalScope,
+    extensions: Sequence[str],
+    project_root: Path,
+) -> tuple[list[str], dict[str, Any]]:
+    """
+    Restrict a gate command to the changed files in scope.
+
+    Trailing directory arguments (e.g. "." or "src tests") are replaced with the
+    changed files beneath them, so the command keeps its original reach.
+
+    Args:
+        command_parts: Gate command split into arguments
+        scope: Incremental scope from resolve_incremental_scope
+        extensions: File extensions the tool checks
+        project_root: Project root directory
+
+    Returns:
+        (command, info). The command is unchanged on a full run and empty when
+        there are no changed files to check. info describes the scope for reports.
+    """
+    if scope.is_full_run:
+        return command_parts, {"incremental": False, "full_run_reason": scope.full_run_reason}
+
+    tool_index = _tool_index(command_parts)
+    tool = Path(command_parts[tool_index]).name
+    if tool not in PATH_AWARE_TOOLS:
+        return command_parts, {
+            "incremental": False,
+            "full_run_reason": f"{tool} does not accept file paths",
+        }
+
+    parts = list(command_parts)
+    targets: list[Path] = []
+    while len(parts) > tool_index + 1 and (parts[-1] == "." or (project_root / parts[-1]).is_dir()):
+        targets.append((project_root / parts.pop()).resolve())
+    if not targets:
+        targets = [project_root.resolve()]
+
+    files = []
+    for path in scope.files:
+        full_path = (project_root / path).resolve()
+        if not path.endswith(tuple(extensions)) or not full_path.is_file():
+            continue
+        if any(full_path == target or target in full_path.parents for target in targets):
+            files.append(path)
+
+    info = {"incremental": True, "base_ref": scope.base_ref, "files_checked": len(files)}
+    if not files:
+        return [], info
+
+    if tool in FORCE_EXCLUDE_TOOLS and "--force-exclude" not in parts:
+        parts.append("--force-exclude")
+    return parts + files, info
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Persistent linter daemons.
+
+Type checkers and linters like mypy and eslint spend most of a run starting up
+and re-analyzing unchanged files. With ``linting.daemon`` enabled, the linting
+gate routes its command to a long-lived checker process per project instead of
+cold-starting the tool: ``dmypy`` for mypy and ``eslint_d`` for eslint. Each run
+health-checks the daemon first, kills and restarts it when it's unresponsive,
+and falls back to the cold command when the daemon can't serve the request.
+
+Daemon state lives in .session/daemons/, and ``sk end`` stops every daemon
+started for the project. As a safety net for sessions that are never ended,
+dmypy also shuts itself down after an hour without requests.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from solokit.core.command_runner import CommandResult, CommandRunner
+from solokit.core.constants import (
+    LINT_DAEMON_TIMEOUT,
+    SESSION_DIR_NAME,
+    get_daemons_dir,
+)
+from solokit.core.file_ops import ensure_session_directory
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds without requests after which dmypy exits on its own
+DMYPY_IDLE_TIMEOUT = 3600
+
+# dmypy status lines that aren't linter output
+_DMYPY_CHATTER = ("Daemon started", "Daemon stopped", "Restarting: ")
+
+
+class LintDaemon(ABC):
+    """A long-lived checker process serving one linter's requests.
+
+    Subclasses implement the daemon's protocol; ``run`` handles health checks,
+    restarts and the fallback to the cold command.
+    """
+
+    name = ""
+
+    def __init__(self, project_root: Path, runner: CommandRunner):
+        """
+        Initialize linter daemon.
+
+        Args:
+            project_root: Project root directory
+            runner: CommandRunner used to talk to the daemon
+        """
+        self.project_root = project_root
+        self.runner = runner
+
+    @abstractmethod
+    def handles(self, command_parts: list[str]) -> bool:
+        """Whether this daemon can serve the linting command."""
+        pass
+
+    @abstractmethod
+    def daemon_command(self, command_parts: list[str]) -> list[str] | None:
+        """Translate the linting command into a daemon request (None: no daemon)."""
+        pass
+
+    @abstractmethod
+    def is_healthy(self) -> bool | None:
+        """Check the daemon (True: serving, False: unresponsive, None: not running)."""
+        pass
+
+    @abstractmethod
+    def kill(self) -> None:
+        """Forcefully stop the daemon."""
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop the daemon if it was started for this project."""
+        pass
+
+    def crashed(self, result: CommandResult) -> bool:
+        """Whether a daemon request failed in the daemon rather than in the linter."""
+        return result.returncode == -1
+
+    def clean_output(self, text: str) -> str:
+        """Remove daemon status messages from the linter output."""
+        return text
+
+    def run(self, command_parts: list[str], timeout: int) -> CommandResult:
+        """
+        Run a linting command through the daemon.
+
+        Starts the daemon if needed and restarts it when the health check fails.
+        Falls back to running the command directly if the daemon can't be used.
+
+        Args:
+            command_parts: Linting command (as it would be run cold)
+            timeout: Timeout in seconds for the linting run
+
+        Returns:
+            CommandResult of the linting run
+        """
+        request = self.daemon_command(command_parts)
+        if request is None:
+            return self.runner.run(command_parts, timeout=timeout)
+
+        if self.is_healthy() is False:
+            logger.info(f"{self.name} daemon is unresponsive, restarting it")
+            self.kill()
+
+        result = self.runner.run(request, timeout=timeout)
+        if result.timed_out:
+            # A wedged daemon would time out every later request too
+            self.kill()
+            return result
+        if self.crashed(result):
+            logger.warning(f"{self.name} daemon failed, running {command_parts[0]} directly")
+            self.kill()
+            return self.runner.run(command_parts, timeout=timeout)
+
+        result.stdout = self.clean_output(result.stdout)
+        result.stderr = self.clean_output(result.stderr)
+        return result
+
+
+class MypyDaemon(LintDaemon):
+    """mypy served by dmypy, with its status file in .session/daemons/."""
+
+    name = "dmypy"
+
+    def __init__(self, project_root: Path, runner: CommandRunner):
+        """
+        Initialize dmypy daemon.
+
+        Args:
+            project_root: Project root directory
+            runner: CommandRunner used to talk to the daemon
+        """
+        super().__init__(project_root, runner)
+        # dmypy matching the mypy being linted with, once a command was routed
+        self._dmypy: str | None = None
+
+    @property
+    def status_file(self) -> Path:
+        """dmypy status file (exists while the daemon is running)."""
+        return get_daemons_dir(self.project_root) / "dmypy.json"
+
+    def handles(self, command_parts: list[str]) -> bool:
+        """Whether the command runs mypy."""
+        return Path(command_parts[0]).name in ("mypy", "mypy.exe")
+
+    def _executable(self, mypy: str) -> str | None:
+        """Find dmypy next to the mypy executable (e.g. in a venv) or on PATH."""
+        mypy_path = Path(mypy)
+        if mypy_path.parent != Path("."):
+            sibling = mypy_path.with_name(mypy_path.name.replace("mypy", "dmypy", 1))
+            if sibling.exists():
+                return str(sibling)
+        return shutil.which("dmypy")
+
+    def _project_executable(self) -> str | None:
+        """Find dmypy in the project's venv or on PATH (for teardown by sk end)."""
+        for candidate in (
+            self.project_root / "venv" / "bin" / "dmypy",
+            self.project_root / "venv" / "Scripts" / "dmypy.exe",
+        ):
+            if candidate.exists():
+                return str(candidate)
+        return shutil.which("dmypy")
+
+    def _control(self, *args: str) -> CommandResult | None:
+        """Send a control command (status, stop, kill) to the daemon."""
+        dmypy = self._dmypy or self._project_executable()
+        if dmypy is None:
+            return None
+        return self.runner.run(
+            [dmypy, "--status-file", str(self.status_file), *args],
+            timeout=LINT_DAEMON_TIMEOUT,
+        )
+
+    def daemon_command(self, command_parts: list[str]) -> list[str] | None:
+        """Build a ``dmypy run`` request, which starts the daemon when needed."""
+        dmypy = self._executable(command_parts[0])
+        if dmypy is None:
+            logger.debug("dmypy not found, running mypy directly")
+            return None
+        self._dmypy = dmypy
+        ensure_session_directory(self.status_file.parent)
+        return [
+            dmypy,
+            "--status-file",
+            str(self.status_file),
+            "run",
+            "--timeout",
+            str(DMYPY_IDLE_TIMEOUT),
+            "--",
+            *command_parts[1:],
+        ]
+
+    def is_healthy(self) -> bool | None:
+        """Check the daemon with ``dmypy status``."""
+        if not self.status_file.exists():
+            return None
+        result = self._control("status")
+        return result is not None and result.success
+
+    def kill(self) -> None:
+        """Kill the daemon and drop its status file."""
+        self._control("kill")
+        self.status_file.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Stop the daemon gracefully, killing it if it doesn't respond."""
+        if not self.status_file.exists():
+            return
+        result = self._control("stop")
+        if result is None or not result.success:
+            self.kill()
+
+    def crashed(self, result: CommandResult) -> bool:
+        """mypy exits with 1 for type errors; 2 means the daemon request failed."""
+        return result.returncode not in (0, 1)
+
+    def clean_output(self, text: str) -> str:
+        """Drop dmypy's "Daemon started" and "Restarting" lines."""
+        if not text:
+            return text
+        lines = text.splitlines(keepends=True)
+        return "".join(line for line in lines if not line.startswith(_DMYPY_CHATTER))
+
+
+class EslintDaemon(LintDaemon):
+    """eslint served by eslint_d, when the project has it installed."""
+
+    name = "eslint_d"
+
+    @property
+    def executable(self) -> Path:
+        """Project-local eslint_d executable."""
+        suffix = ".cmd" if os.name == "nt" else ""
+        return self.project_root / "node_modules" / ".bin" / f"eslint_d{suffix}"
+
+    @property
+    def marker_file(self) -> Path:
+        """Marker recording that solokit started eslint_d for this project."""
+        return get_daemons_dir(self.project_root) / "eslint_d.started"
+
+    def handles(self, command_parts: list[str]) -> bool:
+        """Whether the command runs eslint (directly or through npx)."""
+        if command_parts[0] == "npx":
+            command_parts = [part for part in command_parts[1:] if not part.startswith("-")]
+        return bool(command_parts) and Path(command_parts[0]).name in ("eslint", "eslint.cmd")
+
+    def daemon_command(self, command_parts: list[str]) -> list[str] | None:
+        """Build an eslint_d request (eslint_d takes eslint's arguments and starts itself)."""
+        if not self.executable.exists():
+            logger.debug("eslint_d not installed, running eslint directly")
+            return None
+        index = next(
+            i for i, part in enumerate(command_parts) if Path(part).name in ("eslint", "eslint.cmd")
+        )
+        return [str(self.executable), *command_parts[index + 1 :]]
+
+    def run(self, command_parts: list[str], timeout: int) -> CommandResult:
+        """Run eslint through eslint_d, recording that the daemon may be running."""
+        result = super().run(command_parts, timeout)
+        if self.executable.exists():
+            ensure_session_directory(self.marker_file.parent)
+            self.marker_file.touch()
+        return result
+
+    def _control(self, *args: str) -> CommandResult:
+        return self.runner.run([str(self.executable), *args], timeout=LINT_DAEMON_TIMEOUT)
+
+    def is_healthy(self) -> bool | None:
+        """Check the daemon with ``eslint_d status``."""
+        if not self.marker_file.exists():
+            return None
+        result = self._control("status")
+        if result.timed_out or result.returncode == -1:
+            return False
+        reply = result.output.lower()
+        if "not running" in reply:
+            return None
+        return result.success
+
+    def kill(self) -> None:
+        """Stop the daemon (eslint_d restarts on the next request)."""
+        self._control("stop")
+
+    def stop(self) -> None:
+        """Stop the daemon if solokit started it."""
+        if not self.marker_file.exists():
+            return
+        if self.executable.exists():
+            self.kill()
+        self.marker_file.unlink(missing_ok=True)
+
+    def crashed(self, result: CommandResult) -> bool:
+        """eslint exits with 1 for lint errors; 2 means eslint_d failed."""
+        return result.returncode not in (0, 1)
+
+
+class LintDaemonManager:
+    """Routes linting commands to the project's linter daemons."""
+
+    def __init__(self, project_root: Path, runner: CommandRunner | None = None):
+        """
+        Initialize linter daemon manager.
+
+        Args:
+            project_root: Project root directory
+            runner: Optional CommandRunner instance (for testing)
+        """
+        self.project_root = project_root
+        self.runner = runner or CommandRunner(working_dir=project_root)
+        self.daemons: list[LintDaemon] = [
+            MypyDaemon(project_root, self.runner),
+            EslintDaemon(project_root, self.runner),
+        ]
+
+    @property
+    def enabled(self) -> bool:
+        """Daemons are only started in initialized projects, where sk end stops them."""
+        return (self.project_root / SESSION_DIR_NAME).is_dir()
+
+    def daemon_for(self, command_parts: list[str]) -> LintDaemon | None:
+        """
+        Find the daemon that can serve a linting command.
+
+        Args:
+            command_parts: Linting command
+
+        Returns:
+            The matching daemon, or None if the command must run cold
+        """
+        if not self.enabled or not command_parts:
+            return None
+        return next((daemon for daemon in self.daemons if daemon.handles(command_parts)), None)
+
+    def run(self, command_parts: list[str], timeout: int) -> CommandResult:
+        """
+        Run a linting command, through a daemon when one can serve it.
+
+        Args:
+            command_parts: Linting command
+            timeout: Timeout in seconds
+
+        Returns:
+            CommandResult of the linting run
+        """
+        daemon = self.daemon_for(command_parts)
+        if daemon is None:
+            return self.runner.run(command_parts, timeout=timeout)
+        return daemon.run(command_parts, timeout)
+
+    def stop_all(self) -> None:
+        """Stop every daemon started for the project."""
+        for daemon in self.daemons:
+            try:
+                daemon.stop()
+            except OSError as e:
+                # A daemon left running only costs memory until its idle timeout
+                logger.warning(f"Failed to stop {daemon.name} daemon: {e}")
+
+
+def stop_lint_daemons(project_root: Path) -> None:
+    """
+    Stop the linter daemons started for a project (called by ``sk end``).
+
+    Args:
+        project_root: Project root directory
+    """
+    if not get_daemons_dir(project_root).is_dir():
+        return
+    LintDaemonManager(project_root).stop_all()
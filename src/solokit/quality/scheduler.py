@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Concurrent quality gate scheduler.
+
+Runs independent quality gates in parallel up to a configurable limit. Gates
+declare exclusive resources; two gates sharing a resource never run at the same
+time (e.g. auto-fix linting and auto-fix formatting both rewrite source files).
+Gates also declare resources they only read (by default the source tree):
+readers run alongside each other but never next to a writer, and wait for
+writers still pending, so auto-fix gates finish before any gate reads the tree.
+Outcomes are returned in declaration order regardless of completion order, so
+callers aggregate results exactly as they would for a sequential run. Given
+historical durations, gates start longest-first so the slowest gate does not
+end up running alone at the end. In fail-fast mode gates start cheapest-first
+instead, and gates not yet started when a required gate fails are cancelled.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Held by gates that rewrite source files in place (auto-fix linting/formatting)
+SOURCE_TREE_RESOURCE = "source_tree"
+
+
+def source_tree_resources(writes_files: bool) -> frozenset[str]:
+    """
+    Exclusive resources for a gate that may rewrite source files.
+
+    Args:
+        writes_files: Whether the gate modifies files (e.g. auto-fix enabled)
+
+    Returns:
+        Resource set to declare on the gate's GateTask
+    """
+    return frozenset({SOURCE_TREE_RESOURCE}) if writes_files else frozenset()
+
+
+@dataclass
+class GateTask:
+    """A quality gate to be scheduled.
+
+    Attributes:
+        name: Gate name, used as the key in the aggregated results
+        run: Callable that runs the gate and returns (passed, results)
+        resources: Exclusive resources held while the gate runs
+        shared_resources: Resources read while the gate runs; shared with other
+            readers, never held next to a gate using them exclusively
+        required: Whether a failure of this gate stops a fail-fast run
+    """
+
+    name: str
+    run: Callable[[], tuple[bool, dict[str, Any]]]
+    resources: frozenset[str] = field(default_factory=frozenset)
+    shared_resources: frozenset[str] = field(
+        default_factory=lambda: frozenset({SOURCE_TREE_RESOURCE})
+    )
+    required: bool = True
+
+    @property
+    def read_resources(self) -> frozenset[str]:
+        """Resources only read by the gate (exclusive use takes precedence)."""
+        return self.shared_resources - self.resources
+
+
+@dataclass
+class GateOutcome:
+    """Result of a scheduled quality gate.
+
+    Attributes:
+        name: Gate name
+        passed: Whether the gate passed
+        results: Gate results dict as returned by the gate
+        duration_seconds: Wall-clock time the gate took
+        cancelled: Whether the gate was never run because a required gate failed
+            first (fail-fast mode)
+    """
+
+    name: str
+    passed: bool
+    results: dict[str, Any]
+    duration_seconds: float
+    cancelled: bool = False
+
+    @classmethod
+    def cancelled_gate(cls, name: str) -> GateOutcome:
+        """Outcome of a gate cancelled by fail-fast mode."""
+        return cls(name, False, {"status": "cancelled"}, 0.0, cancelled=True)
+
+
+class GateScheduler:
+    """Runs quality gates concurrently while honoring exclusive resources."""
+
+    def __init__(
+        self,
+        max_parallel: int = 1,
+        expected_durations: Mapping[str, float] | None = None,
+        fail_fast: bool = False,
+    ):
+        """
+        Initialize gate scheduler.
+
+        Args:
+            max_parallel: Maximum number of gates running at once (1 runs sequentially)
+            expected_durations: Typical seconds per gate name (e.g. median of recent
+                sessions); concurrent runs start the slowest gates first
+            fail_fast: Start the cheapest gates first and cancel gates not yet
+                started once a required gate fails
+        """
+        self.max_parallel = max(1, max_parallel)
+        self.expected_durations = dict(expected_durations or {})
+        self.fail_fast = fail_fast
+
+    def run(self, tasks: Sequence[GateTask]) -> dict[str, GateOutcome]:
+        """
+        Run gates and collect their outcomes.
+
+        Gates start in declaration order (slowest first when expected durations
+        are known) as soon as a slot is free and none of their resources are
+        held. Readers of a resource also wait for pending gates using it
+        exclusively, so writers run first. If a gate raises, no further gates are started, running gates are
+        allowed to finish, and the exception of the earliest declared failing
+        gate is re-raised. In fail-fast mode, a failed required gate likewise
+        stops new gates from starting; they get cancelled outcomes.
+
+        Args:
+            tasks: Gates to run, in priority order (put long-running gates first;
+                with expected durations, known gates are reordered slowest first)
+
+        Returns:
+            Outcomes keyed by gate name, in declaration order
+        """
+        if self.max_parallel == 1 or len(tasks) <= 1:
+            return self._run_sequentially(tasks)
+
+        outcomes: dict[str, GateOutcome] = {}
+        errors: dict[str, Exception] = {}
+        pending = self._start_order(tasks)
+        running: dict[Future[GateOutcome], GateTask] = {}
+        held: set[str] = set()
+        readers: Counter[str] = Counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel, thread_name_prefix="quality-gate"
+        ) as executor:
+            while pending or running:
+                for task in list(pending):
+                    if len(running) >= self.max_parallel:
+                        break
+                    if not self._can_start(task, pending, held, readers):
+                        continue
+                    pending.remove(task)
+                    held.update(task.resources)
+                    readers.update(task.read_resources)
+                    running[executor.submit(self._run_task, task)] = task
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    held.difference_update(task.resources)
+                    readers.subtract(task.read_resources)
+                    try:
+                        outcomes[task.name] = future.result()
+                    except Exception as e:
+                        errors[task.name] = e
+                        # Match sequential behavior: nothing new starts after a gate errors
+                        pending.clear()
+                        continue
+                    if self._stops_run(task, outcomes[task.name]):
+                        # Gates already running finish; the rest never start
+                        for cancelled in pending:
+                            outcomes[cancelled.name] = GateOutcome.cancelled_gate(cancelled.name)
+                        pending.clear()
+
+        for task in tasks:
+            if task.name in errors:
+                raise errors[task.name]
+
+        return {task.name: outcomes[task.name] for task in tasks}
+
+    def _run_sequentially(self, tasks: Sequence[GateTask]) -> dict[str, GateOutcome]:
+        """Run gates one at a time (in start order when failing fast)."""
+        outcomes: dict[str, GateOutcome] = {}
+        stopped = False
+        for task in self._start_order(tasks) if self.fail_fast else tasks:
+            if stopped:
+                outcomes[task.name] = GateOutcome.cancelled_gate(task.name)
+                continue
+            outcomes[task.name] = self._run_task(task)
+            stopped = self._stops_run(task, outcomes[task.name])
+        return {task.name: outcomes[task.name] for task in tasks}
+
+    @staticmethod
+    def _can_start(
+        task: GateTask, pending: list[GateTask], held: set[str], readers: Counter[str]
+    ) -> bool:
+        """Whether a gate's resources are free (readers let pending writers go first)."""
+        if task.resources & held or any(readers[resource] for resource in task.resources):
+            return False
+        reads = task.read_resources
+        if reads & held:
+            return False
+        return not any(reads & other.resources for other in pending if other is not task)
+
+    def _stops_run(self, task: GateTask, outcome: GateOutcome) -> bool:
+        """Whether a gate's outcome cancels the gates not yet started."""
+        return self.fail_fast and task.required and not outcome.passed
+
+    def _start_order(self, tasks: Sequence[GateTask]) -> list[GateTask]:
+        """Order gates to start: by expected duration, gates without history keep their place.
+
+        Normally the slowest gates start first (unknown gates up front); when
+        failing fast the cheapest start first so failures surface early (unknown
+        gates last).
+        """
+        if self.fail_fast:
+            return sorted(tasks, key=lambda task: self.expected_durations.get(task.name, math.inf))
+        if not self.expected_durations:
+            return list(tasks)
+        return sorted(tasks, key=lambda task: -self.expected_durations.get(task.name, math.inf))
+
+    def _run_task(self, task: GateTask) -> GateOutcome:
+        """Run a single gate and time it."""
+        start = time.perf_counter()
+        passed, results = task.run()
+        duration = time.perf_counter() - start
+        logger.debug(f"Quality gate '{task.name}' finished in {duration:.2f}s")
+        return GateOutcome(task.name, passed, results, duration)
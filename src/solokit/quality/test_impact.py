@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Test impact analysis for the test execution gate.
+
+A full test run records which source files each test file exercises. For pytest
+this comes from coverage contexts (``--cov-context=test``), read from the
+``.coverage`` database. Later runs select only the test files whose covered files
+changed since that full run, plus changed and new test files. Jest already tracks
+the module graph, so JavaScript selection uses ``--findRelatedTests`` with the
+files changed since the last full run.
+
+Changes are always measured against the commit of the last *passing* full run,
+so every test that could be affected by anything since then keeps being selected
+until the next full run. A full run is forced when no map exists, history was
+rewritten, test or tool configuration changed, every N impacted runs, or on
+request (``sk end --full``).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import (
+    GIT_QUICK_TIMEOUT,
+    QUALITY_CHECK_LONG_TIMEOUT,
+    SESSION_DIR_NAME,
+    get_cache_dir,
+)
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+from solokit.quality.gate_cache import FINGERPRINT_EXCLUDES
+from solokit.quality.incremental import is_config_file
+
+logger = get_logger(__name__)
+
+TEST_IMPACT_FILE = "test_impact.json"
+
+# Bump when the stored map changes shape
+TEST_IMPACT_SCHEMA_VERSION = 1
+
+# Impacted runs between forced full runs (0 disables periodic full runs)
+DEFAULT_FULL_RUN_EVERY = 10
+
+# Changes to these files can affect any test, so they force a full run
+TEST_CONFIG_FILE_NAMES = frozenset(
+    {
+        "conftest.py",
+        "pytest.ini",
+        "requirements.txt",
+        "requirements-dev.txt",
+        "poetry.lock",
+        "uv.lock",
+        "Pipfile.lock",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+    }
+)
+TEST_CONFIG_PREFIXES = ("jest.config.", "jest.setup.", "babel.config.", ".babelrc")
+
+# Directory names that hold tests (non-Python files there are test data)
+TEST_DIR_NAMES = frozenset({"test", "tests", "__tests__"})
+
+# pytest options that take their value as the next argument
+PYTEST_VALUE_OPTIONS = frozenset(
+    {
+        "-k",
+        "-m",
+        "-p",
+        "-c",
+        "-o",
+        "-n",
+        "-r",
+        "-W",
+        "--cov",
+        "--cov-report",
+        "--cov-config",
+        "--cov-fail-under",
+        "--cov-context",
+        "--rootdir",
+        "--confcutdir",
+        "--basetemp",
+        "--junitxml",
+        "--junit-xml",
+        "--ignore",
+        "--ignore-glob",
+        "--deselect",
+        "--maxfail",
+        "--durations",
+        "--tb",
+        "--import-mode",
+        "--log-level",
+        "--numprocesses",
+        "--dist",
+    }
+)
+
+JEST_LAUNCHERS = frozenset({"npm", "yarn", "pnpm"})
+
+# Session state and test outputs are not inputs to the tests
+IGNORED_CHANGE_ROOTS = frozenset(FINGERPRINT_EXCLUDES) | {"coverage"}
+
+
+@dataclass
+class ImpactPlan:
+    """How the test gate runs under test impact analysis.
+
+    Attributes:
+        command: Test command to run
+        impacted: Whether only impacted tests run (False for a full run)
+        full_run_reason: Why all tests run (None for an impacted run)
+        selected: Test files selected on an impacted run
+        total: Test files known from the last full run (plus new test files)
+        base_ref: Commit of the last passing full run changes are measured from
+    """
+
+    command: list[str]
+    impacted: bool = False
+    full_run_reason: str | None = None
+    selected: list[str] = field(default_factory=list)
+    total: int = 0
+    base_ref: str | None = None
+
+    def summary(self) -> dict[str, Any]:
+        """Selection details for gate results and reports."""
+        if not self.impacted:
+            return {"impacted": False, "full_run_reason": self.full_run_reason}
+        return {
+            "impacted": True,
+            "base_ref": self.base_ref,
+            "selected": len(self.selected),
+            "skipped": max(self.total - len(self.selected), 0),
+        }
+
+
+def get_impact_file(project_root: Path) -> Path:
+    """Get the test impact map file path."""
+    return get_cache_dir(project_root) / TEST_IMPACT_FILE
+
+
+def load_impact_state(project_root: Path) -> dict[str, Any] | None:
+    """
+    Load the test impact map recorded by the last passing full run.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Stored state, or None if there is no usable map
+    """
+    impact_file = get_impact_file(project_root)
+    if not impact_file.exists():
+        return None
+    try:
+        state = json.loads(impact_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Ignoring unreadable test impact map: {e}")
+        return None
+    if not isinstance(state, dict) or state.get("schema_version") != TEST_IMPACT_SCHEMA_VERSION:
+        return None
+    return state
+
+
+def _save_impact_state(project_root: Path, state: dict[str, Any]) -> None:
+    # Without a map the next run is simply a full run
+    save_cache_json(get_impact_file(project_root), state, indent=2)
+
+
+def read_coverage_contexts(coverage_file: Path, project_root: Path) -> dict[str, list[str]]:
+    """
+    Build a test file -> covered source files map from a coverage database.
+
+    Reads the contexts pytest-cov records with ``--cov-context=test``
+    (``tests/test_x.py::test_y|run``) straight from coverage's SQLite data file.
+
+    Args:
+        coverage_file: Path to the ``.coverage`` data file
+        project_root: Project root directory (covered paths are made relative to it)
+
+    Returns:
+        Map of project-relative test file paths to sorted covered file paths
+    """
+    if not coverage_file.exists():
+        return {}
+
+    root = project_root.resolve()
+    tests: dict[str, set[str]] = {}
+    try:
+        connection = sqlite3.connect(f"file:{coverage_file}?mode=ro", uri=True)
+        try:
+            tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+            queries = [
+                f"SELECT DISTINCT file.path, context.context FROM {table} "
+                f"JOIN file ON file.id = {table}.file_id "
+                f"JOIN context ON context.id = {table}.context_id"
+                for table in ("line_bits", "arc")
+                if table in tables
+            ]
+            rows = [row for query in queries for row in connection.execute(query)]
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Could not read coverage contexts from {coverage_file}: {e}")
+        return {}
+
+    for path, context in rows:
+        test_file = context.split("::", 1)[0] if "::" in context else ""
+        if not test_file:
+            continue
+        try:
+            relative = Path(path).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        tests.setdefault(test_file, set()).add(relative)
+
+    return {test_file: sorted(files) for test_file, files in sorted(tests.items())}
+
+
+def get_changed_paths(base_ref: str, runner: CommandRunner) -> list[str] | None:
+    """
+    List files changed since a base commit, including deleted and untracked files.
+
+    Args:
+        base_ref: Base commit
+        runner: CommandRunner with the project root as its working directory
+
+    Returns:
+        Sorted project-relative paths, or None if git failed
+    """
+    diff = runner.run(["git", "diff", "--name-only", "--relative", "-z", base_ref, "--"])
+    untracked = runner.run(["git", "ls-files", "--others", "--exclude-standard", "-z"])
+    if not diff.success or not untracked.success:
+        return None
+    return sorted({path for path in (diff.stdout + "\0" + untracked.stdout).split("\0") if path})
+
+
+def _is_test_config_file(path: str) -> bool:
+    name = Path(path).name
+    return (
+        is_config_file(path)
+        or name in TEST_CONFIG_FILE_NAMES
+        or name.startswith(TEST_CONFIG_PREFIXES)
+    )
+
+
+def _is_python_test_file(path: str) -> bool:
+    name = Path(path).name
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def pytest_args_index(command_parts: Sequence[str]) -> int | None:
+    """Index of the first pytest argument, or None if the command is not pytest."""
+    if command_parts and Path(command_parts[0]).name.startswith("pytest"):
+        return 1
+    if len(command_parts) > 2 and list(command_parts[1:3]) == ["-m", "pytest"]:
+        return 3
+    return None
+
+
+def strip_pytest_paths(
+    command_parts: list[str], args_index: int, project_root: Path
+) -> list[str] | None:
+    """
+    Remove positional test paths and the coverage threshold from a pytest command.
+
+    Returns:
+        The stripped command, or None if a path argument cannot be told apart from
+        the value of an unknown option
+    """
+    parts = list(command_parts[:args_index])
+    args = command_parts[args_index:]
+    skip_value = False
+    for index, arg in enumerate(args):
+        if skip_value:
+            skip_value = False
+            if args[index - 1] != "--cov-fail-under":
+                parts.append(arg)
+            continue
+        if arg.startswith("-"):
+            if arg in PYTEST_VALUE_OPTIONS:
+                skip_value = True
+                if arg == "--cov-fail-under":
+                    continue
+            elif arg.startswith("--cov-fail-under="):
+                continue
+            parts.append(arg)
+            continue
+
+        # Positional argument: a test path (possibly a node id) to drop
+        if (project_root / arg.split("::", 1)[0]).exists():
+            previous = args[index - 1] if index > 0 else ""
+            if previous.startswith("--") and "=" not in previous:
+                # Could be the value of an option we don't know about
+                return None
+            continue
+        parts.append(arg)
+    return parts
+
+
+def _jest_base_command(command_parts: list[str], project_root: Path) -> list[str] | None:
+    """
+    Get a Jest command that accepts extra Jest arguments appended to it.
+
+    Returns:
+        Command without ``--coverage`` (subset coverage is meaningless), or None if
+        the command does not run Jest
+    """
+    if not command_parts:
+        return None
+    tool = Path(command_parts[0]).name
+    parts = [part for part in command_parts if part != "--coverage"]
+
+    if tool == "jest" or (tool in ("npx", "pnpx") and "jest" in command_parts[1:2]):
+        return parts
+
+    if tool in JEST_LAUNCHERS and "test" in command_parts[1:3]:
+        package_json = project_root / "package.json"
+        try:
+            scripts = json.loads(package_json.read_text(encoding="utf-8")).get("scripts", {})
+        except (OSError, json.JSONDecodeError):
+            return None
+        if "jest" not in str(scripts.get("test", "")):
+            return None
+        # npm needs "--" before arguments meant for the script
+        if tool == "npm" and "--" not in parts:
+            parts.append("--")
+        return parts
+
+    return None
+
+
+def _parse_listed_tests(output: str) -> set[str]:
+    """Test file paths printed by ``jest --listTests``."""
+    return {
+        line.strip()
+        for line in output.splitlines()
+        if line.strip() and Path(line.strip()).is_absolute() and Path(line.strip()).is_file()
+    }
+
+
+class TestImpactAnalyzer:
+    """Plans impacted test runs and records the map from full runs."""
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(
+        self,
+        project_root: Path,
+        language: str,
+        full_run_every: int = DEFAULT_FULL_RUN_EVERY,
+        runner: CommandRunner | None = None,
+        git_runner: CommandRunner | None = None,
+    ):
+        """
+        Initialize test impact analyzer.
+
+        Args:
+            project_root: Project root directory
+            language: Programming language (python, javascript, typescript)
+            full_run_every: Impacted runs between forced full runs (0: never)
+            runner: CommandRunner for listing Jest tests (for testing)
+            git_runner: CommandRunner for git commands (for testing)
+        """
+        self.project_root = project_root
+        self.language = language
+        self.full_run_every = full_run_every
+        self.runner = runner or CommandRunner(
+            default_timeout=QUALITY_CHECK_LONG_TIMEOUT, working_dir=project_root
+        )
+        self.git_runner = git_runner or CommandRunner(
+            default_timeout=GIT_QUICK_TIMEOUT, working_dir=project_root
+        )
+
+    def plan(self, command_parts: list[str], force_full: bool = False) -> ImpactPlan:
+        """
+        Decide whether to run impacted tests only or the full suite.
+
+        Args:
+            command_parts: Configured test command split into arguments
+            force_full: Run every test (e.g. ``sk end --full``)
+
+        Returns:
+            ImpactPlan with the command to run
+        """
+        if self.language == "python":
+            args_index = pytest_args_index(command_parts)
+            if args_index is None:
+                return ImpactPlan(command_parts, full_run_reason="test command is not pytest")
+            if not any(part == "--cov" or part.startswith("--cov=") for part in command_parts):
+                return ImpactPlan(
+                    command_parts, full_run_reason="test command does not collect coverage"
+                )
+            full_command = list(command_parts)
+            if not any(part.startswith("--cov-context") for part in command_parts):
+                full_command.append("--cov-context=test")
+        else:
+            if _jest_base_command(command_parts, self.project_root) is None:
+                return ImpactPlan(command_parts, full_run_reason="test command does not run Jest")
+            full_command = list(command_parts)
+
+        if not (self.project_root / SESSION_DIR_NAME).is_dir():
+            return ImpactPlan(full_command, full_run_reason="project not initialized")
+        if force_full:
+            return ImpactPlan(full_command, full_run_reason="full run requested")
+
+        state = load_impact_state(self.project_root)
+        if state is None or state.get("language") != self.language:
+            return ImpactPlan(full_command, full_run_reason="no impact map from a full run")
+
+        runs_since_full = int(state.get("runs_since_full", 0))
+        if self.full_run_every > 0 and runs_since_full >= self.full_run_every:
+            return ImpactPlan(
+                full_command,
+                full_run_reason=f"periodic full run (every {self.full_run_every} runs)",
+            )
+
+        base_ref = state.get("commit", "")
+        ancestor = self.git_runner.run(["git", "merge-base", "--is-ancestor", base_ref, "HEAD"])
+        if not base_ref or not ancestor.success:
+            return ImpactPlan(full_command, full_run_reason="history changed since last full run")
+
+        changed = get_changed_paths(base_ref, self.git_runner)
+        if changed is None:
+            return ImpactPlan(full_command, full_run_reason="could not list changed files")
+        changed = [path for path in changed if path.split("/", 1)[0] not in IGNORED_CHANGE_ROOTS]
+
+        changed_config = [path for path in changed if _is_test_config_file(path)]
+        if changed_config:
+            return ImpactPlan(
+                full_command, full_run_reason=f"configuration changed: {changed_config[0]}"
+            )
+
+        if self.language == "python":
+            plan = self._plan_pytest(command_parts, state, changed)
+        else:
+            plan = self._plan_jest(command_parts, changed)
+
+        if plan.full_run_reason is not None:
+            plan.command = full_command
+        plan.base_ref = base_ref
+        return plan
+
+    def _plan_pytest(
+        self, command_parts: list[str], state: dict[str, Any], changed: list[str]
+    ) -> ImpactPlan:
+        test_data = [
+            path
+            for path in changed
+            if not path.endswith(".py") and TEST_DIR_NAMES.intersection(Path(path).parts[:-1])
+        ]
+        if test_data:
+            return ImpactPlan(command_parts, full_run_reason=f"test data changed: {test_data[0]}")
+
+        tests: dict[str, list[str]] = state.get("tests", {})
+        changed_set = set(changed)
+        selected = {
+            test_file
+            for test_file, covered in tests.items()
+            if test_file in changed_set or changed_set.intersection(covered)
+        }
+        new_tests = {path for path in changed if _is_python_test_file(path) and path not in tests}
+        selected |= new_tests
+        # Deleted test files have nothing left to run
+        selected = {path for path in selected if (self.project_root / path).is_file()}
+        total = len(tests) + len(new_tests)
+
+        if selected and len(selected) >= total:
+            return ImpactPlan(command_parts, full_run_reason="all tests impacted")
+
+        args_index = pytest_args_index(command_parts)
+        stripped = (
+            strip_pytest_paths(command_parts, args_index, self.project_root)
+            if args_index is not None
+            else None
+        )
+        if stripped is None:
+            return ImpactPlan(command_parts, full_run_reason="cannot restrict test command")
+
+        ordered = sorted(selected)
+        return ImpactPlan(stripped + ordered, impacted=True, selected=ordered, total=total)
+
+    def _plan_jest(self, command_parts: list[str], changed: list[str]) -> ImpactPlan:
+        base = _jest_base_command(command_parts, self.project_root)
+        if base is None:
+            return ImpactPlan(command_parts, full_run_reason="test command does not run Jest")
+
+        existing = [path for path in changed if (self.project_root / path).is_file()]
+        if len(existing) != len(changed):
+            # Jest can't resolve tests related to a deleted module
+            return ImpactPlan(command_parts, full_run_reason="files deleted since last full run")
+
+        related = ["--findRelatedTests", *existing]
+        all_tests, selected_tests = self.runner.run_many(
+            [[*base, "--listTests"], [*base, "--listTests", *related]],
+            working_dir=self.project_root,
+        )
+        if not all_tests.success or (existing and not selected_tests.success):
+            return ImpactPlan(command_parts, full_run_reason="could not list tests")
+
+        total = len(_parse_listed_tests(all_tests.stdout))
+        selected = sorted(_parse_listed_tests(selected_tests.stdout)) if existing else []
+        if selected and len(selected) >= total:
+            return ImpactPlan(command_parts, full_run_reason="all tests impacted")
+
+        return ImpactPlan([*base, *related], impacted=True, selected=selected, total=total)
+
+    def record(self, plan: ImpactPlan, passed: bool) -> None:
+        """
+        Update the impact map after a test run.
+
+        A passing full run records a fresh map at HEAD; an impacted run counts
+        towards the next periodic full run.
+
+        Args:
+            plan: Plan the tests ran with
+            passed: Whether the test run passed
+        """
+        if not (self.project_root / SESSION_DIR_NAME).is_dir():
+            return
+
+        if plan.impacted:
+            state = load_impact_state(self.project_root)
+            if state is not None:
+                state["runs_since_full"] = int(state.get("runs_since_full", 0)) + 1
+                _save_impact_state(self.project_root, state)
+            return
+
+        if not passed:
+            return
+
+        head = self.git_runner.run(["git", "rev-parse", "HEAD"])
+        if not head.success or not head.stdout.strip():
+            return
+
+        tests: dict[str, list[str]] = {}
+        if self.language == "python":
+            tests = read_coverage_contexts(self.project_root / ".coverage", self.project_root)
+            if not tests:
+                logger.debug("No coverage contexts recorded; test impact map not updated")
+                return
+
+        _save_impact_state(
+            self.project_root,
+            {
+                "schema_version": TEST_IMPACT_SCHEMA_VERSION,
+                "language": self.language,
+                "commit": head.stdout.strip(),
+                "recorded_at": datetime.now().isoformat(),
+                "runs_since_full": 0,
+                "tests": tests,
+            },
+        )
+        logger.info(f"Recorded test impact map for {len(tests)} test file(s)")
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Parallel test workers for the test execution gate.
+
+Splits a pytest run across N worker processes. When pytest-xdist is installed the
+run is handed to it (``-n N``). Otherwise the collected test files are sharded
+natively: each shard is a separate pytest process over a subset of the files,
+balanced by the per-file durations recorded from earlier runs. Shard JUnit
+reports are merged into the command's ``--junitxml`` target and shard coverage
+data is combined and re-reported, so ``coverage.json`` (and ``.coverage``) look
+the same as after a single-process run. Only pytest is required; coverage is
+merged when the command uses pytest-cov.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from xml.etree import ElementTree  # nosec B405 - only parses JUnit reports pytest wrote
+
+from solokit.core.command_runner import CommandResult, CommandRunner, StreamOptions
+from solokit.core.constants import (
+    QUALITY_CHECK_LONG_TIMEOUT,
+    SESSION_DIR_NAME,
+    get_cache_dir,
+)
+from solokit.core.file_ops import ensure_session_directory, save_cache_json
+from solokit.core.logging_config import get_logger
+from solokit.quality.test_impact import (
+    PYTEST_VALUE_OPTIONS,
+    pytest_args_index,
+    strip_pytest_paths,
+)
+
+logger = get_logger(__name__)
+
+TEST_DURATIONS_FILE = "test_durations.json"
+
+# Bump when the stored durations change shape
+TEST_DURATIONS_SCHEMA_VERSION = 1
+
+# Assumed duration of a test file with no recorded history (seconds)
+DEFAULT_FILE_DURATION = 1.0
+
+# Options rewritten per shard (reports are produced once, after merging)
+SHARD_REPORT_OPTIONS = ("--cov-report", "--junitxml", "--junit-xml", "--cov-fail-under")
+
+# Options that make pytest-cov collect or report coverage
+COVERAGE_OPTIONS = ("--cov", "--cov-report", "--cov-context", "--cov-config", "--cov-fail-under")
+
+# pytest-cov report types and the coverage command producing each
+COVERAGE_REPORT_COMMANDS = {
+    "term": ["report"],
+    "term-missing": ["report", "-m"],
+    "json": ["json"],
+    "xml": ["xml"],
+    "lcov": ["lcov"],
+    "html": ["html"],
+}
+
+# A collected test ("path::name") or, with -qq, a per-file count ("path: 3")
+COLLECTED_FILE_PATTERN = re.compile(r"^([^\s:]+\.py)(?:::|: \d+$)")
+
+
+@dataclass
+class Shard:
+    """A subset of test files run by one worker process.
+
+    Attributes:
+        index: Shard number (0-based)
+        files: Test files in the shard
+        expected_seconds: Sum of the files' historical durations
+    """
+
+    index: int
+    files: list[str] = field(default_factory=list)
+    expected_seconds: float = 0.0
+
+
+def get_durations_file(project_root: Path) -> Path:
+    """Get the per-file test durations file path."""
+    return get_cache_dir(project_root) / TEST_DURATIONS_FILE
+
+
+def load_test_durations(project_root: Path) -> dict[str, float]:
+    """
+    Load per-file test durations recorded by earlier sharded runs.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Map of test file path to duration in seconds
+    """
+    durations_file = get_durations_file(project_root)
+    if not durations_file.exists():
+        return {}
+    try:
+        data = json.loads(durations_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Ignoring unreadable test durations file: {e}")
+        return {}
+    if data.get("schema_version") != TEST_DURATIONS_SCHEMA_VERSION:
+        return {}
+    files = data.get("files")
+    return (
+        {path: float(seconds) for path, seconds in files.items()} if isinstance(files, dict) else {}
+    )
+
+
+def save_test_durations(project_root: Path, durations: dict[str, float]) -> None:
+    """
+    Merge newly measured per-file durations into the stored durations.
+
+    Args:
+        project_root: Project root directory
+        durations: Map of test file path to measured duration in seconds
+    """
+    if not durations or not (project_root / SESSION_DIR_NAME).is_dir():
+        return
+    stored = load_test_durations(project_root)
+    stored.update(durations)
+    durations_file = get_durations_file(project_root)
+    data = {
+        "schema_version": TEST_DURATIONS_SCHEMA_VERSION,
+        "files": {path: round(seconds, 3) for path, seconds in sorted(stored.items())},
+    }
+    # Without history, shards are balanced by file count
+    save_cache_json(durations_file, data, indent=2)
+
+
+def balance_shards(
+    files: Sequence[str], durations: dict[str, float], shard_count: int
+) -> list[Shard]:
+    """
+    Split test files into shards of similar expected duration.
+
+    Assigns the longest files first, each to the currently shortest shard. Files
+    without history are assumed to take the average recorded duration.
+
+    Args:
+        files: Test files to distribute
+        durations: Historical per-file durations in seconds
+        shard_count: Number of shards
+
+    Returns:
+        Non-empty shards ordered by index
+    """
+    known = [durations[path] for path in files if path in durations]
+    default = sum(known) / len(known) if known else DEFAULT_FILE_DURATION
+
+    shards = [Shard(index) for index in range(max(1, shard_count))]
+    heap = [(0.0, shard.index) for shard in shards]
+    for path in sorted(files, key=lambda path: (-durations.get(path, default), path)):
+        total, index = heapq.heappop(heap)
+        seconds = durations.get(path, default)
+        shards[index].files.append(path)
+        shards[index].expected_seconds += seconds
+        heapq.heappush(heap, (total + seconds, index))
+
+    return [shard for shard in shards if shard.files]
+
+
+def merge_junit_reports(reports: Sequence[Path], output: Path) -> None:
+    """
+    Merge JUnit XML reports into a single ``<testsuites>`` document.
+
+    Args:
+        reports: Shard report files (missing or invalid files are skipped)
+        output: Merged report path
+    """
+    merged = ElementTree.Element("testsuites")
+    for report in reports:
+        try:
+            root = ElementTree.parse(report).getroot()  # nosec B314
+        except (OSError, ElementTree.ParseError) as e:
+            logger.debug(f"Skipping unreadable JUnit report {report}: {e}")
+            continue
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        merged.extend(suites)
+
+    for attribute in ("tests", "failures", "errors", "skipped"):
+        merged.set(
+            attribute,
+            str(sum(int(suite.get(attribute, 0)) for suite in merged.findall("testsuite"))),
+        )
+    ensure_session_directory(output.parent)
+    ElementTree.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+
+
+def junit_file_durations(report: Path, files: Sequence[str]) -> dict[str, float]:
+    """
+    Sum JUnit test case times per test file.
+
+    Test cases are matched to files through their dotted ``classname``
+    (``tests.unit.test_x.TestY`` belongs to ``tests/unit/test_x.py``).
+
+    Args:
+        report: JUnit XML report
+        files: Test files that ran in the report
+
+    Returns:
+        Map of test file path to total duration in seconds
+    """
+    try:
+        root = ElementTree.parse(report).getroot()  # nosec B314
+    except (OSError, ElementTree.ParseError):
+        return {}
+
+    modules = sorted(
+        ((path[: -len(".py")].replace("/", "."), path) for path in files if path.endswith(".py")),
+        key=lambda item: -len(item[0]),
+    )
+    durations: dict[str, float] = {}
+    for case in root.iter("testcase"):
+        classname = case.get("classname", "")
+        for module, path in modules:
+            if classname == module or classname.startswith(module + "."):
+                durations[path] = durations.get(path, 0.0) + float(case.get("time", 0) or 0)
+                break
+    return durations
+
+
+def _option_name(arg: str) -> str:
+    return arg.split("=", 1)[0]
+
+
+def _remove_options(command_parts: list[str], names: Sequence[str]) -> list[str]:
+    """Remove options (``--opt=value`` or ``--opt value``) from a command."""
+    parts: list[str] = []
+    skip_value = False
+    for arg in command_parts:
+        if skip_value:
+            skip_value = False
+            if not arg.startswith("-"):
+                continue
+        if _option_name(arg) in names:
+            skip_value = "=" not in arg and arg in PYTEST_VALUE_OPTIONS
+            continue
+        parts.append(arg)
+    return parts
+
+
+def _option_values(command_parts: list[str], name: str) -> list[str]:
+    """Values of an option given as ``--opt=value`` or ``--opt value``."""
+    values = []
+    for index, arg in enumerate(command_parts):
+        if arg.startswith(name + "="):
+            values.append(arg.split("=", 1)[1])
+        elif arg == name and index + 1 < len(command_parts):
+            values.append(command_parts[index + 1])
+    return values
+
+
+def _merge_returncodes(returncodes: Sequence[int]) -> int:
+    """Combine shard exit codes the way a single pytest run would report them."""
+    failures = [code for code in returncodes if code not in (0, 5)]
+    if failures:
+        return failures[0]
+    return 0 if 0 in returncodes else 5
+
+
+class ShardedTestRunner:
+    """Runs a pytest command across parallel worker processes."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        workers: int,
+        runner: CommandRunner | None = None,
+        log_file: Path | None = None,
+    ):
+        """
+        Initialize sharded test runner.
+
+        Args:
+            project_root: Project root directory
+            workers: Number of worker processes
+            runner: CommandRunner used for pytest and coverage commands
+            log_file: Merged output log; shards log next to it (None: no log files)
+        """
+        self.project_root = project_root
+        self.workers = workers
+        self.runner = runner or CommandRunner(working_dir=project_root)
+        self.log_file = log_file
+
+    def _shard_log_file(self, shard: Shard) -> Path | None:
+        if self.log_file is None:
+            return None
+        return self.log_file.with_name(f"{self.log_file.stem}-shard-{shard.index + 1}.log")
+
+    def run(
+        self, command_parts: list[str], timeout: float, stream: StreamOptions | None = None
+    ) -> CommandResult:
+        """
+        Run the test command with parallel workers.
+
+        Falls back to a single process when the command is not pytest, fewer than
+        two test files are collected, or the test paths can't be separated safely.
+
+        Args:
+            command_parts: pytest command split into arguments
+            timeout: Timeout for each worker in seconds
+            stream: Streaming options for single-process runs
+
+        Returns:
+            Merged CommandResult
+        """
+        args_index = pytest_args_index(command_parts)
+        if args_index is None or self.workers < 2:
+            return self._run_single(command_parts, timeout, stream)
+
+        if self._has_xdist(command_parts[:args_index]):
+            if any(_option_name(arg) in ("-n", "--numprocesses") for arg in command_parts):
+                return self._run_single(command_parts, timeout, stream)
+            logger.info(f"Running tests with pytest-xdist ({self.workers} workers)")
+            return self._run_single([*command_parts, "-n", str(self.workers)], timeout, stream)
+
+        files = self._collect_test_files(command_parts)
+        base = strip_pytest_paths(command_parts, args_index, self.project_root)
+        if files is None or len(files) < 2 or base is None:
+            return self._run_single(command_parts, timeout, stream)
+
+        shards = balance_shards(
+            files, load_test_durations(self.project_root), min(self.workers, len(files))
+        )
+        logger.info(f"Running {len(files)} test files in {len(shards)} shards")
+        return self._run_shards(command_parts, base, shards, timeout)
+
+    def _run_single(
+        self, command_parts: list[str], timeout: float, stream: StreamOptions | None
+    ) -> CommandResult:
+        return self.runner.run(
+            command_parts, timeout=timeout, working_dir=self.project_root, stream=stream
+        )
+
+    def _has_xdist(self, pytest_prefix: list[str]) -> bool:
+        """Check whether pytest-xdist is registered with this pytest."""
+        result = self.runner.run(
+            [*pytest_prefix, "-VV"],
+            timeout=QUALITY_CHECK_LONG_TIMEOUT,
+            working_dir=self.project_root,
+        )
+        return result.success and "xdist-" in result.stdout + result.stderr
+
+    def _collect_test_files(self, command_parts: list[str]) -> list[str] | None:
+        """Collect the test files the command would run (None if collection failed)."""
+        collect = [
+            *_remove_options(command_parts, COVERAGE_OPTIONS + SHARD_REPORT_OPTIONS),
+            "--collect-only",
+            "-q",
+        ]
+        result = self.runner.run(
+            collect, timeout=QUALITY_CHECK_LONG_TIMEOUT, working_dir=self.project_root
+        )
+        if not result.success:
+            logger.debug(f"Test collection failed (exit {result.returncode}); not sharding")
+            return None
+        # "-q" lists node ids; an extra "-q" in the command lists "file: count" lines
+        files = set()
+        for line in result.stdout.splitlines():
+            match = COLLECTED_FILE_PATTERN.match(line.strip())
+            if match:
+                files.add(match.group(1))
+        return sorted(files)
+
+    def _python_for(self, command_parts: list[str]) -> str:
+        """Interpreter of the pytest command (for running coverage)."""
+        if pytest_args_index(command_parts) == 3:
+            return command_parts[0]
+        pytest_path = shutil.which(command_parts[0]) or command_parts[0]
+        for name in ("python", "python3", "python.exe"):
+            candidate = Path(pytest_path).parent / name
+            if candidate.exists():
+                return str(candidate)
+        return sys.executable
+
+    def _run_shards(
+        self,
+        command_parts: list[str],
+        base: list[str],
+        shards: list[Shard],
+        timeout: float,
+    ) -> CommandResult:
+        start_time = time.time()
+        has_coverage = any(_option_name(arg) == "--cov" for arg in command_parts)
+        shard_base = _remove_options(base, SHARD_REPORT_OPTIONS)
+        if has_coverage:
+            shard_base.append("--cov-report=")
+
+        with tempfile.TemporaryDirectory(prefix="solokit-shards-") as temp_dir:
+            work_dir = Path(temp_dir)
+
+            def run_shard(shard: Shard) -> CommandResult:
+                command = [
+                    *shard_base,
+                    f"--junitxml={work_dir / f'shard-{shard.index}.xml'}",
+                    *shard.files,
+                ]
+                env = None
+                if has_coverage:
+                    env = {
+                        **os.environ,
+                        "COVERAGE_FILE": str(work_dir / f".coverage.shard-{shard.index}"),
+                    }
+                return self.runner.run(
+                    command,
+                    timeout=timeout,
+                    working_dir=self.project_root,
+                    env=env,
+                    stream=StreamOptions(
+                        log_file=self._shard_log_file(shard), label=f"shard {shard.index + 1}"
+                    ),
+                )
+
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                results = list(executor.map(run_shard, shards))
+
+            reports = [work_dir / f"shard-{shard.index}.xml" for shard in shards]
+            durations: dict[str, float] = {}
+            for shard, report in zip(shards, reports):
+                durations.update(junit_file_durations(report, shard.files))
+            save_test_durations(self.project_root, durations)
+
+            for target in _option_values(command_parts, "--junitxml") + _option_values(
+                command_parts, "--junit-xml"
+            ):
+                merge_junit_reports(reports, self.project_root / target)
+
+            coverage_output = ""
+            coverage_met = True
+            if has_coverage:
+                coverage_output, coverage_met = self._combine_coverage(
+                    command_parts, sorted(work_dir.glob(".coverage.shard-*"))
+                )
+
+        stdout = "".join(
+            f"=== shard {shard.index + 1}/{len(shards)}: {len(shard.files)} file(s) ===\n"
+            f"{result.stdout}\n"
+            for shard, result in zip(shards, results)
+        )
+        returncode = _merge_returncodes([result.returncode for result in results])
+        if returncode == 0 and not coverage_met:
+            # pytest-cov fails an otherwise passing run below --cov-fail-under
+            returncode = 1
+        return CommandResult(
+            returncode=-1 if any(result.timed_out for result in results) else returncode,
+            stdout=stdout + coverage_output,
+            stderr="".join(result.stderr for result in results),
+            command=command_parts,
+            duration_seconds=time.time() - start_time,
+            timed_out=any(result.timed_out for result in results),
+            truncated=any(result.truncated for result in results),
+            log_file=self._merge_logs(shards),
+        )
+
+    def _combine_coverage(
+        self, command_parts: list[str], data_files: list[Path]
+    ) -> tuple[str, bool]:
+        """
+        Combine shard coverage data and produce the command's coverage reports.
+
+        ``--cov-fail-under`` is stripped from the shards, since each only sees
+        part of the coverage, and checked here against the combined data.
+
+        Args:
+            command_parts: The unsharded pytest command
+            data_files: Coverage data files written by the shards
+
+        Returns:
+            Tuple of (terminal report output, whether the coverage threshold was met)
+        """
+        fail_under = _option_values(command_parts, "--cov-fail-under")
+        threshold = [f"--fail-under={fail_under[-1]}"] if fail_under else []
+        if not data_files:
+            return "", not threshold
+        python = self._python_for(command_parts)
+        env = {**os.environ, "COVERAGE_FILE": str(self.project_root / ".coverage")}
+
+        combine = self.runner.run(
+            [python, "-m", "coverage", "combine", *map(str, data_files)],
+            timeout=QUALITY_CHECK_LONG_TIMEOUT,
+            working_dir=self.project_root,
+            env=env,
+        )
+        if not combine.success:
+            logger.warning(f"Failed to combine shard coverage data: {combine.stderr[:200]}")
+            return "", not threshold
+
+        output = []
+        threshold_met: bool | None = None
+        # pytest-cov reports to the terminal unless told otherwise
+        for report in _option_values(command_parts, "--cov-report") or ["term"]:
+            kind, _, target = report.partition(":")
+            command = COVERAGE_REPORT_COMMANDS.get(kind)
+            if command is None:
+                continue
+            if target:
+                command = [*command, "-d" if kind == "html" else "-o", target]
+            if command[0] == "report":
+                command = [*command, *threshold]
+            result = self.runner.run(
+                [python, "-m", "coverage", *command],
+                timeout=QUALITY_CHECK_LONG_TIMEOUT,
+                working_dir=self.project_root,
+                env=env,
+            )
+            if command[0] == "report" and result.returncode in (0, 2):
+                # coverage report exits 2 when the total is below --fail-under
+                threshold_met = result.returncode == 0
+                output.append(result.stdout)
+            elif not result.success:
+                logger.warning(f"Coverage {kind} report failed: {result.stderr[:200]}")
+
+        if threshold and threshold_met is None:
+            # No terminal report was requested; check the threshold on its own
+            result = self.runner.run(
+                [python, "-m", "coverage", "report", *threshold],
+                timeout=QUALITY_CHECK_LONG_TIMEOUT,
+                working_dir=self.project_root,
+                env=env,
+            )
+            threshold_met = result.returncode == 0
+        if threshold_met is False and threshold:
+            output.append(f"FAIL Required test coverage of {fail_under[-1]}% not reached.\n")
+        return "".join(output), threshold_met is not False
+
+    def _merge_logs(self, shards: list[Shard]) -> Path | None:
+        """Concatenate shard logs into the merged log file."""
+        if self.log_file is None:
+            return None
+        merged = self.log_file
+        try:
+            with open(merged, "w", encoding="utf-8") as out:
+                for shard in shards:
+                    shard_log = self._shard_log_file(shard)
+                    if shard_log is not None and shard_log.exists():
+                        out.write(f"=== shard {shard.index + 1}/{len(shards)} ===\n")
+                        out.write(shard_log.read_text(encoding="utf-8", errors="replace"))
+        except OSError as e:
+            logger.debug(f"Failed to merge shard logs: {e}")
+            return None
+        return merged
@@ -50,6 +50,7 @@ from solokit.session.briefing import (
     shift_heading_levels,  # noqa: F401
     validate_environment,  # noqa: F401
 )
+from solokit.session.status_cache import refresh_status_cache
 
 logger = get_logger(__name__)
 output = get_output()
@@ -81,6 +82,11 @@ def main():
         action="store_true",
         help="Force start even if another item is in-progress",
     )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Regenerate every briefing section instead of reusing cached ones",
+    )
     args = parser.parse_args()
 
     logger.info("Starting session briefing generation")
@@ -187,7 +193,7 @@ def main():
 
     logger.info("Generating briefing for work item: %s", item_id)
     # Generate briefing
-    briefing = generate_briefing(item_id, item, learnings_data)
+    briefing = generate_briefing(item_id, item, learnings_data, fresh=args.fresh)
 
     # Save briefing
     briefings_dir = session_dir / "briefings"
@@ -303,6 +309,7 @@ def main():
     }
     with open(status_file, "w") as f:
         json.dump(status, f, indent=2)
+    refresh_status_cache(session_dir)
 
     return 0
 
@@ -221,9 +221,9 @@ def check_git_status() -> dict[str, Any]:
     return context.check_git_status()
 
 
-def generate_briefing(item_id: str, item: dict, learnings_data: dict) -> str:
+def generate_briefing(item_id: str, item: dict, learnings_data: dict, fresh: bool = False) -> str:
     """Generate comprehensive markdown briefing (backward compatibility wrapper)."""
-    briefing = SessionBriefing()
+    briefing = SessionBriefing(fresh=fresh)
     return briefing.generate_briefing(item_id, item, learnings_data)
 
 
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Briefing context budget.
+Part of the briefing module decomposition.
+
+On large projects the full tree.txt, project docs and stack can make a briefing
+several megabytes. When the rendered sections exceed the configured budget
+(``briefing.max_bytes`` / ``briefing.max_tokens``), the remaining space is split
+across the docs, stack, tree and learnings by priority, and each over-budget
+section is shrunk to its share:
+
+- the tree is collapsed to the directories relevant to the spec and to recently
+  changed files, then expanded breadth-first while it fits
+- docs keep their introduction and the headings most relevant to the work item
+- the stack and learnings are cut at a line boundary
+
+Shrunk sections end with a "truncated, see <file>" marker. The spec, spec
+validation and milestone are never shrunk.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from solokit.core.logging_config import get_logger
+
+from .formatter import BriefingFormatter
+
+logger = get_logger(__name__)
+
+# Rough size of a token, used to convert briefing.max_tokens into bytes
+BYTES_PER_TOKEN = 4
+
+# Sections the budget may shrink, most important first
+BUDGETED_SECTIONS = ("learnings", "stack", "project_docs", "tree")
+
+# Docs rendered into the briefing, with the path shown in truncation markers
+BUDGETED_DOCS = {"vision.md": "docs/vision.md", "architecture.md": "docs/architecture.md"}
+
+TRUNCATION_MARKER = "[... truncated, see {source}]"
+
+# Approximate length of the "(N entries hidden)" note on a collapsed directory
+_COLLAPSED_NOTE_BYTES = 24
+
+# Path-like tokens in a spec: "src/app/models", "config.json"
+_SPEC_PATH_PATTERN = re.compile(r"[\w.-]+(?:/[\w.-]+)+/?|\b[\w-]+\.[A-Za-z][A-Za-z0-9]{0,4}\b")
+
+
+def budget_bytes(max_bytes: int, max_tokens: int) -> int:
+    """
+    Combine the byte and token limits into one byte budget.
+
+    Args:
+        max_bytes: Byte limit (0 for none)
+        max_tokens: Token limit (0 for none)
+
+    Returns:
+        The smaller limit in bytes, or 0 if neither is set
+    """
+    limits = [limit for limit in (max_bytes, max_tokens * BYTES_PER_TOKEN) if limit > 0]
+    return min(limits) if limits else 0
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _keywords(text: str) -> set[str]:
+    """Lowercase words longer than 3 characters."""
+    return {word for word in re.findall(r"\b\w+\b", text.lower()) if len(word) > 3}
+
+
+def allocate(sizes: dict[str, int], budget: int, priority: Iterable[str]) -> dict[str, int]:
+    """
+    Split a byte budget across sections by priority.
+
+    Each section is offered a share of the remaining budget weighted by its
+    priority. Sections smaller than their share keep their full size and the
+    space they don't use is offered to the others.
+
+    Args:
+        sizes: Full size of each section in bytes
+        budget: Bytes available to the sections
+        priority: Section names, most important first
+
+    Returns:
+        Bytes allotted to each section
+    """
+    order = [name for name in priority if name in sizes]
+    weights = {name: len(order) - index for index, name in enumerate(order)}
+    allotted: dict[str, int] = {}
+    remaining = max(0, budget)
+    pending = list(order)
+    while pending:
+        total_weight = sum(weights[name] for name in pending)
+        shares = {name: remaining * weights[name] // total_weight for name in pending}
+        fitting = [name for name in pending if sizes[name] <= shares[name]]
+        if not fitting:
+            allotted.update(shares)
+            break
+        for name in fitting:
+            allotted[name] = sizes[name]
+            remaining -= sizes[name]
+            pending.remove(name)
+    return allotted
+
+
+def truncate_text(text: str, limit: int, source: str) -> str:
+    """
+    Cut text at a line boundary to fit a byte limit.
+
+    Args:
+        text: Text to shrink
+        limit: Maximum size in bytes
+        source: File holding the full content, named in the marker
+
+    Returns:
+        The text, or its first lines followed by a truncation marker
+    """
+    if _size(text) <= limit:
+        return text
+    marker = TRUNCATION_MARKER.format(source=source)
+    room = max(0, limit - _size(marker) - 1)
+    head = text.encode("utf-8")[:room].decode("utf-8", errors="ignore")
+    if "\n" in head:
+        head = head[: head.rindex("\n") + 1]
+    else:
+        head = ""
+    return f"{head}{marker}"
+
+
+def spec_paths(spec: str) -> set[str]:
+    """
+    Find file and directory references in a spec.
+
+    Args:
+        spec: Spec content
+
+    Returns:
+        Path-like tokens without surrounding slashes (e.g. "src/app", "config.json")
+    """
+    paths = set()
+    for match in _SPEC_PATH_PATTERN.findall(spec):
+        # Sentence punctuation and "./" prefixes aren't part of the path
+        path = match.rstrip("./").removeprefix("./")
+        if path:
+            paths.add(path)
+    return paths
+
+
+def collapse_tree(tree: str, relevant_paths: Iterable[str], limit: int, source: str) -> str:
+    """
+    Collapse a tree listing to the directories that matter.
+
+    Top-level entries and every directory leading to a relevant path are always
+    shown. Other directories are then expanded breadth-first while the listing
+    fits; the rest show how many entries they hide.
+
+    Args:
+        tree: Tree listing (``tree`` command output or solokit's fallback)
+        relevant_paths: Paths relative to the project root, or suffixes of them
+        limit: Maximum size in bytes
+        source: File holding the full tree, named in the marker
+
+    Returns:
+        The collapsed tree, ending with a truncation marker if anything was hidden
+    """
+    if _size(tree) <= limit:
+        return tree
+
+    lines = tree.splitlines()
+    # Per line: (depth, path) for entries, None for the root and summary lines
+    entries: list[tuple[int, str] | None] = []
+    ancestors: list[str] = []
+    for line in lines:
+        connector = next((i for i, char in enumerate(line) if char in "├└"), -1)
+        if connector < 0:
+            entries.append(None)
+            continue
+        depth = connector // 4
+        del ancestors[depth:]
+        ancestors.append(line[connector + 3 :].strip())
+        entries.append((depth, "/".join(ancestors)))
+
+    # Children (line indexes) of each entry, and how many entries each subtree holds
+    children: dict[str, list[int]] = {}
+    descendants: dict[str, int] = {}
+    for index, entry in enumerate(entries):
+        if entry and entry[0] > 0:
+            parent = entry[1].rsplit("/", 1)[0]
+            children.setdefault(parent, []).append(index)
+            while parent:
+                descendants[parent] = descendants.get(parent, 0) + 1
+                parent = parent.rsplit("/", 1)[0] if "/" in parent else ""
+
+    relevant = {path.strip("/") for path in relevant_paths}
+    expanded: set[str] = set()
+    for entry in entries:
+        if entry is None:
+            continue
+        parts = entry[1].split("/")
+        # A reference matches the entry's path or any trailing part of it
+        if any("/".join(parts[start:]) in relevant for start in range(len(parts))):
+            expanded.update("/".join(parts[:end]) for end in range(1, len(parts) + 1))
+
+    def is_shown(entry: tuple[int, str] | None) -> bool:
+        return entry is None or entry[0] == 0 or entry[1].rsplit("/", 1)[0] in expanded
+
+    def line_cost(index: int) -> int:
+        entry = entries[index]
+        note = _COLLAPSED_NOTE_BYTES if entry and entry[1] in children else 0
+        return _size(lines[index]) + 1 + note
+
+    used = sum(line_cost(i) for i, entry in enumerate(entries) if is_shown(entry))
+    room = limit - _size(TRUNCATION_MARKER.format(source=source)) - 1
+    # Shallow directories first, so the overall layout stays visible
+    candidates = sorted(
+        (entry for entry in entries if entry and entry[1] in children),
+        key=lambda entry: entry[0],
+    )
+    for depth, path in candidates:
+        if path in expanded or not is_shown((depth, path)):
+            continue
+        cost = sum(line_cost(i) for i in children[path]) - _COLLAPSED_NOTE_BYTES
+        if used + cost <= room:
+            expanded.add(path)
+            used += cost
+
+    output = []
+    for line, entry in zip(lines, entries):
+        if not is_shown(entry):
+            continue
+        if entry and entry[1] in children and entry[1] not in expanded:
+            line += f"  ({descendants[entry[1]]} entries hidden)"
+        output.append(line)
+    output.append(TRUNCATION_MARKER.format(source=source))
+    return truncate_text("\n".join(output), limit, source)
+
+
+def excerpt_markdown(text: str, keywords: set[str], limit: int, source: str) -> str:
+    """
+    Excerpt a markdown document by heading relevance.
+
+    The document is split at its headings. The introduction (up to and
+    including the first heading's section) is kept, then the sections sharing
+    the most keywords with the work item, in document order.
+
+    Args:
+        text: Markdown document
+        keywords: Work item keywords (see _keywords)
+        limit: Maximum size in bytes
+        source: Document path, named in the marker
+
+    Returns:
+        The document, or an excerpt ending with a truncation marker
+    """
+    if _size(text) <= limit:
+        return text
+
+    chunks: list[str] = []
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.startswith(("```", "~~~")):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("#") and chunks and chunks[-1].strip():
+            chunks.append(line)
+        elif chunks:
+            chunks[-1] += line
+        else:
+            chunks.append(line)
+
+    marker = TRUNCATION_MARKER.format(source=source)
+    room = limit - _size(marker) - 2
+    if not chunks or _size(chunks[0]) > room:
+        return truncate_text(text, limit, source)
+
+    chosen = {0}
+    used = _size(chunks[0])
+    scores = {index: len(keywords & _keywords(chunks[index])) for index in range(1, len(chunks))}
+    for index in sorted(scores, key=lambda index: (-scores[index], index)):
+        if used + _size(chunks[index]) <= room:
+            chosen.add(index)
+            used += _size(chunks[index])
+    excerpt = "".join(chunks[index] for index in sorted(chosen))
+    return f"{excerpt.rstrip()}\n\n{marker}"
+
+
+class ContextBudgeter:
+    """Shrinks briefing sections to fit a byte budget."""
+
+    def __init__(
+        self,
+        formatter: BriefingFormatter,
+        max_bytes: int,
+        stack_file: Path,
+        tree_file: Path,
+        learnings_file: Path,
+    ):
+        """
+        Initialize context budgeter.
+
+        Args:
+            formatter: Formatter used to re-render shrunk sections
+            max_bytes: Byte budget for the rendered sections (0 for none)
+            stack_file: Full stack file, named in truncation markers
+            tree_file: Full tree file, named in truncation markers
+            learnings_file: Full learnings file, named in truncation markers
+        """
+        self.formatter = formatter
+        self.max_bytes = max_bytes
+        self.stack_file = stack_file
+        self.tree_file = tree_file
+        self.learnings_file = learnings_file
+
+    def fit(
+        self,
+        sections: dict[str, str],
+        project_docs: dict[str, str],
+        stack: str,
+        tree: str,
+        work_item_text: str,
+        changed_files: Callable[[], Iterable[str]],
+    ) -> dict[str, str]:
+        """
+        Shrink the budgeted sections if the briefing exceeds the budget.
+
+        Args:
+            sections: Rendered sections by name
+            project_docs: Project documentation the docs section was rendered from
+            stack: Stack the stack section was rendered from
+            tree: Tree the tree section was rendered from
+            work_item_text: Work item title and spec, to rank tree paths and doc headings
+            changed_files: Returns recently changed files (only called if the tree is shrunk)
+
+        Returns:
+            Sections with over-budget ones shrunk (the input is not modified)
+        """
+        sizes = {name: _size(text) for name, text in sections.items()}
+        total = sum(sizes.values())
+        if not self.max_bytes or total <= self.max_bytes:
+            return sections
+
+        fixed = sum(size for name, size in sizes.items() if name not in BUDGETED_SECTIONS)
+        limits = allocate(
+            {name: sizes[name] for name in BUDGETED_SECTIONS if name in sizes},
+            self.max_bytes - fixed,
+            BUDGETED_SECTIONS,
+        )
+
+        fitted = dict(sections)
+        for name, limit in limits.items():
+            if sizes[name] <= limit:
+                continue
+            if name == "stack":
+                room = limit - _size(self.formatter.render_stack(""))
+                fitted[name] = self.formatter.render_stack(
+                    truncate_text(stack, room, str(self.stack_file))
+                )
+            elif name == "tree":
+                room = limit - _size(self.formatter.render_tree(""))
+                relevant = spec_paths(work_item_text) | set(changed_files())
+                fitted[name] = self.formatter.render_tree(
+                    collapse_tree(tree, relevant, room, str(self.tree_file))
+                )
+            elif name == "project_docs":
+                fitted[name] = self._fit_docs(project_docs, limit, _keywords(work_item_text))
+            else:
+                fitted[name] = truncate_text(sections[name], limit, str(self.learnings_file))
+
+        logger.debug(
+            f"Briefing context exceeds budget ({total} > {self.max_bytes} bytes), shrank: "
+            + ", ".join(name for name in limits if fitted[name] != sections[name])
+        )
+        return fitted
+
+    def _fit_docs(self, project_docs: dict[str, str], limit: int, keywords: set[str]) -> str:
+        """Excerpt the rendered docs so that together they fit the limit."""
+        docs = {name: project_docs[name] for name in BUDGETED_DOCS if name in project_docs}
+        overhead = _size(self.formatter.render_project_docs(dict.fromkeys(docs, "")))
+        limits = allocate(
+            {name: _size(content) for name, content in docs.items()},
+            limit - overhead,
+            list(docs),
+        )
+        return self.formatter.render_project_docs(
+            {
+                name: excerpt_markdown(content, keywords, limits[name], BUDGETED_DOCS[name])
+                for name, content in docs.items()
+            }
+        )
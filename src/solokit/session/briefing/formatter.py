@@ -15,6 +15,7 @@ from solokit.core.exceptions import (
 )
 from solokit.core.logging_config import get_logger
 from solokit.core.types import WorkItemStatus, WorkItemType
+from solokit.work_items.spec_parser import SpecSectionIndex
 
 logger = get_logger(__name__)
 
@@ -111,6 +112,10 @@ class BriefingFormatter:
         Returns:
             Section content (without the heading itself)
         """
+        if heading.startswith("## "):
+            # H2 headings resolve through the single-pass section index
+            return SpecSectionIndex(markdown).section_by_prefix(heading)
+
         lines = markdown.split("\n")
         section_lines = []
         in_section = False
@@ -208,6 +213,18 @@ class BriefingFormatter:
         result = self.runner.run([command, "--version"])
         return result.success
 
+    def check_commands_exist(self, commands: list[str]) -> dict[str, bool]:
+        """Check if several commands are available, probing them concurrently.
+
+        Args:
+            commands: Commands to check
+
+        Returns:
+            Availability keyed by command name
+        """
+        results = self.runner.run_many([[command, "--version"] for command in commands])
+        return {command: result.success for command, result in zip(commands, results)}
+
     def generate_integration_test_briefing(self, work_item: dict) -> str:
         """Generate integration test specific briefing sections.
 
@@ -278,12 +295,12 @@ class BriefingFormatter:
         # 6. Environment validation status
         briefing += "**Pre-Session Checks:**\n"
 
-        # Check Docker
-        docker_available = self.check_command_exists("docker")
+        # Check Docker and Docker Compose
+        available = self.check_commands_exist(["docker", "docker-compose"])
+        docker_available = available["docker"]
         briefing += f"- Docker: {'✓ Available' if docker_available else '✗ Not found'}\n"
 
-        # Check Docker Compose
-        compose_available = self.check_command_exists("docker-compose")
+        compose_available = available["docker-compose"]
         briefing += f"- Docker Compose: {'✓ Available' if compose_available else '✗ Not found'}\n"
 
         # Check compose file
@@ -371,34 +388,128 @@ class BriefingFormatter:
 
         return "\n".join(briefing)
 
-    def generate_briefing(
+    def render_project_docs(self, project_docs: dict[str, str]) -> str:
+        """Render the vision and architecture docs of the Project Context section.
+
+        Args:
+            project_docs: Project documentation (dict of filename -> content)
+
+        Returns:
+            Markdown for the docs (empty if neither is available)
+        """
+        rendered = ""
+
+        # Vision (if available) - shift headings to maintain hierarchy under H3
+        if "vision.md" in project_docs:
+            shifted_vision = self.shift_heading_levels(project_docs["vision.md"], 3)
+            rendered += f"### Vision\n\n{shifted_vision}\n\n"
+
+        # Architecture (if available) - shift headings to maintain hierarchy under H3
+        if "architecture.md" in project_docs:
+            shifted_arch = self.shift_heading_levels(project_docs["architecture.md"], 3)
+            rendered += f"### Architecture\n\n{shifted_arch}\n\n"
+
+        return rendered
+
+    def render_stack(self, current_stack: str) -> str:
+        """Render the Current Stack section."""
+        return f"### Current Stack\n```\n{current_stack}\n```\n\n"
+
+    def render_tree(self, current_tree: str) -> str:
+        """Render the Project Structure section (full tree)."""
+        return f"### Project Structure\n```\n{current_tree}\n```\n\n"
+
+    def render_spec_validation(self, spec_validation_warning: Optional[str]) -> str:
+        """Render the spec validation warning (empty if the spec is complete)."""
+        if not spec_validation_warning:
+            return ""
+        return f"""## ⚠️ Specification Validation Warning
+
+{spec_validation_warning}
+
+**Note:** Please review and complete the specification before proceeding with implementation.
+
+"""
+
+    def render_spec(self, work_item_spec: str) -> str:
+        """Render the Work Item Specification section.
+
+        Template comments are stripped and headings shifted to stay under H2.
+        """
+        cleaned_spec = self.strip_template_comments(work_item_spec)
+        shifted_spec = self.shift_heading_levels(cleaned_spec, 2)
+        return f"""## Work Item Specification
+
+{shifted_spec}
+
+"""
+
+    def render_milestone(self, milestone_context: Optional[dict], item_id: str) -> str:
+        """Render the Milestone Context section.
+
+        Args:
+            milestone_context: Optional milestone context
+            item_id: Work item identifier (left out of the related items)
+
+        Returns:
+            Markdown for the milestone (empty if the item has none)
+        """
+        if not milestone_context:
+            return ""
+
+        rendered = f"""
+## Milestone Context
+
+**{milestone_context["title"]}**
+{milestone_context["description"]}
+
+Progress: {milestone_context["progress"]}% ({milestone_context["completed_items"]}"""
+        rendered += f"""/{milestone_context["total_items"]} items complete)
+"""
+        if milestone_context["target_date"]:
+            rendered += f"Target Date: {milestone_context['target_date']}\n"
+
+        rendered += "\nRelated work items in this milestone:\n"
+        # Show other items in same milestone
+        for related_item in milestone_context["milestone_items"]:
+            if related_item["id"] != item_id:
+                status_icon = (
+                    "✓" if related_item["status"] == WorkItemStatus.COMPLETED.value else "○"
+                )
+                rendered += f"- {status_icon} {related_item['id']} - {related_item['title']}\n"
+        rendered += "\n"
+        return rendered
+
+    def render_learnings(self, relevant_learnings: list[dict]) -> str:
+        """Render the Relevant Learnings section (empty if there are none)."""
+        if not relevant_learnings:
+            return ""
+        rendered = "\n## Relevant Learnings\n\n"
+        for learning in relevant_learnings:
+            rendered += f"**{learning.get('category', 'general')}:** {learning['content']}\n\n"
+        return rendered
+
+    def assemble_briefing(
         self,
         item_id: str,
         item: dict,
-        project_docs: dict[str, str],
-        current_stack: str,
-        current_tree: str,
-        work_item_spec: str,
         env_checks: list[str],
         git_status: dict,
-        spec_validation_warning: Optional[str],
-        milestone_context: Optional[dict],
-        relevant_learnings: list[dict],
+        sections: dict[str, str],
     ) -> str:
-        """Generate comprehensive markdown briefing with full project context.
+        """Assemble a briefing from rendered sections.
+
+        The header, environment, git status, previous work and dependencies are
+        rendered here as they change between runs; everything else comes from
+        the render_* methods (possibly cached).
 
         Args:
             item_id: Work item identifier
             item: Work item dictionary
-            project_docs: Project documentation (dict of filename -> content)
-            current_stack: Technology stack information
-            current_tree: Project directory tree
-            work_item_spec: Work item specification content
             env_checks: Environment validation checks
             git_status: Git status information
-            spec_validation_warning: Optional spec validation warning
-            milestone_context: Optional milestone context
-            relevant_learnings: List of relevant learnings
+            sections: Rendered sections by name (project_docs, stack, tree,
+                spec_validation, spec, milestone, learnings)
 
         Returns:
             Complete briefing as markdown string
@@ -427,32 +538,12 @@ class BriefingFormatter:
 
         # Project context section
         briefing += "\n## Project Context\n\n"
-
-        # Vision (if available) - shift headings to maintain hierarchy under H3
-        if "vision.md" in project_docs:
-            shifted_vision = self.shift_heading_levels(project_docs["vision.md"], 3)
-            briefing += f"### Vision\n\n{shifted_vision}\n\n"
-
-        # Architecture (if available) - shift headings to maintain hierarchy under H3
-        if "architecture.md" in project_docs:
-            shifted_arch = self.shift_heading_levels(project_docs["architecture.md"], 3)
-            briefing += f"### Architecture\n\n{shifted_arch}\n\n"
-
-        # Current stack
-        briefing += f"### Current Stack\n```\n{current_stack}\n```\n\n"
-
-        # Project structure - full tree
-        briefing += f"### Project Structure\n```\n{current_tree}\n```\n\n"
+        briefing += sections["project_docs"]
+        briefing += sections["stack"]
+        briefing += sections["tree"]
 
         # Spec validation warning (if spec is incomplete)
-        if spec_validation_warning:
-            briefing += f"""## ⚠️ Specification Validation Warning
-
-{spec_validation_warning}
-
-**Note:** Please review and complete the specification before proceeding with implementation.
-
-"""
+        briefing += sections["spec_validation"]
 
         # Add previous work section for in-progress items (Enhancement #11 Phase 3)
         if item.get("status") == WorkItemStatus.IN_PROGRESS.value:
@@ -460,51 +551,60 @@ class BriefingFormatter:
             if previous_work:
                 briefing += previous_work
 
-        # Work item specification - strip comments and shift headings to maintain hierarchy under H2
-        cleaned_spec = self.strip_template_comments(work_item_spec)
-        shifted_spec = self.shift_heading_levels(cleaned_spec, 2)
-        briefing += f"""## Work Item Specification
-
-{shifted_spec}
-
-## Dependencies
-"""
+        briefing += sections["spec"]
 
         # Show dependency status
+        briefing += "## Dependencies\n"
         if item.get("dependencies"):
             for dep in item["dependencies"]:
                 briefing += f"- {dep} ✓ completed\n"
         else:
             briefing += "No dependencies\n"
 
-        # Add milestone context
-        if milestone_context:
-            briefing += f"""
-## Milestone Context
+        briefing += sections["milestone"]
+        briefing += sections["learnings"]
 
-**{milestone_context["title"]}**
-{milestone_context["description"]}
+        return briefing
 
-Progress: {milestone_context["progress"]}% ({milestone_context["completed_items"]}"""
-            briefing += f"""/{milestone_context["total_items"]} items complete)
-"""
-            if milestone_context["target_date"]:
-                briefing += f"Target Date: {milestone_context['target_date']}\n"
-
-            briefing += "\nRelated work items in this milestone:\n"
-            # Show other items in same milestone
-            for related_item in milestone_context["milestone_items"]:
-                if related_item["id"] != item_id:
-                    status_icon = (
-                        "✓" if related_item["status"] == WorkItemStatus.COMPLETED.value else "○"
-                    )
-                    briefing += f"- {status_icon} {related_item['id']} - {related_item['title']}\n"
-            briefing += "\n"
+    def generate_briefing(
+        self,
+        item_id: str,
+        item: dict,
+        project_docs: dict[str, str],
+        current_stack: str,
+        current_tree: str,
+        work_item_spec: str,
+        env_checks: list[str],
+        git_status: dict,
+        spec_validation_warning: Optional[str],
+        milestone_context: Optional[dict],
+        relevant_learnings: list[dict],
+    ) -> str:
+        """Generate comprehensive markdown briefing with full project context.
 
-        # Relevant learnings
-        if relevant_learnings:
-            briefing += "\n## Relevant Learnings\n\n"
-            for learning in relevant_learnings:
-                briefing += f"**{learning.get('category', 'general')}:** {learning['content']}\n\n"
+        Args:
+            item_id: Work item identifier
+            item: Work item dictionary
+            project_docs: Project documentation (dict of filename -> content)
+            current_stack: Technology stack information
+            current_tree: Project directory tree
+            work_item_spec: Work item specification content
+            env_checks: Environment validation checks
+            git_status: Git status information
+            spec_validation_warning: Optional spec validation warning
+            milestone_context: Optional milestone context
+            relevant_learnings: List of relevant learnings
 
-        return briefing
+        Returns:
+            Complete briefing as markdown string
+        """
+        sections = {
+            "project_docs": self.render_project_docs(project_docs),
+            "stack": self.render_stack(current_stack),
+            "tree": self.render_tree(current_tree),
+            "spec_validation": self.render_spec_validation(spec_validation_warning),
+            "spec": self.render_spec(work_item_spec),
+            "milestone": self.render_milestone(milestone_context, item_id),
+            "learnings": self.render_learnings(relevant_learnings),
+        }
+        return self.assemble_briefing(item_id, item, env_checks, git_status, sections)
@@ -11,14 +11,25 @@ from typing import Any, Optional
 from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import GIT_QUICK_TIMEOUT
 from solokit.core.error_handlers import log_errors
-from solokit.core.exceptions import ErrorCode, GitError, SystemError
+from solokit.core.exceptions import (
+    CommandExecutionError,
+    ErrorCode,
+    GitError,
+    NotAGitRepoError,
+    SystemError,
+)
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import GitStatus, WorkItemStatus
+from solokit.git.objects import get_object_reader
+from solokit.git.snapshot import get_git_snapshot
 
 logger = get_logger(__name__)
 output = get_output()
 
+# Commits whose files count as recently changed
+RECENT_COMMITS = 20
+
 
 class GitContext:
     """Handle git status and branch information."""
@@ -85,6 +96,25 @@ class GitContext:
                 cause=e,
             ) from e
 
+    def get_recently_changed_files(self, max_commits: int = RECENT_COMMITS) -> list[str]:
+        """List files changed in recent commits or not yet committed.
+
+        Args:
+            max_commits: Number of recent commits to look at
+
+        Returns:
+            Paths relative to the repository root (empty outside a git repository)
+        """
+        files: list[str] = []
+        result = self.runner.run(["git", "log", f"-{max_commits}", "--name-only", "--format="])
+        if result.success:
+            files.extend(line for line in result.stdout.splitlines() if line)
+        try:
+            files.extend(get_git_snapshot(runner=self.runner).changed_files)
+        except (NotAGitRepoError, CommandExecutionError) as e:
+            logger.debug(f"Could not list uncommitted changes: {e}")
+        return list(dict.fromkeys(files))
+
     @log_errors()
     def determine_git_branch_final_status(self, branch_name: str, git_info: dict) -> str:
         """Determine the final status of a git branch by inspecting actual git state.
@@ -103,9 +133,16 @@ class GitContext:
         parent_branch = git_info.get("parent_branch", "main")
 
         try:
+            # Local branch tip, read over the shared cat-file batch process
+            reader = get_object_reader(runner=self.runner)
+            try:
+                branch_tip = reader.resolve(f"refs/heads/{branch_name}")
+            except GitError as e:
+                logger.debug(f"Could not read local branch {branch_name}: {e}")
+                branch_tip = None
+
             # Check 1: Is branch merged?
-            result = self.runner.run(["git", "branch", "--merged", parent_branch])
-            if result.success and branch_name in result.stdout:
+            if branch_tip and reader.is_ancestor(branch_tip, parent_branch):
                 logger.debug(f"Branch {branch_name} is merged to {parent_branch}")
                 return GitStatus.MERGED.value
 
@@ -147,8 +184,7 @@ class GitContext:
                 logger.debug("gh CLI not available or no PRs found")
 
             # Check 3: Does branch still exist locally?
-            result = self.runner.run(["git", "show-ref", "--verify", f"refs/heads/{branch_name}"])
-            if result.success:
+            if branch_tip:
                 logger.debug(f"Branch {branch_name} exists locally")
                 # Branch exists locally, no PR found
                 return GitStatus.READY_FOR_PR.value
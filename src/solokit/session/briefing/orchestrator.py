@@ -2,26 +2,63 @@
 """
 Session briefing orchestrator.
 Coordinates all briefing components to generate comprehensive session briefings.
+
+The briefing's context (docs, stack, tree, spec, environment and git checks,
+spec validation, milestone) is loaded concurrently on a thread pool, so
+generation takes about as long as the slowest loader. Per-section load times
+are logged in verbose mode.
+
+Rendered sections are cached with a fingerprint of their inputs (see
+section_cache), so re-running ``sk start`` on the same item only re-renders the
+sections whose docs, stack, tree, spec, learnings or milestone changed. The
+environment and git checks always run. Finally, the sections are fitted to the
+configured context budget (see budget).
 """
 
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+from typing import Any, TypeVar
 
+from solokit.core.config import get_config_manager
 from solokit.core.exceptions import GitError, SystemError
 from solokit.core.logging_config import get_logger
 
+from .budget import ContextBudgeter, budget_bytes
 from .documentation_loader import DocumentationLoader
 from .formatter import BriefingFormatter
 from .git_context import GitContext
 from .learning_loader import LearningLoader
 from .milestone_builder import MilestoneBuilder
+from .section_cache import BriefingSectionCache, fingerprint
 from .stack_detector import StackDetector
 from .tree_generator import TreeGenerator
 from .work_item_loader import WorkItemLoader
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+def _timed(load: Callable[[], T]) -> tuple[T, float]:
+    """Run a context loader, returning its result and duration in seconds."""
+    start = time.perf_counter()
+    result = load()
+    return result, time.perf_counter() - start
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    """Read a file for fingerprinting (None if it doesn't exist)."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
 
 class SessionBriefing:
     """Orchestrate generation of comprehensive session briefings."""
@@ -30,12 +67,14 @@ class SessionBriefing:
         self,
         session_dir: Path | None = None,
         project_root: Path | None = None,
+        fresh: bool = False,
     ):
         """Initialize session briefing orchestrator.
 
         Args:
             session_dir: Path to .session directory (defaults to .session)
             project_root: Path to project root (defaults to current directory)
+            fresh: Re-render every section instead of reusing cached ones
         """
         self.session_dir = session_dir or Path(".session")
         self.project_root = project_root or Path.cwd()
@@ -49,6 +88,23 @@ class SessionBriefing:
         self.git_context = GitContext()
         self.milestone_builder = MilestoneBuilder(session_dir=self.session_dir)
         self.formatter = BriefingFormatter()
+        self.section_cache = BriefingSectionCache(self.session_dir, enabled=not fresh)
+
+        config_manager = get_config_manager()
+        config_manager.load_config(self.session_dir / "config.json")
+        self.budgeter = ContextBudgeter(
+            self.formatter,
+            budget_bytes(config_manager.briefing.max_bytes, config_manager.briefing.max_tokens),
+            stack_file=self.stack_detector.stack_file,
+            tree_file=self.tree_generator.tree_file,
+            learnings_file=self.learning_loader.learnings_file,
+        )
+
+        # Sections reused from the cache in the last generate_briefing()
+        self.cached_sections: set[str] = set()
+
+        # Seconds each context section took to load in the last generate_briefing()
+        self.section_timings: dict[str, float] = {}
 
     def generate_briefing(self, item_id: str, item: dict, learnings_data: dict) -> str:
         """Generate comprehensive markdown briefing with full project context.
@@ -61,45 +117,175 @@ class SessionBriefing:
         Returns:
             Complete briefing as markdown string
         """
-        # Load all context using specialized modules
-        project_docs = self.doc_loader.load_project_docs()
-        current_stack = self.stack_detector.load_current_stack()
-        current_tree = self.tree_generator.load_current_tree()
-        work_item_spec = self.work_item_loader.load_work_item_spec(item)
-        env_checks = self.formatter.validate_environment()
-
-        # Check git status - gracefully handle errors as this is informational
-        try:
-            git_status = self.git_context.check_git_status()
-        except (GitError, SystemError) as e:
-            logger.warning(f"Failed to check git status: {e.message}")
-            git_status = {"clean": False, "status": f"Error: {e.message}", "branch": None}
+        self.cached_sections = set()
+
+        # Independent context loaders (files, subprocess probes, git calls)
+        loaders: dict[str, Callable[[], Any]] = {
+            "project_docs": self.doc_loader.load_project_docs,
+            "stack": self.stack_detector.load_current_stack,
+            "tree": self.tree_generator.load_current_tree,
+            "spec": lambda: self.work_item_loader.load_work_item_spec(item),
+            "environment": self.formatter.validate_environment,
+            "git_status": self._check_git_status,
+            "milestone": lambda: self._milestone_section(item_id, item),
+        }
 
-        # Validate spec completeness
-        spec_validation_warning = self._validate_spec(item_id, item["type"])
+        with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="briefing") as pool:
+            futures = {name: pool.submit(_timed, load) for name, load in loaders.items()}
 
-        # Get milestone context
-        milestone_context = self.milestone_builder.load_milestone_context(item)
+            # Spec validation and learnings depend on the spec, so they start once it's loaded
+            work_item_spec, spec_time = futures["spec"].result()
+            spec_key = fingerprint(work_item_spec)
+            spec_loaders: dict[str, Callable[[], str]] = {
+                "spec_validation": lambda: self._section(
+                    "spec_validation",
+                    fingerprint(spec_key, item_id, item["type"]),
+                    lambda: self.formatter.render_spec_validation(
+                        self._validate_spec(item_id, item["type"])
+                    ),
+                ),
+                "learnings": lambda: self._learnings_section(
+                    item, learnings_data, work_item_spec, spec_key
+                ),
+            }
+            spec_futures = {name: pool.submit(_timed, load) for name, load in spec_loaders.items()}
+            spec_section, render_time = _timed(
+                lambda: self._section(
+                    "spec", spec_key, lambda: self.formatter.render_spec(work_item_spec)
+                )
+            )
+            loaded = {name: future.result() for name, future in futures.items()}
+            loaded.update({name: future.result() for name, future in spec_futures.items()})
 
-        # Get relevant learnings
-        relevant_learnings = self.learning_loader.get_relevant_learnings(
-            learnings_data, item, work_item_spec
+        loaded["spec"] = (spec_section, spec_time + render_time)
+
+        context = {name: result for name, (result, _) in loaded.items()}
+        order = [
+            "project_docs",
+            "stack",
+            "tree",
+            "spec",
+            "environment",
+            "git_status",
+            "spec_validation",
+            "milestone",
+            "learnings",
+        ]
+        self.section_timings = {name: loaded[name][1] for name in order}
+        logger.debug(
+            "Briefing context load times: "
+            + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.section_timings.items())
         )
 
-        # Generate briefing using formatter
-        return self.formatter.generate_briefing(
+        project_docs, stack, tree = context["project_docs"], context["stack"], context["tree"]
+        sections = {
+            "project_docs": self._section(
+                "project_docs",
+                fingerprint(json.dumps(project_docs, sort_keys=True)),
+                lambda: self.formatter.render_project_docs(project_docs),
+            ),
+            "stack": self._section(
+                "stack", fingerprint(stack), lambda: self.formatter.render_stack(stack)
+            ),
+            "tree": self._section(
+                "tree", fingerprint(tree), lambda: self.formatter.render_tree(tree)
+            ),
+            "spec_validation": context["spec_validation"],
+            "spec": context["spec"],
+            "milestone": context["milestone"],
+            "learnings": context["learnings"],
+        }
+        self.section_cache.save()
+        if self.cached_sections:
+            logger.debug(
+                "Briefing sections reused from cache: " + ", ".join(sorted(self.cached_sections))
+            )
+
+        sections = self.budgeter.fit(
+            sections,
+            project_docs=project_docs,
+            stack=stack,
+            tree=tree,
+            work_item_text=f"{item.get('title', '')}\n{work_item_spec}",
+            changed_files=self.git_context.get_recently_changed_files,
+        )
+        return self.formatter.assemble_briefing(
             item_id=item_id,
             item=item,
-            project_docs=project_docs,
-            current_stack=current_stack,
-            current_tree=current_tree,
-            work_item_spec=work_item_spec,
-            env_checks=env_checks,
-            git_status=git_status,
-            spec_validation_warning=spec_validation_warning,
-            milestone_context=milestone_context,
-            relevant_learnings=relevant_learnings,
+            env_checks=context["environment"],
+            git_status=context["git_status"],
+            sections=sections,
+        )
+
+    def _section(self, name: str, key: str, render: Callable[[], str]) -> str:
+        """Return a cached section if its inputs are unchanged, else render and cache it.
+
+        Args:
+            name: Section name
+            key: Fingerprint of the section's current inputs
+            render: Loads the section's remaining inputs and renders it
+
+        Returns:
+            Rendered section
+        """
+        cached = self.section_cache.get(name, key)
+        if cached is not None:
+            self.cached_sections.add(name)
+            return cached
+        rendered = render()
+        self.section_cache.put(name, key, rendered)
+        return rendered
+
+    def _milestone_section(self, item_id: str, item: dict) -> str:
+        """Render the milestone, keyed by work_items.json (the source of its rollup)."""
+        key = fingerprint(
+            _read_bytes(self.milestone_builder.work_items_file),
+            item.get("milestone") or "",
+            item_id,
+        )
+        return self._section(
+            "milestone",
+            key,
+            lambda: self.formatter.render_milestone(
+                self.milestone_builder.load_milestone_context(item), item_id
+            ),
+        )
+
+    def _learnings_section(
+        self, item: dict, learnings_data: dict, work_item_spec: str, spec_key: str
+    ) -> str:
+        """Render the relevant learnings.
+
+        Keyed by the learnings, the item fields and spec they're ranked against,
+        and today's date (ranking favours recent learnings).
+        """
+        key = fingerprint(
+            json.dumps(learnings_data, sort_keys=True, default=str),
+            item.get("title", ""),
+            item.get("type", ""),
+            json.dumps(item.get("tags", [])),
+            spec_key,
+            date.today().isoformat(),
         )
+        return self._section(
+            "learnings",
+            key,
+            lambda: self.formatter.render_learnings(
+                self.learning_loader.get_relevant_learnings(learnings_data, item, work_item_spec)
+            ),
+        )
+
+    def _check_git_status(self) -> dict[str, Any]:
+        """Check git status, gracefully handling errors as this is informational.
+
+        Returns:
+            Git status dict (with the error as status if the check failed)
+        """
+        try:
+            return self.git_context.check_git_status()
+        except (GitError, SystemError) as e:
+            logger.warning(f"Failed to check git status: {e.message}")
+            return {"clean": False, "status": f"Error: {e.message}", "branch": None}
 
     def _validate_spec(self, item_id: str, work_item_type: str) -> str | None:
         """Validate spec completeness and return warning if incomplete.
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Rendered briefing section cache.
+Part of the briefing module decomposition.
+
+Each cacheable briefing section (project docs, stack, tree, spec, spec
+validation, milestone, learnings) is stored in .session/cache/briefing_sections.json
+with a fingerprint of the inputs it was rendered from. Re-running ``sk start``
+reuses every section whose inputs are unchanged and only re-renders stale ones.
+Each section has a single slot, so starting a different work item replaces the
+item-specific sections instead of growing the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from solokit.__version__ import __version__
+from solokit.core.constants import CACHE_DIR_NAME
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BRIEFING_CACHE_FILE = "briefing_sections.json"
+
+# Bump when the section layout changes so cached sections are re-rendered
+BRIEFING_CACHE_SCHEMA_VERSION = 1
+
+# Environment variable that disables reading cached sections (e.g. in tests)
+BRIEFING_CACHE_DISABLE_ENV = "SOLOKIT_NO_BRIEFING_CACHE"
+
+
+def fingerprint(*parts: str | bytes | None) -> str:
+    """
+    Hash the inputs a section is rendered from.
+
+    Args:
+        *parts: Input values (None for a missing input, e.g. an absent file)
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            digest.update(b"\x00missing")
+        else:
+            data = part.encode("utf-8") if isinstance(part, str) else part
+            digest.update(str(len(data)).encode("ascii") + b":" + data)
+    return digest.hexdigest()
+
+
+class BriefingSectionCache:
+    """Stores rendered briefing sections keyed by their input fingerprints."""
+
+    def __init__(self, session_dir: Path, enabled: bool = True):
+        """
+        Initialize briefing section cache.
+
+        Args:
+            session_dir: Path to .session directory
+            enabled: Whether cached sections may be used
+        """
+        self.cache_file = session_dir / CACHE_DIR_NAME / BRIEFING_CACHE_FILE
+        self.session_dir = session_dir
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._sections: dict[str, dict[str, str]] | None = None
+        self._dirty = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is active (requires an initialized project)."""
+        return (
+            self._enabled
+            and not os.environ.get(BRIEFING_CACHE_DISABLE_ENV)
+            and self.session_dir.is_dir()
+        )
+
+    def get(self, section: str, key: str) -> str | None:
+        """
+        Look up a rendered section.
+
+        Args:
+            section: Section name
+            key: Fingerprint of the section's current inputs
+
+        Returns:
+            The cached rendering, or None if missing or stale
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(section)
+        if entry and entry.get("fingerprint") == key:
+            return entry.get("text")
+        return None
+
+    def put(self, section: str, key: str, text: str) -> None:
+        """
+        Store a rendered section (persisted by save()).
+
+        Args:
+            section: Section name
+            key: Fingerprint of the inputs the section was rendered from
+            text: Rendered section
+        """
+        if not self.session_dir.is_dir():
+            return
+        with self._lock:
+            sections = self._load()
+            if sections.get(section) != {"fingerprint": key, "text": text}:
+                sections[section] = {"fingerprint": key, "text": text}
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if any section was re-rendered."""
+        with self._lock:
+            if not self._dirty or self._sections is None:
+                return
+            data = {
+                "schema_version": BRIEFING_CACHE_SCHEMA_VERSION,
+                "solokit_version": __version__,
+                "sections": self._sections,
+            }
+            if save_cache_json(self.cache_file, data):
+                self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        """Read the cache file once (callers hold the lock)."""
+        if self._sections is not None:
+            return self._sections
+        self._sections = {}
+        if not self.cache_file.exists():
+            return self._sections
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable briefing cache {self.cache_file}: {e}")
+            return self._sections
+        if (
+            data.get("schema_version") == BRIEFING_CACHE_SCHEMA_VERSION
+            and data.get("solokit_version") == __version__
+            and isinstance(data.get("sections"), dict)
+        ):
+            self._sections = data["sections"]
+        return self._sections
@@ -12,6 +12,8 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,16 +23,35 @@ from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import (
     GIT_QUICK_TIMEOUT,
     GIT_STANDARD_TIMEOUT,
-    SESSION_COMPLETE_TIMEOUT,
+    SESSION_DIR_NAME,
+    SOLOKIT_SESSION_DIR_NAMES,
 )
 from solokit.core.error_handlers import log_errors
 from solokit.core.exceptions import (
     FileOperationError,
+    GitError,
+    NotAGitRepoError,
 )
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import WorkItemStatus, WorkItemType
+from solokit.git.commit_log import RecordedCommits
+from solokit.git.objects import get_object_reader
+from solokit.git.snapshot import get_git_snapshot
+from solokit.project.stack import StackGenerator
+from solokit.project.tree import TreeGenerator
+from solokit.quality.gate_timings import (
+    GateTiming,
+    detect_regressions,
+    load_gate_timings,
+    record_gate_timings,
+    summarize_gate_timings,
+)
 from solokit.quality.gates import QualityGates
+from solokit.quality.incremental import record_gated_commit
+from solokit.quality.lint_daemons import stop_lint_daemons
+from solokit.quality.scheduler import GateScheduler, GateTask, source_tree_resources
+from solokit.session.status_cache import refresh_status_cache
 from solokit.work_items.repository import WorkItemRepository
 from solokit.work_items.spec_parser import parse_spec_file
 from solokit.work_items.updater import WorkItemUpdater
@@ -111,11 +132,23 @@ def load_work_items() -> dict[str, Any]:
 
 
 @log_errors()
-def run_quality_gates(work_item: dict | None = None) -> tuple[dict, bool, list]:
+def run_quality_gates(
+    work_item: dict | None = None,
+    incremental: bool | None = None,
+    use_cache: bool = True,
+    session_num: int | None = None,
+    fail_fast: bool | None = None,
+) -> tuple[dict, bool, list]:
     """Run comprehensive quality gates using QualityGates class.
 
     Args:
         work_item: Optional work item dict for custom validations
+        incremental: Override per-gate incremental config (True: changed files only,
+            False: full runs, None: use config)
+        use_cache: Reuse passing gate results whose inputs are unchanged
+        session_num: Current session number (recorded with the gate timings)
+        fail_fast: Run the cheapest gates first and cancel the rest once a required
+            gate fails (None: use config)
 
     Returns:
         tuple: (all_results dict, all_passed bool, failed_gates list)
@@ -123,78 +156,154 @@ def run_quality_gates(work_item: dict | None = None) -> tuple[dict, bool, list]:
     Raises:
         QualityGateError: If quality gates fail and are required
     """
-    gates = QualityGates()
+    gates = QualityGates(incremental=incremental, use_cache=use_cache)
+    config = gates.config
+    project_root = Path.cwd()
+    timing_history = load_gate_timings(project_root)
+    if fail_fast is None:
+        fail_fast = config.scheduler.fail_fast
     all_results = {}
     all_passed = True
     failed_gates = []
 
-    # Run tests
-    passed, test_results = gates.run_tests()
-    all_results["tests"] = test_results
-    if not passed and gates.config.test_execution.required:
-        all_passed = False
-        failed_gates.append("tests")
-
-    # Run security scanning
-    passed, security_results = gates.run_security_scan()
-    all_results["security"] = security_results
-    if not passed and gates.config.security.required:
-        all_passed = False
-        failed_gates.append("security")
-
-    # Run linting
-    passed, linting_results = gates.run_linting()
-    all_results["linting"] = linting_results
-    if not passed and gates.config.linting.required:
-        all_passed = False
-        failed_gates.append("linting")
-
-    # Run formatting
-    passed, formatting_results = gates.run_formatting()
-    all_results["formatting"] = formatting_results
-    if not passed and gates.config.formatting.required:
-        all_passed = False
-        failed_gates.append("formatting")
-
-    # Validate documentation
-    passed, doc_results = gates.validate_documentation(work_item)
-    all_results["documentation"] = doc_results
-    if not passed and gates.config.documentation.required:
-        all_passed = False
-        failed_gates.append("documentation")
-
-    # Verify Context7 libraries
-    passed, context7_results = gates.verify_context7_libraries()
-    all_results["context7"] = context7_results
-    # Context7 is optional and not in QualityGatesConfig, always treat as optional
-    if not passed:
-        # Context7 failures are warnings, not failures
-        logger.warning("Context7 library verification failed (non-blocking)")
-
-    # Run custom validations
+    required_gates = {
+        "tests": config.test_execution.required,
+        "security": config.security.required,
+        "linting": config.linting.required,
+        "formatting": config.formatting.required,
+        "documentation": config.documentation.required,
+        # Context7 is always optional
+        "context7": False,
+        # Custom validations decide which rules are required themselves
+        "custom": True,
+    }
+
+    # Independent gates run concurrently; tests go first as the longest-running gate.
+    # Auto-fixing gates hold the source tree, so they finish before the others read it
+    tasks = [
+        GateTask("tests", gates.run_tests),
+        GateTask("security", gates.run_security_scan),
+        GateTask("linting", gates.run_linting, source_tree_resources(config.linting.auto_fix)),
+        GateTask(
+            "formatting", gates.run_formatting, source_tree_resources(config.formatting.auto_fix)
+        ),
+        GateTask("documentation", lambda: gates.validate_documentation(work_item)),
+        GateTask("context7", gates.verify_context7_libraries),
+    ]
     if work_item:
-        passed, custom_results = gates.run_custom_validations(work_item)
-        all_results["custom"] = custom_results
-        if not passed:
+        tasks.append(GateTask("custom", lambda: gates.run_custom_validations(work_item)))
+    for task in tasks:
+        task.required = required_gates[task.name]
+    if fail_fast:
+        # Gates without timing history keep declaration order; still run tests last
+        tasks.append(tasks.pop(0))
+
+    # Historically slow gates start first so they don't finish last on their own
+    # (fail-fast starts the cheapest first instead)
+    expected_durations = {stat.gate: stat.p50 for stat in summarize_gate_timings(timing_history)}
+    outcomes = GateScheduler(
+        max_parallel=config.scheduler.max_parallel,
+        expected_durations=expected_durations,
+        fail_fast=fail_fast,
+    ).run(tasks)
+
+    cancelled_gates = []
+    for name, outcome in outcomes.items():
+        all_results[name] = outcome.results
+        if outcome.cancelled:
+            cancelled_gates.append(name)
+            continue
+        if outcome.passed:
+            continue
+        if name == "context7":
+            # Context7 failures are warnings, not failures
+            logger.warning("Context7 library verification failed (non-blocking)")
+        elif required_gates[name]:
             all_passed = False
-            failed_gates.append("custom")
+            failed_gates.append(name)
+
+    # Later incremental runs only need to check changes made after this commit
+    if all_passed:
+        record_gated_commit(project_root)
+
+    timings = [
+        _gate_timing(gates, name, outcome.duration_seconds, outcome.passed, outcome.results)
+        for name, outcome in outcomes.items()
+        if not outcome.cancelled
+    ]
+    for timing in timings:
+        timing.session = session_num
+    regressions = detect_regressions(
+        timing_history, timings, threshold=config.scheduler.regression_threshold
+    )
+    record_gate_timings(project_root, timings)
 
     # Generate and print report
-    report = gates.generate_report(all_results)
+    report = gates.generate_report(all_results, regressions=regressions)
     output.info("\n" + report)
 
     # Print remediation guidance if any gates failed
     if failed_gates:
         guidance = gates.get_remediation_guidance(failed_gates)
         output.info(guidance)
+    if cancelled_gates:
+        logger.info(f"Fail-fast cancelled quality gates: {cancelled_gates}")
 
     return all_results, all_passed, failed_gates
 
 
+def _gate_timing(
+    gates: QualityGates, name: str, duration: float, passed: bool, results: dict
+) -> GateTiming:
+    """Build the timing record of one gate run."""
+    cached = bool(results.get("cached"))
+    # Incremental gates report the files they checked; test impact reports selected tests
+    files_checked = (results.get("incremental") or {}).get("files_checked")
+    if files_checked is None:
+        files_checked = (results.get("test_impact") or {}).get("selected")
+    return GateTiming(
+        gate=name,
+        duration_seconds=round(duration, 3),
+        passed=passed,
+        cached=cached,
+        # A cached result ran no tools
+        tool_versions={} if cached else gates.gate_tool_versions(name),
+        files_checked=files_checked if isinstance(files_checked, int) else None,
+    )
+
+
 @log_errors()
+def _refresh_tracking_file(
+    label: str, update: Callable[[], tuple[list[dict[str, str]], Path]]
+) -> tuple[list[str], Exception | None]:
+    """Run a stack or tree update, capturing its output (runs on a worker thread).
+
+    Args:
+        label: "Stack" or "Tree"
+        update: Runs the update and returns (changes, file written)
+
+    Returns:
+        (captured output lines, exception if the update failed)
+    """
+    with output.capture() as messages:
+        try:
+            changes, saved_to = update()
+        except Exception as e:
+            return messages, e
+        if changes:
+            output.info(f"\n✓ {label} updated with {len(changes)} changes")
+        else:
+            output.info(f"\n✓ {label} generated (no changes)")
+        output.info(f"✓ Saved to: {saved_to}")
+    return messages, None
+
+
 def update_all_tracking(session_num: int) -> bool:
     """Update stack, tree, and other tracking files.
 
+    The stack and tree scans run concurrently in-process; their output is
+    reported in order once both finish.
+
     Args:
         session_num: Current session number
 
@@ -207,67 +316,34 @@ def update_all_tracking(session_num: int) -> bool:
     """
     logger.info(f"Updating tracking files for session {session_num}")
 
-    # Get Solokit installation directory for absolute path resolution
-    script_dir = Path(__file__).parent
-    project_dir = script_dir.parent / "project"
-
-    runner = CommandRunner(default_timeout=SESSION_COMPLETE_TIMEOUT)
-
-    # Update stack
-    try:
-        result = runner.run(
-            [
-                sys.executable,
-                str(project_dir / "stack.py"),
-                "--session",
-                str(session_num),
-                "--non-interactive",
-            ]
-        )
-        if result.success:
-            output.success("Stack updated")
-            # Print output if there were changes
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        output.info(f"  {line}")
-        else:
-            logger.warning(f"Stack update failed (exit code {result.returncode})")
-            output.warning(f"Stack update failed (exit code {result.returncode})")
-            if result.stderr:
-                logger.warning(f"Stack update error: {result.stderr}")
-                output.info(f"  Error: {result.stderr}")
-    except Exception as e:
-        logger.warning(f"Stack update failed: {e}", exc_info=True)
-        output.warning(f"Stack update failed: {e}")
-
-    # Update tree
-    try:
-        result = runner.run(
-            [
-                sys.executable,
-                str(project_dir / "tree.py"),
-                "--session",
-                str(session_num),
-                "--non-interactive",
-            ]
-        )
-        if result.success:
-            output.success("Tree updated")
-            # Print output if there were changes
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        output.info(f"  {line}")
-        else:
-            logger.warning(f"Tree update failed (exit code {result.returncode})")
-            output.warning(f"Tree update failed (exit code {result.returncode})")
-            if result.stderr:
-                logger.warning(f"Tree update error: {result.stderr}")
-                output.info(f"  Error: {result.stderr}")
-    except Exception as e:
-        logger.warning(f"Tree update failed: {e}", exc_info=True)
-        output.warning(f"Tree update failed: {e}")
+    def update_stack() -> tuple[list[dict[str, str]], Path]:
+        generator = StackGenerator()
+        changes = generator.update_stack(session_num=session_num, non_interactive=True)
+        return changes, generator.stack_file
+
+    def update_tree() -> tuple[list[dict[str, str]], Path]:
+        generator = TreeGenerator()
+        changes = generator.update_tree(session_num=session_num, non_interactive=True)
+        return changes, generator.tree_file
+
+    updates: list[tuple[str, Callable[[], tuple[list[dict[str, str]], Path]]]] = [
+        ("Stack", update_stack),
+        ("Tree", update_tree),
+    ]
+    with ThreadPoolExecutor(max_workers=len(updates), thread_name_prefix="tracking") as pool:
+        futures = [pool.submit(_refresh_tracking_file, label, update) for label, update in updates]
+
+    for (label, _), future in zip(updates, futures):
+        messages, error = future.result()
+        if error is not None:
+            logger.warning(f"{label} update failed: {error}", exc_info=error)
+            output.warning(f"{label} update failed: {error}")
+            continue
+        output.success(f"{label} updated")
+        # Print output if there were changes
+        for line in "\n".join(messages).strip().split("\n"):
+            if line.strip():
+                output.info(f"  {line}")
 
     return True
 
@@ -512,38 +588,47 @@ def record_session_commits(work_item_id: str) -> None:
 
         # Get branch information
         branch_name = git_info.get("branch")
-        parent_branch = git_info.get("parent_branch", "main")
 
         if not branch_name:
             # No git branch tracking for this work item
             logger.debug(f"No git branch tracking for work item: {work_item_id}")
             return
 
-        # Get commits on session branch that aren't in parent branch
         runner = CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT)
-        result = runner.run(
-            ["git", "log", "--pretty=format:%H|%s|%ai", f"{parent_branch}..{branch_name}"]
-        )
+        snapshot = get_git_snapshot(Path.cwd(), runner)
+        if snapshot.head is None:
+            logger.debug("No commits to record yet")
+            return
 
-        if not result.success:
+        # Get commits on session branch that aren't in parent branch, made since the
+        # last recorded one; while the branch is checked out its tip is HEAD, which
+        # the snapshot already resolved
+        branch_tip = snapshot.head if snapshot.branch == branch_name else branch_name
+        reader = get_object_reader(Path.cwd(), runner)
+        recorded = RecordedCommits(git_info)
+        try:
+            new_shas = recorded.list_new(reader, branch_tip)
+            log = reader.commits(new_shas)
+        except GitError as e:
             # Branch might not exist or other git error - skip silently
-            logger.debug(f"Git log failed for branch {branch_name}: {result.stderr}")
+            logger.debug(f"Git log failed for branch {branch_name}: {e}")
             return
 
-        commits = []
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                parts = line.split("|", 2)
-                if len(parts) == 3:
-                    sha, message, timestamp = parts
-                    commits.append({"sha": sha, "message": message, "timestamp": timestamp})
-
-        # Update work_items.json with commits
-        if commits:
-            data["work_items"][work_item_id]["git"]["commits"] = commits
+        new_commits = [
+            commit
+            for commit in log
+            if recorded.add(
+                {"sha": commit.sha, "message": commit.subject, "timestamp": commit.timestamp}
+            )
+        ]
+        recorded.mark_recorded(new_shas)
+
+        # Update work_items.json with commits (bare SHAs listed by the git workflow
+        # gain their messages too)
+        if log:
             with open(work_items_file, "w") as f:
                 json.dump(data, f, indent=2)
-            logger.info(f"Recorded {len(commits)} commits for work item {work_item_id}")
+            logger.info(f"Recorded {len(new_commits)} commits for work item {work_item_id}")
 
     except Exception as e:
         # Silently skip if there's any error - this is non-critical tracking
@@ -600,6 +685,59 @@ def generate_commit_message(status: dict, work_item: dict) -> str:
 
 
 @log_errors()
+def get_commit_file_stats(shas: list[str]) -> dict[str, str]:
+    """Get ``--stat`` file summaries for many commits with a single git call.
+
+    Each commit is diffed against its first parent, like ``git diff --stat
+    sha^..sha``; root commits are diffed against the empty tree. Unknown SHAs
+    (e.g. commits rebased away) are skipped.
+
+    Args:
+        shas: Commit SHAs (full or abbreviated)
+
+    Returns:
+        dict: Stat output keyed by the SHA as given, for commits that changed files
+    """
+    if not shas:
+        return {}
+
+    runner = CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT)
+    result = runner.run(
+        [
+            "git",
+            "log",
+            "--no-walk=unsorted",
+            "--ignore-missing",
+            "--stat",
+            "--diff-merges=first-parent",
+            # A record separator before each commit's full SHA
+            "--format=format:%x1e%H",
+            *shas,
+            "--",
+        ]
+    )
+    if not result.success:
+        logger.debug(f"Git log --stat failed: {result.stderr}")
+        return {}
+
+    stats_by_sha: dict[str, str] = {}
+    for record in result.stdout.split("\x1e"):
+        full_sha, _, stat = record.partition("\n")
+        stat = stat.strip("\n")
+        if full_sha and stat:
+            stats_by_sha[full_sha.strip()] = stat + "\n"
+
+    # Map back to the SHAs as recorded (which may be abbreviated)
+    stats_by_given_sha: dict[str, str] = {}
+    for sha in shas:
+        stats = stats_by_sha.get(sha) or next(
+            (stats for full_sha, stats in stats_by_sha.items() if full_sha.startswith(sha)), None
+        )
+        if stats:
+            stats_by_given_sha[sha] = stats
+    return stats_by_given_sha
+
+
 def generate_summary(
     status: dict, work_items_data: dict, gate_results: dict, learnings: list | None = None
 ) -> str:
@@ -633,6 +771,15 @@ def generate_summary(
     commits = work_item.get("git", {}).get("commits", [])
     if commits:
         summary += "## Commits Made\n\n"
+
+        # Fetch file stats for all commits in one git call
+        try:
+            file_stats = get_commit_file_stats([c["sha"] for c in commits])
+        except Exception as e:
+            # Silently skip file stats if git log fails
+            logger.debug(f"Git log failed for session commits: {e}")
+            file_stats = {}
+
         for commit in commits:
             # Show short SHA and first line of commit message
             message_lines = commit["message"].split("\n")
@@ -647,17 +794,12 @@ def generate_summary(
                     summary += remaining_lines
                     summary += "\n```\n\n"
 
-            # Get file stats using git diff
-            try:
-                runner = CommandRunner(default_timeout=GIT_STANDARD_TIMEOUT)
-                result = runner.run(["git", "diff", "--stat", f"{commit['sha']}^..{commit['sha']}"])
-                if result.success and result.stdout.strip():
-                    summary += "\nFiles changed:\n```\n"
-                    summary += result.stdout
-                    summary += "```\n\n"
-            except Exception as e:
-                # Silently skip if git diff fails
-                logger.debug(f"Git diff failed for commit {commit['sha']}: {e}")
+            # Show file stats from git log
+            stats = file_stats.get(commit["sha"])
+            if stats:
+                summary += "\nFiles changed:\n```\n"
+                summary += stats
+                summary += "```\n\n"
 
         summary += "\n"
 
@@ -670,6 +812,9 @@ def generate_summary(
             summary += f"- {gate_name.title()}: ⊘ SKIPPED\n"
         elif status_text == "passed":
             summary += f"- {gate_name.title()}: ✓ PASSED\n"
+        elif status_text == "cancelled":
+            # Never ran: fail-fast stopped the run after a required gate failed
+            summary += f"- {gate_name.title()}: ⊘ CANCELLED\n"
         else:
             summary += f"- {gate_name.title()}: ✗ FAILED\n"
 
@@ -843,15 +988,17 @@ def check_uncommitted_changes() -> bool:
     """
     try:
         runner = CommandRunner(default_timeout=GIT_QUICK_TIMEOUT, working_dir=Path.cwd())
-        result = runner.run(["git", "status", "--porcelain"])
-
-        uncommitted = [line for line in result.stdout.split("\n") if line.strip()]
-
-        # Filter out .session/tracking files (they're updated by sk end)
+        try:
+            uncommitted = get_git_snapshot(Path.cwd(), runner).status_lines
+        except NotAGitRepoError:
+            logger.debug("Not a git repository, skipping uncommitted changes check")
+            return True
+
+        # Filter out files solokit writes itself (tracking updated by sk end,
+        # briefings, history, caches, logs and daemon state)
+        solokit_dirs = tuple(f"{SESSION_DIR_NAME}/{name}/" for name in SOLOKIT_SESSION_DIR_NAMES)
         user_changes = [
-            line
-            for line in uncommitted
-            if ".session/tracking/" not in line and ".session/briefings/" not in line
+            line for line in uncommitted if not any(path in line for path in solokit_dirs)
         ]
 
         if not user_changes:
@@ -950,6 +1097,46 @@ def main() -> int:
         action="store_true",
         help="Keep work item as in-progress",
     )
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Lint, format and scan only files changed this session, and run only impacted "
+        "tests (overrides config)",
+    )
+    scope_group.add_argument(
+        "--full",
+        dest="incremental",
+        action="store_const",
+        const=False,
+        help="Lint, format, scan and test the whole project (overrides config)",
+    )
+    fail_fast_group = parser.add_mutually_exclusive_group()
+    fail_fast_group.add_argument(
+        "--fail-fast",
+        dest="fail_fast",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Run the cheapest quality gates first and cancel the rest once a required "
+        "gate fails (overrides config)",
+    )
+    fail_fast_group.add_argument(
+        "--no-fail-fast",
+        dest="fail_fast",
+        action="store_const",
+        const=False,
+        help="Run every quality gate even after a required gate fails (overrides config)",
+    )
+    parser.add_argument(
+        "--no-gate-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Re-run every quality gate instead of reusing cached results",
+    )
     args = parser.parse_args()
 
     # Load current status
@@ -1028,7 +1215,13 @@ def main() -> int:
         output.info("Running quality gates (non-blocking for incomplete work)...\n")
 
     # Run quality gates with work item context
-    gate_results, all_passed, failed_gates = run_quality_gates(work_item)
+    gate_results, all_passed, failed_gates = run_quality_gates(
+        work_item,
+        incremental=args.incremental,
+        use_cache=args.use_cache,
+        session_num=session_num,
+        fail_fast=args.fail_fast,
+    )
 
     if not all_passed and enforce_quality_gates:
         logger.error(f"Quality gates failed: {failed_gates}")
@@ -1132,9 +1325,9 @@ def main() -> int:
         work_items_data_temp = repository.load_all()
         if "metadata" not in work_items_data_temp["work_items"][work_item_id]:
             work_items_data_temp["work_items"][work_item_id]["metadata"] = {}
-        work_items_data_temp["work_items"][work_item_id]["metadata"]["completed_at"] = (
-            datetime.now().isoformat()
-        )
+        work_items_data_temp["work_items"][work_item_id]["metadata"][
+            "completed_at"
+        ] = datetime.now().isoformat()
         repository.save_all(work_items_data_temp)
 
         logger.info(
@@ -1184,6 +1377,10 @@ def main() -> int:
     # Generate commit message
     commit_message = generate_commit_message(status, work_item)
 
+    # Linter daemons started by daemon-mode gate runs end with the session; stop
+    # them before the git workflow stages the working tree
+    stop_lint_daemons(Path.cwd())
+
     # Complete git workflow (commit, push, optionally merge or create PR)
     output.info("\nCompleting git workflow...")
     git_result = complete_git_workflow(work_item_id, commit_message, session_num)
@@ -1230,6 +1427,7 @@ def main() -> int:
         with open(".session/tracking/status_update.json", "w") as f:
             json.dump(status, f, indent=2)
         logger.info("Updated session status to completed")
+        refresh_status_cache(Path(".session"))
     except OSError as e:
         logger.error(f"Failed to update session status: {e}")
         output.warning(f"Failed to update session status: {e}")
@@ -4,6 +4,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from solokit.core.command_runner import CommandRunner
 from solokit.core.constants import SESSION_STATUS_TIMEOUT
@@ -16,42 +17,31 @@ from solokit.core.exceptions import (
 )
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
-from solokit.core.types import Priority, WorkItemStatus
+from solokit.core.types import Priority
+from solokit.git.snapshot import get_git_snapshot
+from solokit.session.status_cache import StatusCache, build_status_summary
 
 logger = get_logger(__name__)
 output = get_output()
 
 
-def get_session_status() -> int:
+def _load_tracking_files(
+    session_dir: Path, status_file: Path
+) -> tuple[dict[str, Any], dict[str, Any]]:
     """
-    Get current session status.
+    Read status_update.json and work_items.json.
 
-    Loads and displays the current session status including:
-    - Work item information
-    - Time elapsed
-    - Git changes
-    - Milestone progress
-    - Next items
+    Args:
+        session_dir: Path to .session directory
+        status_file: Path to status_update.json
 
     Returns:
-        int: Exit code (0 for success, error code for failure)
+        tuple: Session status and work items data
 
     Raises:
-        SessionNotFoundError: If no active session exists
-        FileNotFoundError: If required session files are missing
-        FileOperationError: If file read operations fail
-        ValidationError: If session data is invalid
-        WorkItemNotFoundError: If work item doesn't exist
+        FileNotFoundError: If work_items.json is missing
+        FileOperationError: If a file can't be read or parsed
     """
-    logger.debug("Fetching session status")
-    session_dir = Path(".session")
-    status_file = session_dir / "tracking" / "status_update.json"
-
-    if not status_file.exists():
-        logger.info("No active session file found")
-        raise SessionNotFoundError()
-
-    # Load status
     logger.debug("Loading session status from: %s", status_file)
     try:
         status = json.loads(status_file.read_text())
@@ -70,7 +60,6 @@ def get_session_status() -> int:
             cause=e,
         )
 
-    # Load work items first (for context-aware messaging)
     work_items_file = session_dir / "tracking" / "work_items.json"
     logger.debug("Loading work items from: %s", work_items_file)
 
@@ -90,14 +79,54 @@ def get_session_status() -> int:
             cause=e,
         )
 
-    work_item_id = status.get("current_work_item")
+    return status, data
+
+
+def get_session_status() -> int:
+    """
+    Get current session status.
+
+    Loads and displays the current session status including:
+    - Work item information
+    - Time elapsed
+    - Git changes
+    - Milestone progress
+    - Next items
+
+    Returns:
+        int: Exit code (0 for success, error code for failure)
+
+    Raises:
+        SessionNotFoundError: If no active session exists
+        FileNotFoundError: If required session files are missing
+        FileOperationError: If file read operations fail
+        ValidationError: If session data is invalid
+        WorkItemNotFoundError: If work item doesn't exist
+    """
+    logger.debug("Fetching session status")
+    session_dir = Path(".session")
+    status_file = session_dir / "tracking" / "status_update.json"
+
+    if not status_file.exists():
+        logger.info("No active session file found")
+        raise SessionNotFoundError()
+
+    cache = StatusCache(session_dir)
+    summary = cache.load()
+    if summary is None:
+        sources = cache.source_signature()
+        summary = build_status_summary(*_load_tracking_files(session_dir, status_file))
+        cache.store(summary, sources)
+    else:
+        logger.debug("Using cached session summary")
+
+    work_item_id = summary["current_work_item"]
 
     if not work_item_id:
         logger.warning("No active work item in session")
 
         # Provide context-aware message
-        work_items = data.get("work_items", {})
-        total_items = len(work_items)
+        total_items = summary["total_items"]
 
         if total_items == 0:
             raise ValidationError(
@@ -126,8 +155,7 @@ def get_session_status() -> int:
 
     logger.debug("Current work item: %s", work_item_id)
 
-    # Work items already loaded above (data variable)
-    item = data["work_items"].get(work_item_id)
+    item = summary["item"]
 
     if not item:
         logger.error("Work item not found: %s", work_item_id)
@@ -141,14 +169,11 @@ def get_session_status() -> int:
     output.info(f"Work Item: {work_item_id}")
     output.info(f"Type: {item['type']}")
     output.info(f"Priority: {item['priority']}")
-
-    sessions = len(item.get("sessions", []))
-    estimated = item.get("estimated_effort", "Unknown")
-    output.info(f"Session: {sessions} (of estimated {estimated})")
+    output.info(f"Session: {item['sessions']} (of estimated {item['estimated_effort']})")
     output.info("")
 
     # Time elapsed (if session start time recorded)
-    session_start = status.get("session_start")
+    session_start = summary["session_start"]
     if session_start:
         start_time = datetime.fromisoformat(session_start)
         elapsed = datetime.now() - start_time
@@ -162,10 +187,10 @@ def get_session_status() -> int:
     try:
         logger.debug("Fetching git changes")
         runner = CommandRunner(default_timeout=SESSION_STATUS_TIMEOUT)
-        result = runner.run(["git", "diff", "--name-status", "HEAD"])
+        snapshot = get_git_snapshot(runner=runner)
 
-        if result.success and result.stdout:
-            lines = result.stdout.strip().split("\n")
+        lines = [f"{entry.code}\t{entry.path}" for entry in snapshot.tracked_changes]
+        if lines:
             output.info(f"Files Changed ({len(lines)}):")
             for line in lines[:10]:  # Show first 10
                 output.info(f"  {line}")
@@ -179,56 +204,32 @@ def get_session_status() -> int:
         logger.debug("Failed to get git changes: %s", e)
 
     # Git branch
-    git_info = item.get("git", {})
+    git_info = item["git"]
     if git_info:
-        branch = git_info.get("branch", "N/A")
-        commits = len(git_info.get("commits", []))
-        output.info(f"Git Branch: {branch}")
-        output.info(f"Commits: {commits}")
+        output.info(f"Git Branch: {git_info['branch']}")
+        output.info(f"Commits: {git_info['commits']}")
         output.info("")
-        logger.debug("Git info - branch: %s, commits: %d", branch, commits)
+        logger.debug("Git info - branch: %s, commits: %d", git_info["branch"], git_info["commits"])
 
     # Milestone
-    milestone_name = item.get("milestone")
-    if milestone_name:
-        logger.debug("Processing milestone: %s", milestone_name)
-        milestones = data.get("milestones", {})
-        milestone = milestones.get(milestone_name)
-        if milestone:
-            # Calculate progress (simplified)
-            milestone_items = [
-                i for i in data["work_items"].values() if i.get("milestone") == milestone_name
-            ]
-            total = len(milestone_items)
-            completed = sum(
-                1 for i in milestone_items if i["status"] == WorkItemStatus.COMPLETED.value
-            )
-            percent = int((completed / total) * 100) if total > 0 else 0
-
-            in_prog = sum(
-                1 for i in milestone_items if i["status"] == WorkItemStatus.IN_PROGRESS.value
-            )
-            not_started = sum(
-                1 for i in milestone_items if i["status"] == WorkItemStatus.NOT_STARTED.value
-            )
-
-            output.info(f"Milestone: {milestone_name} ({percent}% complete)")
-            output.info(f"  Related items: {in_prog} in progress, {not_started} not started")
-            output.info("")
-            logger.info(
-                "Milestone %s: %d%% complete (%d/%d items)",
-                milestone_name,
-                percent,
-                completed,
-                total,
-            )
+    milestone = item["milestone"]
+    if milestone:
+        output.info(f"Milestone: {milestone['name']} ({milestone['percent']}% complete)")
+        output.info(
+            f"  Related items: {milestone['in_progress']} in progress, "
+            f"{milestone['not_started']} not started"
+        )
+        output.info("")
+        logger.info(
+            "Milestone %s: %d%% complete (%d/%d items)",
+            milestone["name"],
+            milestone["percent"],
+            milestone["completed"],
+            milestone["total"],
+        )
 
     # Next items
     output.info("Next up:")
-    items = data["work_items"]
-    next_items = [
-        (wid, i) for wid, i in items.items() if i["status"] == WorkItemStatus.NOT_STARTED.value
-    ][:3]
 
     priority_emoji = {
         Priority.CRITICAL.value: "🔴",
@@ -237,16 +238,11 @@ def get_session_status() -> int:
         Priority.LOW.value: "🟢",
     }
 
-    logger.debug("Found %d next items to display", len(next_items))
-    for wid, i in next_items:
-        emoji = priority_emoji.get(i["priority"], "")
-        # Check if blocked
-        blocked = any(
-            items.get(dep_id, {}).get("status") != WorkItemStatus.COMPLETED.value
-            for dep_id in i.get("dependencies", [])
-        )
-        status_str = "(blocked)" if blocked else "(ready)"
-        output.info(f"  {emoji} {wid} {status_str}")
+    logger.debug("Found %d next items to display", len(summary["next_items"]))
+    for next_item in summary["next_items"]:
+        emoji = priority_emoji.get(next_item["priority"], "")
+        status_str = "(blocked)" if next_item["blocked"] else "(ready)"
+        output.info(f"  {emoji} {next_item['id']} {status_str}")
     output.info("")
 
     # Quick actions
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Precomputed session summary for ``sk status``.
+
+The commands that change session state (work item create/update/delete,
+``sk start`` and ``sk end``) refresh a compact summary in
+.session/cache/status_cache.json holding everything ``sk status`` displays
+except live git changes. ``sk status`` renders from that summary without
+parsing work_items.json, falling back to the full files when the summary is
+missing or the tracking files changed since it was written (detected by their
+modification time and size, e.g. after a manual edit).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from solokit.core.constants import CACHE_DIR_NAME, STATUS_UPDATE_FILE, WORK_ITEMS_FILE
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+from solokit.core.types import WorkItemStatus
+
+logger = get_logger(__name__)
+
+STATUS_CACHE_FILE = "status_cache.json"
+
+# Bump when the summary layout changes so old summaries are rebuilt
+STATUS_CACHE_SCHEMA_VERSION = 1
+
+# Environment variable that disables the status cache (e.g. in tests)
+STATUS_CACHE_DISABLE_ENV = "SOLOKIT_NO_STATUS_CACHE"
+
+# Number of not-started work items listed under "Next up"
+NEXT_ITEMS_LIMIT = 3
+
+
+def build_status_summary(status: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the summary ``sk status`` renders from.
+
+    Args:
+        status: Contents of status_update.json
+        data: Contents of work_items.json
+
+    Returns:
+        Summary with the current work item, milestone progress and next items
+    """
+    work_items = data.get("work_items", {})
+    work_item_id = status.get("current_work_item")
+    item = work_items.get(work_item_id) if work_item_id else None
+
+    item_summary = None
+    if item:
+        git_info = item.get("git", {})
+        item_summary = {
+            "type": item["type"],
+            "priority": item["priority"],
+            "sessions": len(item.get("sessions", [])),
+            "estimated_effort": item.get("estimated_effort", "Unknown"),
+            "git": (
+                {
+                    "branch": git_info.get("branch", "N/A"),
+                    "commits": len(git_info.get("commits", [])),
+                }
+                if git_info
+                else None
+            ),
+            "milestone": _milestone_progress(item.get("milestone"), data),
+        }
+
+    next_items = [
+        {
+            "id": wid,
+            "priority": next_item.get("priority"),
+            "blocked": any(
+                (work_items.get(dep_id) or {}).get("status") != WorkItemStatus.COMPLETED.value
+                for dep_id in next_item.get("dependencies", [])
+            ),
+        }
+        for wid, next_item in work_items.items()
+        if next_item and next_item.get("status") == WorkItemStatus.NOT_STARTED.value
+    ][:NEXT_ITEMS_LIMIT]
+
+    return {
+        "current_work_item": work_item_id,
+        "session_start": status.get("session_start"),
+        "total_items": len(work_items),
+        "item": item_summary,
+        "next_items": next_items,
+    }
+
+
+def _milestone_progress(milestone_name: str | None, data: dict[str, Any]) -> dict[str, Any] | None:
+    """Summarize progress of the current work item's milestone."""
+    if not milestone_name or not data.get("milestones", {}).get(milestone_name):
+        return None
+
+    milestone_items = [
+        i for i in data["work_items"].values() if i and i.get("milestone") == milestone_name
+    ]
+    total = len(milestone_items)
+    completed = sum(1 for i in milestone_items if i.get("status") == WorkItemStatus.COMPLETED.value)
+    return {
+        "name": milestone_name,
+        "total": total,
+        "completed": completed,
+        "percent": int((completed / total) * 100) if total > 0 else 0,
+        "in_progress": sum(
+            1 for i in milestone_items if i.get("status") == WorkItemStatus.IN_PROGRESS.value
+        ),
+        "not_started": sum(
+            1 for i in milestone_items if i.get("status") == WorkItemStatus.NOT_STARTED.value
+        ),
+    }
+
+
+class StatusCache:
+    """Stores the session summary with the state of the files it was built from."""
+
+    def __init__(self, session_dir: Path):
+        """
+        Initialize status cache.
+
+        Args:
+            session_dir: Path to .session directory
+        """
+        self.session_dir = session_dir
+        self.cache_file = session_dir / CACHE_DIR_NAME / STATUS_CACHE_FILE
+        self.status_file = session_dir / "tracking" / STATUS_UPDATE_FILE
+        self.work_items_file = session_dir / "tracking" / WORK_ITEMS_FILE
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is active."""
+        return not os.environ.get(STATUS_CACHE_DISABLE_ENV)
+
+    def source_signature(self) -> list[list[int]] | None:
+        """
+        Capture the state of the tracking files the summary is built from.
+
+        Take the signature before reading the files, so a write racing with the
+        read leaves a mismatching signature and the summary is rebuilt next time.
+
+        Returns:
+            Modification time and size per file, or None if a file is missing
+        """
+        if not self.enabled:
+            return None
+        try:
+            return [
+                [stat.st_mtime_ns, stat.st_size]
+                for stat in (os.stat(self.status_file), os.stat(self.work_items_file))
+            ]
+        except OSError:
+            return None
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Load the summary if the tracking files haven't changed since it was built.
+
+        Returns:
+            The summary, or None if missing or stale
+        """
+        if not self.enabled:
+            return None
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("schema_version") != STATUS_CACHE_SCHEMA_VERSION
+            or data.get("sources") != self.source_signature()
+        ):
+            return None
+        summary = data.get("summary")
+        return summary if isinstance(summary, dict) else None
+
+    def store(self, summary: dict[str, Any], sources: list[list[int]] | None) -> None:
+        """
+        Write the summary atomically.
+
+        Args:
+            summary: Summary from build_status_summary()
+            sources: Signature taken before the tracking files were read
+        """
+        if sources is None or not self.enabled:
+            return
+        data = {
+            "schema_version": STATUS_CACHE_SCHEMA_VERSION,
+            "sources": sources,
+            "summary": summary,
+        }
+        save_cache_json(self.cache_file, data)
+
+    def refresh(self) -> None:
+        """Rebuild the summary from the tracking files."""
+        sources = self.source_signature()
+        if sources is None:
+            return
+        try:
+            status = json.loads(self.status_file.read_text())
+            data = json.loads(self.work_items_file.read_text())
+            summary = build_status_summary(status, data)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Malformed tracking files are reported by sk status itself
+            logger.debug(f"Skipping status cache refresh: {e}")
+            return
+        self.store(summary, sources)
+
+
+def refresh_status_cache(session_dir: Path) -> None:
+    """
+    Refresh the ``sk status`` summary after session state changed.
+
+    Args:
+        session_dir: Path to .session directory
+    """
+    StatusCache(session_dir).refresh()
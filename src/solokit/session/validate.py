@@ -32,7 +32,10 @@ from solokit.core.exceptions import (
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import WorkItemType
+from solokit.git.snapshot import get_git_snapshot
+from solokit.quality.gate_timings import expected_gate_durations
 from solokit.quality.gates import QualityGates
+from solokit.quality.scheduler import GateScheduler, GateTask, source_tree_resources
 from solokit.work_items import spec_parser
 
 logger = get_logger(__name__)
@@ -42,11 +45,24 @@ output = get_output()
 class SessionValidator:
     """Validate session readiness for completion."""
 
-    def __init__(self, project_root: Path | None = None):
-        """Initialize SessionValidator with project root path."""
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        incremental: bool | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize SessionValidator with project root path.
+
+        Args:
+            project_root: Project root directory (defaults to current directory)
+            incremental: Override per-gate incremental config for quality gates
+            use_cache: Reuse passing gate results whose inputs are unchanged
+        """
         self.project_root = project_root or Path.cwd()
         self.session_dir = get_session_dir(self.project_root)
-        self.quality_gates = QualityGates(get_config_file(self.project_root))
+        self.quality_gates = QualityGates(
+            get_config_file(self.project_root), incremental=incremental, use_cache=use_cache
+        )
         self.runner = CommandRunner(
             default_timeout=GIT_QUICK_TIMEOUT, working_dir=self.project_root
         )
@@ -62,27 +78,12 @@ class SessionValidator:
 
         Raises:
             NotAGitRepoError: If not in a git repository
-            GitError: If git command fails unexpectedly
+            CommandExecutionError: If git status times out
         """
-        # Check if clean or has expected changes
-        result = self.runner.run(["git", "status", "--porcelain"])
-
-        if not result.success:
-            raise NotAGitRepoError(path=str(self.project_root))
-
-        # Check branch
-        branch_result = self.runner.run(["git", "branch", "--show-current"])
-        if not branch_result.success:
-            raise GitError(
-                message="Failed to get current branch",
-                code=ErrorCode.GIT_COMMAND_FAILED,
-                context={"stderr": branch_result.stderr},
-            )
-
-        current_branch = branch_result.stdout.strip()
-
-        # Get status lines
-        status_lines = [line for line in result.stdout.split("\n") if line.strip()]
+        # Raises NotAGitRepoError if git status fails
+        snapshot = get_git_snapshot(self.project_root, self.runner)
+        current_branch = snapshot.branch or ""
+        status_lines = snapshot.status_lines
 
         # Check for tracking file changes
         tracking_changes = [line for line in status_lines if ".session/tracking/" in line]
@@ -107,12 +108,42 @@ class SessionValidator:
                      When True, skips tests since they cannot be auto-fixed.
         """
         gates = {}
-
+        config = self.quality_gates.config
+        test_config = config.test_execution
+        lint_config = config.linting
+        fmt_config = config.formatting
+
+        # Use QualityGates for each gate (respects config); independent gates run
+        # concurrently, auto-fixing gates run first and never overlap other gates
+        tasks = []
         # Skip tests when auto_fix=True since they cannot be automatically fixed
-        # Use QualityGates to run tests (respects config)
-        test_config = self.quality_gates.config.test_execution
         if test_config.enabled and not auto_fix:
-            test_passed, test_results = self.quality_gates.run_tests()
+            tasks.append(GateTask("tests", self.quality_gates.run_tests))
+        if lint_config.enabled:
+            tasks.append(
+                GateTask(
+                    "linting",
+                    lambda: self.quality_gates.run_linting(auto_fix=auto_fix),
+                    source_tree_resources(auto_fix),
+                )
+            )
+        if fmt_config.enabled:
+            tasks.append(
+                GateTask(
+                    "formatting",
+                    lambda: self.quality_gates.run_formatting(auto_fix=auto_fix),
+                    source_tree_resources(auto_fix),
+                )
+            )
+
+        outcomes = GateScheduler(
+            max_parallel=config.scheduler.max_parallel,
+            expected_durations=expected_gate_durations(self.project_root),
+        ).run(tasks)
+
+        if "tests" in outcomes:
+            test_passed = outcomes["tests"].passed
+            test_results = outcomes["tests"].results
             # Check if tests are required
             if test_config.required:
                 gates["tests"] = {
@@ -128,10 +159,9 @@ class SessionValidator:
                     "message": f"Tests {test_results.get('status', 'unknown')} (not required)",
                 }
 
-        # Use QualityGates for linting (respects config)
-        lint_config = self.quality_gates.config.linting
-        if lint_config.enabled:
-            lint_passed, lint_results = self.quality_gates.run_linting(auto_fix=auto_fix)
+        if "linting" in outcomes:
+            lint_passed = outcomes["linting"].passed
+            lint_results = outcomes["linting"].results
             if lint_config.required:
                 message = "No linting issues" if lint_passed else "Linting issues found"
                 if auto_fix and lint_results.get("fixed"):
@@ -146,10 +176,9 @@ class SessionValidator:
                     "message": f"Linting {lint_results.get('status', 'unknown')} (not required)",
                 }
 
-        # Use QualityGates for formatting (respects config)
-        fmt_config = self.quality_gates.config.formatting
-        if fmt_config.enabled:
-            fmt_passed, fmt_results = self.quality_gates.run_formatting(auto_fix=auto_fix)
+        if "formatting" in outcomes:
+            fmt_passed = outcomes["formatting"].passed
+            fmt_results = outcomes["formatting"].results
             if fmt_config.required:
                 message = "All files properly formatted" if fmt_passed else "Files need formatting"
                 if auto_fix and fmt_results.get("formatted"):
@@ -164,6 +193,10 @@ class SessionValidator:
                     "message": f"Formatting {fmt_results.get('status', 'unknown')} (not required)",
                 }
 
+        for name, outcome in outcomes.items():
+            if outcome.results.get("cached"):
+                gates[name]["message"] += " (cached)"
+
         all_passed = all(g["passed"] for g in gates.values())
 
         return {
@@ -425,13 +458,36 @@ def main() -> int:
         action="store_true",
         help="Show detailed error messages and stack traces",
     )
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Lint and format only files changed this session, and run only impacted tests "
+        "(overrides config)",
+    )
+    scope_group.add_argument(
+        "--full",
+        dest="incremental",
+        action="store_const",
+        const=False,
+        help="Lint, format and test the whole project (overrides config)",
+    )
+    parser.add_argument(
+        "--no-gate-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Re-run every quality gate instead of reusing cached results",
+    )
     args = parser.parse_args()
 
     # Note: Logging configuration is handled globally in cli.py
     # No need to configure logging here
 
     try:
-        validator = SessionValidator()
+        validator = SessionValidator(incremental=args.incremental, use_cache=args.use_cache)
         result = validator.validate(auto_fix=args.fix)
         return 0 if result["ready"] else 1
     except (
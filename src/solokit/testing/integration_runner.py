@@ -22,13 +22,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from solokit.core.command_runner import CommandRunner
+from solokit.core.command_runner import CommandRunner, StreamOptions
 from solokit.core.constants import (
     CLEANUP_TIMEOUT,
     DOCKER_COMMAND_TIMEOUT,
     DOCKER_COMPOSE_TIMEOUT,
     FIXTURE_SETUP_TIMEOUT,
     INTEGRATION_TEST_TIMEOUT,
+    SESSION_DIR_NAME,
+    get_logs_dir,
 )
 from solokit.core.exceptions import (
     EnvironmentSetupError,
@@ -317,6 +319,13 @@ class IntegrationTestRunner:
 
         return self.results
 
+    def _stream_options(self) -> StreamOptions:
+        """Streaming capture for test commands, logging full output when possible."""
+        log_file = None
+        if Path(SESSION_DIR_NAME).is_dir():
+            log_file = get_logs_dir(Path.cwd()) / "integration-tests.log"
+        return StreamOptions(log_file=log_file, label="integration")
+
     def _run_pytest(self) -> None:
         """
         Run integration tests using pytest.
@@ -337,6 +346,7 @@ class IntegrationTestRunner:
                 "--json-report-file=integration-test-results.json",
             ],
             timeout=INTEGRATION_TEST_TIMEOUT,
+            stream=self._stream_options(),
         )
 
         # Parse results
@@ -388,6 +398,7 @@ class IntegrationTestRunner:
                 "--outputFile=integration-test-results.json",
             ],
             timeout=INTEGRATION_TEST_TIMEOUT,
+            stream=self._stream_options(),
         )
 
         # Parse results
@@ -321,33 +321,41 @@ class PerformanceBenchmark:
         """
         services = self.work_item.get("environment_requirements", {}).get("services_required", [])
 
-        resource_usage = {}
+        resource_usage: dict[str, Any] = {}
+        if not services:
+            return resource_usage
+
+        # Look up all container IDs at once, then sample all their stats at once
+        ps_results = self.runner.run_many(
+            [["docker-compose", "ps", "-q", service] for service in services],
+            timeout=GIT_QUICK_TIMEOUT,
+        )
 
-        for service in services:
-            try:
-                # Get container ID
-                result = self.runner.run(
-                    ["docker-compose", "ps", "-q", service], timeout=GIT_QUICK_TIMEOUT
-                )
+        containers = {}
+        for service, result in zip(services, ps_results):
+            container_id = result.stdout.strip()
+            if not container_id:
+                logger.warning(f"No container found for service: {service}")
+                continue
+            containers[service] = container_id
 
-                container_id = result.stdout.strip()
-                if not container_id:
-                    logger.warning(f"No container found for service: {service}")
-                    continue
-
-                # Get resource stats
-                stats_result = self.runner.run(
-                    [
-                        "docker",
-                        "stats",
-                        container_id,
-                        "--no-stream",
-                        "--format",
-                        "{{.CPUPerc}},{{.MemUsage}}",
-                    ],
-                    timeout=PERFORMANCE_TEST_TIMEOUT,
-                )
+        stats_results = self.runner.run_many(
+            [
+                [
+                    "docker",
+                    "stats",
+                    container_id,
+                    "--no-stream",
+                    "--format",
+                    "{{.CPUPerc}},{{.MemUsage}}",
+                ]
+                for container_id in containers.values()
+            ],
+            timeout=PERFORMANCE_TEST_TIMEOUT,
+        )
 
+        for service, stats_result in zip(containers, stats_results):
+            try:
                 if stats_result.success:
                     parts = stats_result.stdout.strip().split(",")
                     resource_usage[service] = {
@@ -21,6 +21,7 @@ from solokit.core.file_ops import load_json, save_json
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import WorkItemStatus
+from solokit.session.status_cache import refresh_status_cache
 
 logger = get_logger(__name__)
 output = get_output()
@@ -173,6 +174,7 @@ def delete_work_item(
     try:
         save_json(work_items_file, work_items_data)
         logger.info("Successfully updated work_items.json")
+        refresh_status_cache(session_dir)
         output.info(f"✓ Deleted work item '{work_item_id}'")
     except OSError as e:
         logger.error("Failed to save work items: %s", e)
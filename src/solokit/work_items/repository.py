@@ -16,6 +16,7 @@ from solokit.core.file_ops import load_json, save_json
 from solokit.core.logging_config import get_logger
 from solokit.core.performance import measure_time
 from solokit.core.types import WorkItemStatus
+from solokit.session.status_cache import refresh_status_cache
 
 logger = get_logger(__name__)
 
@@ -56,6 +57,7 @@ class WorkItemRepository:
         save_json(self.work_items_file, data)
         # Invalidate cache after write
         self._file_cache.invalidate(self.work_items_file)
+        refresh_status_cache(self.session_dir)
 
     def get_work_item(self, work_id: str) -> dict[str, Any] | None:
         """Get a single work item by ID
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Batch Spec Validation Module
+
+Validates many work item specification files in one invocation. Work items are
+loaded once, spec paths are resolved up front, and specs are validated across
+worker processes with results streamed to the console or as JSON lines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from solokit.core.command_runner import CommandRunner
+from solokit.core.constants import GIT_QUICK_TIMEOUT, get_specs_dir, get_work_items_file
+from solokit.core.exceptions import (
+    FileNotFoundError,
+    FileOperationError,
+    SolokitError,
+    SpecValidationError,
+    ValidationError,
+)
+from solokit.core.file_ops import load_json
+from solokit.core.logging_config import get_logger
+from solokit.core.output import get_output
+from solokit.core.types import WorkItemType
+from solokit.work_items.spec_validator import validate_spec_path
+
+logger = get_logger(__name__)
+output = get_output()
+
+# H1 heading prefixes used by the spec templates, mapped to work item types
+SPEC_HEADING_TYPES = {
+    "feature": WorkItemType.FEATURE.value,
+    "bug": WorkItemType.BUG.value,
+    "refactor": WorkItemType.REFACTOR.value,
+    "security": WorkItemType.SECURITY.value,
+    "security task": WorkItemType.SECURITY.value,
+    "integration test": WorkItemType.INTEGRATION_TEST.value,
+    "integration_test": WorkItemType.INTEGRATION_TEST.value,
+    "deployment": WorkItemType.DEPLOYMENT.value,
+}
+
+
+@dataclass
+class SpecTarget:
+    """A spec file to validate.
+
+    Attributes:
+        work_item_id: Work item ID (spec file stem for specs without a work item)
+        work_item_type: Work item type, or None if it could not be determined
+        spec_path: Path to the spec file
+    """
+
+    work_item_id: str
+    work_item_type: str | None
+    spec_path: str
+
+
+@dataclass
+class SpecBatchResult:
+    """Validation outcome for a single spec in a batch.
+
+    Attributes:
+        work_item_id: Work item ID
+        work_item_type: Work item type (None if unknown)
+        spec_path: Path to the spec file
+        valid: Whether the spec passed validation
+        errors: Validation or file errors
+    """
+
+    work_item_id: str
+    work_item_type: str | None
+    spec_path: str
+    valid: bool
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to a JSON-serializable dict."""
+        return asdict(self)
+
+
+def detect_spec_type(spec_path: Path) -> str | None:
+    """
+    Determine a work item type from a spec file's '# Type: Name' heading.
+
+    Args:
+        spec_path: Path to the spec file
+
+    Returns:
+        Work item type value, or None if the heading is missing or unknown
+    """
+    try:
+        with open(spec_path, encoding="utf-8") as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+
+    match = re.match(r"#\s*([^:]+):", first_line)
+    if not match:
+        return None
+    return SPEC_HEADING_TYPES.get(match.group(1).strip().lower())
+
+
+def collect_spec_targets(project_root: Path | None = None) -> list[SpecTarget]:
+    """
+    Resolve every spec to validate, loading work_items.json exactly once.
+
+    Specs referenced by work items are validated with the work item's type.
+    Spec files in .session/specs/ without a work item are included with the
+    type taken from their H1 heading.
+
+    Args:
+        project_root: Project root directory (defaults to current directory)
+
+    Returns:
+        Spec targets sorted by work item ID
+    """
+    root = project_root or Path.cwd()
+    work_items_file = get_work_items_file(root)
+    work_items: dict[str, Any] = {}
+    if work_items_file.exists():
+        work_items = load_json(work_items_file).get("work_items", {})
+
+    targets: list[SpecTarget] = []
+    seen_paths: set[Path] = set()
+
+    for work_item_id, work_item in work_items.items():
+        spec_file = work_item.get("spec_file") or f".session/specs/{work_item_id}.md"
+        spec_path = Path(spec_file)
+        if not spec_path.is_absolute():
+            spec_path = root / spec_path
+        seen_paths.add(spec_path.resolve())
+        targets.append(SpecTarget(work_item_id, work_item.get("type"), str(spec_path)))
+
+    specs_dir = get_specs_dir(root)
+    if specs_dir.is_dir():
+        for spec_path in sorted(specs_dir.glob("*.md")):
+            if spec_path.resolve() in seen_paths:
+                continue
+            targets.append(SpecTarget(spec_path.stem, detect_spec_type(spec_path), str(spec_path)))
+
+    targets.sort(key=lambda target: target.work_item_id)
+    return targets
+
+
+def get_changed_spec_paths(project_root: Path | None = None) -> set[Path] | None:
+    """
+    Find spec files with uncommitted changes (modified, staged or untracked).
+
+    Args:
+        project_root: Project root directory (defaults to current directory)
+
+    Returns:
+        Set of resolved spec paths, or None if git could not determine changes
+    """
+    root = project_root or Path.cwd()
+    specs_dir = get_specs_dir(root)
+    runner = CommandRunner(default_timeout=GIT_QUICK_TIMEOUT, working_dir=root)
+
+    diff = runner.run(["git", "diff", "--name-only", "--relative", "HEAD", "--", str(specs_dir)])
+    untracked = runner.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "--", str(specs_dir)]
+    )
+    if not diff.success or not untracked.success:
+        return None
+
+    changed: set[Path] = set()
+    for line in (diff.stdout + "\n" + untracked.stdout).splitlines():
+        if line.strip():
+            changed.add((root / line.strip()).resolve())
+    return changed
+
+
+def validate_target(target: SpecTarget) -> SpecBatchResult:
+    """
+    Validate a single spec target, converting errors into a result.
+
+    Top-level so it can be dispatched to worker processes.
+
+    Args:
+        target: Spec to validate
+
+    Returns:
+        SpecBatchResult for the target
+    """
+    if not Path(target.spec_path).exists():
+        missing = FileNotFoundError(file_path=target.spec_path, file_type="spec")
+        return SpecBatchResult(
+            target.work_item_id, target.work_item_type, target.spec_path, False, [missing.message]
+        )
+
+    if not target.work_item_type:
+        return SpecBatchResult(
+            target.work_item_id,
+            None,
+            target.spec_path,
+            valid=False,
+            errors=["Cannot determine work item type (expected '# Type: Name' heading)"],
+        )
+
+    try:
+        validate_spec_path(target.work_item_id, target.work_item_type, Path(target.spec_path))
+    except SpecValidationError as e:
+        errors = list(e.context.get("validation_errors", []))
+        return SpecBatchResult(
+            target.work_item_id, target.work_item_type, target.spec_path, False, errors
+        )
+    except (FileNotFoundError, FileOperationError) as e:
+        return SpecBatchResult(
+            target.work_item_id, target.work_item_type, target.spec_path, False, [e.message]
+        )
+
+    return SpecBatchResult(target.work_item_id, target.work_item_type, target.spec_path, True)
+
+
+def validate_specs(targets: list[SpecTarget], jobs: int = 1) -> Iterator[SpecBatchResult]:
+    """
+    Validate spec targets, yielding results in target order as they are ready.
+
+    Args:
+        targets: Specs to validate
+        jobs: Number of worker processes (1 validates in-process)
+
+    Yields:
+        SpecBatchResult for each target
+    """
+    if jobs <= 1 or len(targets) <= 1:
+        for target in targets:
+            yield validate_target(target)
+        return
+
+    # Large chunks keep inter-process overhead low for thousands of small specs
+    chunksize = max(1, len(targets) // (jobs * 4))
+    try:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+    except (OSError, NotImplementedError) as e:
+        logger.warning("Process pool unavailable, validating serially: %s", e)
+        yield from validate_specs(targets, jobs=1)
+        return
+
+    with executor:
+        yield from executor.map(validate_target, targets, chunksize=chunksize)
+
+
+def _print_console_result(result: SpecBatchResult) -> None:
+    """Print one batch result in console format."""
+    label = f"{result.work_item_id} ({result.work_item_type or 'unknown'})"
+    if result.valid:
+        output.info(f"✅ {label}")
+        return
+
+    output.info(f"❌ {label} - {result.spec_path}")
+    for error in result.errors:
+        output.info(f"   - {error}")
+
+
+def run_batch(
+    results: Iterable[SpecBatchResult], as_json: bool = False, verbose: bool = True
+) -> dict[str, Any]:
+    """
+    Stream batch results to output and build the summary.
+
+    Args:
+        results: Results to report (consumed as they are produced)
+        as_json: Emit one JSON object per line instead of console text
+        verbose: Print valid specs as well as invalid ones (console only)
+
+    Returns:
+        Summary dict with total, valid, invalid and duration_seconds
+    """
+    start = time.time()
+    total = 0
+    invalid = 0
+
+    for result in results:
+        total += 1
+        if not result.valid:
+            invalid += 1
+        if as_json:
+            output.info(json.dumps(result.to_dict()))
+        elif verbose or not result.valid:
+            _print_console_result(result)
+
+    summary = {
+        "total": total,
+        "valid": total - invalid,
+        "invalid": invalid,
+        "duration_seconds": round(time.time() - start, 3),
+    }
+
+    if as_json:
+        output.info(json.dumps({"summary": summary}))
+    else:
+        output.info(
+            f"\nValidated {summary['total']} spec(s): {summary['valid']} valid, "
+            f"{summary['invalid']} invalid ({summary['duration_seconds']:.2f}s)"
+        )
+
+    return summary
+
+
+def main() -> int:
+    """CLI entry point for spec validation.
+
+    Returns:
+        int: Exit code (0 if all specs are valid, 1 if any spec is invalid)
+    """
+    from solokit.core.argparse_helpers import HelpfulArgumentParser
+
+    parser = HelpfulArgumentParser(
+        description="Validate work item specification files",
+        epilog="""
+Examples:
+  sk spec-validate feat_001
+  sk spec-validate --all
+  sk spec-validate --all --changed
+  sk spec-validate --all --jobs 8 --json
+
+💡 View spec requirements: docs/reference/spec-template-structure.md
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("work_item_ids", nargs="*", help="Work item IDs to validate")
+    parser.add_argument("--all", action="store_true", help="Validate every spec in .session/specs/")
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Only validate specs with uncommitted changes (git)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument("--json", action="store_true", help="Output results as JSON lines")
+    parser.add_argument(
+        "--errors-only", action="store_true", help="Only show specs that failed validation"
+    )
+    args = parser.parse_args()
+
+    if not args.all and not args.work_item_ids:
+        raise ValidationError(
+            message="No specs selected",
+            remediation="Pass work item IDs or use --all to validate every spec",
+        )
+    if args.jobs < 1:
+        raise ValidationError(
+            message=f"Invalid --jobs value: {args.jobs}",
+            remediation="Use --jobs 1 or greater",
+        )
+
+    targets = collect_spec_targets()
+    if args.work_item_ids:
+        requested = set(args.work_item_ids)
+        unknown = requested - {target.work_item_id for target in targets}
+        targets = [target for target in targets if target.work_item_id in requested]
+        for work_item_id in sorted(unknown):
+            spec_path = get_specs_dir(Path.cwd()) / f"{work_item_id}.md"
+            targets.append(SpecTarget(work_item_id, detect_spec_type(spec_path), str(spec_path)))
+
+    if args.changed:
+        changed = get_changed_spec_paths()
+        if changed is None:
+            output.warning("Could not determine changed specs from git; validating all selected")
+        else:
+            targets = [t for t in targets if Path(t.spec_path).resolve() in changed]
+
+    try:
+        summary = run_batch(
+            validate_specs(targets, jobs=args.jobs),
+            as_json=args.json,
+            verbose=not args.errors_only,
+        )
+    except SolokitError as e:
+        output.error(f"Error: {e.message}")
+        return e.exit_code
+
+    return 0 if summary["invalid"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Parsed Spec Cache Module
+
+Caches spec parsing and validation results keyed by spec path and content hash.
+Entries live in-process and are persisted under .session/cache/specs/ so unchanged
+specs are parsed once per edit instead of once per consumer per command.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from solokit.__version__ import __version__
+from solokit.core.constants import SESSION_DIR_NAME, get_cache_dir
+from solokit.core.file_ops import save_cache_json
+from solokit.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when parser or validator output changes shape so stale entries are ignored
+SPEC_CACHE_SCHEMA_VERSION = 1
+
+PARSED_KEY = "parsed"
+
+
+def compute_content_hash(content: str) -> str:
+    """
+    Compute the cache hash for spec content.
+
+    Args:
+        content: Raw spec file content
+
+    Returns:
+        Hex SHA-256 digest of the content
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def validation_key(work_item_type: str) -> str:
+    """Cache entry key for validation results of a work item type."""
+    return f"validation:{work_item_type}"
+
+
+class SpecCache:
+    """Two-level (memory + disk) cache for parsed spec data."""
+
+    def __init__(self, project_root: Path | None = None):
+        """
+        Initialize spec cache.
+
+        Args:
+            project_root: Project root directory (defaults to current working directory
+                at lookup time, matching the relative .session paths used elsewhere)
+        """
+        self.project_root = project_root
+        self._memory: dict[tuple[str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _root(self) -> Path:
+        return self.project_root if self.project_root is not None else Path.cwd()
+
+    def _cache_file(self, spec_path: Path) -> Path:
+        path_digest = hashlib.sha256(str(spec_path).encode("utf-8")).hexdigest()[:16]
+        return get_cache_dir(self._root()) / "specs" / f"{spec_path.stem}-{path_digest}.json"
+
+    def _resolve(self, spec_path: Path | str) -> Path:
+        path = Path(spec_path)
+        return path if path.is_absolute() else (self._root() / path).resolve()
+
+    def get(self, spec_path: Path | str, content_hash: str, key: str) -> Any | None:
+        """
+        Look up a cached value for a spec.
+
+        Args:
+            spec_path: Path to the spec file
+            content_hash: Hash of the spec content (from compute_content_hash)
+            key: Entry key (PARSED_KEY or validation_key(type))
+
+        Returns:
+            Deep copy of the cached value, or None on miss
+        """
+        resolved = self._resolve(spec_path)
+        memory_key = (str(resolved), content_hash)
+
+        with self._lock:
+            entries = self._memory.get(memory_key)
+            if entries is None:
+                entries = self._load_entries(resolved, content_hash)
+                if entries is not None:
+                    self._memory[memory_key] = entries
+            if entries is None or key not in entries:
+                return None
+            return copy.deepcopy(entries[key])
+
+    def set(self, spec_path: Path | str, content_hash: str, key: str, value: Any) -> None:
+        """
+        Store a value for a spec and persist it when a .session directory exists.
+
+        Args:
+            spec_path: Path to the spec file
+            content_hash: Hash of the spec content (from compute_content_hash)
+            key: Entry key (PARSED_KEY or validation_key(type))
+            value: JSON-serializable value to cache
+        """
+        resolved = self._resolve(spec_path)
+        memory_key = (str(resolved), content_hash)
+
+        with self._lock:
+            entries = self._memory.setdefault(memory_key, {})
+            entries[key] = copy.deepcopy(value)
+            self._save_entries(resolved, content_hash, entries)
+
+    def clear(self) -> None:
+        """Clear the in-process cache (persisted entries are left in place)."""
+        with self._lock:
+            self._memory.clear()
+
+    def _load_entries(self, spec_path: Path, content_hash: str) -> dict[str, Any] | None:
+        cache_file = self._cache_file(spec_path)
+        if not cache_file.exists():
+            return None
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug("Ignoring unreadable spec cache file %s: %s", cache_file, e)
+            return None
+
+        if (
+            data.get("schema_version") != SPEC_CACHE_SCHEMA_VERSION
+            or data.get("solokit_version") != __version__
+            or data.get("spec_path") != str(spec_path)
+            or data.get("content_hash") != content_hash
+        ):
+            return None
+
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else None
+
+    def _save_entries(self, spec_path: Path, content_hash: str, entries: dict[str, Any]) -> None:
+        # Only persist inside an initialized project; never create .session implicitly
+        if not (self._root() / SESSION_DIR_NAME).is_dir():
+            return
+
+        cache_file = self._cache_file(spec_path)
+        data = {
+            "schema_version": SPEC_CACHE_SCHEMA_VERSION,
+            "solokit_version": __version__,
+            "spec_path": str(spec_path),
+            "content_hash": content_hash,
+            "entries": entries,
+        }
+        save_cache_json(cache_file, data)
+
+
+# Global cache instance shared by all spec consumers in this process
+_spec_cache = SpecCache()
+
+
+def get_spec_cache() -> SpecCache:
+    """Get the global spec cache instance."""
+    return _spec_cache
@@ -13,8 +13,10 @@ from __future__ import annotations
 import json
 import re
 import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, cast
 
 from solokit.core.error_handlers import log_errors
 from solokit.core.exceptions import (
@@ -27,6 +29,7 @@ from solokit.core.exceptions import (
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import WorkItemType
+from solokit.work_items.spec_cache import PARSED_KEY, compute_content_hash, get_spec_cache
 
 logger = get_logger(__name__)
 output = get_output()
@@ -46,6 +49,232 @@ def strip_html_comments(content: str) -> str:
     return re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
 
 
+@dataclass
+class SpecHeading:
+    """A heading found by the section index.
+
+    Attributes:
+        level: Heading level (2 for '## ', 3 for '### ')
+        title: Heading text with surrounding whitespace stripped
+        line: Zero-based line number of the heading in the indexed content
+        offset: Character offset of the heading line in the indexed content
+        end_offset: Character offset where the heading's block ends (next heading
+            of the same or higher level, or end of content)
+        children: H3 headings nested under an H2 heading
+    """
+
+    level: int
+    title: str
+    line: int
+    offset: int
+    end_offset: int = -1
+    children: list[SpecHeading] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Case-insensitive lookup key for the heading."""
+        return self.title.lower()
+
+
+class SpecSectionIndex:
+    """Heading tree for a markdown document, built in a single pass.
+
+    Sections and subsections are resolved through the tree instead of
+    rescanning the whole document for every lookup. Lookup semantics match
+    ``parse_section`` and ``extract_subsection``: names are case-insensitive,
+    consecutive headings with the same name are merged, and a section with
+    no lines under its heading resolves to None.
+    """
+
+    def __init__(self, content: str):
+        """Tokenize content into H2/H3 headings.
+
+        Args:
+            content: Markdown content (HTML comments should already be stripped)
+        """
+        self.content = content
+        self.lines = content.split("\n")
+        self.line_offsets: list[int] = []
+        self.headings: list[SpecHeading] = []
+        self._first_h2: dict[str, int] = {}
+        self._section_cache: dict[str, tuple[list[int], list[SpecHeading]] | None] = {}
+
+        offset = 0
+        current_h2: SpecHeading | None = None
+        for line_num, line in enumerate(self.lines):
+            self.line_offsets.append(offset)
+            if line.startswith("## "):
+                if current_h2 is not None:
+                    current_h2.end_offset = offset
+                    if current_h2.children:
+                        current_h2.children[-1].end_offset = offset
+                current_h2 = SpecHeading(2, line[3:].strip(), line_num, offset)
+                self._first_h2.setdefault(current_h2.key, len(self.headings))
+                self.headings.append(current_h2)
+            elif line.startswith("### ") and current_h2 is not None:
+                if current_h2.children:
+                    current_h2.children[-1].end_offset = offset
+                current_h2.children.append(SpecHeading(3, line[4:].strip(), line_num, offset))
+            offset += len(line) + 1
+
+        if current_h2 is not None:
+            current_h2.end_offset = len(content)
+            if current_h2.children:
+                current_h2.children[-1].end_offset = len(content)
+
+    def _block_lines(self, position: int) -> range:
+        """Line numbers of the body of the H2 heading at ``position``."""
+        heading = self.headings[position]
+        if position + 1 < len(self.headings):
+            end = self.headings[position + 1].line
+        else:
+            end = len(self.lines)
+        return range(heading.line + 1, end)
+
+    def _span(
+        self, start: int, matches: Callable[[SpecHeading], bool]
+    ) -> tuple[list[int], list[SpecHeading]]:
+        """Collect body lines and H3 headings from ``start`` through merged duplicates."""
+        line_nums: list[int] = []
+        children: list[SpecHeading] = []
+        position = start
+        while position < len(self.headings):
+            if position != start and not matches(self.headings[position]):
+                break
+            line_nums.extend(self._block_lines(position))
+            children.extend(self.headings[position].children)
+            position += 1
+        return line_nums, children
+
+    def _section_span(self, section_name: str) -> tuple[list[int], list[SpecHeading]] | None:
+        """Resolve a section name to its body lines and H3 headings (cached)."""
+        key = section_name.lower()
+        if key not in self._section_cache:
+            start = self._first_h2.get(key)
+            span = None if start is None else self._span(start, lambda h: h.key == key)
+            if span is not None and not span[0]:
+                span = None
+            self._section_cache[key] = span
+        return self._section_cache[key]
+
+    def has_section(self, section_name: str) -> bool:
+        """Whether an H2 section with this name exists and has content lines."""
+        return self._section_span(section_name) is not None
+
+    def section(self, section_name: str) -> str | None:
+        """Extract section content, equivalent to ``parse_section``.
+
+        Args:
+            section_name: Name of section to extract (case-insensitive)
+
+        Returns:
+            Section content (excluding heading) or None if not found
+        """
+        span = self._section_span(section_name)
+        if span is None:
+            return None
+        return "\n".join(self.lines[n] for n in span[0]).strip()
+
+    def section_by_prefix(self, heading_prefix: str) -> str:
+        """Extract content under the first H2 line starting with ``heading_prefix``.
+
+        Args:
+            heading_prefix: Raw heading line prefix (e.g., "## Commits Made")
+
+        Returns:
+            Section content (without the heading itself), empty string if not found
+        """
+        for position, heading in enumerate(self.headings):
+            if self.lines[heading.line].startswith(heading_prefix):
+                line_nums, _ = self._span(
+                    position, lambda h: self.lines[h.line].startswith(heading_prefix)
+                )
+                return "\n".join(self.lines[n] for n in line_nums).strip()
+        return ""
+
+    def subsection(self, section_name: str, subsection_name: str) -> str | None:
+        """Extract an H3 subsection, equivalent to ``extract_subsection(parse_section(...))``.
+
+        Args:
+            section_name: Name of the parent H2 section (case-insensitive)
+            subsection_name: Name of the H3 subsection (case-insensitive)
+
+        Returns:
+            Subsection content (excluding heading) or None if not found
+        """
+        span = self._section_span(section_name)
+        if span is None:
+            return None
+        line_nums, children = span
+
+        # The section text is stripped before subsections are looked up, so the
+        # first and last non-blank lines are seen with their outer whitespace
+        # removed. Re-evaluate those two lines as potential H3 headings.
+        edges = self._stripped_edges(line_nums)
+        if not edges:
+            return None
+        first_text_line, last_text_line = min(edges), max(edges)
+        line_nums = [n for n in line_nums if first_text_line <= n <= last_text_line]
+        headings: list[tuple[int, str]] = [
+            (h.line, h.title) for h in children if h.line not in edges
+        ]
+        for line_num, text in edges.items():
+            if text.startswith("### "):
+                headings.append((line_num, text[4:].strip()))
+        headings.sort()
+
+        key = subsection_name.lower()
+        start = next((i for i, (_, title) in enumerate(headings) if title.lower() == key), None)
+        if start is None:
+            return None
+
+        # Merge consecutive headings with the same name; stop at the next other H3
+        matching_lines: set[int] = set()
+        end_line: int | None = None
+        for line_num, title in headings[start:]:
+            if title.lower() != key:
+                end_line = line_num
+                break
+            matching_lines.add(line_num)
+
+        first_line = headings[start][0]
+        collected = [
+            edges.get(n, self.lines[n])
+            for n in line_nums
+            if n > first_line and (end_line is None or n < end_line) and n not in matching_lines
+        ]
+        if not collected:
+            return None
+        return "\n".join(collected).strip()
+
+    def _stripped_edges(self, line_nums: list[int]) -> dict[int, str]:
+        """Map the first/last non-blank lines of a span to their stripped text."""
+        first = next((n for n in line_nums if self.lines[n].strip()), None)
+        if first is None:
+            return {}
+        last = next(n for n in reversed(line_nums) if self.lines[n].strip())
+        edges = {first: self.lines[first].lstrip()}
+        edges[last] = edges.get(last, self.lines[last]).rstrip()
+        return edges
+
+
+@lru_cache(maxsize=64)
+def get_section_index(content: str) -> SpecSectionIndex:
+    """Build (or reuse) the section index for spec content.
+
+    HTML comments are stripped before indexing. Results are memoized by
+    content so validators that run several checks on the same spec tokenize
+    it only once.
+
+    Args:
+        content: Raw markdown content
+
+    Returns:
+        SpecSectionIndex for the comment-stripped content
+    """
+    return SpecSectionIndex(strip_html_comments(content))
+
+
 def parse_section(content: str, section_name: str) -> str | None:
     """
     Extract content between '## SectionName' and next '##' heading.
@@ -57,33 +286,7 @@ def parse_section(content: str, section_name: str) -> str | None:
     Returns:
         Section content (excluding heading) or None if not found
     """
-    lines = content.split("\n")
-    in_section = False
-    section_content = []
-
-    for line in lines:
-        # Check if this is an H2 heading
-        if line.startswith("## "):
-            heading = line[3:].strip()
-
-            # Found our target section
-            if heading.lower() == section_name.lower():
-                in_section = True
-                continue
-            # Found next section, stop collecting
-            elif in_section:
-                break
-
-        # Collect lines while in target section
-        if in_section:
-            section_content.append(line)
-
-    # Return None if section not found
-    if not section_content:
-        return None
-
-    # Return trimmed content
-    return "\n".join(section_content).strip()
+    return SpecSectionIndex(content).section(section_name)
 
 
 def extract_subsection(section_content: str, subsection_name: str) -> str | None:
@@ -237,48 +440,50 @@ def parse_feature_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["overview"] = parse_section(content, "Overview")
-    result["user_story"] = parse_section(content, "User Story")
-    result["rationale"] = parse_section(content, "Rationale")
+    result["overview"] = index.section("Overview")
+    result["user_story"] = index.section("User Story")
+    result["rationale"] = index.section("Rationale")
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Implementation Details with subsections
-    impl_section = parse_section(content, "Implementation Details")
+    impl_section = index.section("Implementation Details")
     if impl_section:
         result["implementation_details"] = {
-            "approach": extract_subsection(impl_section, "Approach"),
-            "llm_processing_config": extract_subsection(
-                impl_section, "LLM/Processing Configuration"
+            "approach": index.subsection("Implementation Details", "Approach"),
+            "llm_processing_config": index.subsection(
+                "Implementation Details", "LLM/Processing Configuration"
             ),
-            "components_affected": extract_subsection(impl_section, "Components Affected"),
-            "api_changes": extract_subsection(impl_section, "API Changes"),
-            "database_changes": extract_subsection(impl_section, "Database Changes"),
+            "components_affected": index.subsection(
+                "Implementation Details", "Components Affected"
+            ),
+            "api_changes": index.subsection("Implementation Details", "API Changes"),
+            "database_changes": index.subsection("Implementation Details", "Database Changes"),
             "code_blocks": extract_code_blocks(impl_section),
         }
     else:
         result["implementation_details"] = None
 
     # Testing Strategy
-    result["testing_strategy"] = parse_section(content, "Testing Strategy")
+    result["testing_strategy"] = index.section("Testing Strategy")
 
     # Documentation Updates - extract as checklist
-    doc_section = parse_section(content, "Documentation Updates")
+    doc_section = index.section("Documentation Updates")
     result["documentation_updates"] = extract_checklist(doc_section) if doc_section else []
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -300,48 +505,48 @@ def parse_bug_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["description"] = parse_section(content, "Description")
-    result["steps_to_reproduce"] = parse_section(content, "Steps to Reproduce")
-    result["expected_behavior"] = parse_section(content, "Expected Behavior")
-    result["actual_behavior"] = parse_section(content, "Actual Behavior")
-    result["impact"] = parse_section(content, "Impact")
+    result["description"] = index.section("Description")
+    result["steps_to_reproduce"] = index.section("Steps to Reproduce")
+    result["expected_behavior"] = index.section("Expected Behavior")
+    result["actual_behavior"] = index.section("Actual Behavior")
+    result["impact"] = index.section("Impact")
 
     # Root Cause Analysis with subsections
-    rca_section = parse_section(content, "Root Cause Analysis")
+    rca_section = index.section("Root Cause Analysis")
     if rca_section:
         result["root_cause_analysis"] = {
-            "investigation": extract_subsection(rca_section, "Investigation"),
-            "root_cause": extract_subsection(rca_section, "Root Cause"),
-            "why_it_happened": extract_subsection(rca_section, "Why It Happened"),
+            "investigation": index.subsection("Root Cause Analysis", "Investigation"),
+            "root_cause": index.subsection("Root Cause Analysis", "Root Cause"),
+            "why_it_happened": index.subsection("Root Cause Analysis", "Why It Happened"),
             "code_blocks": extract_code_blocks(rca_section),
         }
     else:
         result["root_cause_analysis"] = None
 
     # Fix Approach
-    result["fix_approach"] = parse_section(content, "Fix Approach")
+    result["fix_approach"] = index.section("Fix Approach")
 
     # Prevention
-    result["prevention"] = parse_section(content, "Prevention")
+    result["prevention"] = index.section("Prevention")
 
     # Testing Strategy
-    result["testing_strategy"] = parse_section(content, "Testing Strategy")
+    result["testing_strategy"] = index.section("Testing Strategy")
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -363,56 +568,56 @@ def parse_refactor_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["overview"] = parse_section(content, "Overview")
-    result["current_state"] = parse_section(content, "Current State")
-    result["problems"] = parse_section(content, "Problems with Current Approach")
+    result["overview"] = index.section("Overview")
+    result["current_state"] = index.section("Current State")
+    result["problems"] = index.section("Problems with Current Approach")
 
     # Proposed Refactor with subsections
-    refactor_section = parse_section(content, "Proposed Refactor")
+    refactor_section = index.section("Proposed Refactor")
     if refactor_section:
         result["proposed_refactor"] = {
-            "new_approach": extract_subsection(refactor_section, "New Approach"),
-            "benefits": extract_subsection(refactor_section, "Benefits"),
-            "trade_offs": extract_subsection(refactor_section, "Trade-offs"),
+            "new_approach": index.subsection("Proposed Refactor", "New Approach"),
+            "benefits": index.subsection("Proposed Refactor", "Benefits"),
+            "trade_offs": index.subsection("Proposed Refactor", "Trade-offs"),
             "code_blocks": extract_code_blocks(refactor_section),
         }
     else:
         result["proposed_refactor"] = None
 
     # Implementation Plan
-    result["implementation_plan"] = parse_section(content, "Implementation Plan")
+    result["implementation_plan"] = index.section("Implementation Plan")
 
     # Scope with subsections
-    scope_section = parse_section(content, "Scope")
+    scope_section = index.section("Scope")
     if scope_section:
         result["scope"] = {
-            "in_scope": extract_subsection(scope_section, "In Scope"),
-            "out_of_scope": extract_subsection(scope_section, "Out of Scope"),
+            "in_scope": index.subsection("Scope", "In Scope"),
+            "out_of_scope": index.subsection("Scope", "Out of Scope"),
         }
     else:
         result["scope"] = None
 
     # Risk Assessment
-    result["risk_assessment"] = parse_section(content, "Risk Assessment")
+    result["risk_assessment"] = index.section("Risk Assessment")
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Testing Strategy
-    result["testing_strategy"] = parse_section(content, "Testing Strategy")
+    result["testing_strategy"] = index.section("Testing Strategy")
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -435,63 +640,63 @@ def parse_security_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["security_issue"] = parse_section(content, "Security Issue")
-    result["severity"] = parse_section(content, "Severity")
-    result["affected_components"] = parse_section(content, "Affected Components")
+    result["security_issue"] = index.section("Security Issue")
+    result["severity"] = index.section("Severity")
+    result["affected_components"] = index.section("Affected Components")
 
     # Threat Model with subsections
-    threat_section = parse_section(content, "Threat Model")
+    threat_section = index.section("Threat Model")
     if threat_section:
         result["threat_model"] = {
-            "assets_at_risk": extract_subsection(threat_section, "Assets at Risk"),
-            "threat_actors": extract_subsection(threat_section, "Threat Actors"),
-            "attack_scenarios": extract_subsection(threat_section, "Attack Scenarios"),
+            "assets_at_risk": index.subsection("Threat Model", "Assets at Risk"),
+            "threat_actors": index.subsection("Threat Model", "Threat Actors"),
+            "attack_scenarios": index.subsection("Threat Model", "Attack Scenarios"),
             "code_blocks": extract_code_blocks(threat_section),
         }
     else:
         result["threat_model"] = None
 
     # Attack Vector
-    result["attack_vector"] = parse_section(content, "Attack Vector")
+    result["attack_vector"] = index.section("Attack Vector")
 
     # Mitigation Strategy
-    result["mitigation_strategy"] = parse_section(content, "Mitigation Strategy")
+    result["mitigation_strategy"] = index.section("Mitigation Strategy")
 
     # Security Testing with subsections
-    testing_section = parse_section(content, "Security Testing")
+    testing_section = index.section("Security Testing")
     if testing_section:
         result["security_testing"] = {
-            "automated": extract_subsection(testing_section, "Automated Security Testing"),
-            "manual": extract_subsection(testing_section, "Manual Security Testing"),
-            "test_cases": extract_subsection(testing_section, "Test Cases"),
+            "automated": index.subsection("Security Testing", "Automated Security Testing"),
+            "manual": index.subsection("Security Testing", "Manual Security Testing"),
+            "test_cases": index.subsection("Security Testing", "Test Cases"),
             "checklist": extract_checklist(testing_section),
         }
     else:
         result["security_testing"] = None
 
     # Compliance - extract as checklist
-    compliance_section = parse_section(content, "Compliance")
+    compliance_section = index.section("Compliance")
     result["compliance"] = extract_checklist(compliance_section) if compliance_section else []
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Post-Deployment
-    post_section = parse_section(content, "Post-Deployment")
+    post_section = index.section("Post-Deployment")
     result["post_deployment"] = extract_checklist(post_section) if post_section else []
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -510,16 +715,16 @@ def parse_integration_test_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["scope"] = parse_section(content, "Scope")
+    result["scope"] = index.section("Scope")
 
     # Test Scenarios - extract all scenarios
-    scenarios_section = parse_section(content, "Test Scenarios")
+    scenarios_section = index.section("Test Scenarios")
     if scenarios_section:
         # Find all subsections that start with "Scenario"
         scenarios = []
@@ -557,23 +762,23 @@ def parse_integration_test_spec(content: str) -> dict[str, Any]:
         result["test_scenarios"] = []
 
     # Performance Benchmarks
-    result["performance_benchmarks"] = parse_section(content, "Performance Benchmarks")
+    result["performance_benchmarks"] = index.section("Performance Benchmarks")
 
     # API Contracts
-    result["api_contracts"] = parse_section(content, "API Contracts")
+    result["api_contracts"] = index.section("API Contracts")
 
     # Environment Requirements
-    result["environment_requirements"] = parse_section(content, "Environment Requirements")
+    result["environment_requirements"] = index.section("Environment Requirements")
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -594,21 +799,21 @@ def parse_deployment_spec(content: str) -> dict[str, Any]:
     - Dependencies
     - Estimated Effort
     """
-    # Strip HTML comments first
-    content = strip_html_comments(content)
+    # Strip HTML comments and index headings once
+    index = get_section_index(content)
 
     result: dict[str, Any] = {}
 
     # Extract main sections
-    result["deployment_scope"] = parse_section(content, "Deployment Scope")
+    result["deployment_scope"] = index.section("Deployment Scope")
 
     # Deployment Procedure with subsections
-    procedure_section = parse_section(content, "Deployment Procedure")
+    procedure_section = index.section("Deployment Procedure")
     if procedure_section:
         result["deployment_procedure"] = {
-            "pre_deployment": extract_subsection(procedure_section, "Pre-Deployment Checklist"),
-            "deployment_steps": extract_subsection(procedure_section, "Deployment Steps"),
-            "post_deployment": extract_subsection(procedure_section, "Post-Deployment Steps"),
+            "pre_deployment": index.subsection("Deployment Procedure", "Pre-Deployment Checklist"),
+            "deployment_steps": index.subsection("Deployment Procedure", "Deployment Steps"),
+            "post_deployment": index.subsection("Deployment Procedure", "Post-Deployment Steps"),
             "code_blocks": extract_code_blocks(procedure_section),
             "checklist": extract_checklist(procedure_section),
         }
@@ -616,21 +821,21 @@ def parse_deployment_spec(content: str) -> dict[str, Any]:
         result["deployment_procedure"] = None
 
     # Environment Configuration
-    result["environment_configuration"] = parse_section(content, "Environment Configuration")
+    result["environment_configuration"] = index.section("Environment Configuration")
 
     # Rollback Procedure with subsections
-    rollback_section = parse_section(content, "Rollback Procedure")
+    rollback_section = index.section("Rollback Procedure")
     if rollback_section:
         result["rollback_procedure"] = {
-            "triggers": extract_subsection(rollback_section, "Rollback Triggers"),
-            "steps": extract_subsection(rollback_section, "Rollback Steps"),
+            "triggers": index.subsection("Rollback Procedure", "Rollback Triggers"),
+            "steps": index.subsection("Rollback Procedure", "Rollback Steps"),
             "code_blocks": extract_code_blocks(rollback_section),
         }
     else:
         result["rollback_procedure"] = None
 
     # Smoke Tests - extract all tests
-    smoke_section = parse_section(content, "Smoke Tests")
+    smoke_section = index.section("Smoke Tests")
     if smoke_section:
         # Find all subsections that start with "Test"
         tests = []
@@ -663,20 +868,20 @@ def parse_deployment_spec(content: str) -> dict[str, Any]:
         result["smoke_tests"] = []
 
     # Monitoring & Alerting
-    result["monitoring"] = parse_section(content, "Monitoring & Alerting")
+    result["monitoring"] = index.section("Monitoring & Alerting")
 
     # Post-Deployment Monitoring Period
-    result["monitoring_period"] = parse_section(content, "Post-Deployment Monitoring Period")
+    result["monitoring_period"] = index.section("Post-Deployment Monitoring Period")
 
     # Acceptance Criteria - extract as checklist
-    ac_section = parse_section(content, "Acceptance Criteria")
+    ac_section = index.section("Acceptance Criteria")
     result["acceptance_criteria"] = extract_checklist(ac_section) if ac_section else []
 
     # Dependencies
-    result["dependencies"] = parse_section(content, "Dependencies")
+    result["dependencies"] = index.section("Dependencies")
 
     # Estimated Effort
-    result["estimated_effort"] = parse_section(content, "Estimated Effort")
+    result["estimated_effort"] = index.section("Estimated Effort")
 
     return result
 
@@ -739,6 +944,16 @@ def parse_spec_file(work_item: str | dict[str, Any]) -> dict[str, Any]:
             cause=e,
         )
 
+    # Reuse the parsed result when this spec content has been parsed before
+    spec_cache = get_spec_cache()
+    content_hash = compute_content_hash(content)
+    cached = cast("dict[str, Any] | None", spec_cache.get(spec_path, content_hash, PARSED_KEY))
+    if cached is not None:
+        logger.debug("Using cached parse for spec file: %s", spec_path)
+        cached["_meta"]["work_item_id"] = work_item_id
+        cached["_meta"]["spec_path"] = str(spec_path)
+        return cached
+
     # Determine work item type from first line (H1 heading)
     first_line = content.split("\n")[0].strip()
     if not first_line.startswith("# "):
@@ -798,6 +1013,7 @@ def parse_spec_file(work_item: str | dict[str, Any]) -> dict[str, Any]:
             "name": work_name,
             "spec_path": str(spec_path),
         }
+        spec_cache.set(spec_path, content_hash, PARSED_KEY, parsed)
         return parsed
     except ValidationError:
         # Re-raise ValidationError as-is
@@ -21,11 +21,14 @@ from solokit.core.exceptions import (
 from solokit.core.logging_config import get_logger
 from solokit.core.output import get_output
 from solokit.core.types import WorkItemType
+from solokit.work_items.spec_cache import (
+    compute_content_hash,
+    get_spec_cache,
+    validation_key,
+)
 from solokit.work_items.spec_parser import (
     extract_checklist,
-    extract_subsection,
-    parse_section,
-    strip_html_comments,
+    get_section_index,
 )
 
 logger = get_logger(__name__)
@@ -181,11 +184,11 @@ def check_required_sections(spec_content: str, work_item_type: str) -> list[str]
     rules = get_validation_rules(work_item_type)
     required_sections = rules.get("required_sections", [])
 
-    # Strip HTML comments before parsing
-    clean_content = strip_html_comments(spec_content)
+    # Strip HTML comments and index headings once for all sections
+    index = get_section_index(spec_content)
 
     for section_name in required_sections:
-        section_content = parse_section(clean_content, section_name)
+        section_content = index.section(section_name)
 
         if section_content is None:
             errors.append(f"Missing required section: '{section_name}'")
@@ -206,8 +209,8 @@ def check_acceptance_criteria(spec_content: str, min_items: int = 3) -> Optional
     Returns:
         Error message if validation fails, None otherwise
     """
-    clean_content = strip_html_comments(spec_content)
-    ac_section = parse_section(clean_content, "Acceptance Criteria")
+    index = get_section_index(spec_content)
+    ac_section = index.section("Acceptance Criteria")
 
     if ac_section is None:
         return None  # Section doesn't exist, will be caught by check_required_sections
@@ -231,8 +234,8 @@ def check_test_scenarios(spec_content: str, min_scenarios: int = 1) -> Optional[
     Returns:
         Error message if validation fails, None otherwise
     """
-    clean_content = strip_html_comments(spec_content)
-    scenarios_section = parse_section(clean_content, "Test Scenarios")
+    index = get_section_index(spec_content)
+    scenarios_section = index.section("Test Scenarios")
 
     if scenarios_section is None:
         return None  # Will be caught by check_required_sections
@@ -257,8 +260,8 @@ def check_smoke_tests(spec_content: str, min_tests: int = 1) -> Optional[str]:
     Returns:
         Error message if validation fails, None otherwise
     """
-    clean_content = strip_html_comments(spec_content)
-    smoke_tests_section = parse_section(clean_content, "Smoke Tests")
+    index = get_section_index(spec_content)
+    smoke_tests_section = index.section("Smoke Tests")
 
     if smoke_tests_section is None:
         return None  # Will be caught by check_required_sections
@@ -283,8 +286,8 @@ def check_deployment_subsections(spec_content: str) -> list[str]:
         List of error messages (empty if all checks pass)
     """
     errors = []
-    clean_content = strip_html_comments(spec_content)
-    deployment_section = parse_section(clean_content, "Deployment Procedure")
+    index = get_section_index(spec_content)
+    deployment_section = index.section("Deployment Procedure")
 
     if deployment_section is None:
         return []  # Will be caught by check_required_sections
@@ -296,7 +299,7 @@ def check_deployment_subsections(spec_content: str) -> list[str]:
     ]
 
     for subsection_name in required_subsections:
-        subsection_content = extract_subsection(deployment_section, subsection_name)
+        subsection_content = index.subsection("Deployment Procedure", subsection_name)
         if subsection_content is None:
             errors.append(f"Deployment Procedure missing required subsection: '{subsection_name}'")
         elif not subsection_content.strip():
@@ -316,8 +319,8 @@ def check_rollback_subsections(spec_content: str) -> list[str]:
         List of error messages (empty if all checks pass)
     """
     errors = []
-    clean_content = strip_html_comments(spec_content)
-    rollback_section = parse_section(clean_content, "Rollback Procedure")
+    index = get_section_index(spec_content)
+    rollback_section = index.section("Rollback Procedure")
 
     if rollback_section is None:
         return []  # Will be caught by check_required_sections
@@ -325,7 +328,7 @@ def check_rollback_subsections(spec_content: str) -> list[str]:
     required_subsections = ["Rollback Triggers", "Rollback Steps"]
 
     for subsection_name in required_subsections:
-        subsection_content = extract_subsection(rollback_section, subsection_name)
+        subsection_content = index.subsection("Rollback Procedure", subsection_name)
         if subsection_content is None:
             errors.append(f"Rollback Procedure missing required subsection: '{subsection_name}'")
         elif not subsection_content.strip():
@@ -334,6 +337,59 @@ def check_rollback_subsections(spec_content: str) -> list[str]:
     return errors
 
 
+def collect_spec_errors(spec_content: str, work_item_type: str) -> list[str]:
+    """
+    Run all validation checks for a work item type against spec content.
+
+    Args:
+        spec_content: Full spec file content
+        work_item_type: Type of work item
+
+    Returns:
+        List of error messages (empty if the spec is valid)
+    """
+    # Collect all errors
+    errors: list[str] = []
+
+    # Check required sections
+    errors.extend(check_required_sections(spec_content, work_item_type))
+
+    # Get special requirements for this work item type
+    rules = get_validation_rules(work_item_type)
+    special_requirements = rules.get("special_requirements", {})
+
+    # Check acceptance criteria (if required)
+    if "acceptance_criteria_min_items" in special_requirements:
+        min_items = special_requirements["acceptance_criteria_min_items"]
+        ac_error = check_acceptance_criteria(spec_content, min_items)
+        if ac_error:
+            errors.append(ac_error)
+
+    # Check test scenarios (for integration_test)
+    if "test_scenarios_min" in special_requirements:
+        min_scenarios = special_requirements["test_scenarios_min"]
+        scenarios_error = check_test_scenarios(spec_content, min_scenarios)
+        if scenarios_error:
+            errors.append(scenarios_error)
+
+    # Check smoke tests (for deployment)
+    if "smoke_tests_min" in special_requirements:
+        min_tests = special_requirements["smoke_tests_min"]
+        smoke_error = check_smoke_tests(spec_content, min_tests)
+        if smoke_error:
+            errors.append(smoke_error)
+
+    # Check deployment subsections (for deployment)
+    if "deployment_procedure_subsections" in special_requirements:
+        errors.extend(check_deployment_subsections(spec_content))
+
+    # Check rollback subsections (for deployment)
+    if "rollback_procedure_subsections" in special_requirements:
+        errors.extend(check_rollback_subsections(spec_content))
+
+    return errors
+
+
 @log_errors()
 def validate_spec_file(work_item_id: str, work_item_type: str) -> None:
     """
@@ -372,8 +428,26 @@ def validate_spec_file(work_item_id: str, work_item_type: str) -> None:
     if not spec_file_path:
         spec_file_path = f".session/specs/{work_item_id}.md"
 
-    spec_path = Path(spec_file_path)
+    validate_spec_path(work_item_id, work_item_type, Path(spec_file_path))
 
+
+def validate_spec_path(work_item_id: str, work_item_type: str, spec_path: Path) -> None:
+    """
+    Validate a spec file at a known path without consulting work_items.json.
+
+    Used by validate_spec_file and by batch validation, which resolves spec
+    paths for all work items up front.
+
+    Args:
+        work_item_id: ID of the work item (used in error reporting)
+        work_item_type: Type of work item
+        spec_path: Path to the spec file
+
+    Raises:
+        FileNotFoundError: If spec file doesn't exist
+        FileOperationError: If spec file cannot be read
+        SpecValidationError: If spec validation fails (contains list of validation errors)
+    """
     if not spec_path.exists():
         raise FileNotFoundError(file_path=str(spec_path), file_type="spec")
 
@@ -385,44 +459,14 @@ def validate_spec_file(work_item_id: str, work_item_type: str) -> None:
             operation="read", file_path=str(spec_path), details=str(e), cause=e
         )
 
-    # Collect all errors
-    errors = []
-
-    # Check required sections
-    errors.extend(check_required_sections(spec_content, work_item_type))
-
-    # Get special requirements for this work item type
-    rules = get_validation_rules(work_item_type)
-    special_requirements = rules.get("special_requirements", {})
-
-    # Check acceptance criteria (if required)
-    if "acceptance_criteria_min_items" in special_requirements:
-        min_items = special_requirements["acceptance_criteria_min_items"]
-        ac_error = check_acceptance_criteria(spec_content, min_items)
-        if ac_error:
-            errors.append(ac_error)
-
-    # Check test scenarios (for integration_test)
-    if "test_scenarios_min" in special_requirements:
-        min_scenarios = special_requirements["test_scenarios_min"]
-        scenarios_error = check_test_scenarios(spec_content, min_scenarios)
-        if scenarios_error:
-            errors.append(scenarios_error)
-
-    # Check smoke tests (for deployment)
-    if "smoke_tests_min" in special_requirements:
-        min_tests = special_requirements["smoke_tests_min"]
-        smoke_error = check_smoke_tests(spec_content, min_tests)
-        if smoke_error:
-            errors.append(smoke_error)
-
-    # Check deployment subsections (for deployment)
-    if "deployment_procedure_subsections" in special_requirements:
-        errors.extend(check_deployment_subsections(spec_content))
-
-    # Check rollback subsections (for deployment)
-    if "rollback_procedure_subsections" in special_requirements:
-        errors.extend(check_rollback_subsections(spec_content))
+    # Reuse validation results for unchanged specs
+    spec_cache = get_spec_cache()
+    content_hash = compute_content_hash(spec_content)
+    cache_key = validation_key(work_item_type)
+    errors = spec_cache.get(spec_path, content_hash, cache_key)
+    if errors is None:
+        errors = collect_spec_errors(spec_content, work_item_type)
+        spec_cache.set(spec_path, content_hash, cache_key, errors)
 
     # Raise SpecValidationError if any validation errors found
     if errors:
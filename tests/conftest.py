@@ -5,10 +5,14 @@ This module provides common fixtures used across unit, integration, and e2e test
 
 import json
 import logging
+import subprocess
 from typing import Any
 
 import pytest
 
+from solokit.git.objects import close_object_readers
+from solokit.git.snapshot import invalidate_git_snapshot
+
 
 @pytest.fixture
 def temp_dir(tmp_path):
@@ -132,6 +136,56 @@ def mock_git_repo(temp_project_dir):
     return temp_project_dir
 
 
+def _run_git(repo, *args) -> str:
+    """Run a git command in a test repository and return its stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def run_git():
+    """Provide a helper running git commands in a test repository.
+
+    Returns:
+        Callable: run_git(repo, *args) returning the command's stripped stdout.
+    """
+    return _run_git
+
+
+@pytest.fixture
+def git_repo_files() -> dict[str, str]:
+    """Files committed by the git_repo fixture (override in a module to change them).
+
+    Returns:
+        dict: File contents keyed by path relative to the repository root.
+    """
+    return {"app.py": "x = 1\n"}
+
+
+@pytest.fixture
+def git_repo(tmp_path, git_repo_files):
+    """Create a git repository on main with one commit and a .session directory.
+
+    Args:
+        tmp_path: Pytest temporary directory.
+        git_repo_files: Files to write and commit.
+
+    Returns:
+        Path: Root directory of the repository.
+    """
+    _run_git(tmp_path, "init", "-q", "-b", "main")
+    _run_git(tmp_path, "config", "user.email", "test@example.com")
+    _run_git(tmp_path, "config", "user.name", "Test")
+    for path, content in git_repo_files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+    _run_git(tmp_path, "add", ".")
+    _run_git(tmp_path, "commit", "-q", "-m", "initial")
+    (tmp_path / ".session" / "tracking").mkdir(parents=True)
+    return tmp_path
+
+
 @pytest.fixture
 def config_file(temp_project_dir, sample_config):
     """Create a config.json file in the temporary project.
@@ -209,6 +263,49 @@ def reset_logging():
         root_logger.removeHandler(handler)
 
 
+@pytest.fixture(autouse=True)
+def disable_gate_cache(monkeypatch):
+    """Disable the quality gate result cache so gate tests always run their checkers.
+
+    Tests of the cache itself remove SOLOKIT_NO_GATE_CACHE explicitly.
+    """
+    monkeypatch.setenv("SOLOKIT_NO_GATE_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def disable_briefing_cache(monkeypatch):
+    """Disable the briefing section cache so briefing tests always render their sections.
+
+    Tests of the cache itself remove SOLOKIT_NO_BRIEFING_CACHE explicitly.
+    """
+    monkeypatch.setenv("SOLOKIT_NO_BRIEFING_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def disable_status_cache(monkeypatch):
+    """Disable the sk status summary cache so status tests read the tracking files.
+
+    Tests of the cache itself remove SOLOKIT_NO_STATUS_CACHE explicitly.
+    """
+    monkeypatch.setenv("SOLOKIT_NO_STATUS_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def reset_git_snapshot():
+    """Drop git snapshots so each test sees the git output it mocks."""
+    invalidate_git_snapshot()
+    yield
+    invalidate_git_snapshot()
+
+
+@pytest.fixture(autouse=True)
+def reset_object_readers():
+    """Stop git cat-file processes so readers don't outlive their test's repository."""
+    close_object_readers()
+    yield
+    close_object_readers()
+
+
 @pytest.fixture
 def capture_logs():
     """Capture log messages during test execution.
@@ -321,11 +321,11 @@ class TestEnvironmentValidation:
         for key in expected_keys:
             assert key in results
 
-    @patch("subprocess.run")
-    def test_validate_environment_passes_when_all_requirements_met(self, mock_run, temp_dir):
+    @patch("solokit.core.command_runner.CommandRunner.run_many")
+    def test_validate_environment_passes_when_all_requirements_met(self, mock_run_many, temp_dir):
         """Test that validate_integration_environment passes when all requirements are met."""
         # Arrange
-        mock_run.return_value = Mock(returncode=0)
+        mock_run_many.return_value = [Mock(success=True), Mock(success=True)]
         compose_file = temp_dir / "docker-compose.yml"
         compose_file.write_text("version: '3'")
 
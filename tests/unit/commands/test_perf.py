@@ -0,0 +1,82 @@
+"""Unit tests for perf command."""
+
+import json
+import sys
+from unittest.mock import patch
+
+from solokit.commands.perf import format_seconds, main, show_gate_timings
+from solokit.quality.gate_timings import GateTiming, record_gate_timings
+
+
+def _record(project, gate, durations):
+    (project / ".session" / "tracking").mkdir(parents=True, exist_ok=True)
+    record_gate_timings(
+        project,
+        [
+            GateTiming(gate=gate, duration_seconds=duration, passed=True, session=session)
+            for session, duration in enumerate(durations, start=1)
+        ],
+    )
+
+
+def test_format_seconds():
+    """Test durations are formatted for the table."""
+    assert format_seconds(0.25) == "250ms"
+    assert format_seconds(12.34) == "12.3s"
+    assert format_seconds(125) == "2m05s"
+
+
+def test_show_gate_timings_table(capsys, tmp_path, monkeypatch):
+    """Test the table lists gates slowest first with p50/p95."""
+    monkeypatch.chdir(tmp_path)
+    _record(tmp_path, "linting", [1.0, 2.0])
+    _record(tmp_path, "tests", [30.0, 40.0])
+
+    result = show_gate_timings()
+
+    lines = capsys.readouterr().out.splitlines()
+    rows = [line for line in lines if line.startswith(("tests", "linting"))]
+    assert result == 0
+    assert rows[0].split() == ["tests", "2", "35.0s", "39.5s", "40.0s"]
+    assert rows[1].startswith("linting")
+
+
+def test_show_gate_timings_json(capsys, tmp_path, monkeypatch):
+    """Test JSON output contains the statistics per gate."""
+    monkeypatch.chdir(tmp_path)
+    _record(tmp_path, "tests", [10.0, 20.0, 30.0])
+
+    result = show_gate_timings(sessions=2, as_json=True)
+
+    data = json.loads(capsys.readouterr().out)
+    assert result == 0
+    assert data == [{"gate": "tests", "runs": 2, "p50": 25.0, "p95": 29.5, "last": 30.0}]
+
+
+def test_show_gate_timings_without_history(capsys, tmp_path, monkeypatch):
+    """Test a hint is shown when nothing is recorded yet."""
+    monkeypatch.chdir(tmp_path)
+
+    result = show_gate_timings()
+
+    assert result == 1
+    assert "No gate timings recorded yet" in capsys.readouterr().out
+
+
+def test_main_unknown_subcommand(capsys):
+    """Test unknown subcommands are rejected."""
+    with patch.object(sys, "argv", ["perf", "tests"]):
+        result = main()
+
+    assert result == 1
+    assert "Unknown subcommand" in capsys.readouterr().err
+
+
+def test_main_passes_options():
+    """Test --sessions and --json are forwarded."""
+    with patch.object(sys, "argv", ["perf", "gates", "--sessions", "5", "--json"]):
+        with patch("solokit.commands.perf.show_gate_timings", return_value=0) as mock_show:
+            result = main()
+
+    assert result == 0
+    mock_show.assert_called_once_with(sessions=5, as_json=True)
@@ -2,14 +2,18 @@
 
 import json
 import subprocess
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from solokit.core.command_runner import (
+    BoundedOutput,
     CommandResult,
     CommandRunner,
+    StreamOptions,
     run_command,
 )
 from solokit.core.exceptions import CommandExecutionError, TimeoutError
@@ -392,6 +396,220 @@ class TestCommandRunner:
         # Should not raise
 
 
+class TestBoundedOutput:
+    """Tests for BoundedOutput head/tail buffer."""
+
+    def test_small_output_kept_whole(self):
+        """Test output within the limits is returned unchanged."""
+        buffer = BoundedOutput(head_chars=10, tail_chars=10)
+        buffer.append("hello\n")
+        buffer.append("world\n")
+
+        assert buffer.getvalue() == "hello\nworld\n"
+        assert buffer.truncated is False
+
+    def test_middle_dropped(self):
+        """Test only the head and tail are kept with an omission marker."""
+        buffer = BoundedOutput(head_chars=4, tail_chars=4)
+        for chunk in ("abcdef", "ghij", "klmnop"):
+            buffer.append(chunk)
+
+        assert buffer.truncated is True
+        assert buffer.omitted_chars == 8
+        assert buffer.getvalue() == "abcd\n... [8 characters omitted] ...\nmnop"
+
+
+class TestStreamingMode:
+    """Tests for CommandRunner.run in streaming mode (real subprocesses)."""
+
+    def test_streams_stdout_and_stderr(self):
+        """Test output and exit code are captured like a normal run."""
+        script = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+
+        result = CommandRunner().run([sys.executable, "-c", script], stream=StreamOptions())
+
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert result.truncated is False
+
+    def test_large_output_bounded_and_spilled_to_log(self, tmp_path):
+        """Test large output keeps only head and tail while the log has everything."""
+        script = "for i in range(20000): print(f'line {i}')"
+        log_file = tmp_path / "logs" / "tests.log"
+
+        result = CommandRunner().run(
+            [sys.executable, "-c", script],
+            stream=StreamOptions(head_chars=100, tail_chars=100, log_file=log_file),
+        )
+
+        assert result.success is True
+        assert result.truncated is True
+        assert result.stdout.startswith("line 0\n")
+        assert result.stdout.endswith("line 19999\n")
+        assert len(result.stdout) < 300
+        assert result.log_file == log_file
+        assert log_file.read_text().count("\n") == 20000
+
+    def test_tee_echoes_lines_with_label(self, capsys):
+        """Test tee writes output lines to the console as they arrive."""
+        CommandRunner().run(
+            [sys.executable, "-c", "print('hello')"],
+            stream=StreamOptions(tee=True, label="tests"),
+        )
+
+        assert "[tests] hello" in capsys.readouterr().out
+
+    def test_timeout_kills_process_and_keeps_output(self):
+        """Test a timed-out streaming command is killed and returns partial output."""
+        script = "import time; print('started', flush=True); time.sleep(30)"
+
+        result = CommandRunner().run(
+            [sys.executable, "-c", script], timeout=1, stream=StreamOptions()
+        )
+
+        assert result.timed_out is True
+        assert result.returncode == -1
+        assert result.stdout == "started\n"
+        assert result.duration_seconds < 10
+
+    def test_missing_executable(self):
+        """Test a missing executable is reported like a normal run."""
+        result = CommandRunner().run(["solokit-no-such-tool"], stream=StreamOptions())
+
+        assert result.returncode == -1
+        assert result.success is False
+
+
+class TestRunMany:
+    """Tests for concurrent execution with run_many() and run_async()."""
+
+    def _python(self, code):
+        return [sys.executable, "-c", code]
+
+    def test_results_in_command_order(self):
+        """Test results are returned in input order regardless of completion order."""
+        commands = [
+            self._python("import time; time.sleep(0.3); print('slow')"),
+            self._python("print('fast')"),
+        ]
+
+        results = CommandRunner().run_many(commands)
+
+        assert [r.stdout.strip() for r in results] == ["slow", "fast"]
+        assert all(r.success for r in results)
+
+    def test_commands_run_concurrently(self):
+        """Test total latency is close to the slowest command, not the sum."""
+        commands = [self._python("import time; time.sleep(0.5)")] * 4
+
+        start = time.time()
+        results = CommandRunner().run_many(commands)
+        elapsed = time.time() - start
+
+        assert all(r.success for r in results)
+        assert elapsed < 1.5
+
+    def test_max_concurrency_limits_parallelism(self):
+        """Test max_concurrency=1 runs commands one after another."""
+        commands = [self._python("import time; time.sleep(0.3)")] * 3
+
+        start = time.time()
+        CommandRunner().run_many(commands, max_concurrency=1)
+
+        assert time.time() - start >= 0.9
+
+    def test_empty_commands(self):
+        """Test an empty batch returns no results."""
+        assert CommandRunner().run_many([]) == []
+
+    def test_failures_and_missing_executables_reported(self):
+        """Test failing and missing commands produce results without check."""
+        results = CommandRunner().run_many(
+            [self._python("import sys; sys.exit(3)"), ["solokit-no-such-tool"]]
+        )
+
+        assert results[0].returncode == 3
+        assert results[1].returncode == -1
+        assert results[1].success is False
+
+    def test_timeout_keeps_partial_output(self):
+        """Test a timed-out command is killed and reports its partial output."""
+        code = "import time; print('started', flush=True); time.sleep(30)"
+
+        start = time.time()
+        (result,) = CommandRunner().run_many([self._python(code)], timeout=1)
+
+        assert result.timed_out is True
+        assert result.returncode == -1
+        assert result.stdout == "started\n"
+        assert time.time() - start < 10
+
+    def test_check_raises_command_error(self):
+        """Test check=True raises after the batch finishes."""
+        runner = CommandRunner(raise_on_error=True)
+
+        with pytest.raises(CommandExecutionError):
+            runner.run_many([self._python("pass"), self._python("import sys; sys.exit(1)")])
+
+    def test_check_raises_timeout_error(self):
+        """Test check=True raises TimeoutError for timed-out commands."""
+        with pytest.raises(TimeoutError):
+            CommandRunner().run_many(
+                [self._python("import time; time.sleep(30)")], timeout=1, check=True
+            )
+
+    def test_retries_failed_command(self, tmp_path):
+        """Test retry_count re-runs failing commands."""
+        counter = tmp_path / "attempts"
+        code = (
+            "import pathlib, sys; p = pathlib.Path(sys.argv[1]); "
+            "n = int(p.read_text()) + 1 if p.exists() else 1; "
+            "p.write_text(str(n)); sys.exit(0 if n >= 2 else 1)"
+        )
+
+        (result,) = CommandRunner().run_many(
+            [[sys.executable, "-c", code, str(counter)]], retry_count=1, retry_delay=0
+        )
+
+        assert result.success is True
+        assert counter.read_text() == "2"
+
+    def test_working_dir_and_env(self, tmp_path):
+        """Test working_dir and env are applied to every command."""
+        runner = CommandRunner(working_dir=tmp_path)
+        code = "import os; print(os.getcwd(), os.environ.get('SOLOKIT_TEST_VAR'))"
+
+        (result,) = runner.run_many(
+            [self._python(code)], env={"SOLOKIT_TEST_VAR": "set", "PATH": ""}
+        )
+
+        cwd, value = result.stdout.split()
+        assert Path(cwd).resolve() == tmp_path.resolve()
+        assert value == "set"
+
+    def test_works_inside_running_event_loop(self):
+        """Test run_many can be called from code already running in an event loop."""
+        import asyncio
+
+        async def caller():
+            return CommandRunner().run_many([self._python("print('ok')")])
+
+        (result,) = asyncio.run(caller())
+
+        assert result.stdout.strip() == "ok"
+
+    def test_run_async(self):
+        """Test run_async returns the same result shape as run()."""
+        import asyncio
+
+        result = asyncio.run(CommandRunner().run_async(self._python("print('async')")))
+
+        assert result.success is True
+        assert result.stdout == "async\n"
+        assert result.command[0] == sys.executable
+
+
 class TestConvenienceFunction:
     """Tests for run_command convenience function."""
 
@@ -5,6 +5,7 @@ import json
 import pytest
 
 from solokit.core.config import (
+    BriefingConfig,
     ConfigManager,
     CurationConfig,
     DocumentationConfig,
@@ -146,6 +147,18 @@ class TestConfigManager:
         assert config.quality_gates.test_execution.coverage_threshold == 80
         assert config.git_workflow.mode == "pr"
         assert config.curation.frequency == 5
+        assert config.briefing.max_bytes == 100_000
+
+    def test_load_briefing_config(self, config_file):
+        """Test the briefing budget is loaded, ignoring unknown fields."""
+        config_file.write_text(
+            json.dumps({"briefing": {"max_bytes": 0, "max_tokens": 8000, "unknown": True}})
+        )
+
+        manager = ConfigManager()
+        manager.load_config(config_file)
+
+        assert manager.briefing == BriefingConfig(max_bytes=0, max_tokens=8000)
 
     def test_load_invalid_json(self, config_file):
         """Test loading with invalid JSON."""
@@ -272,6 +285,16 @@ class TestConfigManager:
         assert manager.quality_gates.test_execution.coverage_threshold == 80
         assert manager.curation.frequency == 5
 
+    def test_scheduler_config(self, config_file):
+        """Test quality gate scheduler settings are parsed."""
+        with open(config_file, "w") as f:
+            json.dump({"quality_gates": {"scheduler": {"max_parallel": 2}}}, f)
+
+        manager = ConfigManager()
+        manager.load_config(config_file)
+
+        assert manager.quality_gates.scheduler.max_parallel == 2
+
     def test_property_access(self, config_file, valid_config_data):
         """Test property access for config sections."""
         with open(config_file, "w") as f:
@@ -444,6 +467,7 @@ class TestDataclassDefaults:
         assert config.test_execution.coverage_threshold == 80
         assert config.linting.enabled is True
         assert config.security.fail_on == "high"
+        assert config.scheduler.max_parallel == 4
 
     def test_git_workflow_config_defaults(self):
         """Test GitWorkflowConfig default values."""
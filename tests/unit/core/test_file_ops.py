@@ -12,8 +12,10 @@ from solokit.core.file_ops import (
     JSONFileOperations,
     backup_file,
     ensure_directory,
+    ensure_session_directory,
     load_json,
     read_file,
+    save_cache_json,
     save_json,
     write_file,
 )
@@ -186,6 +188,80 @@ class TestEnsureDirectory:
         assert existing_dir.exists()
 
 
+class TestEnsureSessionDirectory:
+    """Tests for ensure_session_directory function."""
+
+    def test_ignores_session_cache_directory(self, tmp_path):
+        """Test .session/cache/ gets a catch-all .gitignore when a nested dir is created."""
+        # Arrange
+        nested_dir = tmp_path / ".session" / "cache" / "gates"
+
+        # Act
+        ensure_session_directory(nested_dir)
+
+        # Assert
+        assert nested_dir.is_dir()
+        assert (tmp_path / ".session" / "cache" / ".gitignore").read_text() == "*\n"
+        assert not (nested_dir / ".gitignore").exists()
+
+    def test_keeps_existing_gitignore(self, tmp_path):
+        """Test an existing .gitignore in a state directory is left alone."""
+        # Arrange
+        daemons_dir = tmp_path / ".session" / "daemons"
+        daemons_dir.mkdir(parents=True)
+        (daemons_dir / ".gitignore").write_text("status.json\n")
+
+        # Act
+        ensure_session_directory(daemons_dir)
+
+        # Assert
+        assert (daemons_dir / ".gitignore").read_text() == "status.json\n"
+
+    def test_leaves_other_directories_untracked(self, tmp_path):
+        """Test directories outside solokit's state directories get no .gitignore."""
+        # Arrange
+        tracking_dir = tmp_path / ".session" / "tracking"
+        other_dir = tmp_path / "cache"
+
+        # Act
+        ensure_session_directory(tracking_dir)
+        ensure_session_directory(other_dir)
+
+        # Assert
+        assert not (tracking_dir / ".gitignore").exists()
+        assert not (other_dir / ".gitignore").exists()
+
+
+class TestSaveCacheJson:
+    """Tests for save_cache_json function."""
+
+    def test_writes_compact_json_in_ignored_directory(self, tmp_path):
+        """Test the cache file is written compactly and its state directory ignored."""
+        # Arrange
+        cache_file = tmp_path / ".session" / "cache" / "gates" / "tests.json"
+
+        # Act
+        written = save_cache_json(cache_file, {"entries": {"a": 1}})
+
+        # Assert
+        assert written is True
+        assert cache_file.read_text() == '{"entries": {"a": 1}}'
+        assert (tmp_path / ".session" / "cache" / ".gitignore").exists()
+        assert not cache_file.with_suffix(".json.tmp").exists()
+
+    def test_failed_write_is_ignored(self, tmp_path):
+        """Test a write failure is swallowed and reported through the return value."""
+        # Arrange
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+
+        # Act
+        written = save_cache_json(blocker / "tests.json", {"entries": {}})
+
+        # Assert
+        assert written is False
+
+
 class TestBackupFile:
     """Tests for backup_file function."""
 
@@ -120,6 +120,29 @@ class TestOutputHandler:
         # Assert
         assert "❌ This should still appear" in captured.err
 
+    def test_capture_collects_messages_of_current_thread(self, capsys):
+        """Test capture() buffers this thread's messages but not other threads' or errors."""
+        import threading
+
+        # Arrange
+        handler = OutputHandler()
+
+        # Act
+        with handler.capture() as messages:
+            handler.info("captured")
+            handler.success("done")
+            handler.error("failed")
+            thread = threading.Thread(target=handler.info, args=("other thread",))
+            thread.start()
+            thread.join()
+        handler.info("after")
+        captured = capsys.readouterr()
+
+        # Assert
+        assert messages == ["captured", "✅ done"]
+        assert captured.out == "other thread\nafter\n"
+        assert "❌ failed" in captured.err
+
 
 class TestGlobalOutputHandler:
     """Test suite for global output handler functions."""
@@ -0,0 +1,60 @@
+"""Unit tests for incremental commit recording."""
+
+from unittest.mock import Mock
+
+from solokit.core.exceptions import ErrorCode, GitError
+from solokit.git.commit_log import RecordedCommits
+
+SHA = "a" * 40
+OTHER_SHA = "b" * 40
+
+
+class TestRecordedCommits:
+    """Tests for RecordedCommits."""
+
+    def test_membership_matches_full_and_abbreviated_shas(self):
+        """Test recorded dicts, full SHAs and abbreviated SHAs are all found."""
+        recorded = RecordedCommits({"commits": [{"sha": SHA, "message": "One"}, "bbbbbbb"]})
+
+        assert SHA in recorded
+        assert OTHER_SHA in recorded
+        assert "c" * 40 not in recorded
+        assert len(recorded) == 2
+
+    def test_add_skips_recorded_and_upgrades_bare_shas(self):
+        """Test duplicates aren't appended and dicts replace bare SHAs of the same commit."""
+        git_info = {"commits": ["bbbbbbb"]}
+        recorded = RecordedCommits(git_info)
+
+        assert recorded.add({"sha": SHA, "message": "New"})
+        assert not recorded.add(SHA)
+        assert not recorded.add({"sha": OTHER_SHA, "message": "Upgraded"})
+
+        assert git_info["commits"] == [
+            {"sha": OTHER_SHA, "message": "Upgraded"},
+            {"sha": SHA, "message": "New"},
+        ]
+
+    def test_list_new_since_last_recorded(self):
+        """Test only commits after the last recorded one are listed."""
+        git_info = {"parent_branch": "develop", "last_recorded_commit": SHA}
+        reader = Mock(**{"rev_list.return_value": [OTHER_SHA]})
+        recorded = RecordedCommits(git_info)
+
+        new_commits = recorded.list_new(reader, "feature")
+        recorded.mark_recorded(new_commits)
+
+        reader.rev_list.assert_called_once_with("--reverse", "feature", "^develop", f"^{SHA}")
+        assert git_info["last_recorded_commit"] == OTHER_SHA
+
+    def test_list_new_falls_back_to_whole_branch(self):
+        """Test an unknown last recorded commit lists the whole branch instead."""
+        reader = Mock()
+        reader.rev_list.side_effect = [
+            GitError("bad revision", ErrorCode.GIT_COMMAND_FAILED),
+            [SHA, OTHER_SHA],
+        ]
+        recorded = RecordedCommits({"last_recorded_commit": "c" * 40})
+
+        assert recorded.list_new(reader, "feature") == [SHA, OTHER_SHA]
+        reader.rev_list.assert_called_with("--reverse", "feature", "^main")
@@ -18,6 +18,8 @@ from solokit.core.exceptions import (
 )
 from solokit.git.integration import GitWorkflow
 
+SHA = "a" * 40
+
 
 @pytest.fixture
 def mock_config_manager():
@@ -106,13 +108,17 @@ class TestCheckGitStatus:
         """Test check_git_status with uncommitted changes."""
         # Arrange
         workflow = GitWorkflow(project_root=tmp_path)
-        mock_result = Mock(returncode=0, stdout=" M file.txt\n")
+        mock_result = Mock(
+            returncode=0,
+            stdout=f"# branch.head main\x001 .M N... 100644 100644 100644 {SHA} {SHA} file.txt\x00",
+        )
 
         # Act & Assert
         with patch("subprocess.run", return_value=mock_result):
             with pytest.raises(WorkingDirNotCleanError) as exc_info:
                 workflow.check_git_status()
             assert "not clean" in str(exc_info.value).lower()
+            assert exc_info.value.context["uncommitted_changes"] == [" M file.txt"]
 
     def test_check_git_status_not_git_repo(self, tmp_path):
         """Test check_git_status when not in git repository."""
@@ -171,7 +177,9 @@ class TestGetCurrentBranch:
         """Test getting current branch successfully."""
         # Arrange
         workflow = GitWorkflow(project_root=tmp_path)
-        mock_result = Mock(returncode=0, stdout="feature-branch\n")
+        mock_result = Mock(
+            returncode=0, stdout=f"# branch.oid {SHA}\x00# branch.head feature-branch\x00"
+        )
 
         # Act
         with patch("subprocess.run", return_value=mock_result):
@@ -184,7 +192,7 @@ class TestGetCurrentBranch:
         """Test getting current branch when on main."""
         # Arrange
         workflow = GitWorkflow(project_root=tmp_path)
-        mock_result = Mock(returncode=0, stdout="main\n")
+        mock_result = Mock(returncode=0, stdout=f"# branch.oid {SHA}\x00# branch.head main\x00")
 
         # Act
         with patch("subprocess.run", return_value=mock_result):
@@ -197,7 +205,9 @@ class TestGetCurrentBranch:
         """Test getting current branch in detached HEAD state."""
         # Arrange
         workflow = GitWorkflow(project_root=tmp_path)
-        mock_result = Mock(returncode=0, stdout="")
+        mock_result = Mock(
+            returncode=0, stdout=f"# branch.oid {SHA}\x00# branch.head (detached)\x00"
+        )
 
         # Act
         with patch("subprocess.run", return_value=mock_result):
@@ -841,6 +851,31 @@ class TestFormatPRBody:
         assert "- abc1234" in body
         assert "- def5678" in body
 
+    def test_format_pr_body_commit_subjects(self, tmp_path):
+        """Test commits are listed with their subjects."""
+        # Arrange
+        config_data = {"git_workflow": {"pr_body_template": "{commit_messages}"}}
+        config_file = tmp_path / ".session" / "config.json"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(json.dumps(config_data))
+        workflow = GitWorkflow(project_root=tmp_path)
+        work_item = {
+            "git": {
+                "commits": [
+                    "abc1234",
+                    {"sha": "def5678" + "0" * 33, "message": "Recorded commit"},
+                ]
+            }
+        }
+
+        # Act
+        with patch("solokit.git.integration.get_object_reader") as mock_get_reader:
+            mock_get_reader.return_value.commit.return_value = Mock(subject="Add login form")
+            body = workflow._format_pr_body(work_item, "feature_1", 1)
+
+        # Assert
+        assert body == "- abc1234 Add login form\n- def5678 Recorded commit"
+
     def test_format_pr_body_no_commits(self, tmp_path):
         """Test formatting PR body with no commits uses default text in custom template."""
         # Arrange
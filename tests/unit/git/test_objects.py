@@ -0,0 +1,137 @@
+"""Unit tests for the persistent git object reader."""
+
+import subprocess
+from datetime import timedelta
+
+import pytest
+
+from solokit.core.exceptions import GitError
+from solokit.git.objects import (
+    TreeEntry,
+    close_object_readers,
+    get_object_reader,
+    parse_commit,
+    parse_tree,
+)
+
+SHA = "a" * 40
+OTHER_SHA = "b" * 40
+
+
+def git(repo, *args):
+    """Run a git command in the test repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with two commits on main and one on a feature branch."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "README.md").write_text("# App\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "Initial commit")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Second\n\nLEARNING: Body text")
+    git(tmp_path, "checkout", "-q", "-b", "feature")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Feature work")
+    return tmp_path
+
+
+class TestParsing:
+    """Tests for parse_commit and parse_tree."""
+
+    def test_parse_commit(self):
+        """Test headers, continuation lines and the message are parsed."""
+        content = (
+            f"tree {SHA}\nparent {SHA}\nparent {OTHER_SHA}\n"
+            "author Jane Doe <jane@example.com> 1736935200 +0130\n"
+            "committer Jane Doe <jane@example.com> 1736935200 +0130\n"
+            "gpgsig -----BEGIN PGP SIGNATURE-----\n \n -----END PGP SIGNATURE-----\n"
+            "\nMerge feature\n\nDetails\n"
+        ).encode()
+
+        commit = parse_commit(SHA, content)
+
+        assert commit.parents == (SHA, OTHER_SHA)
+        assert commit.author == "Jane Doe <jane@example.com>"
+        assert commit.author_date.utcoffset() == timedelta(hours=1, minutes=30)
+        assert commit.timestamp == "2025-01-15 11:30:00 +0130"
+        assert commit.message == "Merge feature\n\nDetails"
+        assert commit.subject == "Merge feature"
+
+    def test_parse_tree(self):
+        """Test binary tree entries are split into mode, type, SHA and name."""
+        content = (
+            b"100644 README.md\0"
+            + bytes.fromhex(SHA)
+            + b"40000 src\0"
+            + bytes.fromhex(OTHER_SHA)
+            + b"160000 vendor\0"
+            + bytes.fromhex(SHA)
+        )
+
+        assert parse_tree(content, 20) == [
+            TreeEntry("100644", "blob", SHA, "README.md"),
+            TreeEntry("40000", "tree", OTHER_SHA, "src"),
+            TreeEntry("160000", "commit", SHA, "vendor"),
+        ]
+
+
+class TestGitObjectReader:
+    """Tests for GitObjectReader against real repositories."""
+
+    def test_reads_commits_trees_and_refs(self, repo):
+        """Test the typed helpers over one batch process."""
+        reader = get_object_reader(repo)
+        head = reader.resolve("HEAD")
+        main = reader.resolve("refs/heads/main")
+        process = reader._process
+
+        assert reader.commit_message("main") == "Second\n\nLEARNING: Body text"
+        assert reader.commit_parents(head) == (main,)
+        assert [entry.name for entry in reader.tree_entries("main")] == ["README.md", "src"]
+        assert reader.resolve("refs/heads/missing") is None
+        assert reader.commit("no-such-rev") is None
+        assert reader._process is process
+
+    def test_log_merge_base_and_ancestry(self, repo):
+        """Test rev-list ranges and merge-base lookups."""
+        reader = get_object_reader(repo)
+
+        assert [commit.subject for commit in reader.log("main..feature")] == ["Feature work"]
+        assert reader.merge_base("feature", "main") == reader.resolve("main")
+        assert reader.is_ancestor("main", "feature")
+        assert not reader.is_ancestor("feature", "main")
+        with pytest.raises(GitError):
+            reader.rev_list("missing..feature")
+
+    def test_refs_follow_new_commits(self, repo):
+        """Test a long-lived reader sees commits made after it started."""
+        reader = get_object_reader(repo)
+        before = reader.resolve("HEAD")
+
+        git(repo, "commit", "-q", "--allow-empty", "-m", "Later")
+
+        assert reader.resolve("HEAD") != before
+        assert reader.commit("HEAD").subject == "Later"
+
+    def test_outside_repository(self, tmp_path):
+        """Test reads outside a repository raise GitError."""
+        with pytest.raises(GitError):
+            get_object_reader(tmp_path).resolve("HEAD")
+
+    def test_shared_until_closed(self, repo):
+        """Test readers are shared per repository until closed."""
+        reader = get_object_reader(repo)
+        reader.resolve("HEAD")
+
+        assert get_object_reader(repo) is reader
+        close_object_readers()
+        assert reader._process is None
+        assert get_object_reader(repo) is not reader
@@ -0,0 +1,146 @@
+"""Unit tests for the per-invocation git snapshot."""
+
+import subprocess
+from unittest.mock import Mock
+
+import pytest
+
+from solokit.core.command_runner import CommandResult
+from solokit.core.exceptions import CommandExecutionError, NotAGitRepoError
+from solokit.git.snapshot import (
+    StatusEntry,
+    get_git_snapshot,
+    invalidate_git_snapshot,
+    parse_porcelain_v2,
+)
+
+SHA = "a" * 40
+
+
+def result(stdout="", returncode=0, timed_out=False):
+    """Build a CommandResult for a git call."""
+    return CommandResult(
+        returncode=returncode,
+        stdout=stdout,
+        stderr="",
+        command=["git"],
+        duration_seconds=0.01,
+        timed_out=timed_out,
+    )
+
+
+class TestParsePorcelainV2:
+    """Tests for parse_porcelain_v2."""
+
+    def test_branch_headers(self):
+        """Test HEAD, branch, upstream and ahead/behind are read from the headers."""
+        output = (
+            f"# branch.oid {SHA}\0# branch.head feature\0"
+            "# branch.upstream origin/feature\0# branch.ab +2 -1\0"
+        )
+
+        head, branch, upstream, ahead, behind, entries = parse_porcelain_v2(output)
+
+        assert (head, branch, upstream, ahead, behind) == (SHA, "feature", "origin/feature", 2, 1)
+        assert entries == []
+
+    def test_initial_commit_and_detached_head(self):
+        """Test an unborn branch has no HEAD and a detached HEAD has no branch."""
+        assert parse_porcelain_v2("# branch.oid (initial)\0# branch.head main\0")[:2] == (
+            None,
+            "main",
+        )
+        assert parse_porcelain_v2(f"# branch.oid {SHA}\0# branch.head (detached)\0")[:2] == (
+            SHA,
+            None,
+        )
+
+    def test_entries(self):
+        """Test changed, renamed, unmerged and untracked entries are parsed."""
+        output = (
+            f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/app.py\0"
+            f"1 A. N... 000000 100644 100644 {SHA} {SHA} with space.py\0"
+            f"2 R. N... 100644 100644 100644 {SHA} {SHA} R100 new.py\0old.py\0"
+            f"u UU N... 100644 100644 100644 100644 {SHA} {SHA} {SHA} conflict.py\0"
+            "? notes.txt\0"
+        )
+
+        entries = parse_porcelain_v2(output)[5]
+
+        assert entries == [
+            StatusEntry(" M", "src/app.py"),
+            StatusEntry("A ", "with space.py"),
+            StatusEntry("R ", "new.py", "old.py"),
+            StatusEntry("UU", "conflict.py"),
+            StatusEntry("??", "notes.txt"),
+        ]
+        assert [entry.line for entry in entries] == [
+            " M src/app.py",
+            "A  with space.py",
+            "R  old.py -> new.py",
+            "UU conflict.py",
+            "?? notes.txt",
+        ]
+        assert [entry.code for entry in entries] == ["M", "A", "R", "U", "?"]
+
+
+class TestGetGitSnapshot:
+    """Tests for get_git_snapshot."""
+
+    def test_shared_until_invalidated(self, tmp_path):
+        """Test git status runs once per invocation until the snapshot is invalidated."""
+        runner = Mock()
+        runner.run.return_value = result(f"# branch.oid {SHA}\0# branch.head main\0")
+
+        first = get_git_snapshot(tmp_path, runner)
+        second = get_git_snapshot(tmp_path, Mock())
+        invalidate_git_snapshot(tmp_path)
+        third = get_git_snapshot(tmp_path, runner)
+
+        assert second is first
+        assert third is not first
+        assert runner.run.call_count == 2
+
+    def test_failure_raises_and_is_not_cached(self, tmp_path):
+        """Test git failures raise and the next call tries again."""
+        runner = Mock()
+        runner.run.side_effect = [
+            result(returncode=128),
+            result(returncode=-1, timed_out=True),
+            result("# branch.head main\0"),
+        ]
+
+        with pytest.raises(NotAGitRepoError):
+            get_git_snapshot(tmp_path, runner)
+        with pytest.raises(CommandExecutionError):
+            get_git_snapshot(tmp_path, runner)
+        assert get_git_snapshot(tmp_path, runner).branch == "main"
+
+    def test_last_commit_files_fetched_once(self, tmp_path):
+        """Test the last commit's files are fetched lazily and reused."""
+        runner = Mock()
+        runner.run.side_effect = [result("# branch.head main\0"), result("README.md\nsrc/app.py\n")]
+
+        snapshot = get_git_snapshot(tmp_path, runner)
+
+        assert snapshot.last_commit_files() == ["README.md", "src/app.py"]
+        assert snapshot.last_commit_files() == ["README.md", "src/app.py"]
+        assert runner.run.call_count == 2
+
+    def test_real_repository(self, tmp_path):
+        """Test a snapshot of an actual repository."""
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+        (tmp_path / "tracked.txt").write_text("one\n")
+        subprocess.run(["git", "add", "tracked.txt"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "Initial"], cwd=tmp_path, check=True)
+        (tmp_path / "tracked.txt").write_text("two\n")
+        (tmp_path / "new.txt").write_text("new\n")
+
+        snapshot = get_git_snapshot(tmp_path)
+
+        assert snapshot.branch == "main"
+        assert snapshot.head is not None and len(snapshot.head) == 40
+        assert snapshot.status_lines == [" M tracked.txt", "?? new.txt"]
+        assert snapshot.changed_files == ["tracked.txt"]
+        assert not snapshot.is_clean
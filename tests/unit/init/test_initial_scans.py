@@ -9,7 +9,8 @@ Run tests:
 Target: 90%+ coverage
 """
 
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import patch
 
 from solokit.init.initial_scans import run_initial_scans, run_stack_scan, run_tree_scan
 
@@ -18,65 +19,69 @@ class TestRunStackScan:
     """Tests for run_stack_scan()."""
 
     def test_stack_scan_success(self, tmp_path):
-        """Test successful stack scan."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
+        """Test successful stack scan runs the generator in-process."""
+        with patch("solokit.init.initial_scans.StackGenerator") as mock_generator:
             result = run_stack_scan(tmp_path)
 
             assert result is True
+            mock_generator.assert_called_once_with(tmp_path)
+            mock_generator.return_value.update_stack.assert_called_once_with()
 
     def test_stack_scan_failure(self, tmp_path):
-        """Test stack scan failure."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=False, stderr="Error")
+        """Test stack scan handles generator errors gracefully."""
+        with patch("solokit.init.initial_scans.StackGenerator") as mock_generator:
+            mock_generator.return_value.update_stack.side_effect = Exception("Unexpected error")
 
             result = run_stack_scan(tmp_path)
 
             assert result is False
 
-    def test_stack_script_not_found(self, tmp_path):
-        """Test when stack.py script doesn't exist."""
-        # Mock __file__ at module level to point to a fake location
-        import solokit.init.initial_scans as initial_scans_module
+    def test_stack_scan_default_project_root(self, tmp_path, monkeypatch):
+        """Test stack scan with default project root (None)."""
+        monkeypatch.chdir(tmp_path)
+        with patch("solokit.init.initial_scans.StackGenerator") as mock_generator:
+            result = run_stack_scan(None)
 
-        with patch.object(initial_scans_module, "__file__", "/fake/solokit/init/initial_scans.py"):
-            # Now Path(__file__).parent.parent / "project" / "stack.py" will be /fake/solokit/project/stack.py
-            # which doesn't exist
-            result = run_stack_scan(tmp_path)
+            assert result is True
+            mock_generator.assert_called_once_with(tmp_path)
 
-            assert result is False
+    def test_stack_scan_writes_stack_file(self, tmp_path):
+        """Test stack scan generates stack.txt in the project."""
+        (tmp_path / "app.py").write_text("print('hello')\n")
+
+        assert run_stack_scan(tmp_path) is True
+        assert (tmp_path / ".session" / "tracking" / "stack.txt").exists()
 
 
 class TestRunTreeScan:
     """Tests for run_tree_scan()."""
 
     def test_tree_scan_success(self, tmp_path):
-        """Test successful tree scan."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
+        """Test successful tree scan runs the generator in-process."""
+        with patch("solokit.init.initial_scans.TreeGenerator") as mock_generator:
             result = run_tree_scan(tmp_path)
 
             assert result is True
+            mock_generator.assert_called_once_with(tmp_path)
+            mock_generator.return_value.update_tree.assert_called_once_with()
 
     def test_tree_scan_failure(self, tmp_path):
-        """Test tree scan failure."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=False)
+        """Test tree scan handles generator errors gracefully."""
+        with patch("solokit.init.initial_scans.TreeGenerator") as mock_generator:
+            mock_generator.return_value.update_tree.side_effect = Exception("Unexpected error")
 
             result = run_tree_scan(tmp_path)
 
             assert result is False
 
+    def test_tree_scan_writes_tree_file(self, tmp_path):
+        """Test tree scan generates tree.txt in the project."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("print('hello')\n")
+
+        assert run_tree_scan(tmp_path) is True
+        assert (tmp_path / ".session" / "tracking" / "tree.txt").exists()
+
 
 class TestRunInitialScans:
     """Tests for run_initial_scans()."""
@@ -131,179 +136,16 @@ class TestRunInitialScans:
                 assert results["stack"] is True
                 assert results["tree"] is True
 
+    def test_scans_run_concurrently(self, tmp_path):
+        """Test the stack and tree scans overlap instead of running in sequence."""
+        both_started = threading.Barrier(2, timeout=5)
 
-class TestRunStackScanEdgeCases:
-    """Additional edge case tests for run_stack_scan."""
-
-    def test_stack_scan_exception(self, tmp_path):
-        """Test stack scan handles exception gracefully."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.side_effect = Exception("Unexpected error")
-
-            result = run_stack_scan(tmp_path)
-
-            assert result is False
-
-    def test_stack_scan_with_stderr_message(self, tmp_path):
-        """Test stack scan logs stderr when command fails."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=False, stderr="Stack generation error")
-
-            result = run_stack_scan(tmp_path)
-
-            assert result is False
-
-    def test_stack_scan_default_project_root(self):
-        """Test stack scan with default project root (None)."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            result = run_stack_scan(None)
-
-            assert result is True
-
-    def test_stack_scan_command_runner_check_flag(self, tmp_path):
-        """Test stack scan uses check=True flag."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_stack_scan(tmp_path)
-
-            # Verify check=True was passed
-            call_args = mock_runner.run.call_args
-            assert call_args[1]["check"] is True
-
-
-class TestRunTreeScanEdgeCases:
-    """Additional edge case tests for run_tree_scan."""
-
-    def test_tree_scan_exception(self, tmp_path):
-        """Test tree scan handles exception gracefully."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.side_effect = Exception("Unexpected error")
-
-            result = run_tree_scan(tmp_path)
-
-            assert result is False
-
-    def test_tree_scan_with_stderr_message(self, tmp_path):
-        """Test tree scan logs stderr when command fails."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=False, stderr="Tree generation error")
-
-            result = run_tree_scan(tmp_path)
-
-            assert result is False
-
-    def test_tree_scan_default_project_root(self):
-        """Test tree scan with default project root (None)."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            result = run_tree_scan(None)
-
-            assert result is True
-
-    def test_tree_script_not_found(self, tmp_path):
-        """Test when tree.py script doesn't exist."""
-        import solokit.init.initial_scans as initial_scans_module
-
-        with patch.object(initial_scans_module, "__file__", "/fake/solokit/init/initial_scans.py"):
-            result = run_tree_scan(tmp_path)
-
-            assert result is False
-
-    def test_tree_scan_command_runner_check_flag(self, tmp_path):
-        """Test tree scan uses check=True flag."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_tree_scan(tmp_path)
-
-            # Verify check=True was passed
-            call_args = mock_runner.run.call_args
-            assert call_args[1]["check"] is True
+        def scan(project_root):
+            both_started.wait()
+            return True
 
+        with patch("solokit.init.initial_scans.run_stack_scan", side_effect=scan):
+            with patch("solokit.init.initial_scans.run_tree_scan", side_effect=scan):
+                results = run_initial_scans(tmp_path)
 
-class TestCommandRunnerIntegration:
-    """Test CommandRunner integration with scans."""
-
-    def test_stack_scan_uses_correct_timeout(self, tmp_path):
-        """Test stack scan initializes CommandRunner with correct timeout."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_stack_scan(tmp_path)
-
-            # Verify CommandRunner was initialized with GIT_STANDARD_TIMEOUT
-            from solokit.core.constants import GIT_STANDARD_TIMEOUT
-
-            mock_runner_class.assert_called_once()
-            call_kwargs = mock_runner_class.call_args[1]
-            assert call_kwargs["default_timeout"] == GIT_STANDARD_TIMEOUT
-            assert call_kwargs["working_dir"] == tmp_path
-
-    def test_tree_scan_uses_correct_timeout(self, tmp_path):
-        """Test tree scan initializes CommandRunner with correct timeout."""
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_tree_scan(tmp_path)
-
-            # Verify CommandRunner was initialized with GIT_STANDARD_TIMEOUT
-            from solokit.core.constants import GIT_STANDARD_TIMEOUT
-
-            mock_runner_class.assert_called_once()
-            call_kwargs = mock_runner_class.call_args[1]
-            assert call_kwargs["default_timeout"] == GIT_STANDARD_TIMEOUT
-            assert call_kwargs["working_dir"] == tmp_path
-
-    def test_stack_scan_uses_sys_executable(self, tmp_path):
-        """Test stack scan uses sys.executable for Python interpreter."""
-        import sys
-
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_stack_scan(tmp_path)
-
-            # Verify sys.executable was used in the command
-            call_args = mock_runner.run.call_args[0][0]
-            assert call_args[0] == sys.executable
-
-    def test_tree_scan_uses_sys_executable(self, tmp_path):
-        """Test tree scan uses sys.executable for Python interpreter."""
-        import sys
-
-        with patch("solokit.init.initial_scans.CommandRunner") as mock_runner_class:
-            mock_runner = Mock()
-            mock_runner_class.return_value = mock_runner
-            mock_runner.run.return_value = Mock(success=True)
-
-            run_tree_scan(tmp_path)
-
-            # Verify sys.executable was used in the command
-            call_args = mock_runner.run.call_args[0][0]
-            assert call_args[0] == sys.executable
+        assert results == {"stack": True, "tree": True}
@@ -362,20 +362,22 @@ class TestStandardizedEntryCreation:
 
     def test_git_extracted_learnings_have_both_fields(self, curator):
         """Test that git-extracted learnings include both learned_in and context fields."""
-        # Arrange & Act
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="abc123|||feat: Test\n\nLEARNING: Git commit learning with enough words",
-            )
+        # Arrange
+        commit = Mock(
+            sha="abc123" + "0" * 34,
+            message="feat: Test\n\nLEARNING: Git commit learning with enough words",
+        )
+
+        # Act
+        with patch("solokit.learning.extractor.get_object_reader") as mock_get_reader:
+            mock_get_reader.return_value.log.return_value = [commit]
             learnings = curator.extract_from_git_commits(session_id="session_003")
 
-            # Assert
-            if learnings:
-                learning = learnings[0]
-                assert "learned_in" in learning
-                assert "context" in learning
-                assert learning["learned_in"] == "session_003"
+        # Assert
+        learning = learnings[0]
+        assert learning["content"] == "Git commit learning with enough words"
+        assert learning["context"] == "Commit abc12300"
+        assert learning["learned_in"] == "session_003"
 
     def test_temp_file_entry_has_both_fields(self, curator):
         """Test that temp-file sourced learnings include both learned_in and context."""
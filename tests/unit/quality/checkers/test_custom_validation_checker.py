@@ -331,29 +331,20 @@ class TestCustomValidationCheckerGrepValidation:
 
     def test_run_grep_validation_succeeds(self, custom_config, temp_project_dir, mock_runner):
         """Test _run_grep_validation succeeds when pattern found."""
+        (temp_project_dir / "app.py").write_text("def test():\n    pass\n")
         checker = CustomValidationChecker(custom_config, temp_project_dir, runner=mock_runner)
 
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="match found",
-            stderr="",
-            command=["grep"],
-            duration_seconds=0.1,
-        )
-
         rule = {"type": "grep", "pattern": "test", "files": ".", "name": "Test"}
         result = checker._run_grep_validation(rule)
 
         assert result is True
+        mock_runner.run.assert_not_called()
 
     def test_run_grep_validation_fails(self, custom_config, temp_project_dir, mock_runner):
         """Test _run_grep_validation fails when pattern not found."""
+        (temp_project_dir / "app.py").write_text("x = 1\n")
         checker = CustomValidationChecker(custom_config, temp_project_dir, runner=mock_runner)
 
-        mock_runner.run.return_value = CommandResult(
-            returncode=1, stdout="", stderr="", command=["grep"], duration_seconds=0.1
-        )
-
         rule = {"type": "grep", "pattern": "test", "files": ".", "name": "Test"}
         result = checker._run_grep_validation(rule)
 
@@ -373,23 +364,80 @@ class TestCustomValidationCheckerGrepValidation:
     def test_run_grep_validation_uses_default_files(
         self, custom_config, temp_project_dir, mock_runner
     ):
-        """Test _run_grep_validation uses default files when not specified."""
+        """Test _run_grep_validation searches the whole project when files is not specified."""
+        (temp_project_dir / "pkg").mkdir()
+        (temp_project_dir / "pkg" / "module.py").write_text("# test marker\n")
         checker = CustomValidationChecker(custom_config, temp_project_dir, runner=mock_runner)
 
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="match",
-            stderr="",
-            command=["grep"],
-            duration_seconds=0.1,
-        )
-
         rule = {"type": "grep", "pattern": "test", "name": "Test"}
         result = checker._run_grep_validation(rule)
 
         assert result is True
-        call_args = mock_runner.run.call_args[0][0]
-        assert "." in call_args
+
+    def test_run_grep_validation_respects_files(self, custom_config, temp_project_dir, mock_runner):
+        """Test only the configured files or directories are searched."""
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "app.py").write_text("x = 1\n")
+        (temp_project_dir / "README.md").write_text("TODO\n")
+        checker = CustomValidationChecker(custom_config, temp_project_dir, runner=mock_runner)
+
+        assert checker._run_grep_validation({"pattern": "TODO", "files": "src"}) is False
+        assert checker._run_grep_validation({"pattern": "TODO", "files": "README.md"}) is True
+        assert checker._run_grep_validation({"pattern": "TODO", "files": "missing"}) is False
+
+    def test_run_evaluates_grep_rules_per_rule(self, temp_project_dir, mock_runner):
+        """Test run() reports each grep rule's own result."""
+        (temp_project_dir / "app.py").write_text("import logging\n")
+        config = {
+            "rules": [
+                {"type": "grep", "name": "Uses logging", "pattern": "import logging"},
+                {"type": "grep", "name": "Has TODO", "pattern": "TODO", "required": True},
+                {"type": "grep", "name": "No pattern"},
+            ]
+        }
+        checker = CustomValidationChecker(config, temp_project_dir, runner=mock_runner)
+
+        result = checker.run()
+
+        assert [v["passed"] for v in result.info["validations"]] == [True, False, True]
+        assert result.passed is False
+
+
+class TestCustomValidationCheckerConcurrency:
+    """Tests for concurrent command rules."""
+
+    def test_command_rules_run_concurrently(self, temp_project_dir, mock_runner):
+        """Test independent command rules run at the same time, results in rule order."""
+        import threading
+
+        config = {
+            "rules": [
+                {"type": "command", "name": "First", "command": "true"},
+                {"type": "command", "name": "Second", "command": "false"},
+            ]
+        }
+        started = threading.Barrier(2, timeout=5)
+
+        def run(command, **kwargs):
+            # Each command waits for the other to start; sequential runs would time out
+            started.wait()
+            return CommandResult(
+                returncode=0 if command == ["true"] else 1,
+                stdout="",
+                stderr="",
+                command=command,
+                duration_seconds=0.1,
+            )
+
+        mock_runner.run.side_effect = run
+        checker = CustomValidationChecker(config, temp_project_dir, runner=mock_runner)
+
+        result = checker.run()
+
+        assert [(v["name"], v["passed"]) for v in result.info["validations"]] == [
+            ("First", True),
+            ("Second", False),
+        ]
 
 
 class TestCustomValidationCheckerUnknownRuleType:
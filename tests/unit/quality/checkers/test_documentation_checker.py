@@ -30,6 +30,7 @@ def doc_config():
         "enabled": True,
         "check_changelog": True,
         "check_docstrings": True,
+        "docstring_checker": "pydocstyle",
         "check_readme": True,
     }
 
@@ -122,7 +123,7 @@ class TestDocumentationCheckerRun:
         # Mock all git commands to succeed
         mock_runner.run.return_value = CommandResult(
             returncode=0,
-            stdout="main",
+            stdout="# branch.head main\x00",
             stderr="",
             command=["git"],
             duration_seconds=0.1,
@@ -142,7 +143,7 @@ class TestDocumentationCheckerChangelog:
 
         mock_runner.run.return_value = CommandResult(
             returncode=0,
-            stdout="main",
+            stdout="# branch.head main\x00",
             stderr="",
             command=["git"],
             duration_seconds=0.1,
@@ -160,7 +161,7 @@ class TestDocumentationCheckerChangelog:
 
         mock_runner.run.return_value = CommandResult(
             returncode=0,
-            stdout="master",
+            stdout="# branch.head master\x00",
             stderr="",
             command=["git"],
             duration_seconds=0.1,
@@ -179,7 +180,7 @@ class TestDocumentationCheckerChangelog:
         mock_runner.run.side_effect = [
             CommandResult(
                 returncode=0,
-                stdout="feature-branch",
+                stdout="# branch.head feature-branch\x00",
                 stderr="",
                 command=["git"],
                 duration_seconds=0.1,
@@ -206,7 +207,7 @@ class TestDocumentationCheckerChangelog:
         mock_runner.run.side_effect = [
             CommandResult(
                 returncode=0,
-                stdout="feature-branch",
+                stdout="# branch.head feature-branch\x00",
                 stderr="",
                 command=["git"],
                 duration_seconds=0.1,
@@ -342,6 +343,59 @@ class TestDocumentationCheckerDocstrings:
         assert result is True
 
 
+class TestDocumentationCheckerBuiltinDocstrings:
+    """Tests for the built-in (in-process) docstring check."""
+
+    @pytest.fixture
+    def builtin_config(self):
+        """Config with only the built-in docstring check enabled."""
+        return {"enabled": True, "check_docstrings": True, "docstring_checker": "builtin"}
+
+    def test_reports_locations_without_venv(self, builtin_config, temp_project_dir, mock_runner):
+        """Test missing docstrings fail the check with their locations, no venv needed."""
+        (temp_project_dir / "pyproject.toml").touch()
+        (temp_project_dir / "app.py").write_text('"""App."""\n\n\ndef run():\n    pass\n')
+
+        checker = DocumentationChecker(builtin_config, temp_project_dir, runner=mock_runner)
+        result = checker.run()
+
+        assert result.passed is False
+        assert result.info["checks"] == [
+            {
+                "name": "Docstrings present",
+                "passed": False,
+                "missing": 1,
+                "locations": ["app.py:4: public function 'run' has no docstring"],
+            }
+        ]
+        mock_runner.run.assert_not_called()
+
+    def test_passes_when_documented(self, builtin_config, temp_project_dir, mock_runner):
+        """Test the check passes when every public definition has a docstring."""
+        (temp_project_dir / "pyproject.toml").touch()
+        (temp_project_dir / "app.py").write_text('"""App."""\n')
+
+        checker = DocumentationChecker(builtin_config, temp_project_dir, runner=mock_runner)
+
+        assert checker._check_python_docstrings() is True
+
+    def test_locations_truncated(self, builtin_config, temp_project_dir, mock_runner):
+        """Test only the first locations are kept while the count covers all of them."""
+        from solokit.quality.checkers.documentation import MAX_REPORTED_LOCATIONS
+
+        (temp_project_dir / "pyproject.toml").touch()
+        functions = "".join(
+            f"def run_{index}():\n    pass\n" for index in range(MAX_REPORTED_LOCATIONS + 5)
+        )
+        (temp_project_dir / "app.py").write_text('"""App."""\n' + functions)
+
+        checker = DocumentationChecker(builtin_config, temp_project_dir, runner=mock_runner)
+        check = checker.run().info["checks"][0]
+
+        assert check["missing"] == MAX_REPORTED_LOCATIONS + 5
+        assert len(check["locations"]) == MAX_REPORTED_LOCATIONS
+
+
 class TestDocumentationCheckerReadme:
     """Tests for README validation."""
 
@@ -434,7 +488,7 @@ class TestDocumentationCheckerIntegration:
             # CHANGELOG check
             CommandResult(
                 returncode=0,
-                stdout="main",
+                stdout="# branch.head main\x00",
                 stderr="",
                 command=["git"],
                 duration_seconds=0.1,
@@ -478,7 +532,7 @@ class TestDocumentationCheckerIntegration:
             # CHANGELOG check - passes
             CommandResult(
                 returncode=0,
-                stdout="main",
+                stdout="# branch.head main\x00",
                 stderr="",
                 command=["git"],
                 duration_seconds=0.1,
@@ -515,7 +569,7 @@ class TestDocumentationCheckerIntegration:
         mock_runner.run.side_effect = [
             CommandResult(
                 returncode=0,
-                stdout="main",
+                stdout="# branch.head main\x00",
                 stderr="",
                 command=["git"],
                 duration_seconds=0.1,
@@ -523,3 +523,52 @@ class TestFormattingCheckerDifferentLanguages:
         assert result.passed is True
         call_args = mock_runner.run.call_args[0][0]
         assert "prettier" in call_args
+
+
+class TestFormattingCheckerIncremental:
+    """Tests for changed-files-only formatting checks."""
+
+    def test_run_checks_only_changed_files(self, formatting_config, temp_project_dir, mock_runner):
+        """Test incremental mode passes changed files before the check flag."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "app.ts").write_text("")
+        (temp_project_dir / "styles.css").write_text("")
+        scope = IncrementalScope("abc123", ["app.ts", "styles.css", "logo.png"])
+        checker = FormattingChecker(
+            formatting_config,
+            temp_project_dir,
+            language="typescript",
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=scope,
+        )
+        mock_runner.run.return_value = CommandResult(
+            returncode=0, stdout="", stderr="", command=["prettier"], duration_seconds=0.1
+        )
+
+        result = checker.run()
+
+        assert mock_runner.run.call_args[0][0] == ["prettier", "app.ts", "styles.css", "--check"]
+        assert result.info["files_checked"] == 2
+
+    def test_run_without_changed_files_skips_formatter(
+        self, formatting_config, temp_project_dir, mock_runner
+    ):
+        """Test no formatter runs when no formattable files changed."""
+        from solokit.quality.incremental import IncrementalScope
+
+        checker = FormattingChecker(
+            formatting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=IncrementalScope("abc123", []),
+        )
+
+        result = checker.run()
+
+        mock_runner.run.assert_not_called()
+        assert result.passed is True
+        assert result.info["formatted"] is False
@@ -462,13 +462,15 @@ class TestIntegrationCheckerValidateEnvironment:
         integration_work_item["environment_requirements"]["config_files"] = [str(config_file)]
 
         # Mock Docker commands to succeed
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="Docker version 20.10",
-            stderr="",
-            command=["docker"],
-            duration_seconds=0.1,
-        )
+        mock_runner.run_many.return_value = [
+            CommandResult(
+                returncode=0,
+                stdout="Docker version 20.10",
+                stderr="",
+                command=["docker"],
+                duration_seconds=0.1,
+            )
+        ] * 2
 
         checker = IntegrationChecker(integration_work_item, integration_config, runner=mock_runner)
         result = checker.validate_environment()
@@ -489,7 +491,7 @@ class TestIntegrationCheckerValidateEnvironment:
         integration_work_item["environment_requirements"]["compose_file"] = str(compose_file)
 
         # Mock Docker command to fail
-        mock_runner.run.side_effect = [
+        mock_runner.run_many.return_value = [
             CommandResult(
                 returncode=1,
                 stdout="",
@@ -524,7 +526,7 @@ class TestIntegrationCheckerValidateEnvironment:
         integration_work_item["environment_requirements"]["compose_file"] = str(compose_file)
 
         # Mock Docker Compose command to fail
-        mock_runner.run.side_effect = [
+        mock_runner.run_many.return_value = [
             CommandResult(
                 returncode=0,
                 stdout="Docker version 20.10",
@@ -556,13 +558,15 @@ class TestIntegrationCheckerValidateEnvironment:
         integration_work_item["environment_requirements"]["compose_file"] = "missing-compose.yml"
 
         # Mock Docker commands to succeed
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="version",
-            stderr="",
-            command=["docker"],
-            duration_seconds=0.1,
-        )
+        mock_runner.run_many.return_value = [
+            CommandResult(
+                returncode=0,
+                stdout="version",
+                stderr="",
+                command=["docker"],
+                duration_seconds=0.1,
+            )
+        ] * 2
 
         checker = IntegrationChecker(integration_work_item, integration_config, runner=mock_runner)
         result = checker.validate_environment()
@@ -586,13 +590,15 @@ class TestIntegrationCheckerValidateEnvironment:
         ]
 
         # Mock Docker commands to succeed
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="version",
-            stderr="",
-            command=["docker"],
-            duration_seconds=0.1,
-        )
+        mock_runner.run_many.return_value = [
+            CommandResult(
+                returncode=0,
+                stdout="version",
+                stderr="",
+                command=["docker"],
+                duration_seconds=0.1,
+            )
+        ] * 2
 
         checker = IntegrationChecker(integration_work_item, integration_config, runner=mock_runner)
         result = checker.validate_environment()
@@ -607,13 +613,15 @@ class TestIntegrationCheckerValidateEnvironment:
         self, integration_config, integration_work_item, mock_runner
     ):
         """Test validate_environment() includes execution time."""
-        mock_runner.run.return_value = CommandResult(
-            returncode=0,
-            stdout="version",
-            stderr="",
-            command=["docker"],
-            duration_seconds=0.1,
-        )
+        mock_runner.run_many.return_value = [
+            CommandResult(
+                returncode=0,
+                stdout="version",
+                stderr="",
+                command=["docker"],
+                duration_seconds=0.1,
+            )
+        ] * 2
 
         checker = IntegrationChecker(integration_work_item, integration_config, runner=mock_runner)
         result = checker.validate_environment()
@@ -486,3 +486,134 @@ class TestLintingCheckerDifferentLanguages:
         assert result.passed is True
         call_args = mock_runner.run.call_args[0][0]
         assert "eslint" in call_args
+
+
+class TestLintingCheckerIncremental:
+    """Tests for changed-files-only linting."""
+
+    def test_run_lints_only_changed_files(self, linting_config, temp_project_dir, mock_runner):
+        """Test incremental mode passes changed files instead of directories."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "app.py").write_text("")
+        scope = IncrementalScope("abc123", ["src/app.py", "README.md"])
+        linting_config["auto_fix"] = True
+        checker = LintingChecker(
+            linting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=scope,
+        )
+        mock_runner.run.return_value = CommandResult(
+            returncode=0, stdout="", stderr="", command=["ruff"], duration_seconds=0.1
+        )
+
+        result = checker.run()
+
+        call_args = mock_runner.run.call_args[0][0]
+        assert call_args == ["ruff", "check", "--force-exclude", "src/app.py", "--fix"]
+        assert result.info["incremental"] is True
+        assert result.info["files_checked"] == 1
+
+    def test_run_without_changed_files_skips_linter(
+        self, linting_config, temp_project_dir, mock_runner
+    ):
+        """Test no linter runs when no lintable files changed."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "src").mkdir()
+        checker = LintingChecker(
+            linting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=IncrementalScope("abc123", ["docs/guide.md"]),
+        )
+
+        result = checker.run()
+
+        mock_runner.run.assert_not_called()
+        assert result.passed is True
+        assert result.status == "passed"
+        assert result.info["files_checked"] == 0
+
+    def test_run_full_when_scope_requires_it(self, linting_config, temp_project_dir, mock_runner):
+        """Test a full-run scope keeps the configured command."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "src").mkdir()
+        scope = IncrementalScope("abc123", full_run_reason="configuration changed: pyproject.toml")
+        checker = LintingChecker(
+            linting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=scope,
+        )
+        mock_runner.run.return_value = CommandResult(
+            returncode=0, stdout="", stderr="", command=["ruff"], duration_seconds=0.1
+        )
+
+        result = checker.run()
+
+        assert mock_runner.run.call_args[0][0] == ["ruff", "check", "src"]
+        assert result.info["incremental"] is False
+        assert result.info["full_run_reason"] == "configuration changed: pyproject.toml"
+
+    def test_incremental_from_config(self, linting_config, temp_project_dir):
+        """Test incremental mode is read from config and can be overridden."""
+        linting_config["incremental"] = True
+
+        assert LintingChecker(linting_config, temp_project_dir).incremental is True
+        assert (
+            LintingChecker(linting_config, temp_project_dir, incremental=False).incremental is False
+        )
+
+
+class TestLintingCheckerDaemon:
+    """Tests for daemon mode."""
+
+    def test_run_routes_through_daemons(self, linting_config, temp_project_dir, mock_runner):
+        """Test daemon mode sends the command to the daemon manager."""
+        linting_config["daemon"] = True
+        daemons = Mock()
+        daemons.run.return_value = CommandResult(
+            returncode=0, stdout="", stderr="", command=["dmypy"], duration_seconds=0.1
+        )
+        checker = LintingChecker(
+            linting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            daemons=daemons,
+        )
+
+        result = checker.run()
+
+        assert result.passed is True
+        daemons.run.assert_called_once_with(["ruff", "check", "src"], timeout=120)
+        mock_runner.run.assert_not_called()
+
+    def test_daemon_disabled_by_default(self, linting_config, temp_project_dir, mock_runner):
+        """Test the linter is run directly unless daemon mode is enabled."""
+        daemons = Mock()
+        mock_runner.run.return_value = CommandResult(
+            returncode=0, stdout="", stderr="", command=["ruff"], duration_seconds=0.1
+        )
+        checker = LintingChecker(
+            linting_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            daemons=daemons,
+        )
+
+        checker.run()
+
+        daemons.run.assert_not_called()
+        mock_runner.run.assert_called_once()
@@ -579,22 +579,24 @@ class TestSecurityCheckerPythonIntegration:
 
         safety_output = [{"package": "django", "version": "1.0"}]
 
-        mock_runner.run.side_effect = [
-            CommandResult(
+        # Bandit and Safety run concurrently, so answer by command rather than call order
+        outputs = {
+            "bandit": CommandResult(
                 returncode=0,
                 stdout="",
                 stderr="",
                 command=["bandit"],
                 duration_seconds=0.5,
             ),
-            CommandResult(
+            "safety": CommandResult(
                 returncode=0,
                 stdout=json.dumps(safety_output),
                 stderr="",
                 command=["safety"],
                 duration_seconds=0.5,
             ),
-        ]
+        }
+        mock_runner.run.side_effect = lambda command, **kwargs: outputs[command[0]]
 
         with patch("tempfile.mkstemp", return_value=(1, "/tmp/bandit_report.json")):
             with patch("os.close"):
@@ -610,3 +612,164 @@ class TestSecurityCheckerPythonIntegration:
         assert "safety" in result
         assert result["by_severity"]["HIGH"] == 1
         assert len(result["vulnerabilities"]) == 2
+
+
+class TestSecurityCheckerIncremental:
+    """Tests for changed-files-only Bandit scans."""
+
+    def test_bandit_targets_changed_source_files(self, python_config, temp_project_dir):
+        """Test incremental mode scans only changed Python files under src/."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "src" / "app.py").write_text("")
+        (temp_project_dir / "tests").mkdir()
+        (temp_project_dir / "tests" / "test_app.py").write_text("")
+        scope = IncrementalScope("abc123", ["src/app.py", "tests/test_app.py"])
+        checker = SecurityChecker(
+            python_config, temp_project_dir, incremental=True, incremental_scope=scope
+        )
+
+        targets = checker._bandit_targets(temp_project_dir / "src")
+
+        assert targets == [str(temp_project_dir / "src" / "app.py")]
+        assert checker._incremental_info["files_checked"] == 1
+
+    def test_bandit_skipped_without_changed_source(
+        self, python_config, temp_project_dir, mock_runner
+    ):
+        """Test Bandit does not run when no source files changed."""
+        from solokit.quality.incremental import IncrementalScope
+
+        (temp_project_dir / "src").mkdir()
+        checker = SecurityChecker(
+            python_config,
+            temp_project_dir,
+            runner=mock_runner,
+            incremental=True,
+            incremental_scope=IncrementalScope("abc123", ["README.md"]),
+        )
+
+        assert checker._run_bandit() is None
+        mock_runner.run.assert_not_called()
+
+    def test_bandit_full_scan_when_scope_requires_it(self, python_config, temp_project_dir):
+        """Test a full-run scope scans the whole src/ tree."""
+        from solokit.quality.incremental import IncrementalScope
+
+        scope = IncrementalScope(None, full_run_reason="no parent branch or gated commit")
+        checker = SecurityChecker(
+            python_config, temp_project_dir, incremental=True, incremental_scope=scope
+        )
+
+        targets = checker._bandit_targets(temp_project_dir / "src")
+
+        assert targets == ["-r", str(temp_project_dir / "src")]
+        assert checker._incremental_info["incremental"] is False
+
+
+class TestSecurityCheckerAuditCache:
+    """Tests for cached dependency audits."""
+
+    @pytest.fixture
+    def audit_cache(self, temp_project_dir, monkeypatch):
+        """Create an enabled audit cache in an initialized project."""
+        from solokit.quality.audit_cache import DependencyAuditCache
+        from solokit.quality.gate_cache import GATE_CACHE_DISABLE_ENV
+
+        monkeypatch.delenv(GATE_CACHE_DISABLE_ENV, raising=False)
+        (temp_project_dir / ".session").mkdir()
+        return DependencyAuditCache(temp_project_dir)
+
+    def _result(self, stdout):
+        return CommandResult(
+            returncode=0, stdout=stdout, stderr="", command=["audit"], duration_seconds=0.5
+        )
+
+    def test_safety_result_reused_until_requirements_change(
+        self, python_config, temp_project_dir, mock_runner, audit_cache
+    ):
+        """Test Safety runs once per requirements content."""
+        (temp_project_dir / "requirements.txt").write_text("django==1.0\n")
+        mock_runner.run.return_value = self._result(json.dumps([{"package": "django"}]))
+
+        with patch(
+            "solokit.quality.checkers.security.get_command_version", return_value="safety 2.3.5"
+        ):
+            first = SecurityChecker(
+                python_config, temp_project_dir, runner=mock_runner, audit_cache=audit_cache
+            )
+            assert first._run_safety() == [{"package": "django"}]
+            second = SecurityChecker(
+                python_config, temp_project_dir, runner=mock_runner, audit_cache=audit_cache
+            )
+            assert second._run_safety() == [{"package": "django"}]
+            assert mock_runner.run.call_count == 1
+            assert second._cached_audits == ["safety"]
+
+            (temp_project_dir / "requirements.txt").write_text("django==4.2\n")
+            second._run_safety()
+
+        assert mock_runner.run.call_count == 2
+
+    def test_npm_audit_cached_by_lockfile(
+        self, js_config, temp_project_dir, mock_runner, audit_cache
+    ):
+        """Test npm audit results are reused for an unchanged lockfile."""
+        (temp_project_dir / "package.json").write_text("{}")
+        (temp_project_dir / "package-lock.json").write_text("{}")
+        audit = {"vulnerabilities": {"lodash": {"severity": "high"}}}
+        mock_runner.run.return_value = self._result(json.dumps(audit))
+
+        with patch("solokit.quality.checkers.security.get_command_version", return_value="10.2.0"):
+            for _ in range(2):
+                checker = SecurityChecker(
+                    js_config,
+                    temp_project_dir,
+                    language="javascript",
+                    runner=mock_runner,
+                    audit_cache=audit_cache,
+                )
+                result = checker.run()
+
+        mock_runner.run.assert_called_once()
+        assert result.info["by_severity"] == {"HIGH": 1}
+        assert result.info["cached_audits"] == ["npm-audit"]
+
+    def test_unavailable_tool_not_cached(
+        self, python_config, temp_project_dir, mock_runner, audit_cache
+    ):
+        """Test nothing is cached when the audit tool cannot report its version."""
+        (temp_project_dir / "requirements.txt").write_text("django==1.0\n")
+        mock_runner.run.return_value = self._result("[]")
+        checker = SecurityChecker(
+            python_config, temp_project_dir, runner=mock_runner, audit_cache=audit_cache
+        )
+
+        with patch(
+            "solokit.quality.checkers.security.get_command_version", return_value="unavailable"
+        ):
+            checker._run_safety()
+
+        assert not (temp_project_dir / ".session" / "cache" / "audits").exists()
+
+    def test_bandit_and_safety_run_concurrently(self, python_config, temp_project_dir, mock_runner):
+        """Test Safety starts while Bandit is still running."""
+        import threading
+
+        (temp_project_dir / "src").mkdir()
+        (temp_project_dir / "requirements.txt").touch()
+        started = threading.Barrier(2, timeout=5)
+
+        def run(command, **kwargs):
+            # Each scanner waits for the other to start; sequential runs would time out
+            started.wait()
+            return self._result("[]")
+
+        mock_runner.run.side_effect = run
+        checker = SecurityChecker(python_config, temp_project_dir, runner=mock_runner)
+
+        results = checker._scan_python()
+
+        assert mock_runner.run.call_count == 2
+        assert results["vulnerabilities"] == []
@@ -11,6 +11,7 @@ import pytest
 
 from solokit.core.command_runner import CommandResult, CommandRunner
 from solokit.quality.checkers.tests import ExecutionChecker
+from solokit.quality.test_impact import ImpactPlan
 
 
 @pytest.fixture
@@ -172,6 +173,36 @@ class TestTestRunnerRun:
         call_args = mock_runner.run.call_args[0][0]
         assert "pytest" in call_args
 
+    def test_run_streams_output_to_session_log(self, test_config, temp_project_dir, mock_runner):
+        """Test the test command streams output and logs it under .session/logs/."""
+        (temp_project_dir / ".session").mkdir()
+        runner = ExecutionChecker(
+            test_config, temp_project_dir, language="python", runner=mock_runner
+        )
+        log_file = temp_project_dir / ".session" / "logs" / "tests.log"
+        mock_runner.run.return_value = CommandResult(
+            returncode=1,
+            stdout="1 failed",
+            stderr="",
+            command=["pytest"],
+            duration_seconds=1.5,
+            log_file=log_file,
+        )
+
+        with patch.object(runner, "_parse_coverage", return_value=None):
+            result = runner.run()
+
+        stream = mock_runner.run.call_args.kwargs["stream"]
+        assert stream.log_file == log_file
+        assert stream.label == "tests"
+        assert result.info["log_file"] == str(log_file)
+
+    def test_run_without_session_dir_does_not_log(self, test_config, temp_project_dir):
+        """Test no log file is written outside an initialized project."""
+        runner = ExecutionChecker(test_config, temp_project_dir, language="python")
+
+        assert runner._stream_options().log_file is None
+
     def test_run_passes_when_tests_pass_and_coverage_met(
         self, test_config, temp_project_dir, mock_runner
     ):
@@ -550,3 +581,159 @@ class TestTestRunnerCustomThreshold:
 
         assert result.passed is True
         assert result.info["threshold"] == 70
+
+
+class TestTestRunnerImpactAnalysis:
+    """Tests for test impact analysis in TestRunner.run()."""
+
+    @pytest.fixture
+    def impact_config(self, test_config):
+        """Test config with impact analysis enabled."""
+        return {**test_config, "impact_analysis": True}
+
+    def _passing_result(self):
+        return CommandResult(
+            returncode=0, stdout="ok", stderr="", command=["pytest"], duration_seconds=1.0
+        )
+
+    def test_disabled_by_default(self, test_config, temp_project_dir, mock_runner):
+        """Test the configured command runs unchanged without impact analysis."""
+        mock_runner.run.return_value = self._passing_result()
+        checker = ExecutionChecker(
+            test_config, temp_project_dir, language="python", runner=mock_runner
+        )
+
+        with patch("solokit.quality.checkers.tests.TestImpactAnalyzer") as mock_analyzer:
+            with patch.object(checker, "_parse_coverage", return_value=90.0):
+                result = checker.run()
+
+        mock_analyzer.assert_not_called()
+        assert "test_impact" not in result.info
+
+    def test_impacted_run_skips_coverage_threshold(
+        self, impact_config, temp_project_dir, mock_runner
+    ):
+        """Test only selected tests run and subset coverage is not checked."""
+        mock_runner.run.return_value = self._passing_result()
+        plan = ImpactPlan(
+            ["pytest", "--cov=src", "tests/test_a.py"],
+            impacted=True,
+            selected=["tests/test_a.py"],
+            total=10,
+        )
+        checker = ExecutionChecker(
+            impact_config, temp_project_dir, language="python", runner=mock_runner
+        )
+
+        with patch("solokit.quality.checkers.tests.TestImpactAnalyzer") as mock_analyzer:
+            mock_analyzer.return_value.plan.return_value = plan
+            with patch.object(checker, "_parse_coverage", return_value=10.0) as mock_coverage:
+                result = checker.run()
+
+        assert mock_runner.run.call_args[0][0] == ["pytest", "--cov=src", "tests/test_a.py"]
+        mock_coverage.assert_not_called()
+        assert result.passed is True
+        assert result.info["coverage"] is None
+        assert result.info["test_impact"]["selected"] == 1
+        assert result.info["test_impact"]["skipped"] == 9
+        mock_analyzer.return_value.record.assert_called_once_with(plan, passed=True)
+
+    def test_no_impacted_tests_skips_run(self, impact_config, temp_project_dir, mock_runner):
+        """Test nothing runs when no test is impacted by the changes."""
+        plan = ImpactPlan(["pytest"], impacted=True, selected=[], total=10)
+        checker = ExecutionChecker(
+            impact_config, temp_project_dir, language="python", runner=mock_runner
+        )
+
+        with patch("solokit.quality.checkers.tests.TestImpactAnalyzer") as mock_analyzer:
+            mock_analyzer.return_value.plan.return_value = plan
+            result = checker.run()
+
+        mock_runner.run.assert_not_called()
+        assert result.passed is True
+        assert result.status == "skipped"
+        assert result.info["reason"] == "no impacted tests"
+        assert result.info["test_impact"]["skipped"] == 10
+
+    def test_full_override_forces_full_run(self, impact_config, temp_project_dir, mock_runner):
+        """Test impact_analysis=False (sk end --full) plans a forced full run."""
+        mock_runner.run.return_value = self._passing_result()
+        checker = ExecutionChecker(
+            impact_config,
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+            impact_analysis=False,
+        )
+
+        with patch("solokit.quality.checkers.tests.TestImpactAnalyzer") as mock_analyzer:
+            mock_analyzer.return_value.plan.return_value = ImpactPlan(
+                ["pytest"], full_run_reason="full run requested"
+            )
+            with patch.object(checker, "_parse_coverage", return_value=90.0):
+                result = checker.run()
+
+        assert mock_analyzer.return_value.plan.call_args[1]["force_full"] is True
+        assert result.info["coverage"] == 90.0
+        assert result.info["test_impact"] == {
+            "impacted": False,
+            "full_run_reason": "full run requested",
+        }
+
+
+class TestTestRunnerWorkers:
+    """Tests for parallel test workers in TestRunner.run()."""
+
+    def _passing_result(self):
+        return CommandResult(
+            returncode=0, stdout="ok", stderr="", command=["pytest"], duration_seconds=1.0
+        )
+
+    def test_single_worker_by_default(self, test_config, temp_project_dir, mock_runner):
+        """Test the command runs in one process without the workers setting."""
+        mock_runner.run.return_value = self._passing_result()
+        checker = ExecutionChecker(
+            test_config, temp_project_dir, language="python", runner=mock_runner
+        )
+
+        with patch("solokit.quality.checkers.tests.ShardedTestRunner") as mock_sharded:
+            with patch.object(checker, "_parse_coverage", return_value=90.0):
+                checker.run()
+
+        mock_sharded.assert_not_called()
+        mock_runner.run.assert_called_once()
+
+    def test_workers_use_sharded_runner(self, test_config, temp_project_dir, mock_runner):
+        """Test workers > 1 runs pytest through the sharded runner."""
+        checker = ExecutionChecker(
+            {**test_config, "workers": 4},
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+        )
+
+        with patch("solokit.quality.checkers.tests.ShardedTestRunner") as mock_sharded:
+            mock_sharded.return_value.run.return_value = self._passing_result()
+            with patch.object(checker, "_parse_coverage", return_value=90.0):
+                result = checker.run()
+
+        assert mock_sharded.call_args[0][1] == 4
+        assert mock_sharded.return_value.run.call_args[0][0] == [
+            "pytest",
+            "--cov=src",
+            "--cov-report=json",
+        ]
+        mock_runner.run.assert_not_called()
+        assert result.passed is True
+
+    def test_zero_workers_means_cpu_count(self, test_config, temp_project_dir, mock_runner):
+        """Test workers = 0 uses one worker per CPU."""
+        checker = ExecutionChecker(
+            {**test_config, "workers": 0},
+            temp_project_dir,
+            language="python",
+            runner=mock_runner,
+        )
+
+        with patch("solokit.quality.checkers.tests.os.cpu_count", return_value=6):
+            assert checker._worker_count() == 6
@@ -0,0 +1,106 @@
+"""Unit tests for the dependency audit cache."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from solokit.quality.audit_cache import (
+    MAX_ENTRIES_PER_TOOL,
+    DependencyAuditCache,
+    get_dependency_files,
+)
+from solokit.quality.gate_cache import GATE_CACHE_DISABLE_ENV
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with Python dependency files and a .session directory."""
+    monkeypatch.delenv(GATE_CACHE_DISABLE_ENV, raising=False)
+    (tmp_path / "requirements.txt").write_text("requests==2.31.0\n")
+    (tmp_path / "requirements-dev.txt").write_text("pytest\n")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'app'\n")
+    (tmp_path / "app.py").write_text("x = 1\n")
+    (tmp_path / ".session").mkdir()
+    return tmp_path
+
+
+class TestGetDependencyFiles:
+    """Tests for get_dependency_files."""
+
+    def test_python_manifests_and_requirements(self, project):
+        """Test Python manifests and every requirements file are found."""
+        files = get_dependency_files(project, "python")
+
+        assert [path.name for path in files] == [
+            "pyproject.toml",
+            "requirements-dev.txt",
+            "requirements.txt",
+        ]
+
+    def test_javascript_lockfiles(self, project):
+        """Test package.json and lockfiles are found for JavaScript."""
+        (project / "package.json").write_text("{}")
+        (project / "package-lock.json").write_text("{}")
+
+        files = get_dependency_files(project, "typescript")
+
+        assert [path.name for path in files] == ["package-lock.json", "package.json"]
+
+
+class TestDependencyAuditCache:
+    """Tests for DependencyAuditCache."""
+
+    def test_miss_then_hit(self, project):
+        """Test a stored audit is returned for the same key."""
+        cache = DependencyAuditCache(project)
+        key = cache.key(get_dependency_files(project, "python"), "safety 2.3.5")
+
+        assert cache.get("safety", key) is None
+        cache.set("safety", key, [{"package": "requests"}])
+
+        assert cache.get("safety", key) == [{"package": "requests"}]
+
+    def test_key_depends_on_dependency_files_and_tool_version(self, project):
+        """Test the key changes with lockfile contents and tool version, not source."""
+        cache = DependencyAuditCache(project)
+        files = get_dependency_files(project, "python")
+        key = cache.key(files, "safety 2.3.5")
+
+        (project / "app.py").write_text("x = 2\n")
+        assert cache.key(files, "safety 2.3.5") == key
+        assert cache.key(files, "safety 3.0.0") != key
+
+        (project / "requirements.txt").write_text("requests==2.32.0\n")
+        assert cache.key(files, "safety 2.3.5") != key
+
+    def test_expired_entry_ignored(self, project):
+        """Test entries older than a day are treated as misses."""
+        cache = DependencyAuditCache(project)
+        cache.set("safety", "key", [])
+        cache_file = project / ".session" / "cache" / "audits" / "safety.json"
+        data = json.loads(cache_file.read_text())
+        data["entries"]["key"]["cached_at"] = (datetime.now() - timedelta(days=2)).isoformat()
+        cache_file.write_text(json.dumps(data))
+
+        assert cache.get("safety", "key") is None
+
+    def test_oldest_entries_evicted(self, project):
+        """Test only the most recent entries are kept per tool."""
+        cache = DependencyAuditCache(project)
+        for index in range(MAX_ENTRIES_PER_TOOL + 1):
+            cache.set("npm-audit", f"key-{index}", {"index": index})
+
+        assert cache.get("npm-audit", "key-0") is None
+        assert cache.get("npm-audit", f"key-{MAX_ENTRIES_PER_TOOL}") == {
+            "index": MAX_ENTRIES_PER_TOOL
+        }
+
+    def test_disabled_by_flag_env_or_missing_session(self, project, tmp_path, monkeypatch):
+        """Test the cache is off with --no-gate-cache, the env variable or no .session."""
+        assert DependencyAuditCache(project).enabled is True
+        assert DependencyAuditCache(project, enabled=False).enabled is False
+        assert DependencyAuditCache(tmp_path / "missing").enabled is False
+
+        monkeypatch.setenv(GATE_CACHE_DISABLE_ENV, "1")
+        assert DependencyAuditCache(project).enabled is False
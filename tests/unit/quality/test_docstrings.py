@@ -0,0 +1,216 @@
+"""Unit tests for the in-process docstring checker."""
+
+import subprocess
+import textwrap
+
+import pytest
+
+from solokit.quality import docstrings
+from solokit.quality.docstrings import DocstringScanner, find_missing_docstrings
+from solokit.quality.gate_cache import GATE_CACHE_DISABLE_ENV
+
+DOCUMENTED = '''"""Module."""
+
+
+def public():
+    """Function."""
+'''
+
+
+def _missing(source, path="pkg/app.py"):
+    return [
+        (issue.line, issue.kind, issue.name)
+        for issue in find_missing_docstrings(textwrap.dedent(source), path)
+    ]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create an initialized git project with the gate cache allowed."""
+    monkeypatch.delenv(GATE_CACHE_DISABLE_ENV, raising=False)
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / ".session").mkdir()
+    return tmp_path
+
+
+class TestFindMissingDocstrings:
+    """Tests for find_missing_docstrings."""
+
+    def test_reports_public_definitions(self):
+        """Test modules, classes, functions and methods without docstrings are reported."""
+        source = """
+        class Service:
+            def run(self):
+                pass
+
+            async def stop(self):
+                '''Stop.'''
+
+        def helper():
+            def inner():
+                pass
+        """
+
+        assert _missing(source) == [
+            (1, "module", ""),
+            (2, "class", "Service"),
+            (3, "method", "Service.run"),
+            (9, "function", "helper"),
+        ]
+
+    def test_private_and_exempt_definitions_skipped(self):
+        """Test private names, overloads and property setters need no docstring."""
+        source = '''
+        """Module."""
+        from typing import overload
+
+        def _private():
+            pass
+
+        class _Internal:
+            def method(self):
+                pass
+
+        class Value:
+            """Value."""
+
+            @property
+            def amount(self):
+                """Amount."""
+
+            @amount.setter
+            def amount(self, value):
+                pass
+
+        @overload
+        def parse(value: int) -> int: ...
+        '''
+
+        assert _missing(source) == []
+
+    def test_dunder_methods_of_public_classes_checked(self):
+        """Test __init__ and magic methods are public, as in pydocstyle (D105, D107)."""
+        source = '''
+        """Module."""
+
+        def __getattr__(name):
+            pass
+
+        class Value:
+            """Value."""
+
+            def __init__(self):
+                pass
+
+            def __eq__(self, other):
+                pass
+
+            def _helper(self):
+                pass
+
+        class _Internal:
+            def __init__(self):
+                pass
+        '''
+
+        assert [(kind, name) for _, kind, name in _missing(source)] == [
+            ("method", "Value.__init__"),
+            ("method", "Value.__eq__"),
+        ]
+
+    def test_all_limits_public_names(self):
+        """Test only names exported through __all__ are public."""
+        source = '''
+        """Module."""
+        __all__ = ["exported"]
+
+        def exported():
+            pass
+
+        def not_exported():
+            pass
+        '''
+
+        assert _missing(source) == [(5, "function", "exported")]
+
+    def test_private_and_empty_modules(self):
+        """Test private modules are skipped and empty modules need no docstring."""
+        assert _missing("def run():\n    pass\n", "pkg/_impl.py") == []
+        assert _missing("", "pkg/__init__.py") == []
+
+    def test_syntax_error_raised(self):
+        """Test unparseable source raises SyntaxError."""
+        with pytest.raises(SyntaxError):
+            find_missing_docstrings("def broken(:\n", "bad.py")
+
+
+class TestDocstringScanner:
+    """Tests for DocstringScanner."""
+
+    def test_scan_reports_locations(self, project):
+        """Test issues are reported with paths and lines relative to the project."""
+        (project / "src").mkdir()
+        (project / "src" / "app.py").write_text(DOCUMENTED + "\n\ndef undocumented():\n    pass\n")
+        (project / "src" / "test_app.py").write_text("def test_x():\n    pass\n")
+        (project / "broken.py").write_text("def broken(:\n")
+
+        scan = DocstringScanner(project).scan()
+
+        assert [str(issue) for issue in scan.issues] == [
+            "src/app.py:8: public function 'undocumented' has no docstring"
+        ]
+        assert scan.files_checked == 2
+
+    def test_skips_ignored_files(self, project):
+        """Test git-ignored files and dependency directories are not checked."""
+        (project / ".gitignore").write_text("build/\n")
+        for directory in ("build", ".venv", "node_modules"):
+            (project / directory).mkdir()
+            (project / directory / "lib.py").write_text("def run():\n    pass\n")
+        (project / "app.py").write_text(DOCUMENTED)
+
+        assert DocstringScanner(project).python_files() == ["app.py"]
+
+    def test_walks_tree_outside_git(self, tmp_path):
+        """Test files are found without git, pruning dependency directories."""
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "venv" / "lib.py").write_text("x = 1\n")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text(DOCUMENTED)
+
+        assert DocstringScanner(tmp_path).python_files() == ["pkg/mod.py"]
+
+    def test_only_changed_files_reparsed(self, project):
+        """Test unchanged files are served from the per-file cache."""
+        (project / "a.py").write_text(DOCUMENTED)
+        (project / "b.py").write_text("def run():\n    pass\n")
+
+        first = DocstringScanner(project).scan()
+        (project / "b.py").write_text('"""B."""\n')
+        second = DocstringScanner(project).scan()
+
+        assert (first.files_parsed, len(first.issues)) == (2, 2)
+        assert (second.files_parsed, second.issues) == (1, [])
+        assert (project / ".session" / "cache" / "docstrings.json").exists()
+
+    def test_cache_disabled(self, project, monkeypatch):
+        """Test every file is parsed when the cache is disabled."""
+        (project / "a.py").write_text(DOCUMENTED)
+        DocstringScanner(project).scan()
+
+        assert DocstringScanner(project, enabled=False).scan().files_parsed == 1
+        monkeypatch.setenv(GATE_CACHE_DISABLE_ENV, "1")
+        assert DocstringScanner(project).scan().files_parsed == 1
+
+    def test_process_pool_matches_serial(self, project, monkeypatch):
+        """Test parsing across worker processes gives the same issues in order."""
+        for index in range(6):
+            (project / f"mod_{index}.py").write_text(f"def run_{index}():\n    pass\n")
+        serial = DocstringScanner(project, enabled=False, max_workers=1).scan()
+        monkeypatch.setattr(docstrings, "PROCESS_POOL_MIN_FILES", 2)
+        monkeypatch.setattr(docstrings, "FILES_PER_TASK", 2)
+
+        pooled = DocstringScanner(project, enabled=False, max_workers=2).scan()
+
+        assert pooled.issues == serial.issues
+        assert len(pooled.issues) == 12
@@ -0,0 +1,175 @@
+"""Unit tests for the quality gate result cache."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from solokit.quality.gate_cache import (
+    GATE_CACHE_DISABLE_ENV,
+    MAX_ENTRIES_PER_GATE,
+    GateResultCache,
+    _version_command,
+    compute_tree_hash,
+)
+
+
+@pytest.fixture
+def git_repo_files():
+    """A module and a .gitignore committed to the test repository."""
+    return {"app.py": "x = 1\n", ".gitignore": "build/\n"}
+
+
+@pytest.fixture(autouse=True)
+def enable_gate_cache(monkeypatch):
+    """Re-enable the gate cache disabled for the rest of the suite."""
+    monkeypatch.delenv(GATE_CACHE_DISABLE_ENV, raising=False)
+
+
+class TestComputeTreeHash:
+    """Tests for compute_tree_hash."""
+
+    def test_stable_for_unchanged_tree(self, git_repo, run_git):
+        """Test the hash is the committed tree when nothing changed."""
+        assert compute_tree_hash(git_repo) == run_git(git_repo, "rev-parse", "HEAD^{tree}")
+
+    def test_changes_with_modified_and_untracked_files(self, git_repo):
+        """Test edits and new untracked files change the hash."""
+        original = compute_tree_hash(git_repo)
+
+        (git_repo / "app.py").write_text("x = 2\n")
+        modified = compute_tree_hash(git_repo)
+        (git_repo / "new.py").write_text("y = 1\n")
+        untracked = compute_tree_hash(git_repo)
+
+        assert len({original, modified, untracked}) == 3
+
+    def test_ignores_session_outputs_and_ignored_files(self, git_repo):
+        """Test session state, coverage output and gitignored files do not count."""
+        original = compute_tree_hash(git_repo)
+
+        (git_repo / ".session" / "state.json").write_text("{}")
+        (git_repo / "coverage.json").write_text("{}")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.py").write_text("")
+
+        assert compute_tree_hash(git_repo) == original
+
+    def test_real_index_untouched(self, git_repo, run_git):
+        """Test hashing does not stage anything in the repository's index."""
+        (git_repo / "new.py").write_text("y = 1\n")
+
+        compute_tree_hash(git_repo)
+
+        assert run_git(git_repo, "diff", "--cached", "--name-only") == ""
+
+    def test_not_a_git_repo(self, tmp_path):
+        """Test None is returned outside a git repository."""
+        assert compute_tree_hash(tmp_path) is None
+
+
+class TestVersionCommand:
+    """Tests for _version_command."""
+
+    @pytest.mark.parametrize(
+        "command, expected",
+        [
+            ("ruff check .", ["ruff", "--version"]),
+            ("python -m pytest --cov=src", ["python", "-m", "pytest", "--version"]),
+            ("npx eslint .", None),
+            ("npm test", None),
+            ("", None),
+        ],
+    )
+    def test_version_command(self, command, expected):
+        """Test the version probe for gate commands."""
+        assert _version_command(command) == expected
+
+
+class TestGateResultCache:
+    """Tests for GateResultCache."""
+
+    def test_miss_then_hit(self, git_repo):
+        """Test a stored passing result is returned marked as cached."""
+        cache = GateResultCache(git_repo)
+        fingerprint = cache.fingerprint("linting", {"enabled": True})
+
+        assert cache.get("linting", fingerprint) is None
+        cache.set("linting", fingerprint, True, {"status": "passed"})
+        passed, results = cache.get("linting", fingerprint)
+
+        assert passed is True
+        assert results["status"] == "passed"
+        assert results["cached"] is True
+        assert results["cached_at"]
+
+    def test_fingerprint_depends_on_inputs(self, git_repo):
+        """Test tree, gate config and extra inputs all change the fingerprint."""
+        cache = GateResultCache(git_repo)
+        base = cache.fingerprint("linting", {"auto_fix": False})
+
+        assert cache.fingerprint("linting", {"auto_fix": False}) == base
+        assert cache.fingerprint("linting", {"auto_fix": True}) != base
+        assert cache.fingerprint("linting", {"auto_fix": False}, extra={"language": "js"}) != base
+        assert cache.fingerprint("formatting", {"auto_fix": False}) != base
+        (git_repo / "app.py").write_text("x = 3\n")
+        cache.tree_changed()
+        assert cache.fingerprint("linting", {"auto_fix": False}) != base
+
+    def test_tree_hashed_once_until_rewritten(self, git_repo, monkeypatch):
+        """Test gates share one tree hash, recomputed only after a rewriting gate."""
+        calls = []
+        monkeypatch.setattr(
+            "solokit.quality.gate_cache.compute_tree_hash",
+            lambda root, runner: calls.append(root) or f"tree{len(calls)}",
+        )
+        cache = GateResultCache(git_repo)
+        generation = cache.tree_generation
+
+        assert cache.tree_hash() == cache.tree_hash() == "tree1"
+        with cache.rewriting_tree():
+            assert not cache.tree_unchanged_since(cache.tree_generation)
+        assert cache.tree_hash() == "tree2"
+        assert len(calls) == 2
+        assert not cache.tree_unchanged_since(generation)
+        assert cache.tree_unchanged_since(cache.tree_generation)
+
+    def test_failed_results_not_cached(self, git_repo):
+        """Test failing results are never stored."""
+        cache = GateResultCache(git_repo)
+        fingerprint = cache.fingerprint("tests", {})
+
+        cache.set("tests", fingerprint, False, {"status": "failed"})
+
+        assert cache.get("tests", fingerprint) is None
+
+    def test_expired_entry_ignored(self, git_repo):
+        """Test entries older than max_age_seconds are treated as misses."""
+        cache = GateResultCache(git_repo)
+        cache.set("security", "fp", True, {"status": "passed"})
+        cache_file = git_repo / ".session" / "cache" / "gates" / "security.json"
+        data = json.loads(cache_file.read_text())
+        data["entries"]["fp"]["cached_at"] = (datetime.now() - timedelta(days=2)).isoformat()
+        cache_file.write_text(json.dumps(data))
+
+        assert cache.get("security", "fp", max_age_seconds=86400) is None
+        assert cache.get("security", "fp") is not None
+
+    def test_oldest_entries_evicted(self, git_repo):
+        """Test only the most recent fingerprints per gate are kept."""
+        cache = GateResultCache(git_repo)
+        for i in range(MAX_ENTRIES_PER_GATE + 2):
+            cache.set("tests", f"fp{i}", True, {"status": "passed"})
+
+        assert cache.get("tests", "fp0") is None
+        assert cache.get("tests", "fp1") is None
+        assert cache.get("tests", f"fp{MAX_ENTRIES_PER_GATE + 1}") is not None
+
+    def test_disabled_by_flag_env_or_missing_session(self, git_repo, tmp_path, monkeypatch):
+        """Test the cache is inactive for --no-gate-cache, the env var, or no .session."""
+        assert GateResultCache(git_repo).enabled
+        assert not GateResultCache(git_repo, enabled=False).enabled
+        assert not GateResultCache(tmp_path / "missing").enabled
+
+        monkeypatch.setenv(GATE_CACHE_DISABLE_ENV, "1")
+        assert not GateResultCache(git_repo).enabled
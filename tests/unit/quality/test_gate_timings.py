@@ -0,0 +1,143 @@
+"""Unit tests for the quality gate timing history."""
+
+import pytest
+
+from solokit.quality.gate_timings import (
+    MIN_BASELINE_RUNS,
+    GateTiming,
+    detect_regressions,
+    expected_gate_durations,
+    get_gate_timings_file,
+    load_gate_timings,
+    percentile,
+    record_gate_timings,
+    recent_timings,
+    summarize_gate_timings,
+)
+
+
+def _timing(gate, duration, session, cached=False):
+    return GateTiming(
+        gate=gate, duration_seconds=duration, passed=True, cached=cached, session=session
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create an initialized project."""
+    (tmp_path / ".session" / "tracking").mkdir(parents=True)
+    return tmp_path
+
+
+class TestGateTimingStore:
+    """Tests for recording and loading gate timings."""
+
+    def test_round_trip(self, project):
+        """Test recorded timings are appended and loaded back in order."""
+        record_gate_timings(project, [_timing("tests", 12.5, 1)])
+        record_gate_timings(
+            project,
+            [
+                GateTiming(
+                    gate="linting",
+                    duration_seconds=1.2,
+                    passed=False,
+                    session=2,
+                    tool_versions={"ruff check .": "ruff 0.5.0"},
+                    files_checked=3,
+                )
+            ],
+        )
+
+        timings = load_gate_timings(project)
+
+        assert [timing.gate for timing in timings] == ["tests", "linting"]
+        assert timings[1].tool_versions == {"ruff check .": "ruff 0.5.0"}
+        assert timings[1].files_checked == 3
+        assert timings[1].passed is False
+
+    def test_not_recorded_outside_initialized_project(self, tmp_path):
+        """Test nothing is written without a .session directory."""
+        record_gate_timings(tmp_path, [_timing("tests", 1.0, 1)])
+
+        assert not get_gate_timings_file(tmp_path).exists()
+        assert load_gate_timings(tmp_path) == []
+
+    def test_malformed_lines_skipped(self, project):
+        """Test unreadable lines don't prevent loading the rest of the history."""
+        record_gate_timings(project, [_timing("tests", 1.0, 1)])
+        with open(get_gate_timings_file(project), "a") as f:
+            f.write("not json\n{}\n")
+
+        assert len(load_gate_timings(project)) == 1
+
+
+class TestGateTimingStatistics:
+    """Tests for percentiles, summaries and regression detection."""
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate linearly between ranks."""
+        assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+        assert percentile([7.0], 95) == 7.0
+
+    def test_recent_timings_keeps_last_sessions_and_skips_cached(self):
+        """Test only uncached runs from the last N sessions are used."""
+        timings = [_timing("tests", float(session), session) for session in range(1, 6)]
+        timings.append(_timing("tests", 0.1, 5, cached=True))
+
+        recent = recent_timings(timings, sessions=2)
+
+        assert [timing.session for timing in recent] == [4, 5]
+
+    def test_summary_sorted_slowest_first(self):
+        """Test per-gate statistics are ordered by median duration."""
+        timings = [
+            _timing("linting", 2.0, 1),
+            _timing("tests", 30.0, 1),
+            _timing("tests", 40.0, 2),
+            _timing("linting", 4.0, 2),
+        ]
+
+        stats = summarize_gate_timings(timings)
+
+        assert [stat.gate for stat in stats] == ["tests", "linting"]
+        assert stats[0].runs == 2
+        assert stats[0].p50 == 35.0
+        assert stats[0].last == 40.0
+
+    def test_expected_gate_durations(self, project):
+        """Test medians are read from the recorded history."""
+        record_gate_timings(project, [_timing("tests", 10.0, 1), _timing("tests", 20.0, 2)])
+
+        assert expected_gate_durations(project) == {"tests": 15.0}
+
+    def test_detects_regression(self):
+        """Test a gate much slower than its median is reported."""
+        history = [_timing("tests", 10.0, session) for session in range(MIN_BASELINE_RUNS)]
+        current = [_timing("tests", 25.0, 9), _timing("linting", 25.0, 9)]
+
+        regressions = detect_regressions(history, current, threshold=2.0)
+
+        assert [regression.gate for regression in regressions] == ["tests"]
+        assert regressions[0].baseline_seconds == 10.0
+        assert regressions[0].factor == 2.5
+
+    @pytest.mark.parametrize(
+        "duration, cached, threshold",
+        [(15.0, False, 2.0), (25.0, True, 2.0), (25.0, False, 0)],
+    )
+    def test_no_regression(self, duration, cached, threshold):
+        """Test runs within the threshold, cached runs and a zero threshold are not reported."""
+        history = [_timing("tests", 10.0, session) for session in range(MIN_BASELINE_RUNS)]
+        current = [_timing("tests", duration, 9, cached=cached)]
+
+        assert detect_regressions(history, current, threshold=threshold) == []
+
+    def test_fast_gates_and_short_history_ignored(self):
+        """Test sub-second noise and gates with too little history are not reported."""
+        history = [_timing("linting", 0.5, session) for session in range(MIN_BASELINE_RUNS)]
+        history.append(_timing("tests", 10.0, 1))
+        current = [_timing("linting", 3.0, 9), _timing("tests", 60.0, 9)]
+
+        assert detect_regressions(history, current) == []
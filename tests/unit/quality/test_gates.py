@@ -8,12 +8,13 @@ security scanning, documentation validation, and custom checks.
 import json
 from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
 from solokit.core.command_runner import CommandResult
 from solokit.core.exceptions import SpecValidationError
+from solokit.quality.gate_timings import GateRegression
 from solokit.quality.gates import QualityGates
 
 
@@ -881,6 +882,130 @@ class TestQualityGatesLinting:
         assert results["status"] == "skipped"
 
 
+class TestQualityGatesIncremental:
+    """Tests for changed-files-only gate runs."""
+
+    def test_incremental_scope_resolved_once_and_shared(self):
+        """Test gates share one changed-file scope when incremental is forced."""
+        from solokit.quality.incremental import IncrementalScope
+
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates(incremental=True)
+        scope = IncrementalScope("abc123", ["src/app.py"])
+
+        with patch(
+            "solokit.quality.gates.resolve_incremental_scope", return_value=scope
+        ) as mock_resolve:
+            assert gates._get_incremental_scope(False) is scope
+            assert gates._get_incremental_scope(False) is scope
+
+        mock_resolve.assert_called_once()
+
+    def test_full_override_disables_configured_incremental(self):
+        """Test incremental=False runs gates on the whole project despite config."""
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates(incremental=False)
+
+        assert gates._get_incremental_scope(True) is None
+
+    def test_config_controls_incremental_without_override(self):
+        """Test per-gate config decides when no override is given."""
+        from solokit.quality.incremental import IncrementalScope
+
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+        scope = IncrementalScope("abc123", [])
+
+        with patch("solokit.quality.gates.resolve_incremental_scope", return_value=scope):
+            assert gates._get_incremental_scope(False) is None
+            assert gates._get_incremental_scope(True) is scope
+
+
+class TestQualityGatesCache:
+    """Tests for reusing cached gate results."""
+
+    @pytest.fixture
+    def gates(self):
+        """QualityGates with an active, mocked result cache."""
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+        gates.cache = MagicMock(enabled=True)
+        gates.cache.fingerprint.return_value = "fp1"
+        gates.cache.tree_unchanged_since.return_value = True
+        return gates
+
+    def test_cached_result_skips_checker(self, gates):
+        """Test a cache hit is returned without running the gate."""
+        gates.cache.get.return_value = (True, {"status": "passed", "cached": True})
+        run = Mock()
+
+        passed, results = gates._run_cached("linting", run, {"enabled": True})
+
+        assert passed is True
+        assert results["cached"] is True
+        run.assert_not_called()
+
+    def test_miss_runs_gate_and_stores_result(self, gates):
+        """Test a cache miss runs the gate and stores the result under its fingerprint."""
+        gates.cache.get.return_value = None
+        run = Mock(return_value=(True, {"status": "passed"}))
+
+        passed, _results = gates._run_cached("tests", run, {"enabled": True})
+
+        assert passed is True
+        gates.cache.set.assert_called_once_with("tests", "fp1", True, {"status": "passed"})
+
+    def test_result_not_stored_when_tree_changed_during_run(self, gates):
+        """Test results are discarded if another gate rewrote files meanwhile."""
+        gates.cache.get.return_value = None
+        gates.cache.tree_unchanged_since.return_value = False
+
+        gates._run_cached("tests", Mock(return_value=(True, {})), {"enabled": True})
+
+        gates.cache.fingerprint.assert_called_once()
+        gates.cache.set.assert_not_called()
+
+    def test_auto_fix_result_stored_for_resulting_tree(self, gates):
+        """Test gates that rewrite files store their result for the post-fix tree."""
+        gates.cache.get.return_value = None
+        gates.cache.fingerprint.side_effect = ["fp1", "fp2"]
+
+        gates._run_cached(
+            "formatting", Mock(return_value=(True, {})), {"enabled": True}, writes_files=True
+        )
+
+        gates.cache.rewriting_tree.assert_called_once()
+        gates.cache.set.assert_called_once_with("formatting", "fp2", True, {})
+
+    def test_disabled_gate_bypasses_cache(self, gates):
+        """Test disabled gates run directly without fingerprinting."""
+        run = Mock(return_value=(True, {"status": "skipped"}))
+
+        gates._run_cached("security", run, {"enabled": False})
+
+        run.assert_called_once()
+        gates.cache.fingerprint.assert_not_called()
+
+    def test_run_tests_uses_cache(self, gates):
+        """Test run_tests returns the cached result without invoking the test runner."""
+        gates.cache.get.return_value = (True, {"status": "passed", "coverage": 90, "cached": True})
+        gates.runner = Mock()
+
+        passed, results = gates.run_tests(language="python")
+
+        assert passed is True
+        assert results["coverage"] == 90
+        gates.runner.run.assert_not_called()
+        assert gates.cache.fingerprint.call_args.args[0] == "tests"
+
+    def test_no_gate_cache_option(self):
+        """Test use_cache=False disables the cache."""
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates(use_cache=False)
+
+        assert gates.cache.enabled is False
+
+
 class TestQualityGatesFormatting:
     """Tests for code formatting validation."""
 
@@ -1106,6 +1231,10 @@ class TestQualityGatesDocumentation:
 
         with patch.object(Path, "exists", return_value=False):
             gates = QualityGates()
+        gates.config = replace(
+            gates.config,
+            documentation=replace(gates.config.documentation, docstring_checker="pydocstyle"),
+        )
 
         # Act
         passed, results = gates.validate_documentation()
@@ -1213,7 +1342,11 @@ class TestQualityGatesDocumentation:
         mock_runner = Mock()
 
         mock_runner.run.return_value = CommandResult(
-            returncode=0, stdout="main", stderr="", command=["pytest"], duration_seconds=0.1
+            returncode=0,
+            stdout="# branch.head main\x00",
+            stderr="",
+            command=["git"],
+            duration_seconds=0.1,
         )
 
         mock_run.return_value = mock_runner
@@ -1249,7 +1382,8 @@ class TestQualityGatesDocumentation:
 
         # Act
         checker = DocumentationChecker(
-            config=gates.config.documentation.__dict__, runner=mock_runner
+            config={**gates.config.documentation.__dict__, "docstring_checker": "pydocstyle"},
+            runner=mock_runner,
         )
         result = checker._check_python_docstrings()
 
@@ -1281,6 +1415,7 @@ class TestQualityGatesDocumentation:
             "enabled": True,
             "check_changelog": False,
             "check_docstrings": True,
+            "docstring_checker": "pydocstyle",
             "check_readme": False,
         }
 
@@ -1314,7 +1449,8 @@ class TestQualityGatesDocumentation:
 
         # Act
         checker = DocumentationChecker(
-            config=gates.config.documentation.__dict__, runner=mock_runner
+            config={**gates.config.documentation.__dict__, "docstring_checker": "pydocstyle"},
+            runner=mock_runner,
         )
         result = checker._check_python_docstrings()
 
@@ -1624,9 +1760,11 @@ class TestQualityGatesCustomValidations:
         assert passed is True
 
     @patch("solokit.quality.gates.CommandRunner")
-    def test_run_custom_validations_grep_pattern_not_found(self, mock_run):
+    def test_run_custom_validations_grep_pattern_not_found(self, mock_run, tmp_path, monkeypatch):
         """Test grep validation when pattern is not found."""
         # Arrange
+        # Grep rules search the project in-process; use a project without the pattern
+        monkeypatch.chdir(tmp_path)
         mock_runner = Mock()
 
         mock_runner.run.return_value = CommandResult(
@@ -1741,6 +1879,121 @@ class TestQualityGatesReporting:
         assert "✓ PASSED" in report
         assert "Coverage: 85%" in report
 
+    def test_generate_report_marks_cached_gates(self):
+        """Test gates served from the result cache are marked in the report."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        all_results = {
+            "tests": {"status": "passed", "cached": True},
+            "linting": {"status": "passed"},
+        }
+
+        # Act
+        report = gates.generate_report(all_results)
+
+        # Assert
+        assert "Tests: ✓ PASSED (cached)" in report
+        assert "Linting: ✓ PASSED\n" in report
+
+    def test_generate_report_with_slow_gate_regressions(self):
+        """Test gates much slower than in recent sessions are called out."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        regressions = [GateRegression("tests", duration_seconds=45.0, baseline_seconds=15.0)]
+
+        # Act
+        report = gates.generate_report({"tests": {"status": "passed"}}, regressions=regressions)
+
+        # Assert
+        assert "⚠ Slow gates (compared with recent sessions):" in report
+        assert "tests: 45.0s (median 15.0s, 3.0x slower)" in report
+        assert "sk perf gates" in report
+
+    def test_generate_report_marks_cancelled_gates(self):
+        """Test gates cancelled by fail-fast are listed as cancelled, not failed."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        all_results = {
+            "tests": {"status": "cancelled"},
+            "linting": {"status": "failed"},
+            "context7": {"status": "cancelled"},
+        }
+
+        # Act
+        report = gates.generate_report(all_results)
+
+        # Assert
+        assert "Tests: ✗ FAILED" not in report
+        assert "Linting: ✗ FAILED" in report
+        assert "Cancelled after a required gate failed (fail-fast):" in report
+        assert "  Tests: ⊘ CANCELLED" in report
+        assert "  Context7: ⊘ CANCELLED" in report
+
+    def test_generate_report_lists_missing_docstrings(self):
+        """Test missing docstring locations are listed under the documentation gate."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        all_results = {
+            "documentation": {
+                "status": "failed",
+                "checks": [
+                    {
+                        "name": "Docstrings present",
+                        "passed": False,
+                        "missing": 3,
+                        "locations": ["app.py:4: public function 'run' has no docstring"],
+                    }
+                ],
+            }
+        }
+
+        # Act
+        report = gates.generate_report(all_results)
+
+        # Assert
+        assert "  ✗ Docstrings present\n    app.py:4: public function 'run'" in report
+        assert "    ... and 2 more" in report
+
+    def test_generate_report_with_test_impact(self):
+        """Test impacted test selection and skipped test runs are shown in the report."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        impacted = {
+            "tests": {
+                "status": "passed",
+                "test_impact": {"impacted": True, "selected": 3, "skipped": 40},
+            }
+        }
+        nothing_impacted = {
+            "tests": {
+                "status": "skipped",
+                "test_impact": {"impacted": True, "selected": 0, "skipped": 43},
+            }
+        }
+        full = {
+            "tests": {
+                "status": "passed",
+                "test_impact": {"impacted": False, "full_run_reason": "periodic full run"},
+            }
+        }
+
+        # Act / Assert
+        assert "Impacted tests: 3 test file(s) selected, 40 skipped" in gates.generate_report(
+            impacted
+        )
+        assert "Tests: ⊘ SKIPPED" in gates.generate_report(nothing_impacted)
+        assert "Full run: periodic full run" in gates.generate_report(full)
+
     def test_generate_report_some_failed(self):
         """Test generating report when some gates failed."""
         # Arrange
@@ -1764,6 +2017,38 @@ class TestQualityGatesReporting:
         assert "HIGH: 3" in report
         assert "MEDIUM: 5" in report
 
+    def test_generate_report_with_incremental_gates(self):
+        """Test report shows incremental scope and full-run fallbacks."""
+        # Arrange
+        with patch.object(Path, "exists", return_value=False):
+            gates = QualityGates()
+
+        all_results = {
+            "linting": {
+                "status": "passed",
+                "incremental": {
+                    "incremental": True,
+                    "files_checked": 3,
+                    "full_run_reason": None,
+                },
+            },
+            "formatting": {
+                "status": "passed",
+                "incremental": {
+                    "incremental": False,
+                    "files_checked": None,
+                    "full_run_reason": "configuration changed: pyproject.toml",
+                },
+            },
+        }
+
+        # Act
+        report = gates.generate_report(all_results)
+
+        # Assert
+        assert "Incremental: 3 changed file(s) checked" in report
+        assert "Full run: configuration changed: pyproject.toml" in report
+
     def test_generate_report_with_skipped_gates(self):
         """Test generating report with skipped gates."""
         # Arrange
@@ -2024,7 +2309,7 @@ class TestQualityGatesIntegration:
         }
 
         mock_runner = Mock()
-        mock_runner.run.side_effect = [
+        mock_runner.run_many.return_value = [
             CommandResult(
                 returncode=0, stdout="", stderr="", command=["docker"], duration_seconds=0.1
             ),
@@ -2059,13 +2344,15 @@ class TestQualityGatesIntegration:
 
         mock_runner = Mock()
 
-        mock_runner.run.return_value = CommandResult(
-            returncode=-1,
-            stdout="",
-            stderr="docker not found",
-            command=["pytest"],
-            duration_seconds=0.1,
-        )
+        mock_runner.run_many.return_value = [
+            CommandResult(
+                returncode=-1,
+                stdout="",
+                stderr="docker not found",
+                command=["docker"],
+                duration_seconds=0.1,
+            )
+        ] * 2
 
         mock_run.return_value = mock_runner
 
@@ -2093,7 +2380,7 @@ class TestQualityGatesIntegration:
         }
 
         mock_runner = Mock()
-        mock_runner.run.side_effect = [
+        mock_runner.run_many.return_value = [
             CommandResult(
                 returncode=0, stdout="", stderr="", command=["docker"], duration_seconds=0.1
             ),
@@ -2515,9 +2802,7 @@ class TestQualityGatesHelperMethods:
         from solokit.quality.checkers.custom import CustomValidationChecker
 
         mock_runner = Mock()
-        mock_runner.run.return_value = CommandResult(
-            returncode=0, stdout="", stderr="", command=["grep"], duration_seconds=0.1
-        )
+        (temp_dir / "app.py").write_text("# TODO: implement\n")
 
         rule = {"pattern": "TODO", "files": "."}
 
@@ -2534,9 +2819,7 @@ class TestQualityGatesHelperMethods:
         from solokit.quality.checkers.custom import CustomValidationChecker
 
         mock_runner = Mock()
-        mock_runner.run.return_value = CommandResult(
-            returncode=1, stdout="", stderr="", command=["grep"], duration_seconds=0.1
-        )
+        (temp_dir / "app.py").write_text("# TODO: implement\n")
 
         rule = {"pattern": "NOTFOUND", "files": "."}
 
@@ -2553,10 +2836,9 @@ class TestQualityGatesHelperMethods:
         from solokit.quality.checkers.custom import CustomValidationChecker
 
         mock_runner = Mock()
-        mock_runner.run.return_value = CommandResult(
-            returncode=-1, stdout="", stderr="grep failed", command=["grep"], duration_seconds=0.1
-        )
-        rule = {"pattern": "test", "files": "."}
+        (temp_dir / "app.py").write_text("test\n")
+        # An invalid pattern is an error (grep exit 2), never a match
+        rule = {"pattern": "[test", "files": "."}
 
         # Act
         checker = CustomValidationChecker({}, temp_dir, runner=mock_runner)
@@ -2673,18 +2955,20 @@ class TestQualityGatesAdditionalCoverage:
 
         with patch("tempfile.mkstemp", return_value=(999, str(temp_file))):
             mock_runner = Mock()
-            mock_runner.run.side_effect = [
-                CommandResult(
+            # Bandit and Safety run concurrently, so answer by command rather than call order
+            outputs = {
+                "bandit": CommandResult(
                     returncode=0, stdout="", stderr="", command=["bandit"], duration_seconds=0.1
                 ),
-                CommandResult(
+                "safety": CommandResult(
                     returncode=0,
                     stdout=json.dumps(safety_data),
                     stderr="",
                     command=["safety"],
                     duration_seconds=0.1,
                 ),
-            ]
+            }
+            mock_runner.run.side_effect = lambda command, **kwargs: outputs[command[0]]
             mock_run.return_value = mock_runner
 
             with patch.object(Path, "exists", return_value=False):
@@ -2883,6 +3167,7 @@ class TestQualityGatesAdditionalCoverage:
             "enabled": True,
             "check_changelog": True,
             "check_docstrings": True,
+            "docstring_checker": "pydocstyle",
             "check_readme": True,
         }
 
@@ -0,0 +1,131 @@
+"""Unit tests for the in-process grep engine."""
+
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from solokit.quality.grep_engine import GrepEngine, GrepQuery, translate_grep_pattern
+
+SAMPLE = """hello world
+foo(bar) + baz?
+a|b literal
+TODO: fix this
+price $5 and ^caret
+x*y star
+version 1.2.3
+def my_function(arg1, arg2):
+[brackets] and {braces}
+"""
+
+
+def _search(root, pattern, *paths):
+    return GrepEngine(root).search([GrepQuery(pattern, paths or (".",))])[0]
+
+
+class TestTranslateGrepPattern:
+    """Tests for translate_grep_pattern."""
+
+    @pytest.mark.parametrize(
+        "pattern, matches",
+        [
+            ("foo(bar)", True),
+            ("a|b", True),
+            ("TODO\\|FIXME", True),
+            ("^TODO", True),
+            ("^caret", False),
+            ("\\$5", True),
+            ("*y", True),
+            ("x\\*y", True),
+            ("[[:digit:]]\\+\\.[0-9]\\+", True),
+            ("\\<fix\\>", True),
+            ("my_\\w\\+(", True),
+            ("{braces}", True),
+            ("z\\{1,\\}", True),
+            ("\\[brackets\\]", True),
+            ("[]a]", True),
+            ("baz?", True),
+            ("zzz\\?", False),
+            ("\\(x\\)\\1", False),
+            ("\\(l\\)\\1", True),
+            ("nomatch\nhello", True),
+            ("def.*:$", True),
+        ],
+    )
+    def test_basic_regular_expressions(self, pattern, matches):
+        """Test grep's basic regex syntax is translated, not read as Python syntax."""
+        regex = re.compile(translate_grep_pattern(pattern), re.MULTILINE)
+
+        assert (regex.search(SAMPLE) is not None) is matches
+
+    @pytest.mark.skipif(shutil.which("grep") is None, reason="grep not installed")
+    @pytest.mark.parametrize(
+        "pattern", ["a|b", "^ *def", "[^a-z ]", "\\(foo\\|bar\\)(", "[[:upper:]]\\{4\\}:", "^$"]
+    )
+    def test_agrees_with_grep(self, tmp_path, pattern):
+        """Test results match grep's exit status."""
+        (tmp_path / "sample.txt").write_text(SAMPLE)
+        expected = subprocess.run(["grep", "-q", "--", pattern, "sample.txt"], cwd=tmp_path)
+
+        assert _search(tmp_path, pattern, "sample.txt") is (expected.returncode == 0)
+
+    @pytest.mark.parametrize("pattern", ["[abc", "trailing\\", "[[:nope:]]"])
+    def test_invalid_patterns(self, pattern):
+        """Test patterns grep rejects raise re.error."""
+        with pytest.raises(re.error):
+            translate_grep_pattern(pattern)
+
+
+class TestGrepEngine:
+    """Tests for GrepEngine.search."""
+
+    def test_results_per_query(self, tmp_path):
+        """Test each query gets its own result, in order."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("import logging\n")
+        (tmp_path / "docs.md").write_text("TODO\n")
+
+        results = GrepEngine(tmp_path).search(
+            [
+                GrepQuery("import logging"),
+                GrepQuery("TODO", ["src"]),
+                GrepQuery("TODO", ["docs.md", "src"]),
+                GrepQuery("[invalid"),
+                GrepQuery("x", ["missing"]),
+            ]
+        )
+
+        assert results == [True, False, True, False, False]
+
+    def test_prunes_dependency_directories(self, tmp_path):
+        """Test node_modules and virtualenvs are skipped unless named explicitly."""
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("eval(x)\n")
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "site.py").write_text("eval(x)\n")
+
+        assert _search(tmp_path, "eval(") is False
+        assert _search(tmp_path, "eval(", "node_modules") is True
+
+    def test_honours_gitignore(self, git_repo):
+        """Test files ignored by git are skipped unless their directory is named."""
+        (git_repo / ".gitignore").write_text("build/\n*.log\n")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.js").write_text("SECRET\n")
+        (git_repo / "debug.log").write_text("SECRET\n")
+        (git_repo / "app.py").write_text("value = 1\n")
+
+        assert _search(git_repo, "SECRET") is False
+        assert _search(git_repo, "SECRET", "build") is True
+        assert _search(git_repo, "SECRET", "debug.log") is True
+        assert _search(git_repo, "value") is True
+
+    def test_line_semantics(self, tmp_path):
+        """Test matches never span lines and a final newline adds no empty line."""
+        (tmp_path / "a.txt").write_text("first\nsecond\n")
+
+        assert _search(tmp_path, "first.second") is False
+        assert _search(tmp_path, "t[^x]*s") is False
+        assert _search(tmp_path, "^$") is False
+        assert _search(tmp_path, "^second$") is True
@@ -0,0 +1,188 @@
+"""Unit tests for incremental (changed-files-only) quality gate scope."""
+
+import json
+
+import pytest
+
+from solokit.quality.incremental import (
+    IncrementalScope,
+    get_last_gated_commit,
+    is_config_file,
+    record_gated_commit,
+    resolve_incremental_scope,
+    scope_command,
+)
+
+PY_EXTENSIONS = (".py", ".pyi")
+
+
+@pytest.fixture
+def git_repo_files():
+    """Two modules and a config file committed to the test repository."""
+    return {"src/app.py": "x = 1\n", "src/util.py": "y = 2\n", "pyproject.toml": "[tool.ruff]\n"}
+
+
+def _start_work_item_branch(run_git, repo, parent="main"):
+    """Record a current work item whose branch was created from parent."""
+    tracking = repo / ".session" / "tracking"
+    (tracking / "status_update.json").write_text(json.dumps({"current_work_item": "feat_001"}))
+    (tracking / "work_items.json").write_text(
+        json.dumps(
+            {"work_items": {"feat_001": {"id": "feat_001", "git": {"parent_branch": parent}}}}
+        )
+    )
+    run_git(repo, "checkout", "-q", "-b", "session-001-feat_001")
+
+
+class TestIsConfigFile:
+    """Tests for is_config_file."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "pyproject.toml",
+            "pkg/setup.cfg",
+            ".eslintrc.json",
+            "eslint.config.mjs",
+            ".session/config.json",
+        ],
+    )
+    def test_config_files_detected(self, path):
+        """Test tool and gate configuration files are detected."""
+        assert is_config_file(path)
+
+    @pytest.mark.parametrize("path", ["src/app.py", "src/config.json", "README.md"])
+    def test_source_files_not_detected(self, path):
+        """Test ordinary source files are not configuration files."""
+        assert not is_config_file(path)
+
+
+class TestGatedCommit:
+    """Tests for recording the last gated commit."""
+
+    def test_record_and_read_gated_commit(self, git_repo, run_git):
+        """Test HEAD is recorded under .session/cache and read back."""
+        head = run_git(git_repo, "rev-parse", "HEAD")
+
+        assert record_gated_commit(git_repo) == head
+        assert get_last_gated_commit(git_repo) == head
+        assert (git_repo / ".session" / "cache" / "gate_state.json").exists()
+
+    def test_record_requires_session_dir(self, tmp_path):
+        """Test nothing is recorded outside an initialized project."""
+        assert record_gated_commit(tmp_path) is None
+        assert get_last_gated_commit(tmp_path) is None
+
+
+class TestResolveIncrementalScope:
+    """Tests for resolve_incremental_scope."""
+
+    def test_full_run_without_base(self, git_repo):
+        """Test a full run is required with no parent branch or gated commit."""
+        scope = resolve_incremental_scope(git_repo)
+
+        assert scope.is_full_run
+        assert scope.full_run_reason == "no parent branch or gated commit"
+
+    def test_changes_since_parent_branch(self, git_repo, run_git):
+        """Test committed, modified and untracked changes on a work item branch are found."""
+        _start_work_item_branch(run_git, git_repo)
+        (git_repo / "src" / "app.py").write_text("x = 2\n")
+        run_git(git_repo, "commit", "-q", "-am", "change app")
+        (git_repo / "src" / "util.py").write_text("y = 3\n")
+        (git_repo / "src" / "new.py").write_text("z = 1\n")
+
+        scope = resolve_incremental_scope(git_repo)
+
+        assert not scope.is_full_run
+        assert scope.base_ref == run_git(git_repo, "rev-parse", "main")
+        assert {"src/app.py", "src/util.py", "src/new.py"} <= set(scope.files)
+
+    def test_changes_since_last_gated_commit(self, git_repo, run_git):
+        """Test the last gated commit is the base when working on the parent branch."""
+        record_gated_commit(git_repo)
+        (git_repo / "src" / "util.py").write_text("y = 3\n")
+        run_git(git_repo, "commit", "-q", "-am", "change util")
+
+        scope = resolve_incremental_scope(git_repo)
+
+        assert not scope.is_full_run
+        assert "src/util.py" in scope.files
+        assert "src/app.py" not in scope.files
+
+    def test_deleted_files_excluded(self, git_repo, run_git):
+        """Test deleted files are not part of the changed set."""
+        record_gated_commit(git_repo)
+        run_git(git_repo, "rm", "-q", "src/util.py")
+
+        scope = resolve_incremental_scope(git_repo)
+
+        assert "src/util.py" not in scope.files
+
+    def test_config_change_forces_full_run(self, git_repo):
+        """Test changing a tool configuration file falls back to a full run."""
+        record_gated_commit(git_repo)
+        (git_repo / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+
+        scope = resolve_incremental_scope(git_repo)
+
+        assert scope.is_full_run
+        assert "pyproject.toml" in scope.full_run_reason
+
+
+class TestScopeCommand:
+    """Tests for scope_command."""
+
+    def test_full_run_keeps_command(self, tmp_path):
+        """Test the command is unchanged when a full run is required."""
+        scope = IncrementalScope(None, full_run_reason="no parent branch or gated commit")
+
+        command, info = scope_command(["ruff", "check", "."], scope, PY_EXTENSIONS, tmp_path)
+
+        assert command == ["ruff", "check", "."]
+        assert info == {"incremental": False, "full_run_reason": scope.full_run_reason}
+
+    def test_replaces_directory_targets_with_changed_files(self, tmp_path):
+        """Test trailing directories are replaced by changed files beneath them."""
+        for name in ("src/app.py", "tests/test_app.py", "scripts/tool.py", "src/README.md"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text("")
+        scope = IncrementalScope(
+            "abc123",
+            ["scripts/tool.py", "src/README.md", "src/app.py", "tests/test_app.py"],
+        )
+
+        command, info = scope_command(
+            ["ruff", "check", "src", "tests"], scope, PY_EXTENSIONS, tmp_path
+        )
+
+        assert command == ["ruff", "check", "--force-exclude", "src/app.py", "tests/test_app.py"]
+        assert info == {"incremental": True, "base_ref": "abc123", "files_checked": 2}
+
+    def test_npx_tool_is_scoped(self, tmp_path):
+        """Test tools launched through npx are scoped."""
+        (tmp_path / "index.ts").write_text("")
+        scope = IncrementalScope("abc123", ["index.ts"])
+
+        command, _info = scope_command(["npx", "eslint", "."], scope, (".ts",), tmp_path)
+
+        assert command == ["npx", "eslint", "index.ts"]
+
+    def test_no_changed_files_returns_empty_command(self, tmp_path):
+        """Test an empty command is returned when nothing relevant changed."""
+        scope = IncrementalScope("abc123", ["docs/guide.md"])
+
+        command, info = scope_command(["ruff", "check", "."], scope, PY_EXTENSIONS, tmp_path)
+
+        assert command == []
+        assert info["files_checked"] == 0
+
+    def test_script_commands_run_in_full(self, tmp_path):
+        """Test commands that cannot take file paths fall back to a full run."""
+        scope = IncrementalScope("abc123", ["src/app.ts"])
+
+        command, info = scope_command(["npm", "run", "lint"], scope, (".ts",), tmp_path)
+
+        assert command == ["npm", "run", "lint"]
+        assert info["incremental"] is False
+        assert "npm" in info["full_run_reason"]
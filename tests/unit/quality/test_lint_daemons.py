@@ -0,0 +1,193 @@
+"""Unit tests for persistent linter daemons."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from solokit.core.command_runner import CommandResult, CommandRunner
+from solokit.quality.lint_daemons import (
+    EslintDaemon,
+    LintDaemonManager,
+    MypyDaemon,
+    stop_lint_daemons,
+)
+
+
+def _result(returncode=0, stdout="", timed_out=False):
+    return CommandResult(
+        returncode=returncode,
+        stdout=stdout,
+        stderr="",
+        command=[],
+        duration_seconds=0.1,
+        timed_out=timed_out,
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create an initialized project with dmypy in its venv."""
+    (tmp_path / ".session").mkdir()
+    bin_dir = tmp_path / "venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "mypy").touch()
+    (bin_dir / "dmypy").touch()
+    return tmp_path
+
+
+@pytest.fixture
+def runner():
+    """Create a mock CommandRunner."""
+    return Mock(spec=CommandRunner)
+
+
+def _commands(runner):
+    return [call.args[0] for call in runner.run.call_args_list]
+
+
+class TestLintDaemonManager:
+    """Tests for routing commands to daemons."""
+
+    def test_routes_mypy_to_dmypy(self, project, runner):
+        """Test mypy runs as a dmypy request with the status file in .session/daemons."""
+        runner.run.return_value = _result(1, "Daemon started\napp.py:1: error: bad\n")
+        mypy = str(project / "venv" / "bin" / "mypy")
+
+        result = LintDaemonManager(project, runner).run([mypy, "src"], timeout=120)
+
+        status_file = project / ".session" / "daemons" / "dmypy.json"
+        assert _commands(runner) == [
+            [
+                str(project / "venv" / "bin" / "dmypy"),
+                "--status-file",
+                str(status_file),
+                "run",
+                "--timeout",
+                "3600",
+                "--",
+                "src",
+            ]
+        ]
+        assert result.returncode == 1
+        assert result.stdout == "app.py:1: error: bad\n"
+
+    def test_other_linters_run_directly(self, project, runner):
+        """Test commands without a daemon run cold."""
+        runner.run.return_value = _result()
+
+        LintDaemonManager(project, runner).run(["ruff", "check", "."], timeout=120)
+
+        assert _commands(runner) == [["ruff", "check", "."]]
+
+    def test_requires_initialized_project(self, project, runner):
+        """Test no daemon is started outside a solokit project (nothing would stop it)."""
+        (project / ".session").rmdir()
+        runner.run.return_value = _result()
+        mypy = str(project / "venv" / "bin" / "mypy")
+
+        LintDaemonManager(project, runner).run([mypy, "src"], timeout=120)
+
+        assert _commands(runner) == [[mypy, "src"]]
+
+
+class TestMypyDaemon:
+    """Tests for health checks, restarts and fallbacks."""
+
+    def test_restarts_unresponsive_daemon(self, project, runner):
+        """Test a failing health check kills the daemon before the request."""
+        daemon = MypyDaemon(project, runner)
+        daemon.status_file.parent.mkdir(parents=True)
+        daemon.status_file.write_text("{}")
+        runner.run.side_effect = [_result(2), _result(), _result()]
+
+        daemon.run([str(project / "venv" / "bin" / "mypy"), "src"], timeout=120)
+
+        commands = _commands(runner)
+        assert commands[0][-1] == "status"
+        assert commands[1][-1] == "kill"
+        assert "run" in commands[2]
+        assert not daemon.status_file.exists()
+
+    def test_healthy_daemon_is_reused(self, project, runner):
+        """Test a running daemon serves the request without a restart."""
+        daemon = MypyDaemon(project, runner)
+        daemon.status_file.parent.mkdir(parents=True)
+        daemon.status_file.write_text("{}")
+        runner.run.return_value = _result()
+
+        daemon.run([str(project / "venv" / "bin" / "mypy"), "src"], timeout=120)
+
+        assert [command[3] for command in _commands(runner)] == ["status", "run"]
+
+    def test_falls_back_to_mypy_when_daemon_fails(self, project, runner):
+        """Test a daemon failure kills it and runs mypy directly."""
+        mypy = str(project / "venv" / "bin" / "mypy")
+        runner.run.side_effect = [_result(2), _result(), _result(1, "error")]
+
+        result = MypyDaemon(project, runner).run([mypy, "src"], timeout=120)
+
+        assert _commands(runner)[1][-1] == "kill"
+        assert _commands(runner)[2] == [mypy, "src"]
+        assert result.stdout == "error"
+
+    def test_timeout_kills_daemon(self, project, runner):
+        """Test a timed out request kills the daemon instead of retrying."""
+        runner.run.side_effect = [_result(-1, timed_out=True), _result()]
+
+        result = MypyDaemon(project, runner).run(
+            [str(project / "venv" / "bin" / "mypy"), "src"], timeout=120
+        )
+
+        assert result.timed_out is True
+        assert _commands(runner)[-1][-1] == "kill"
+
+    def test_stop_only_when_running(self, project, runner):
+        """Test stop sends dmypy stop only when the daemon has a status file."""
+        daemon = MypyDaemon(project, runner)
+        runner.run.return_value = _result()
+
+        daemon.stop()
+        assert runner.run.call_count == 0
+
+        daemon.status_file.parent.mkdir(parents=True)
+        daemon.status_file.write_text("{}")
+        daemon.stop()
+        assert _commands(runner) == [
+            [
+                str(project / "venv" / "bin" / "dmypy"),
+                "--status-file",
+                str(daemon.status_file),
+                "stop",
+            ]
+        ]
+
+
+class TestEslintDaemon:
+    """Tests for eslint_d routing."""
+
+    def test_routes_npx_eslint_to_eslint_d(self, project, runner):
+        """Test eslint arguments are passed to the project's eslint_d."""
+        eslint_d = project / "node_modules" / ".bin" / "eslint_d"
+        eslint_d.parent.mkdir(parents=True)
+        eslint_d.touch()
+        runner.run.return_value = _result()
+
+        LintDaemonManager(project, runner).run(["npx", "eslint", ".", "--fix"], timeout=120)
+
+        assert _commands(runner) == [[str(eslint_d), ".", "--fix"]]
+        assert EslintDaemon(project, runner).marker_file.exists()
+
+    def test_runs_eslint_without_eslint_d(self, project, runner):
+        """Test eslint runs cold when eslint_d isn't installed."""
+        runner.run.return_value = _result()
+
+        LintDaemonManager(project, runner).run(["npx", "eslint", "."], timeout=120)
+
+        assert _commands(runner) == [["npx", "eslint", "."]]
+
+
+def test_stop_lint_daemons_without_daemons(tmp_path):
+    """Test teardown is a no-op when no daemon was ever started."""
+    stop_lint_daemons(tmp_path)
+
+    assert not (tmp_path / ".session").exists()
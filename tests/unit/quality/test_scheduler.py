@@ -0,0 +1,324 @@
+"""Unit tests for the concurrent quality gate scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from solokit.quality.scheduler import (
+    SOURCE_TREE_RESOURCE,
+    GateScheduler,
+    GateTask,
+    source_tree_resources,
+)
+
+
+def _gate(passed=True, delay=0.0, **results):
+    """Build a gate callable returning (passed, results) after an optional delay."""
+
+    def run():
+        time.sleep(delay)
+        return passed, {"status": "passed" if passed else "failed", **results}
+
+    return run
+
+
+class _ConcurrencyTracker:
+    """Records the maximum number of gates observed running at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def gate(self, delay=0.05):
+        def run():
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(delay)
+            with self.lock:
+                self.active -= 1
+            return True, {"status": "passed"}
+
+        return run
+
+
+class TestSourceTreeResources:
+    """Tests for source_tree_resources helper."""
+
+    def test_writer_holds_source_tree(self):
+        """Test gates that write files hold the source tree resource."""
+        assert source_tree_resources(True) == frozenset({SOURCE_TREE_RESOURCE})
+
+    def test_reader_holds_nothing(self):
+        """Test check-only gates hold no exclusive resources."""
+        assert source_tree_resources(False) == frozenset()
+
+    def test_gates_read_source_tree_by_default(self):
+        """Test gates share the source tree unless they hold it exclusively."""
+        assert GateTask("tests", _gate()).read_resources == frozenset({SOURCE_TREE_RESOURCE})
+        assert not GateTask("linting", _gate(), source_tree_resources(True)).read_resources
+
+
+class TestGateScheduler:
+    """Tests for GateScheduler.run."""
+
+    def test_results_in_declaration_order(self):
+        """Test outcomes keep declaration order even when gates finish out of order."""
+        scheduler = GateScheduler(max_parallel=3)
+        tasks = [
+            GateTask("tests", _gate(delay=0.1, coverage=90)),
+            GateTask("security", _gate(passed=False)),
+            GateTask("linting", _gate(delay=0.05)),
+        ]
+
+        outcomes = scheduler.run(tasks)
+
+        assert list(outcomes) == ["tests", "security", "linting"]
+        assert outcomes["tests"].passed is True
+        assert outcomes["tests"].results["coverage"] == 90
+        assert outcomes["security"].passed is False
+        assert outcomes["security"].results == {"status": "failed"}
+        assert outcomes["linting"].duration_seconds >= 0.05
+
+    def test_runs_gates_concurrently(self):
+        """Test independent gates run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer():
+            barrier.wait()
+            return True, {"status": "passed"}
+
+        outcomes = GateScheduler(max_parallel=2).run(
+            [GateTask("tests", wait_for_peer), GateTask("security", wait_for_peer)]
+        )
+
+        assert all(outcome.passed for outcome in outcomes.values())
+
+    def test_respects_max_parallel(self):
+        """Test no more than max_parallel gates run at once."""
+        tracker = _ConcurrencyTracker()
+        tasks = [GateTask(f"gate{i}", tracker.gate()) for i in range(6)]
+
+        GateScheduler(max_parallel=2).run(tasks)
+
+        assert tracker.peak == 2
+
+    def test_exclusive_resources_never_overlap(self):
+        """Test gates holding the same exclusive resource are serialized."""
+        writers = _ConcurrencyTracker()
+        tasks = [
+            GateTask("linting", writers.gate(), source_tree_resources(True)),
+            GateTask("formatting", writers.gate(), source_tree_resources(True)),
+            GateTask("security", _gate(delay=0.05)),
+        ]
+
+        outcomes = GateScheduler(max_parallel=3).run(tasks)
+
+        assert writers.peak == 1
+        assert list(outcomes) == ["linting", "formatting", "security"]
+
+    def test_readers_never_overlap_writers(self):
+        """Test readers wait for pending writers, then run alongside each other."""
+        lock = threading.Lock()
+        active = {"readers": 0, "writers": 0}
+        overlaps = []
+        peak_readers = []
+
+        def gate(kind):
+            def run():
+                with lock:
+                    active[kind] += 1
+                    overlaps.append(active["readers"] and active["writers"])
+                    peak_readers.append(active["readers"])
+                time.sleep(0.05)
+                with lock:
+                    active[kind] -= 1
+                return True, {"status": "passed"}
+
+            return run
+
+        tasks = [
+            GateTask("tests", gate("readers")),
+            GateTask("security", gate("readers")),
+            GateTask("linting", gate("writers"), source_tree_resources(True)),
+            GateTask("formatting", gate("writers"), source_tree_resources(True)),
+            GateTask("documentation", gate("readers")),
+        ]
+
+        outcomes = GateScheduler(max_parallel=4).run(tasks)
+
+        assert not any(overlaps)
+        assert max(peak_readers) == 3
+        assert all(outcome.passed for outcome in outcomes.values())
+
+    def test_sequential_when_max_parallel_is_one(self):
+        """Test max_parallel=1 runs gates one after another in order."""
+        order = []
+
+        def record(name):
+            def run():
+                order.append(name)
+                return True, {"status": "passed"}
+
+            return run
+
+        GateScheduler(max_parallel=1).run(
+            [GateTask("tests", record("tests")), GateTask("linting", record("linting"))]
+        )
+
+        assert order == ["tests", "linting"]
+
+    def test_historically_slow_gates_start_first(self):
+        """Test gates start slowest first; gates without history keep their place up front."""
+        order = []
+
+        def record(name):
+            def run():
+                order.append(name)
+                return True, {"status": "passed"}
+
+            return run
+
+        # A shared exclusive resource serializes the gates so start order is observable
+        resources = source_tree_resources(True)
+        scheduler = GateScheduler(
+            max_parallel=2, expected_durations={"linting": 1.0, "security": 20.0, "tests": 5.0}
+        )
+        outcomes = scheduler.run(
+            [
+                GateTask("tests", record("tests"), resources),
+                GateTask("linting", record("linting"), resources),
+                GateTask("custom", record("custom"), resources),
+                GateTask("security", record("security"), resources),
+            ]
+        )
+
+        assert order == ["custom", "security", "tests", "linting"]
+        assert list(outcomes) == ["tests", "linting", "custom", "security"]
+
+    def test_invalid_max_parallel_clamped(self):
+        """Test non-positive max_parallel falls back to sequential execution."""
+        assert GateScheduler(max_parallel=0).max_parallel == 1
+
+    def test_gate_exception_propagates(self):
+        """Test an exception raised by a gate is re-raised after running gates finish."""
+
+        def boom():
+            raise RuntimeError("gate crashed")
+
+        finished = threading.Event()
+
+        def slow():
+            time.sleep(0.05)
+            finished.set()
+            return True, {"status": "passed"}
+
+        with pytest.raises(RuntimeError, match="gate crashed"):
+            GateScheduler(max_parallel=2).run([GateTask("tests", slow), GateTask("custom", boom)])
+
+        assert finished.is_set()
+
+    def test_no_new_gates_start_after_exception(self):
+        """Test queued gates are not started once a gate has raised."""
+        started = []
+
+        def boom():
+            raise RuntimeError("gate crashed")
+
+        def record():
+            started.append("documentation")
+            return True, {"status": "passed"}
+
+        with pytest.raises(RuntimeError):
+            GateScheduler(max_parallel=2).run(
+                [
+                    GateTask("linting", boom, source_tree_resources(True)),
+                    GateTask("formatting", record, source_tree_resources(True)),
+                ]
+            )
+
+        assert started == []
+
+    def test_empty_task_list(self):
+        """Test running no gates returns no outcomes."""
+        assert GateScheduler(max_parallel=4).run([]) == {}
+
+
+class TestGateSchedulerFailFast:
+    """Tests for GateScheduler fail-fast mode."""
+
+    @pytest.mark.parametrize("max_parallel", [1, 2])
+    def test_cheapest_first_and_cancels_rest_after_required_failure(self, max_parallel):
+        """Test gates start cheapest-first and unstarted gates are cancelled on failure."""
+        started = []
+
+        def record(name, passed=True):
+            def run():
+                started.append(name)
+                return passed, {"status": "passed" if passed else "failed"}
+
+            return run
+
+        # A shared exclusive resource serializes the gates so start order is observable
+        resources = source_tree_resources(True)
+        scheduler = GateScheduler(
+            max_parallel=max_parallel,
+            expected_durations={"tests": 120.0, "linting": 2.0, "security": 10.0},
+            fail_fast=True,
+        )
+        outcomes = scheduler.run(
+            [
+                GateTask("tests", record("tests"), resources),
+                GateTask("security", record("security"), resources),
+                GateTask("linting", record("linting", passed=False), resources),
+            ]
+        )
+
+        assert started == ["linting"]
+        assert list(outcomes) == ["tests", "security", "linting"]
+        assert outcomes["linting"].cancelled is False
+        assert outcomes["linting"].passed is False
+        assert outcomes["tests"].cancelled is True
+        assert outcomes["tests"].results == {"status": "cancelled"}
+        assert outcomes["security"].cancelled is True
+
+    def test_running_gates_finish(self):
+        """Test gates already running when a required gate fails still complete."""
+        scheduler = GateScheduler(max_parallel=2, fail_fast=True)
+
+        outcomes = scheduler.run(
+            [
+                GateTask("tests", _gate(delay=0.1)),
+                GateTask("linting", _gate(passed=False)),
+                GateTask("formatting", _gate()),
+            ]
+        )
+
+        assert outcomes["tests"].passed is True
+        assert outcomes["tests"].cancelled is False
+        assert outcomes["formatting"].cancelled is True
+
+    def test_optional_gate_failure_does_not_stop_run(self):
+        """Test a failing optional gate doesn't cancel the remaining gates."""
+        outcomes = GateScheduler(max_parallel=1, fail_fast=True).run(
+            [
+                GateTask("context7", _gate(passed=False), required=False),
+                GateTask("linting", _gate()),
+            ]
+        )
+
+        assert outcomes["linting"].passed is True
+        assert not any(outcome.cancelled for outcome in outcomes.values())
+
+    def test_gates_without_history_start_last(self):
+        """Test gates with unknown duration keep declaration order after known gates."""
+        scheduler = GateScheduler(fail_fast=True, expected_durations={"linting": 1.0})
+        tasks = [GateTask(name, _gate()) for name in ("tests", "security", "linting")]
+
+        assert [task.name for task in scheduler._start_order(tasks)] == [
+            "linting",
+            "tests",
+            "security",
+        ]
@@ -0,0 +1,305 @@
+"""Unit tests for test impact analysis."""
+
+import json
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from solokit.core.command_runner import CommandResult
+from solokit.quality.test_impact import (
+    ImpactPlan,
+    TestImpactAnalyzer,
+    get_impact_file,
+    load_impact_state,
+    read_coverage_contexts,
+    strip_pytest_paths,
+)
+
+PYTEST_COMMAND = ["pytest", "--cov=src", "--cov-report=json", "tests"]
+
+
+def _write_coverage_db(path, rows):
+    """Write a minimal coverage.py SQLite data file with (file, context) rows."""
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);"
+        "CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);"
+        "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+    )
+    files, contexts = {}, {}
+    for file_path, context in rows:
+        file_id = files.setdefault(str(file_path), len(files) + 1)
+        context_id = contexts.setdefault(context, len(contexts) + 1)
+        connection.execute("INSERT OR IGNORE INTO file VALUES (?, ?)", (file_id, str(file_path)))
+        connection.execute("INSERT OR IGNORE INTO context VALUES (?, ?)", (context_id, context))
+        connection.execute("INSERT INTO line_bits VALUES (?, ?, x'01')", (file_id, context_id))
+    connection.commit()
+    connection.close()
+
+
+@pytest.fixture
+def git_repo_files():
+    """Two modules with a test for each, committed to the test repository."""
+    files = {}
+    for name in ("a", "b"):
+        files[f"src/{name}.py"] = f"{name} = 1\n"
+        files[f"tests/test_{name}.py"] = "def test(): pass\n"
+    return files
+
+
+def _record_full_run(git_repo):
+    """Record a passing full run whose coverage maps each test to its module."""
+    _write_coverage_db(
+        git_repo / ".coverage",
+        [
+            (git_repo / "src" / "a.py", "tests/test_a.py::test|run"),
+            (git_repo / "src" / "b.py", "tests/test_b.py::test|run"),
+            (git_repo / "src" / "a.py", ""),
+        ],
+    )
+    analyzer = TestImpactAnalyzer(git_repo, "python")
+    plan = analyzer.plan(PYTEST_COMMAND)
+    analyzer.record(plan, passed=True)
+    return analyzer
+
+
+class TestReadCoverageContexts:
+    """Tests for read_coverage_contexts."""
+
+    def test_maps_test_files_to_covered_files(self, tmp_path):
+        """Test contexts are grouped by test file; empty contexts and outside files ignored."""
+        coverage_file = tmp_path / ".coverage"
+        _write_coverage_db(
+            coverage_file,
+            [
+                (tmp_path / "src" / "a.py", "tests/test_a.py::test_one|run"),
+                (tmp_path / "src" / "b.py", "tests/test_a.py::TestX::test_two|setup"),
+                (tmp_path / "src" / "b.py", "tests/test_b.py::test|run"),
+                (tmp_path / "src" / "c.py", ""),
+                ("/elsewhere/lib.py", "tests/test_b.py::test|run"),
+            ],
+        )
+
+        tests = read_coverage_contexts(coverage_file, tmp_path)
+
+        assert tests == {
+            "tests/test_a.py": ["src/a.py", "src/b.py"],
+            "tests/test_b.py": ["src/b.py"],
+        }
+
+    def test_missing_or_invalid_file(self, tmp_path):
+        """Test an empty map is returned for missing or unreadable data files."""
+        invalid = tmp_path / ".coverage"
+        invalid.write_text("not a database")
+
+        assert read_coverage_contexts(tmp_path / "missing", tmp_path) == {}
+        assert read_coverage_contexts(invalid, tmp_path) == {}
+
+
+class TestStripPytestPaths:
+    """Tests for strip_pytest_paths."""
+
+    def test_removes_paths_and_coverage_threshold(self, tmp_path):
+        """Test positional test paths and --cov-fail-under are removed, option values kept."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tests").mkdir()
+        command = ["pytest", "-v", "tests", "--cov", "src", "--cov-fail-under", "80", "-q"]
+
+        assert strip_pytest_paths(command, 1, tmp_path) == ["pytest", "-v", "--cov", "src", "-q"]
+        assert strip_pytest_paths(["pytest", "--cov-fail-under=80"], 1, tmp_path) == ["pytest"]
+
+    def test_ambiguous_path_after_unknown_option(self, tmp_path):
+        """Test a path following an unknown long option cannot be stripped safely."""
+        (tmp_path / "tests").mkdir()
+
+        assert strip_pytest_paths(["pytest", "--custom-flag", "tests"], 1, tmp_path) is None
+
+
+class TestPythonImpactPlan:
+    """Tests for TestImpactAnalyzer with pytest."""
+
+    def test_first_run_is_full_and_records_contexts(self, git_repo):
+        """Test the first run is a full run with coverage contexts enabled."""
+        plan = TestImpactAnalyzer(git_repo, "python").plan(PYTEST_COMMAND)
+
+        assert plan.impacted is False
+        assert plan.full_run_reason == "no impact map from a full run"
+        assert plan.command == [*PYTEST_COMMAND, "--cov-context=test"]
+
+    def test_passing_full_run_records_map(self, git_repo, run_git):
+        """Test a passing full run stores the map at HEAD."""
+        _record_full_run(git_repo)
+
+        state = load_impact_state(git_repo)
+        assert state["commit"] == run_git(git_repo, "rev-parse", "HEAD")
+        assert state["runs_since_full"] == 0
+        assert state["tests"] == {
+            "tests/test_a.py": ["src/a.py"],
+            "tests/test_b.py": ["src/b.py"],
+        }
+
+    def test_failed_full_run_not_recorded(self, git_repo):
+        """Test a failing full run leaves no map behind."""
+        _write_coverage_db(
+            git_repo / ".coverage", [(git_repo / "src" / "a.py", "tests/test_a.py::t")]
+        )
+        analyzer = TestImpactAnalyzer(git_repo, "python")
+
+        analyzer.record(analyzer.plan(PYTEST_COMMAND), passed=False)
+
+        assert not get_impact_file(git_repo).exists()
+
+    def test_selects_tests_covering_changed_files(self, git_repo):
+        """Test only tests covering changed modules run, without the original test path."""
+        analyzer = _record_full_run(git_repo)
+        (git_repo / "src" / "a.py").write_text("a = 2\n")
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.impacted is True
+        assert plan.selected == ["tests/test_a.py"]
+        assert plan.command == ["pytest", "--cov=src", "--cov-report=json", "tests/test_a.py"]
+        assert plan.summary()["selected"] == 1
+        assert plan.summary()["skipped"] == 1
+
+    def test_selects_changed_and_new_test_files(self, git_repo):
+        """Test edited and newly added test files are selected."""
+        analyzer = _record_full_run(git_repo)
+        (git_repo / "tests" / "test_b.py").write_text("def test(): assert True\n")
+        (git_repo / "tests" / "test_c.py").write_text("def test(): pass\n")
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.selected == ["tests/test_b.py", "tests/test_c.py"]
+        assert plan.total == 3
+
+    def test_no_changes_selects_nothing(self, git_repo):
+        """Test an unchanged project selects no tests."""
+        analyzer = _record_full_run(git_repo)
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.impacted is True
+        assert plan.selected == []
+
+    @pytest.mark.parametrize(
+        "path, reason",
+        [
+            ("tests/conftest.py", "configuration changed: tests/conftest.py"),
+            ("pyproject.toml", "configuration changed: pyproject.toml"),
+            ("tests/data/input.json", "test data changed: tests/data/input.json"),
+        ],
+    )
+    def test_full_run_triggers(self, git_repo, path, reason):
+        """Test test configuration and test data changes force a full run."""
+        analyzer = _record_full_run(git_repo)
+        (git_repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (git_repo / path).write_text("{}\n")
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.impacted is False
+        assert plan.full_run_reason == reason
+        assert "--cov-context=test" in plan.command
+
+    def test_all_tests_impacted_runs_full(self, git_repo):
+        """Test a selection covering every test becomes a full run that refreshes the map."""
+        analyzer = _record_full_run(git_repo)
+        (git_repo / "src" / "a.py").write_text("a = 2\n")
+        (git_repo / "src" / "b.py").write_text("b = 2\n")
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.full_run_reason == "all tests impacted"
+
+    def test_periodic_and_forced_full_runs(self, git_repo):
+        """Test full runs every N impacted runs and when requested."""
+        analyzer = _record_full_run(git_repo)
+        analyzer.full_run_every = 2
+
+        assert analyzer.plan(PYTEST_COMMAND, force_full=True).full_run_reason == (
+            "full run requested"
+        )
+        for _ in range(2):
+            plan = analyzer.plan(PYTEST_COMMAND)
+            assert plan.impacted is True
+            analyzer.record(plan, passed=True)
+
+        assert analyzer.plan(PYTEST_COMMAND).full_run_reason == "periodic full run (every 2 runs)"
+
+    def test_rewritten_history_runs_full(self, git_repo):
+        """Test a map recorded on a commit no longer in history is not used."""
+        analyzer = _record_full_run(git_repo)
+        impact_file = get_impact_file(git_repo)
+        state = json.loads(impact_file.read_text())
+        state["commit"] = "0" * 40
+        impact_file.write_text(json.dumps(state))
+
+        plan = analyzer.plan(PYTEST_COMMAND)
+
+        assert plan.full_run_reason == "history changed since last full run"
+
+    @pytest.mark.parametrize(
+        "command, reason",
+        [
+            (["tox"], "test command is not pytest"),
+            (["pytest", "tests"], "test command does not collect coverage"),
+        ],
+    )
+    def test_unsupported_commands(self, git_repo, command, reason):
+        """Test commands that cannot be restricted or mapped always run in full."""
+        plan = TestImpactAnalyzer(git_repo, "python").plan(command)
+
+        assert plan.impacted is False
+        assert plan.full_run_reason == reason
+        assert plan.command == command
+
+
+class TestJestImpactPlan:
+    """Tests for TestImpactAnalyzer with Jest."""
+
+    def _listing(self, *paths):
+        return CommandResult(
+            returncode=0,
+            stdout="\n".join(str(path) for path in paths),
+            stderr="",
+            command=["jest"],
+            duration_seconds=0.1,
+        )
+
+    def test_related_tests_selected(self, git_repo, run_git):
+        """Test Jest's related tests for changed files are selected, without --coverage."""
+        (git_repo / "tests" / "a.test.js").write_text("")
+        (git_repo / "tests" / "b.test.js").write_text("")
+        run_git(git_repo, "add", "tests")
+        run_git(git_repo, "commit", "-q", "-m", "add js tests")
+        runner = Mock()
+        analyzer = TestImpactAnalyzer(git_repo, "javascript", runner=runner)
+        analyzer.record(ImpactPlan(["npx", "jest"]), passed=True)
+        (git_repo / "src" / "a.js").write_text("")
+        runner.run_many.return_value = [
+            self._listing(git_repo / "tests" / "a.test.js", git_repo / "tests" / "b.test.js"),
+            self._listing(git_repo / "tests" / "a.test.js"),
+        ]
+
+        plan = analyzer.plan(["npx", "jest", "--coverage"])
+
+        assert plan.impacted is True
+        assert plan.command == ["npx", "jest", "--findRelatedTests", "src/a.js"]
+        assert plan.summary() == {
+            "impacted": True,
+            "base_ref": run_git(git_repo, "rev-parse", "HEAD"),
+            "selected": 1,
+            "skipped": 1,
+        }
+        listed = runner.run_many.call_args[0][0]
+        assert listed[0] == ["npx", "jest", "--listTests"]
+
+    def test_npm_test_requires_jest_script(self, git_repo):
+        """Test npm test is only restricted when its script runs Jest."""
+        (git_repo / "package.json").write_text(json.dumps({"scripts": {"test": "mocha"}}))
+
+        plan = TestImpactAnalyzer(git_repo, "javascript").plan(["npm", "test"])
+
+        assert plan.full_run_reason == "test command does not run Jest"
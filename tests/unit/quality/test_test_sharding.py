@@ -0,0 +1,280 @@
+"""Unit tests for parallel test workers (sharding)."""
+
+import sys
+from unittest.mock import Mock
+from xml.etree import ElementTree
+
+import pytest
+
+from solokit.core.command_runner import CommandResult, CommandRunner
+from solokit.quality.test_sharding import (
+    ShardedTestRunner,
+    _merge_returncodes,
+    _remove_options,
+    balance_shards,
+    get_durations_file,
+    junit_file_durations,
+    load_test_durations,
+    merge_junit_reports,
+    save_test_durations,
+)
+
+PYTEST = [sys.executable, "-m", "pytest", "-p", "no:cacheprovider"]
+
+
+def _junit(path, cases, failures=0):
+    """Write a JUnit report with (classname, name, time) test cases."""
+    body = "".join(
+        f'<testcase classname="{classname}" name="{name}" time="{seconds}"/>'
+        for classname, name, seconds in cases
+    )
+    path.write_text(
+        f'<testsuites><testsuite name="pytest" tests="{len(cases)}" failures="{failures}" '
+        f'errors="0" skipped="0">{body}</testsuite></testsuites>'
+    )
+    return path
+
+
+def _result(returncode=0, stdout="", stderr=""):
+    return CommandResult(
+        returncode=returncode,
+        stdout=stdout,
+        stderr=stderr,
+        command=["pytest"],
+        duration_seconds=0.1,
+    )
+
+
+class TestBalanceShards:
+    """Tests for balance_shards."""
+
+    def test_balances_by_duration(self):
+        """Test long files are spread so shard totals are close."""
+        durations = {"a.py": 10.0, "b.py": 6.0, "c.py": 5.0, "d.py": 4.0}
+
+        shards = balance_shards(list(durations), durations, 2)
+
+        assert [shard.files for shard in shards] == [["a.py", "d.py"], ["b.py", "c.py"]]
+        assert [shard.expected_seconds for shard in shards] == [14.0, 11.0]
+
+    def test_unknown_files_use_average_duration(self):
+        """Test files without history are assumed to take the average time."""
+        shards = balance_shards(["a.py", "new.py", "z.py"], {"a.py": 4.0, "z.py": 2.0}, 3)
+
+        assert {shard.files[0]: shard.expected_seconds for shard in shards} == {
+            "a.py": 4.0,
+            "new.py": 3.0,
+            "z.py": 2.0,
+        }
+
+    def test_more_shards_than_files(self):
+        """Test empty shards are dropped."""
+        shards = balance_shards(["a.py"], {}, 4)
+
+        assert len(shards) == 1
+        assert shards[0].files == ["a.py"]
+
+
+class TestJunitReports:
+    """Tests for JUnit merging and per-file durations."""
+
+    def test_merge_sums_counts(self, tmp_path):
+        """Test suites from every shard report are merged with summed counts."""
+        first = _junit(tmp_path / "1.xml", [("tests.test_a", "t1", 1)], failures=1)
+        second = _junit(tmp_path / "2.xml", [("tests.test_b", "t2", 2), ("tests.test_b", "t3", 1)])
+        output = tmp_path / "out" / "junit.xml"
+
+        merge_junit_reports([first, second, tmp_path / "missing.xml"], output)
+
+        root = ElementTree.parse(output).getroot()
+        assert root.get("tests") == "3"
+        assert root.get("failures") == "1"
+        assert len(root.findall("testsuite")) == 2
+
+    def test_file_durations_from_classnames(self, tmp_path):
+        """Test case times are summed per file via the dotted classname."""
+        report = _junit(
+            tmp_path / "r.xml",
+            [
+                ("tests.test_a", "t1", 1.5),
+                ("tests.test_a.TestX", "t2", 0.5),
+                ("tests.test_ab", "t3", 3),
+            ],
+        )
+
+        durations = junit_file_durations(report, ["tests/test_a.py", "tests/test_ab.py"])
+
+        assert durations == {"tests/test_a.py": 2.0, "tests/test_ab.py": 3.0}
+
+    def test_durations_persisted_only_in_initialized_project(self, tmp_path):
+        """Test durations merge into .session/cache and need a .session directory."""
+        save_test_durations(tmp_path, {"tests/test_a.py": 1.0})
+        assert not get_durations_file(tmp_path).exists()
+
+        (tmp_path / ".session").mkdir()
+        save_test_durations(tmp_path, {"tests/test_a.py": 1.0})
+        save_test_durations(tmp_path, {"tests/test_b.py": 2.0})
+
+        assert load_test_durations(tmp_path) == {"tests/test_a.py": 1.0, "tests/test_b.py": 2.0}
+
+
+class TestHelpers:
+    """Tests for command and exit code helpers."""
+
+    def test_remove_options(self):
+        """Test options are removed in both --opt=value and --opt value forms."""
+        command = ["pytest", "--cov", "src", "--cov-report=json", "--junitxml", "r.xml", "-q"]
+
+        assert _remove_options(command, ("--cov", "--cov-report", "--junitxml")) == [
+            "pytest",
+            "-q",
+        ]
+        assert _remove_options(["pytest", "--cov", "-q"], ("--cov",)) == ["pytest", "-q"]
+
+    @pytest.mark.parametrize(
+        "returncodes, expected",
+        [([0, 0], 0), ([0, 5], 0), ([5, 5], 5), ([0, 1, 5], 1), ([2, 1], 2)],
+    )
+    def test_merge_returncodes(self, returncodes, expected):
+        """Test shard exit codes combine like a single pytest run."""
+        assert _merge_returncodes(returncodes) == expected
+
+
+class TestShardedTestRunner:
+    """Tests for ShardedTestRunner."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a project with three test files and a .session directory."""
+        (tmp_path / ".session").mkdir()
+        tests = tmp_path / "tests"
+        tests.mkdir()
+        (tests / "__init__.py").write_text("")
+        for name in ("a", "b", "c"):
+            (tests / f"test_{name}.py").write_text(f"def test_{name}():\n    assert True\n")
+        return tmp_path
+
+    def test_native_shards_merge_results(self, project):
+        """Test files are split across real pytest processes and reports merged."""
+        runner = ShardedTestRunner(
+            project,
+            2,
+            runner=CommandRunner(),
+            log_file=project / ".session" / "logs" / "tests.log",
+        )
+
+        result = runner.run([*PYTEST, "-q", "--junitxml=junit.xml", "tests"], timeout=120)
+
+        assert result.returncode == 0
+        assert "shard 1/2" in result.stdout
+        assert "shard 2/2" in result.stdout
+        assert ElementTree.parse(project / "junit.xml").getroot().get("tests") == "3"
+        assert set(load_test_durations(project)) == {
+            "tests/test_a.py",
+            "tests/test_b.py",
+            "tests/test_c.py",
+        }
+        assert result.log_file == project / ".session" / "logs" / "tests.log"
+        assert "shard 2/2" in result.log_file.read_text()
+
+    def test_native_shards_report_failures(self, project):
+        """Test a failing shard fails the merged run."""
+        (project / "tests" / "test_b.py").write_text("def test_b():\n    assert False\n")
+
+        result = ShardedTestRunner(project, 3, runner=CommandRunner()).run(
+            [*PYTEST, "-q", "tests"], timeout=120
+        )
+
+        assert result.returncode == 1
+        assert "1 failed" in result.stdout
+
+    def test_single_process_for_one_file(self, project):
+        """Test no sharding happens when only one test file is collected."""
+        result = ShardedTestRunner(project, 4, runner=CommandRunner()).run(
+            [*PYTEST, "-q", "tests/test_a.py"], timeout=120
+        )
+
+        assert result.returncode == 0
+        assert "shard" not in result.stdout
+
+    def test_uses_xdist_when_installed(self, tmp_path):
+        """Test the run is delegated to pytest-xdist when it is registered."""
+        runner = Mock()
+        runner.run.side_effect = [
+            _result(stdout="registered third-party plugins:\n  xdist-3.5.0 at /x"),
+            _result(stdout="passed"),
+        ]
+
+        ShardedTestRunner(tmp_path, 4, runner=runner).run(["pytest", "--cov=src"], timeout=60)
+
+        assert runner.run.call_args_list[0][0][0] == ["pytest", "-VV"]
+        assert runner.run.call_args_list[1][0][0] == ["pytest", "--cov=src", "-n", "4"]
+
+    def test_coverage_combined_and_reported(self, project):
+        """Test shard coverage data is combined and the requested reports regenerated."""
+        runner = Mock()
+        calls = []
+
+        def fake_run(command, **kwargs):
+            calls.append((command, kwargs))
+            if "-VV" in command:
+                return _result()
+            if "--collect-only" in command:
+                return _result(stdout="tests/test_a.py::test_a\ntests/test_b.py::test_b\n")
+            if "--junitxml" in " ".join(command):
+                # A shard: leave coverage data where COVERAGE_FILE points
+                open(kwargs["env"]["COVERAGE_FILE"], "w").close()
+            return _result(stdout="TOTAL 90%\n" if command[-1] == "report" else "ok")
+
+        runner.run.side_effect = fake_run
+        command = ["pytest", "--cov=src", "--cov-report=json", "--cov-report=term", "tests"]
+
+        result = ShardedTestRunner(project, 2, runner=runner).run(command, timeout=60)
+
+        collect = next(c for c, _ in calls if "--collect-only" in c)
+        assert "--cov=src" not in collect
+        shards = [c for c, _ in calls if any(arg.startswith("--junitxml=") for arg in c)]
+        assert len(shards) == 2
+        assert all("--cov-report=" in c and "--cov-report=json" not in c for c in shards)
+        coverage = [c[3:] for c, _ in calls if c[1:3] == ["-m", "coverage"]]
+        assert coverage[0][0] == "combine"
+        assert len(coverage[0]) == 3
+        assert coverage[1:] == [["json"], ["report"]]
+        assert result.stdout.endswith("TOTAL 90%\n")
+        assert result.returncode == 0
+
+    @pytest.mark.parametrize(
+        ("reports", "coverage_calls"),
+        [
+            (["--cov-report=term"], [["report", "--fail-under=95"]]),
+            (["--cov-report=json"], [["json"], ["report", "--fail-under=95"]]),
+        ],
+    )
+    def test_coverage_threshold_checked_after_combining(self, project, reports, coverage_calls):
+        """Test --cov-fail-under is checked against the combined coverage, not per shard."""
+        runner = Mock()
+        calls = []
+
+        def fake_run(command, **kwargs):
+            calls.append(command)
+            if "-VV" in command:
+                return _result()
+            if "--collect-only" in command:
+                return _result(stdout="tests/test_a.py::test_a\ntests/test_b.py::test_b\n")
+            if "--junitxml" in " ".join(command):
+                open(kwargs["env"]["COVERAGE_FILE"], "w").close()
+            if "report" in command:
+                # coverage report exits 2 when below --fail-under
+                return _result(returncode=2, stdout="TOTAL 90%\n")
+            return _result(stdout="ok")
+
+        runner.run.side_effect = fake_run
+        command = ["pytest", "--cov=src", *reports, "--cov-fail-under=95", "tests"]
+
+        result = ShardedTestRunner(project, 2, runner=runner).run(command, timeout=60)
+
+        shards = [c for c in calls if any(arg.startswith("--junitxml=") for arg in c)]
+        assert all("--cov-fail-under=95" not in c for c in shards)
+        assert [c[3:] for c in calls if c[1:3] == ["-m", "coverage"]][1:] == coverage_calls
+        assert result.returncode == 1
+        assert "Required test coverage of 95% not reached" in result.stdout
@@ -0,0 +1,222 @@
+"""Unit tests for the briefing context budget."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from solokit.session.briefing.budget import (
+    ContextBudgeter,
+    allocate,
+    budget_bytes,
+    collapse_tree,
+    excerpt_markdown,
+    spec_paths,
+    truncate_text,
+)
+from solokit.session.briefing.formatter import BriefingFormatter
+
+
+def make_tree(vendor_files=200):
+    """Build a tree listing in the fallback format with a large vendor directory."""
+    lines = [
+        "project/",
+        "├── src",
+        "│   ├── app",
+        "│   │   ├── models.py",
+        "│   │   └── views.py",
+        "│   └── lib",
+        "│       └── util.py",
+        "├── vendor",
+    ]
+    lines += [f"│   ├── package_{i}.js" for i in range(vendor_files - 1)]
+    lines += [f"│   └── package_{vendor_files - 1}.js", "└── README.md"]
+    return "\n".join(lines)
+
+
+class TestBudgetBytes:
+    """Tests for budget_bytes."""
+
+    def test_smaller_limit_applies(self):
+        """Test tokens are converted to bytes and the smaller limit wins."""
+        assert budget_bytes(100_000, 0) == 100_000
+        assert budget_bytes(100_000, 10_000) == 40_000
+        assert budget_bytes(0, 10_000) == 40_000
+        assert budget_bytes(0, 0) == 0
+
+
+class TestAllocate:
+    """Tests for allocate."""
+
+    def test_everything_fits(self):
+        """Test sections within the budget keep their full size."""
+        assert allocate({"a": 10, "b": 20}, 100, ["a", "b"]) == {"a": 10, "b": 20}
+
+    def test_unused_share_goes_to_larger_sections(self):
+        """Test small sections keep their size and the rest is split by priority."""
+        limits = allocate({"a": 10, "b": 1000, "c": 1000}, 310, ["a", "b", "c"])
+
+        assert limits["a"] == 10
+        assert limits["b"] > limits["c"]
+        assert sum(limits.values()) <= 310
+
+    def test_no_budget_left(self):
+        """Test a negative budget allots nothing."""
+        assert allocate({"a": 10}, -5, ["a"]) == {"a": 0}
+
+
+class TestTruncateText:
+    """Tests for truncate_text."""
+
+    def test_short_text_unchanged(self):
+        """Test text within the limit is returned as is."""
+        assert truncate_text("one\ntwo", 100, "file.txt") == "one\ntwo"
+
+    def test_cuts_at_line_boundary(self):
+        """Test long text is cut after a whole line and points to the full file."""
+        text = "\n".join(f"line {i}" for i in range(100))
+
+        result = truncate_text(text, 80, "stack.txt")
+
+        assert result.startswith("line 0\nline 1\n")
+        assert result.endswith("[... truncated, see stack.txt]")
+        assert len(result.encode()) <= 80
+
+
+class TestSpecPaths:
+    """Tests for spec_paths."""
+
+    def test_finds_paths_and_file_names(self):
+        """Test directory paths and file names are extracted without punctuation."""
+        spec = "Update src/app/models.py and ./docs/guide/. Also touch config.json."
+
+        assert {"src/app/models.py", "docs/guide", "config.json"} <= spec_paths(spec)
+
+
+class TestCollapseTree:
+    """Tests for collapse_tree."""
+
+    def test_small_tree_unchanged(self):
+        """Test a tree within the limit is returned as is."""
+        tree = make_tree(vendor_files=2)
+        assert collapse_tree(tree, [], 10_000, "tree.txt") == tree
+
+    def test_keeps_relevant_paths_and_collapses_the_rest(self):
+        """Test directories leading to relevant paths stay expanded."""
+        result = collapse_tree(make_tree(), ["app/models.py"], 300, "tree.txt")
+
+        assert "│   │   ├── models.py" in result
+        assert "├── vendor  (200 entries hidden)" in result
+        assert "package_0.js" not in result
+        assert "└── README.md" in result
+        assert result.endswith("[... truncated, see tree.txt]")
+        assert len(result.encode()) <= 300
+
+    def test_expands_shallow_directories_while_they_fit(self):
+        """Test spare room is used to expand directories breadth-first."""
+        result = collapse_tree(make_tree(), [], 210, "tree.txt")
+
+        # src and lib fit, app and vendor don't
+        assert "│   ├── app  (2 entries hidden)" in result
+        assert "│       └── util.py" in result
+        assert "vendor  (200 entries hidden)" in result
+
+    def test_parses_tree_command_output(self):
+        """Test non-breaking spaces used by the tree command are handled."""
+        tree = "\n".join(
+            [".", "├──\u00a0src", "│\u00a0\u00a0 └──\u00a0main.py", "└──\u00a0vendor"]
+            + [f"\u00a0\u00a0\u00a0 ├──\u00a0file_{i}.txt" for i in range(100)]
+            + ["", "3 directories, 101 files"]
+        )
+
+        result = collapse_tree(tree, ["src/main.py"], 200, "tree.txt")
+
+        assert "│\u00a0\u00a0 └──\u00a0main.py" in result
+        assert "└──\u00a0vendor  (100 entries hidden)" in result
+        assert "3 directories, 101 files" in result
+        assert len(result.encode()) <= 200
+
+
+class TestExcerptMarkdown:
+    """Tests for excerpt_markdown."""
+
+    def test_keeps_introduction_and_relevant_sections(self):
+        """Test sections sharing keywords with the work item are preferred."""
+        doc = (
+            "# Architecture\n\nOverview.\n\n"
+            + "## Billing\n\n"
+            + "Invoices and payments. " * 20
+            + "\n\n## Authentication\n\nLogin sessions use tokens.\n\n"
+            + "## Deployment\n\n"
+            + "Containers and clusters. " * 20
+            + "\n"
+        )
+
+        result = excerpt_markdown(doc, {"login", "tokens"}, 300, "docs/architecture.md")
+
+        assert result.startswith("# Architecture\n\nOverview.")
+        assert "## Authentication" in result
+        assert "## Billing" not in result
+        assert result.endswith("[... truncated, see docs/architecture.md]")
+        assert len(result.encode()) <= 300
+
+    def test_headings_in_code_blocks_do_not_split(self):
+        """Test comment lines in fenced code aren't treated as headings."""
+        doc = "# Title\n\n```bash\n# install\npip install x\n```\n\n## Other\n\n" + "x" * 500
+
+        result = excerpt_markdown(doc, set(), 200, "README.md")
+
+        assert "# install\npip install x\n```" in result
+        assert "## Other" not in result
+
+
+class TestContextBudgeter:
+    """Tests for ContextBudgeter."""
+
+    def make_sections(self, formatter, tree):
+        return {
+            "project_docs": formatter.render_project_docs({}),
+            "stack": formatter.render_stack("Python 3.11"),
+            "tree": formatter.render_tree(tree),
+            "spec_validation": "",
+            "spec": formatter.render_spec("x" * 500),
+            "milestone": "",
+            "learnings": "",
+        }
+
+    def make_budgeter(self, formatter, max_bytes):
+        return ContextBudgeter(
+            formatter,
+            max_bytes,
+            stack_file=Path(".session/tracking/stack.txt"),
+            tree_file=Path(".session/tracking/tree.txt"),
+            learnings_file=Path(".session/tracking/learnings.json"),
+        )
+
+    def test_within_budget_unchanged(self):
+        """Test sections are untouched (and git isn't queried) under the budget."""
+        formatter = BriefingFormatter()
+        tree = make_tree()
+        sections = self.make_sections(formatter, tree)
+        changed_files = Mock(return_value=[])
+
+        result = self.make_budgeter(formatter, 100_000).fit(
+            sections, {}, "Python 3.11", tree, "", changed_files
+        )
+
+        assert result is sections
+        changed_files.assert_not_called()
+
+    def test_shrinks_tree_but_not_spec(self):
+        """Test an oversized tree is collapsed around changed files and the spec kept."""
+        formatter = BriefingFormatter()
+        tree = make_tree()
+        sections = self.make_sections(formatter, tree)
+
+        result = self.make_budgeter(formatter, 1500).fit(
+            sections, {}, "Python 3.11", tree, "Spec", lambda: ["src/lib/util.py"]
+        )
+
+        assert result["spec"] == sections["spec"]
+        assert result["stack"] == sections["stack"]
+        assert "util.py" in result["tree"]
+        assert "[... truncated, see .session/tracking/tree.txt]" in result["tree"]
+        assert sum(len(text.encode()) for text in result.values()) <= 1500
@@ -69,7 +69,9 @@ class TestDetectLanguages:
         (temp_project / "utils.py").touch()
 
         # Act
-        with patch.object(stack_generator, "_detect_language_version", return_value="3.9.0"):
+        with patch.object(
+            stack_generator, "_detect_language_versions", return_value={"python": "3.9.0"}
+        ):
             languages = stack_generator.detect_languages()
 
         # Assert
@@ -84,7 +86,7 @@ class TestDetectLanguages:
         (temp_project / "server.rs").touch()
 
         # Act
-        with patch.object(stack_generator, "_detect_language_version", return_value=""):
+        with patch.object(stack_generator, "_detect_language_versions", return_value={}):
             languages = stack_generator.detect_languages()
 
         # Assert
@@ -101,7 +103,7 @@ class TestDetectLanguages:
         (temp_project / "main.py").touch()
 
         # Act
-        with patch.object(stack_generator, "_detect_language_version", return_value=""):
+        with patch.object(stack_generator, "_detect_language_versions", return_value={}):
             languages = stack_generator.detect_languages()
 
         # Assert
@@ -122,7 +124,7 @@ class TestDetectLanguages:
         (temp_project / "main.py").touch()
 
         # Act
-        with patch.object(stack_generator, "_detect_language_version", return_value=""):
+        with patch.object(stack_generator, "_detect_language_versions", return_value={}):
             languages = stack_generator.detect_languages()
 
         # Assert
@@ -136,11 +138,13 @@ class TestDetectLanguageVersion:
         """Test successful Python version detection."""
         # Arrange
         mock_result = Mock()
-        mock_result.returncode = 0
+        mock_result.success = True
         mock_result.stdout = "Python 3.9.7"
 
         # Act
-        with patch("subprocess.run", return_value=mock_result):
+        with patch(
+            "solokit.core.command_runner.CommandRunner.run_many", return_value=[mock_result]
+        ):
             version = stack_generator._detect_language_version("python")
 
         # Assert
@@ -150,11 +154,13 @@ class TestDetectLanguageVersion:
         """Test version detection with no version match."""
         # Arrange
         mock_result = Mock()
-        mock_result.returncode = 0
+        mock_result.success = True
         mock_result.stdout = "Some output without version"
 
         # Act
-        with patch("subprocess.run", return_value=mock_result):
+        with patch(
+            "solokit.core.command_runner.CommandRunner.run_many", return_value=[mock_result]
+        ):
             version = stack_generator._detect_language_version("python")
 
         # Assert
@@ -163,7 +169,10 @@ class TestDetectLanguageVersion:
     def test_detect_language_version_subprocess_error(self, stack_generator):
         """Test version detection handles subprocess errors."""
         # Act
-        with patch("subprocess.run", side_effect=Exception("Command failed")):
+        with patch(
+            "solokit.core.command_runner.CommandRunner.run_many",
+            side_effect=Exception("Command failed"),
+        ):
             version = stack_generator._detect_language_version("python")
 
         # Assert
@@ -177,13 +186,34 @@ class TestDetectLanguageVersion:
         # Assert
         assert version == ""
 
+    def test_detect_language_versions_batches_probes(self, stack_generator):
+        """Test several languages are probed with one concurrent batch."""
+        # Arrange
+        python_result = Mock(success=True, stdout="Python 3.11.4")
+        go_result = Mock(success=True, stdout="go version go1.21.0 linux/amd64")
+
+        # Act
+        with patch(
+            "solokit.core.command_runner.CommandRunner.run_many",
+            return_value=[python_result, go_result],
+        ) as mock_run_many:
+            versions = stack_generator._detect_language_versions(["python", "javascript", "go"])
+
+        # Assert
+        mock_run_many.assert_called_once()
+        assert len(mock_run_many.call_args[0][0]) == 2
+        assert versions == {"python": "3.11.4", "javascript": "", "go": "1.21.0"}
+
     def test_detect_language_version_timeout(self, stack_generator):
         """Test version detection timeout is handled."""
         # Arrange
         import subprocess
 
         # Act
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 2)):
+        with patch(
+            "solokit.core.command_runner.CommandRunner.run_many",
+            side_effect=subprocess.TimeoutExpired("cmd", 2),
+        ):
             version = stack_generator._detect_language_version("python")
 
         # Assert
@@ -0,0 +1,200 @@
+"""Unit tests for the SessionBriefing orchestrator."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from solokit.core.exceptions import ErrorCode, GitError
+from solokit.session.briefing.orchestrator import SessionBriefing
+
+ITEM = {"title": "Feature", "type": "feature", "priority": "high", "status": "not_started"}
+
+
+def make_briefing(tmp_path, fresh=False):
+    """Create a SessionBriefing with every context loader mocked."""
+    briefing = SessionBriefing(
+        session_dir=tmp_path / ".session", project_root=tmp_path, fresh=fresh
+    )
+    briefing.doc_loader = Mock(**{"load_project_docs.return_value": {"vision.md": "Vision"}})
+    briefing.stack_detector = Mock(**{"load_current_stack.return_value": "Python 3.11"})
+    briefing.tree_generator = Mock(**{"load_current_tree.return_value": "."})
+    briefing.work_item_loader = Mock(**{"load_work_item_spec.return_value": "# Spec"})
+    briefing.git_context = Mock(**{"check_git_status.return_value": {"status": "clean"}})
+    briefing.milestone_builder = Mock(
+        work_items_file=tmp_path / ".session" / "tracking" / "work_items.json",
+        **{"load_milestone_context.return_value": None},
+    )
+    briefing.learning_loader = Mock(
+        **{"get_relevant_learnings.return_value": [{"category": "gotchas", "content": "Lesson"}]}
+    )
+    briefing.formatter.validate_environment = Mock(return_value=["Python: 3.11"])
+    briefing._validate_spec = Mock(return_value=None)
+    return briefing
+
+
+@pytest.fixture
+def briefing(tmp_path):
+    """Create a SessionBriefing with every context loader mocked."""
+    return make_briefing(tmp_path)
+
+
+class TestGenerateBriefing:
+    """Tests for SessionBriefing.generate_briefing."""
+
+    def test_renders_loaded_context(self, briefing):
+        """Test every loader's result ends up in its section of the briefing."""
+        result = briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "- **Work Item ID:** feature-001" in result
+        assert "- Python: 3.11\n" in result
+        assert "- Status: clean\n" in result
+        assert "### Vision\n\nVision\n\n" in result
+        assert "### Current Stack\n```\nPython 3.11\n```" in result
+        assert "### Project Structure\n```\n.\n```" in result
+        assert "## Work Item Specification\n\n### Spec\n\n## Dependencies\n" in result
+        assert "**gotchas:** Lesson" in result
+        briefing.learning_loader.get_relevant_learnings.assert_called_once_with(
+            {"learnings": []}, ITEM, "# Spec"
+        )
+
+    def test_loaders_run_concurrently(self, briefing):
+        """Test independent loaders overlap instead of running one after another."""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_loader(*args):
+            both_started.wait()
+            return "loaded"
+
+        briefing.stack_detector.load_current_stack.side_effect = wait_for_other_loader
+        briefing.tree_generator.load_current_tree.side_effect = wait_for_other_loader
+
+        result = briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "### Current Stack\n```\nloaded\n```" in result
+        assert "### Project Structure\n```\nloaded\n```" in result
+
+    def test_records_section_timings(self, briefing):
+        """Test load times are recorded per section in a fixed order."""
+        briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert list(briefing.section_timings) == [
+            "project_docs",
+            "stack",
+            "tree",
+            "spec",
+            "environment",
+            "git_status",
+            "spec_validation",
+            "milestone",
+            "learnings",
+        ]
+        assert all(seconds >= 0 for seconds in briefing.section_timings.values())
+
+    def test_git_errors_are_reported_in_briefing(self, briefing):
+        """Test a failing git check doesn't stop the briefing."""
+        briefing.git_context.check_git_status.side_effect = GitError(
+            "not a git repository", ErrorCode.NOT_A_GIT_REPO
+        )
+
+        result = briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "- Status: Error: not a git repository\n" in result
+
+    def test_loader_errors_propagate(self, briefing):
+        """Test errors from other loaders are raised as before."""
+        briefing.doc_loader.load_project_docs.side_effect = OSError("unreadable")
+
+        with pytest.raises(OSError, match="unreadable"):
+            briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+    def test_fits_context_to_configured_budget(self, tmp_path):
+        """Test an oversized tree is shrunk to the briefing budget from config.json."""
+        (tmp_path / ".session").mkdir()
+        (tmp_path / ".session" / "config.json").write_text('{"briefing": {"max_bytes": 2000}}')
+        briefing = make_briefing(tmp_path)
+        briefing.tree_generator.load_current_tree.return_value = ".\n" + "\n".join(
+            f"├── file_{i}.txt" for i in range(1000)
+        )
+        briefing.git_context.get_recently_changed_files.return_value = []
+
+        result = briefing.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "[... truncated, see " in result
+        assert "### Spec" in result
+        assert len(result.encode()) < 4000
+
+
+class TestSectionCache:
+    """Tests for reusing cached briefing sections."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, tmp_path, monkeypatch):
+        """Enable the cache, which requires a .session directory."""
+        monkeypatch.delenv("SOLOKIT_NO_BRIEFING_CACHE")
+        (tmp_path / ".session").mkdir()
+
+    def test_rerun_reuses_every_section(self, tmp_path):
+        """Test a second run with unchanged inputs renders nothing again."""
+        first = make_briefing(tmp_path).generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        rerun = make_briefing(tmp_path)
+        second = rerun.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert second == first
+        assert rerun.cached_sections == {
+            "project_docs",
+            "stack",
+            "tree",
+            "spec_validation",
+            "spec",
+            "milestone",
+            "learnings",
+        }
+        rerun._validate_spec.assert_not_called()
+        rerun.learning_loader.get_relevant_learnings.assert_not_called()
+        rerun.milestone_builder.load_milestone_context.assert_not_called()
+
+    def test_only_stale_sections_are_rendered(self, tmp_path):
+        """Test changed inputs re-render their own sections only."""
+        make_briefing(tmp_path).generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        rerun = make_briefing(tmp_path)
+        rerun.stack_detector.load_current_stack.return_value = "Python 3.12"
+        rerun.work_item_loader.load_work_item_spec.return_value = "# Updated spec"
+        result = rerun.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "### Current Stack\n```\nPython 3.12\n```" in result
+        assert "### Updated spec" in result
+        # The spec feeds validation and learnings ranking, so they're stale too
+        assert rerun.cached_sections == {"project_docs", "tree", "milestone"}
+
+    def test_work_items_change_rerenders_milestone(self, tmp_path):
+        """Test the milestone is re-rendered when work_items.json changes."""
+        work_items_file = tmp_path / ".session" / "tracking" / "work_items.json"
+        work_items_file.parent.mkdir()
+        work_items_file.write_text('{"work_items": {}}')
+        make_briefing(tmp_path).generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        work_items_file.write_text('{"work_items": {"feature-001": {}}}')
+        rerun = make_briefing(tmp_path)
+        rerun.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert "milestone" not in rerun.cached_sections
+        rerun.milestone_builder.load_milestone_context.assert_called_once_with(ITEM)
+
+    def test_fresh_bypasses_and_refreshes_cache(self, tmp_path):
+        """Test --fresh re-renders every section and stores the result."""
+        make_briefing(tmp_path).generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        fresh = make_briefing(tmp_path, fresh=True)
+        fresh.stack_detector.load_current_stack.return_value = "Python 3.12"
+        fresh.generate_briefing("feature-001", ITEM, {"learnings": []})
+
+        assert fresh.cached_sections == set()
+        fresh.learning_loader.get_relevant_learnings.assert_called_once()
+
+        rerun = make_briefing(tmp_path)
+        rerun.stack_detector.load_current_stack.return_value = "Python 3.12"
+        rerun.generate_briefing("feature-001", ITEM, {"learnings": []})
+        assert "stack" in rerun.cached_sections
@@ -0,0 +1,83 @@
+"""Unit tests for the briefing section cache."""
+
+import json
+
+import pytest
+
+from solokit.session.briefing.section_cache import (
+    BRIEFING_CACHE_FILE,
+    BriefingSectionCache,
+    fingerprint,
+)
+
+
+class TestFingerprint:
+    """Tests for fingerprint."""
+
+    def test_same_inputs_same_fingerprint(self):
+        """Test fingerprints are stable for equal inputs."""
+        assert fingerprint("a", b"b", None) == fingerprint("a", b"b", None)
+
+    def test_input_boundaries_are_distinguished(self):
+        """Test moving text between inputs or a missing input changes the fingerprint."""
+        assert fingerprint("ab", "c") != fingerprint("a", "bc")
+        assert fingerprint(None) != fingerprint("")
+
+
+class TestBriefingSectionCache:
+    """Tests for BriefingSectionCache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch):
+        """Undo the suite-wide cache opt-out."""
+        monkeypatch.delenv("SOLOKIT_NO_BRIEFING_CACHE")
+
+    def test_roundtrip(self, tmp_path):
+        """Test a saved section is returned for the same fingerprint only."""
+        cache = BriefingSectionCache(tmp_path)
+        cache.put("stack", "key", "### Current Stack")
+        cache.save()
+
+        reloaded = BriefingSectionCache(tmp_path)
+        assert reloaded.get("stack", "key") == "### Current Stack"
+        assert reloaded.get("stack", "other") is None
+        assert reloaded.get("tree", "key") is None
+
+    def test_disabled_cache_is_not_read_but_written(self, tmp_path):
+        """Test a disabled cache (--fresh) misses but still stores new sections."""
+        fresh = BriefingSectionCache(tmp_path, enabled=False)
+        fresh.put("stack", "key", "new")
+        fresh.save()
+
+        assert fresh.get("stack", "key") is None
+        assert BriefingSectionCache(tmp_path).get("stack", "key") == "new"
+
+    def test_requires_session_dir(self, tmp_path):
+        """Test nothing is cached outside an initialized project."""
+        cache = BriefingSectionCache(tmp_path / ".session")
+        cache.put("stack", "key", "text")
+        cache.save()
+
+        assert cache.get("stack", "key") is None
+        assert not (tmp_path / ".session").exists()
+
+    def test_ignores_other_versions_and_corrupt_files(self, tmp_path):
+        """Test caches from another layout or solokit version are discarded."""
+        cache_file = tmp_path / "cache" / BRIEFING_CACHE_FILE
+        cache_file.parent.mkdir()
+        sections = {"stack": {"fingerprint": "key", "text": "text"}}
+        cache_file.write_text(
+            json.dumps({"schema_version": 1, "solokit_version": "0.0.0", "sections": sections})
+        )
+        assert BriefingSectionCache(tmp_path).get("stack", "key") is None
+
+        cache_file.write_text("{not json")
+        assert BriefingSectionCache(tmp_path).get("stack", "key") is None
+
+    def test_disabled_by_env(self, tmp_path, monkeypatch):
+        """Test SOLOKIT_NO_BRIEFING_CACHE disables reading cached sections."""
+        cache = BriefingSectionCache(tmp_path)
+        cache.put("stack", "key", "text")
+        monkeypatch.setenv("SOLOKIT_NO_BRIEFING_CACHE", "1")
+
+        assert cache.get("stack", "key") is None
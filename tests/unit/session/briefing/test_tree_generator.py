@@ -71,8 +71,9 @@ class TestGenerateTree:
         mock_result.stdout = "project/\n├── file1.py\n└── file2.py"
 
         # Act
-        with patch("subprocess.run", return_value=mock_result):
-            tree = tree_generator.generate_tree()
+        with patch("solokit.project.tree.shutil.which", return_value="/usr/bin/tree"):
+            with patch("subprocess.run", return_value=mock_result):
+                tree = tree_generator.generate_tree()
 
         # Assert
         assert "project/" in tree
@@ -121,8 +122,9 @@ class TestGenerateTree:
         mock_result.stdout = "tree output"
 
         # Act
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            tree_generator.generate_tree()
+        with patch("solokit.project.tree.shutil.which", return_value="/usr/bin/tree"):
+            with patch("subprocess.run", return_value=mock_result) as mock_run:
+                tree_generator.generate_tree()
 
         # Assert
         call_args = mock_run.call_args[0][0]
@@ -14,12 +14,14 @@ Tests cover:
 """
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
 from solokit.core.command_runner import CommandResult
+from solokit.git.objects import CommitInfo
 from solokit.session.complete import (
     auto_extract_learnings,
     check_uncommitted_changes,
@@ -29,6 +31,7 @@ from solokit.session.complete import (
     generate_deployment_summary,
     generate_integration_test_summary,
     generate_summary,
+    get_commit_file_stats,
     # load_curation_config,  # Removed - now in ConfigManager (tested in test_config.py)
     load_status,
     load_work_items,
@@ -39,6 +42,20 @@ from solokit.session.complete import (
     update_all_tracking,
 )
 
+SHA = "a" * 40
+
+
+def make_commit(sha, message):
+    """Build a commit as read by the git object reader."""
+    return CommitInfo(
+        sha=sha,
+        tree=SHA,
+        parents=(),
+        author="Dev <dev@example.com>",
+        author_date=datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc),
+        message=message,
+    )
+
 
 class TestLoadStatus:
     """Tests for load_status function."""
@@ -149,16 +166,11 @@ class TestRunQualityGates:
     def test_run_quality_gates_all_pass(self, mock_gates_class):
         """Test run_quality_gates when all gates pass."""
         # Arrange
+        from solokit.core.config import QualityGatesConfig
+
         mock_gates = MagicMock()
         mock_gates_class.return_value = mock_gates
-        mock_gates.config = {
-            "test_execution": {"required": True},
-            "security": {"required": True},
-            "linting": {"required": True},
-            "formatting": {"required": True},
-            "documentation": {"required": True},
-            "context7": {"required": True},
-        }
+        mock_gates.config = QualityGatesConfig()
 
         # All gates pass
         mock_gates.run_tests.return_value = (True, {"status": "passed", "coverage": 85})
@@ -276,16 +288,11 @@ class TestRunQualityGates:
     def test_run_quality_gates_with_work_item(self, mock_gates_class):
         """Test run_quality_gates with work item for custom validations."""
         # Arrange
+        from solokit.core.config import QualityGatesConfig
+
         mock_gates = MagicMock()
         mock_gates_class.return_value = mock_gates
-        mock_gates.config = {
-            "test_execution": {"required": True},
-            "security": {"required": True},
-            "linting": {"required": True},
-            "formatting": {"required": True},
-            "documentation": {"required": True},
-            "context7": {"required": True},
-        }
+        mock_gates.config = QualityGatesConfig()
 
         mock_gates.run_tests.return_value = (True, {"status": "passed"})
         mock_gates.run_security_scan.return_value = (True, {"status": "passed"})
@@ -306,6 +313,163 @@ class TestRunQualityGates:
         assert "custom" in results
         mock_gates.run_custom_validations.assert_called_once_with(work_item)
 
+    @patch("solokit.session.complete.record_gated_commit")
+    @patch("solokit.session.complete.QualityGates")
+    def test_run_quality_gates_records_gated_commit(self, mock_gates_class, mock_record):
+        """Test HEAD is recorded as gated only when all required gates pass."""
+        # Arrange
+        from solokit.core.config import QualityGatesConfig
+
+        mock_gates = MagicMock()
+        mock_gates_class.return_value = mock_gates
+        mock_gates.config = QualityGatesConfig()
+        mock_gates.run_tests.return_value = (True, {"status": "passed"})
+        mock_gates.run_security_scan.return_value = (True, {"status": "passed"})
+        mock_gates.run_linting.return_value = (True, {"status": "passed"})
+        mock_gates.run_formatting.return_value = (True, {"status": "passed"})
+        mock_gates.validate_documentation.return_value = (True, {"status": "passed"})
+        mock_gates.verify_context7_libraries.return_value = (True, {"status": "passed"})
+        mock_gates.generate_report.return_value = "All passed"
+
+        # Act
+        run_quality_gates(incremental=True)
+        mock_gates.run_tests.return_value = (False, {"status": "failed"})
+        run_quality_gates()
+
+        # Assert
+        mock_gates_class.assert_any_call(incremental=True, use_cache=True)
+        mock_record.assert_called_once()
+
+    @patch("solokit.session.complete.record_gate_timings")
+    @patch("solokit.session.complete.load_gate_timings")
+    @patch("solokit.session.complete.QualityGates")
+    def test_run_quality_gates_records_timings_and_regressions(
+        self, mock_gates_class, mock_load, mock_record
+    ):
+        """Test gate timings are recorded and slow gates are passed to the report."""
+        # Arrange
+        import time
+
+        from solokit.core.config import QualityGatesConfig
+        from solokit.quality.gate_timings import GateTiming
+
+        mock_gates = MagicMock()
+        mock_gates_class.return_value = mock_gates
+        mock_gates.config = QualityGatesConfig()
+        mock_gates.run_tests.return_value = (True, {"status": "passed"})
+        mock_gates.run_security_scan.return_value = (True, {"status": "passed", "cached": True})
+
+        def slow_linting():
+            time.sleep(0.05)
+            return True, {
+                "status": "passed",
+                "incremental": {"incremental": True, "files_checked": 4},
+            }
+
+        mock_gates.run_linting.side_effect = slow_linting
+        mock_gates.run_formatting.return_value = (True, {"status": "passed"})
+        mock_gates.validate_documentation.return_value = (True, {"status": "passed"})
+        mock_gates.verify_context7_libraries.return_value = (True, {"status": "passed"})
+        mock_gates.gate_tool_versions.return_value = {"ruff check .": "ruff 0.5.0"}
+        mock_gates.generate_report.return_value = "All passed"
+        # Linting historically took a millisecond, so this run is a regression
+        mock_load.return_value = [
+            GateTiming(gate="linting", duration_seconds=0.001, passed=True, session=session)
+            for session in range(1, 4)
+        ]
+
+        # Act
+        with patch("solokit.quality.gate_timings.MIN_REGRESSION_SECONDS", 0):
+            run_quality_gates(session_num=7)
+
+        # Assert
+        timings = {timing.gate: timing for timing in mock_record.call_args[0][1]}
+        assert set(timings) == {
+            "tests",
+            "security",
+            "linting",
+            "formatting",
+            "documentation",
+            "context7",
+        }
+        assert timings["linting"].session == 7
+        assert timings["linting"].files_checked == 4
+        assert timings["linting"].tool_versions == {"ruff check .": "ruff 0.5.0"}
+        assert timings["security"].cached is True
+        assert timings["security"].tool_versions == {}
+        regressions = mock_gates.generate_report.call_args.kwargs["regressions"]
+        assert [regression.gate for regression in regressions] == ["linting"]
+
+    @patch("solokit.session.complete.QualityGates")
+    def test_run_quality_gates_fail_fast(self, mock_gates_class):
+        """Test fail-fast runs tests last and cancels them after a required failure."""
+        # Arrange
+        from dataclasses import replace
+
+        from solokit.core.config import QualityGatesConfig
+
+        config = QualityGatesConfig()
+        mock_gates = MagicMock()
+        mock_gates_class.return_value = mock_gates
+        mock_gates.config = replace(config, scheduler=replace(config.scheduler, max_parallel=1))
+        mock_gates.run_tests.return_value = (True, {"status": "passed"})
+        mock_gates.run_security_scan.return_value = (False, {"status": "failed"})
+        mock_gates.generate_report.return_value = "Security failed"
+
+        # Act
+        results, all_passed, failed_gates = run_quality_gates(fail_fast=True)
+
+        # Assert
+        assert all_passed is False
+        assert failed_gates == ["security"]
+        assert results["tests"] == {"status": "cancelled"}
+        assert results["linting"] == {"status": "cancelled"}
+        mock_gates.run_tests.assert_not_called()
+        mock_gates.run_linting.assert_not_called()
+
+    @patch("solokit.session.complete.QualityGates")
+    def test_run_quality_gates_parallel_keeps_result_order(self, mock_gates_class):
+        """Test concurrent gates aggregate results in the sequential gate order."""
+        # Arrange
+        import time
+        from dataclasses import replace
+
+        from solokit.core.config import QualityGatesConfig
+
+        mock_gates = MagicMock()
+        mock_gates_class.return_value = mock_gates
+        config = QualityGatesConfig()
+        mock_gates.config = replace(config, scheduler=replace(config.scheduler, max_parallel=4))
+
+        def slow_tests():
+            time.sleep(0.05)
+            return False, {"status": "failed"}
+
+        mock_gates.run_tests.side_effect = slow_tests
+        mock_gates.run_security_scan.return_value = (False, {"status": "failed"})
+        mock_gates.run_linting.return_value = (True, {"status": "passed"})
+        mock_gates.run_formatting.return_value = (True, {"status": "passed"})
+        mock_gates.validate_documentation.return_value = (True, {"status": "passed"})
+        mock_gates.verify_context7_libraries.return_value = (True, {"status": "passed"})
+        mock_gates.run_custom_validations.return_value = (True, {"status": "passed"})
+        mock_gates.generate_report.return_value = "Failures"
+
+        # Act
+        results, all_passed, failed_gates = run_quality_gates({"id": "feat_001"})
+
+        # Assert
+        assert list(results) == [
+            "tests",
+            "security",
+            "linting",
+            "formatting",
+            "documentation",
+            "context7",
+            "custom",
+        ]
+        assert all_passed is False
+        assert failed_gates == ["tests", "security"]
+
     @patch("solokit.session.complete.QualityGates")
     def test_run_quality_gates_non_required_gate_failure(self, mock_gates_class):
         """Test run_quality_gates when non-required gate fails."""
@@ -343,134 +507,90 @@ class TestRunQualityGates:
 class TestUpdateAllTracking:
     """Tests for update_all_tracking function."""
 
-    @patch("solokit.session.complete.CommandRunner")
-    @patch("solokit.session.complete.Path")
-    def test_update_tracking_success(self, mock_path, mock_run):
-        """Test successful tracking update."""
+    @patch("solokit.session.complete.TreeGenerator")
+    @patch("solokit.session.complete.StackGenerator")
+    def test_update_tracking_success(self, mock_stack, mock_tree, capsys):
+        """Test successful tracking update runs both generators in-process."""
         # Arrange
-        mock_path.return_value.parent = Path("/fake/scripts")
-        mock_result = CommandResult(
-            returncode=0,
-            stdout="Stack updated successfully",
-            stderr="",
-            command=["python"],
-            duration_seconds=0.1,
-        )
-        mock_runner = Mock()
-
-        mock_runner.run.return_value = mock_result
-
-        mock_run.return_value = mock_runner
+        mock_stack.return_value.update_stack.return_value = [
+            {"type": "addition", "content": "Python 3.11"}
+        ]
+        mock_stack.return_value.stack_file = Path(".session/tracking/stack.txt")
+        mock_tree.return_value.update_tree.return_value = []
+        mock_tree.return_value.tree_file = Path(".session/tracking/tree.txt")
 
         # Act
         result = update_all_tracking(5)
 
         # Assert
         assert result is True
-        assert mock_runner.run.call_count == 2  # stack and tree
-
-    @patch("solokit.session.complete.CommandRunner")
-    @patch("solokit.session.complete.Path")
-    def test_update_tracking_stack_failure(self, mock_path, mock_run):
+        mock_stack.return_value.update_stack.assert_called_once_with(
+            session_num=5, non_interactive=True
+        )
+        mock_tree.return_value.update_tree.assert_called_once_with(
+            session_num=5, non_interactive=True
+        )
+        out = capsys.readouterr().out
+        assert out.index("Stack updated") < out.index("Tree updated")
+        assert "  ✓ Stack updated with 1 changes" in out
+        assert "  ✓ Tree generated (no changes)" in out
+
+    @patch("solokit.session.complete.TreeGenerator")
+    @patch("solokit.session.complete.StackGenerator")
+    def test_update_tracking_stack_failure(self, mock_stack, mock_tree, capsys):
         """Test tracking update when stack update fails."""
         # Arrange
-        mock_path.return_value.parent = Path("/fake/scripts")
-
-        def run_side_effect(*args, **kwargs):
-            if "generate_stack.py" in str(args[0]):
-                result = CommandResult(
-                    returncode=1,
-                    stdout="",
-                    stderr="Stack update error",
-                    command=["python"],
-                    duration_seconds=0.1,
-                )
-                return result
-            else:
-                result = CommandResult(
-                    returncode=0,
-                    stdout="Tree updated",
-                    stderr="",
-                    command=["python"],
-                    duration_seconds=0.1,
-                )
-                return result
-
-        mock_runner = Mock()
-
-        mock_runner.run.side_effect = run_side_effect
-
-        mock_run.return_value = mock_runner
+        mock_stack.return_value.update_stack.side_effect = Exception("Stack update error")
+        mock_tree.return_value.update_tree.return_value = []
 
         # Act
         result = update_all_tracking(5)
 
         # Assert
         assert result is True  # Function returns True even on failure
+        out = capsys.readouterr().out
+        assert "Stack update failed: Stack update error" in out
+        assert "Tree updated" in out
 
-    @patch("solokit.session.complete.CommandRunner")
-    @patch("solokit.session.complete.Path")
-    def test_update_tracking_tree_failure(self, mock_path, mock_run):
+    @patch("solokit.session.complete.TreeGenerator")
+    @patch("solokit.session.complete.StackGenerator")
+    def test_update_tracking_tree_failure(self, mock_stack, mock_tree, capsys):
         """Test tracking update when tree update fails."""
         # Arrange
-        mock_path.return_value.parent = Path("/fake/scripts")
-
-        def run_side_effect(*args, **kwargs):
-            if "generate_tree.py" in str(args[0]):
-                result = CommandResult(
-                    returncode=1,
-                    stdout="",
-                    stderr="Tree update error",
-                    command=["python"],
-                    duration_seconds=0.1,
-                )
-                return result
-            else:
-                result = CommandResult(
-                    returncode=0,
-                    stdout="Stack updated",
-                    stderr="",
-                    command=["python"],
-                    duration_seconds=0.1,
-                )
-                return result
-
-        mock_runner = Mock()
-
-        mock_runner.run.side_effect = run_side_effect
-
-        mock_run.return_value = mock_runner
+        mock_stack.return_value.update_stack.return_value = []
+        mock_tree.side_effect = Exception("Tree update error")
 
         # Act
         result = update_all_tracking(5)
 
         # Assert
         assert result is True
+        out = capsys.readouterr().out
+        assert "Stack updated" in out
+        assert "Tree update failed: Tree update error" in out
+
+    @patch("solokit.session.complete.TreeGenerator")
+    @patch("solokit.session.complete.StackGenerator")
+    def test_update_tracking_runs_concurrently(self, mock_stack, mock_tree):
+        """Test the stack and tree updates overlap instead of running in sequence."""
+        import threading
 
-    @patch("solokit.session.complete.CommandRunner")
-    @patch("solokit.session.complete.Path")
-    def test_update_tracking_timeout(self, mock_path, mock_run):
-        """Test tracking update handles timeout exception."""
         # Arrange
-        mock_path.return_value.parent = Path("/fake/scripts")
-        mock_runner = Mock()
+        both_started = threading.Barrier(2, timeout=5)
 
-        mock_runner.run.return_value = CommandResult(
-            returncode=124,
-            stdout="",
-            stderr="Timeout",
-            command=["python"],
-            duration_seconds=30.0,
-            timed_out=True,
-        )
+        def update(**kwargs):
+            both_started.wait()
+            return []
 
-        mock_run.return_value = mock_runner
+        mock_stack.return_value.update_stack.side_effect = update
+        mock_tree.return_value.update_tree.side_effect = update
 
         # Act
         result = update_all_tracking(5)
 
         # Assert
-        assert result is True  # Function continues despite exception
+        assert result is True
+        assert not both_started.broken
 
 
 class TestTriggerCurationIfNeeded:
@@ -866,8 +986,9 @@ class TestCompleteGitWorkflow:
 class TestRecordSessionCommits:
     """Tests for record_session_commits function."""
 
+    @patch("solokit.session.complete.get_object_reader")
     @patch("solokit.session.complete.CommandRunner")
-    def test_record_commits_success(self, mock_run, tmp_path, monkeypatch):
+    def test_record_commits_success(self, mock_run, mock_get_reader, tmp_path, monkeypatch):
         """Test successful recording of session commits."""
         # Arrange
         monkeypatch.chdir(tmp_path)
@@ -882,14 +1003,15 @@ class TestRecordSessionCommits:
         }
         work_items_file.write_text(json.dumps(work_items_data))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "abc123|Commit message|2025-01-15 10:00:00"
+        mock_status = MagicMock()
+        mock_status.stdout = f"# branch.oid {SHA}\x00# branch.head main\x00"
         mock_runner = Mock()
-
-        mock_runner.run.return_value = mock_result
-
+        mock_runner.run.return_value = mock_status
         mock_run.return_value = mock_runner
+        mock_get_reader.return_value.rev_list.return_value = ["abc123"]
+        mock_get_reader.return_value.commits.return_value = [
+            make_commit("abc123", "Commit message")
+        ]
 
         # Act
         record_session_commits("feature-001")
@@ -956,8 +1078,9 @@ class TestRecordSessionCommits:
 
         # Assert - should not raise exception
 
+    @patch("solokit.session.complete.get_object_reader")
     @patch("solokit.session.complete.CommandRunner")
-    def test_record_commits_parsing(self, mock_run, tmp_path, monkeypatch):
+    def test_record_commits_parsing(self, mock_run, mock_get_reader, tmp_path, monkeypatch):
         """Test record_session_commits parses multiple commits correctly."""
         # Arrange
         monkeypatch.chdir(tmp_path)
@@ -972,27 +1095,85 @@ class TestRecordSessionCommits:
         }
         work_items_file.write_text(json.dumps(work_items_data))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = (
-            "abc123|Commit 1|2025-01-15 10:00:00\ndef456|Commit 2|2025-01-15 11:00:00"
-        )
+        mock_status = MagicMock()
+        mock_status.stdout = f"# branch.oid {SHA}\x00# branch.head session-001\x00"
         mock_runner = Mock()
-
-        mock_runner.run.return_value = mock_result
-
+        mock_runner.run.return_value = mock_status
         mock_run.return_value = mock_runner
+        reader = mock_get_reader.return_value
+        reader.rev_list.return_value = ["abc123", "def456"]
+        reader.commits.return_value = [
+            make_commit("abc123", "Commit 1\n\nDetails"),
+            make_commit("def456", "Commit 2"),
+        ]
 
         # Act
         record_session_commits("feature-001")
 
-        # Assert
+        # Assert - the checked-out branch is listed by its HEAD SHA from the git snapshot
+        reader.rev_list.assert_called_once_with("--reverse", SHA, "^main")
         with open(work_items_file) as f:
             updated_data = json.load(f)
         commits = updated_data["work_items"]["feature-001"]["git"]["commits"]
         assert len(commits) == 2
         assert commits[0]["sha"] == "abc123"
+        assert commits[0]["message"] == "Commit 1"
         assert commits[1]["message"] == "Commit 2"
+        assert commits[1]["timestamp"] == "2025-01-15 10:00:00 +0000"
+        assert updated_data["work_items"]["feature-001"]["git"]["last_recorded_commit"] == "def456"
+
+    @patch("solokit.session.complete.get_object_reader")
+    @patch("solokit.session.complete.CommandRunner")
+    def test_record_commits_since_last_recorded(
+        self, mock_run, mock_get_reader, tmp_path, monkeypatch
+    ):
+        """Test only commits after the last recorded one are listed and appended."""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        session_dir = tmp_path / ".session" / "tracking"
+        session_dir.mkdir(parents=True)
+        work_items_file = session_dir / "work_items.json"
+        old_commit = {"sha": "abc123", "message": "Earlier session", "timestamp": "2025-01-14"}
+        work_items_data = {
+            "work_items": {
+                "feature-001": {
+                    "git": {
+                        "branch": "session-001",
+                        "parent_branch": "main",
+                        # The git workflow lists the session's commit by abbreviated SHA
+                        "commits": [old_commit, "def4567"],
+                        "last_recorded_commit": "abc123",
+                    }
+                }
+            }
+        }
+        work_items_file.write_text(json.dumps(work_items_data))
+
+        mock_status = MagicMock()
+        mock_status.stdout = f"# branch.oid {SHA}\x00# branch.head session-001\x00"
+        mock_runner = Mock()
+        mock_runner.run.return_value = mock_status
+        mock_run.return_value = mock_runner
+        reader = mock_get_reader.return_value
+        reader.rev_list.return_value = ["def4567" + "0" * 33, "fed9876" + "0" * 33]
+        reader.commits.return_value = [
+            make_commit("def4567" + "0" * 33, "Session commit"),
+            make_commit("fed9876" + "0" * 33, "Follow-up"),
+        ]
+
+        # Act
+        record_session_commits("feature-001")
+
+        # Assert
+        reader.rev_list.assert_called_once_with("--reverse", SHA, "^main", "^abc123")
+        with open(work_items_file) as f:
+            git_info = json.load(f)["work_items"]["feature-001"]["git"]
+        assert [c["message"] for c in git_info["commits"]] == [
+            "Earlier session",
+            "Session commit",
+            "Follow-up",
+        ]
+        assert git_info["last_recorded_commit"] == "fed9876" + "0" * 33
 
 
 class TestGenerateCommitMessage:
@@ -1142,6 +1323,22 @@ class TestGenerateSummary:
         # Assert
         assert "Linting: ⊘ SKIPPED" in result
 
+    def test_generate_summary_with_cancelled_gate(self):
+        """Test gates cancelled by fail-fast are marked cancelled, not failed."""
+        # Arrange
+        status = {"current_session": 1, "current_work_item": "feature-001"}
+        work_items_data = {
+            "work_items": {"feature-001": {"title": "Feature", "status": "in_progress"}}
+        }
+        gate_results = {"linting": {"status": "failed"}, "tests": {"status": "cancelled"}}
+
+        # Act
+        result = generate_summary(status, work_items_data, gate_results, None)
+
+        # Assert
+        assert "Linting: ✗ FAILED" in result
+        assert "Tests: ⊘ CANCELLED" in result
+
     @patch("solokit.session.complete.CommandRunner")
     def test_generate_summary_with_commits(self, mock_run):
         """Test summary includes commit details (Enhancement #11)."""
@@ -1166,11 +1363,12 @@ class TestGenerateSummary:
         }
         gate_results = {"tests": {"status": "passed"}}
 
-        # Mock git diff --stat
+        # Mock git log --stat
         mock_runner = Mock()
         mock_runner.run.return_value = CommandResult(
             returncode=0,
-            stdout=" file1.py | 10 +++++-----\n 1 file changed, 5 insertions(+), 5 deletions(-)",
+            stdout="\x1eabc1234567890ff\n file1.py | 10 +++++-----\n"
+            " 1 file changed, 5 insertions(+), 5 deletions(-)\n",
             stderr="",
             command=["git"],
             duration_seconds=0.1,
@@ -1265,10 +1463,10 @@ class TestGenerateSummary:
         }
         gate_results = {"tests": {"status": "passed"}}
 
-        # Mock git diff failure
+        # Mock git log failure
         mock_runner = Mock()
         mock_runner.run.return_value = CommandResult(
-            returncode=1, stdout="", stderr="", command=["git"], duration_seconds=0.1
+            returncode=128, stdout="", stderr="", command=["git"], duration_seconds=0.1
         )
         mock_run.return_value = mock_runner
 
@@ -1280,6 +1478,70 @@ class TestGenerateSummary:
         assert "abc1234" in result
         assert "feat: Add feature X" in result
         # File stats section should not crash, just be omitted
+        assert "Files changed:" not in result
+
+
+class TestGetCommitFileStats:
+    """Tests for get_commit_file_stats function."""
+
+    @staticmethod
+    def _commit(repo, name, content, message):
+        """Write a file and commit it, returning the commit SHA."""
+        import subprocess
+
+        (repo / name).write_text(content)
+        subprocess.run(["git", "add", name], cwd=repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-q", "-m", message], cwd=repo, check=True, capture_output=True
+        )
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        """Create a git repository and change into it."""
+        import subprocess
+
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "config", "user.email", "t@example.com"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], cwd=tmp_path, check=True)
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_stats_match_git_diff_per_commit(self, repo):
+        """Test one git log call yields the same stats as git diff --stat per commit."""
+        import subprocess
+
+        first = self._commit(repo, "a.py", "one\n", "first")
+        second = self._commit(repo, "b.py", "two\nthree\n", "second")
+
+        stats = get_commit_file_stats([first, second[:7]])
+
+        expected = subprocess.run(
+            ["git", "diff", "--stat", f"{second}^..{second}"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+        ).stdout
+        assert stats[second[:7]] == expected
+        # Root commits have no parent and are diffed against the empty tree
+        assert "a.py | 1 +" in stats[first]
+
+    def test_unknown_commits_are_skipped(self, repo):
+        """Test SHAs that no longer exist don't prevent stats for the others."""
+        sha = self._commit(repo, "a.py", "one\n", "first")
+
+        stats = get_commit_file_stats(["0" * 40, sha])
+
+        assert list(stats) == [sha]
+
+    def test_no_commits(self):
+        """Test no git call is made without commits."""
+        with patch("solokit.session.complete.CommandRunner") as mock_runner:
+            assert get_commit_file_stats([]) == {}
+
+        mock_runner.assert_not_called()
 
 
 class TestGenerateIntegrationTestSummary:
@@ -1445,7 +1707,7 @@ class TestCheckUncommittedChanges:
         """Test user can override uncommitted changes check."""
         # Arrange
         mock_result = MagicMock()
-        mock_result.stdout = " M src/main.py\n"
+        mock_result.stdout = f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/main.py\x00"
         mock_runner = Mock()
 
         mock_runner.run.return_value = mock_result
@@ -1465,7 +1727,7 @@ class TestCheckUncommittedChanges:
         """Test user can abort on uncommitted changes."""
         # Arrange
         mock_result = MagicMock()
-        mock_result.stdout = " M src/main.py\n"
+        mock_result.stdout = f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/main.py\x00"
         mock_runner = Mock()
 
         mock_runner.run.return_value = mock_result
@@ -1484,7 +1746,7 @@ class TestCheckUncommittedChanges:
         """Test non-interactive mode returns False on uncommitted changes."""
         # Arrange
         mock_result = MagicMock()
-        mock_result.stdout = " M src/main.py\n"
+        mock_result.stdout = f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/main.py\x00"
         mock_runner = Mock()
 
         mock_runner.run.return_value = mock_result
@@ -1503,7 +1765,31 @@ class TestCheckUncommittedChanges:
         # Arrange
         mock_result = MagicMock()
         mock_result.stdout = (
-            " M .session/tracking/status_update.json\n M .session/briefings/session_005.md\n"
+            f"1 .M N... 100644 100644 100644 {SHA} {SHA} .session/tracking/status_update.json\x00"
+            f"? .session/briefings/session_005.md\x00"
+        )
+        mock_runner = Mock()
+
+        mock_runner.run.return_value = mock_result
+
+        mock_run.return_value = mock_runner
+
+        # Act
+        result = check_uncommitted_changes()
+
+        # Assert
+        assert result is True
+
+    @patch("solokit.session.complete.CommandRunner")
+    def test_uncommitted_changes_only_solokit_state(self, mock_run):
+        """Test check passes when only solokit's caches, logs and daemon state changed."""
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.stdout = (
+            "? .session/cache/gates.json\x00"
+            "? .session/logs/commands.log\x00"
+            "? .session/daemons/status.json\x00"
+            "? .session/history/test_durations.json\x00"
         )
         mock_runner = Mock()
 
@@ -1626,14 +1912,24 @@ class TestMain:
         mock_complete_git.return_value = {"success": True, "message": "Success"}
         mock_auto_extract.return_value = 0
 
+        # Record whether the git workflow had run when daemons were stopped
+        stopped_after_git = []
+
         # Act
-        with patch("sys.argv", ["session_complete.py", "--complete"]):
+        with (
+            patch("sys.argv", ["session_complete.py", "--complete"]),
+            patch(
+                "solokit.session.complete.stop_lint_daemons",
+                side_effect=lambda root: stopped_after_git.append(mock_complete_git.called),
+            ),
+        ):
             result = main()
 
         # Assert
         assert result == 0
         assert mock_run_gates.called
         assert mock_update_tracking.called
+        assert stopped_after_git == [False]
 
     @patch("solokit.session.complete.check_uncommitted_changes")
     @patch("solokit.session.complete.load_work_items")
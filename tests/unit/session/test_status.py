@@ -592,9 +592,9 @@ class TestGetSessionStatusWithGitChanges:
 
     def test_git_changes_displayed(self, capsys):
         """
-        Test display of git changes from diff output.
+        Test display of tracked git changes from git status output.
 
-        Arrange: Mock subprocess to return git diff with 3 files
+        Arrange: Mock git status to return 3 changed files and an untracked one
         Act: Call get_session_status()
         Assert: Returns 0 and displays "Files Changed (3)"
         """
@@ -611,7 +611,14 @@ class TestGetSessionStatusWithGitChanges:
                 }
             }
 
-            git_output = "M\tfile1.py\nA\tfile2.py\nD\tfile3.py"
+            sha = "0" * 40
+            git_output = (
+                "# branch.head main\x00"
+                f"1 .M N... 100644 100644 100644 {sha} {sha} file1.py\x00"
+                f"1 A. N... 000000 100644 100644 {sha} {sha} file2.py\x00"
+                f"1 D. N... 100644 000000 000000 {sha} {sha} file3.py\x00"
+                "? untracked.py\x00"
+            )
 
             with patch.object(
                 Path,
@@ -639,12 +646,13 @@ class TestGetSessionStatusWithGitChanges:
             assert "M\tfile1.py" in captured.out
             assert "A\tfile2.py" in captured.out
             assert "D\tfile3.py" in captured.out
+            assert "untracked.py" not in captured.out
 
     def test_git_changes_more_than_ten(self, capsys):
         """
         Test display when more than 10 files changed.
 
-        Arrange: Mock subprocess to return git diff with 15 files
+        Arrange: Mock git status to return 15 changed files
         Act: Call get_session_status()
         Assert: Returns 0 and shows first 10 plus "and 5 more"
         """
@@ -662,7 +670,10 @@ class TestGetSessionStatusWithGitChanges:
             }
 
             # Create 15 files
-            git_output = "\n".join([f"M\tfile{i}.py" for i in range(1, 16)])
+            sha = "0" * 40
+            git_output = "".join(
+                f"1 .M N... 100644 100644 100644 {sha} {sha} file{i}.py\x00" for i in range(1, 16)
+            )
 
             with patch.object(
                 Path,
@@ -828,6 +839,52 @@ class TestGetSessionStatusWithGitChanges:
             captured = capsys.readouterr()
             assert "Files Changed" not in captured.out
 
+    def test_git_renames_and_conflicts_displayed(self, capsys):
+        """
+        Test renamed and unmerged entries from git status are shown by path.
+
+        Arrange: Mock git status with a rename and a merge conflict
+        Act: Call get_session_status()
+        Assert: Displays "R" and "U" entries with the current path
+        """
+        with patch.object(Path, "exists", return_value=True):
+            # Arrange
+            status_data = {"current_work_item": "WI-001"}
+            work_items_data = {
+                "work_items": {
+                    "WI-001": {"type": "feature", "priority": "high", "status": "in_progress"}
+                }
+            }
+            sha = "0" * 40
+            git_output = (
+                f"2 R. N... 100644 100644 100644 {sha} {sha} R100 new name.py\x00old.py\x00"
+                f"u UU N... 100644 100644 100644 100644 {sha} {sha} {sha} conflict.py\x00"
+            )
+
+            with patch.object(
+                Path,
+                "read_text",
+                side_effect=[json.dumps(status_data), json.dumps(work_items_data)],
+            ):
+                with patch("solokit.session.status.CommandRunner") as mock_run_class:
+                    mock_run_class.return_value.run.return_value = CommandResult(
+                        returncode=0,
+                        stdout=git_output,
+                        stderr="",
+                        command=["git"],
+                        duration_seconds=0.1,
+                    )
+
+                    # Act
+                    result = get_session_status()
+
+            # Assert
+            assert result == 0
+            captured = capsys.readouterr()
+            assert "Files Changed (2):" in captured.out
+            assert "R\tnew name.py" in captured.out
+            assert "U\tconflict.py" in captured.out
+
 
 class TestGetSessionStatusWithGitInfo:
     """Tests for get_session_status with git info from work item."""
@@ -1585,3 +1642,46 @@ class TestGetSessionStatusMainEntry:
             # Act & Assert
             with pytest.raises(SessionNotFoundError):
                 get_session_status()
+
+
+class TestGetSessionStatusCache:
+    """Tests for rendering from the precomputed session summary."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """Create a project with tracking files and the status cache enabled."""
+        monkeypatch.delenv("SOLOKIT_NO_STATUS_CACHE")
+        monkeypatch.chdir(tmp_path)
+        tracking = tmp_path / ".session" / "tracking"
+        tracking.mkdir(parents=True)
+        (tracking / "status_update.json").write_text(json.dumps({"current_work_item": "WI-001"}))
+        (tracking / "work_items.json").write_text(
+            json.dumps(
+                {
+                    "work_items": {
+                        "WI-001": {"type": "feature", "priority": "high", "status": "in_progress"}
+                    }
+                }
+            )
+        )
+        return tmp_path
+
+    def test_second_run_renders_from_cache(self, project, capsys):
+        """
+        Test an unchanged session is displayed without re-reading tracking files.
+
+        Arrange: Run get_session_status() once to build the summary
+        Act: Run it again
+        Assert: The tracking files aren't parsed and the output is the same
+        """
+        with patch("solokit.session.status.CommandRunner"):
+            get_session_status()
+            first = capsys.readouterr().out
+
+            with patch("solokit.session.status._load_tracking_files") as mock_load:
+                result = get_session_status()
+
+        assert result == 0
+        mock_load.assert_not_called()
+        assert capsys.readouterr().out == first
+        assert (project / ".session" / "cache" / "status_cache.json").exists()
@@ -0,0 +1,130 @@
+"""Unit tests for the sk status summary cache."""
+
+import json
+import os
+
+import pytest
+
+from solokit.session.status_cache import (
+    StatusCache,
+    build_status_summary,
+    refresh_status_cache,
+)
+
+WORK_ITEMS = {
+    "work_items": {
+        "feat_001": {
+            "type": "feature",
+            "priority": "high",
+            "status": "in_progress",
+            "sessions": [{"session": 1}],
+            "milestone": "m1",
+            "git": {"branch": "feat_001", "commits": ["abc", "def"]},
+        },
+        "feat_002": {
+            "type": "feature",
+            "priority": "medium",
+            "status": "not_started",
+            "milestone": "m1",
+            "dependencies": ["feat_001"],
+        },
+        "bug_001": {"type": "bug", "priority": "low", "status": "completed", "milestone": "m1"},
+        "bug_002": {
+            "type": "bug",
+            "priority": "critical",
+            "status": "not_started",
+            "dependencies": ["bug_001"],
+        },
+    },
+    "milestones": {"m1": {"title": "Milestone 1"}},
+}
+
+
+@pytest.fixture
+def session_dir(tmp_path, monkeypatch):
+    """Create tracking files and enable the cache."""
+    monkeypatch.delenv("SOLOKIT_NO_STATUS_CACHE")
+    tracking = tmp_path / ".session" / "tracking"
+    tracking.mkdir(parents=True)
+    (tracking / "status_update.json").write_text(json.dumps({"current_work_item": "feat_001"}))
+    (tracking / "work_items.json").write_text(json.dumps(WORK_ITEMS))
+    return tmp_path / ".session"
+
+
+class TestBuildStatusSummary:
+    """Tests for build_status_summary."""
+
+    def test_summarizes_current_item_milestone_and_next_items(self):
+        """Test the summary holds everything sk status displays."""
+        summary = build_status_summary({"current_work_item": "feat_001"}, WORK_ITEMS)
+
+        assert summary["total_items"] == 4
+        assert summary["item"]["sessions"] == 1
+        assert summary["item"]["estimated_effort"] == "Unknown"
+        assert summary["item"]["git"] == {"branch": "feat_001", "commits": 2}
+        assert summary["item"]["milestone"] == {
+            "name": "m1",
+            "total": 3,
+            "completed": 1,
+            "percent": 33,
+            "in_progress": 1,
+            "not_started": 1,
+        }
+        assert summary["next_items"] == [
+            {"id": "feat_002", "priority": "medium", "blocked": True},
+            {"id": "bug_002", "priority": "critical", "blocked": False},
+        ]
+
+    def test_no_current_item(self):
+        """Test a session without a work item has no item summary."""
+        summary = build_status_summary({}, WORK_ITEMS)
+
+        assert summary["current_work_item"] is None
+        assert summary["item"] is None
+
+
+class TestStatusCache:
+    """Tests for StatusCache."""
+
+    def test_refresh_then_load(self, session_dir):
+        """Test a refreshed summary is loaded while the tracking files are unchanged."""
+        refresh_status_cache(session_dir)
+
+        summary = StatusCache(session_dir).load()
+        assert summary == build_status_summary({"current_work_item": "feat_001"}, WORK_ITEMS)
+
+    def test_changed_tracking_file_invalidates(self, session_dir):
+        """Test a summary is stale once a tracking file is rewritten."""
+        refresh_status_cache(session_dir)
+
+        status_file = session_dir / "tracking" / "status_update.json"
+        status_file.write_text(json.dumps({"current_work_item": "feat_002"}))
+        stat = status_file.stat()
+        os.utime(status_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert StatusCache(session_dir).load() is None
+
+    def test_missing_or_corrupt_cache(self, session_dir):
+        """Test missing and unreadable cache files are treated as misses."""
+        cache = StatusCache(session_dir)
+        assert cache.load() is None
+
+        cache.cache_file.parent.mkdir()
+        cache.cache_file.write_text("{not json")
+        assert cache.load() is None
+
+    def test_refresh_skips_malformed_tracking_files(self, session_dir):
+        """Test a malformed work_items.json leaves no summary behind."""
+        (session_dir / "tracking" / "work_items.json").write_text("{not json")
+
+        refresh_status_cache(session_dir)
+
+        assert not StatusCache(session_dir).cache_file.exists()
+
+    def test_disabled_by_env(self, session_dir, monkeypatch):
+        """Test SOLOKIT_NO_STATUS_CACHE disables reading and writing summaries."""
+        monkeypatch.setenv("SOLOKIT_NO_STATUS_CACHE", "1")
+
+        refresh_status_cache(session_dir)
+
+        assert not StatusCache(session_dir).cache_file.exists()
@@ -18,7 +18,6 @@ from solokit.core.exceptions import (
     FileNotFoundError as SolokitFileNotFoundError,
 )
 from solokit.core.exceptions import (
-    GitError,
     NotAGitRepoError,
     SessionNotFoundError,
     SpecValidationError,
@@ -26,6 +25,8 @@ from solokit.core.exceptions import (
 )
 from solokit.session.validate import SessionValidator
 
+SHA = "a" * 40
+
 
 @pytest.fixture
 def temp_session_dir(tmp_path):
@@ -110,7 +111,37 @@ class TestSessionValidatorInit:
 
         # Assert
         expected_config_path = temp_session_dir / "config.json"
-        mock_qg_class.assert_called_once_with(expected_config_path)
+        mock_qg_class.assert_called_once_with(
+            expected_config_path, incremental=None, use_cache=True
+        )
+
+    def test_init_passes_incremental_override(self, temp_session_dir):
+        """Test SessionValidator forwards the incremental override to QualityGates."""
+        # Arrange
+        project_root = temp_session_dir.parent
+
+        # Act
+        with patch("solokit.session.validate.QualityGates") as mock_qg_class:
+            _validator = SessionValidator(project_root=project_root, incremental=True)
+
+        # Assert
+        mock_qg_class.assert_called_once_with(
+            temp_session_dir / "config.json", incremental=True, use_cache=True
+        )
+
+    def test_init_passes_no_gate_cache(self, temp_session_dir):
+        """Test SessionValidator forwards use_cache=False (--no-gate-cache) to QualityGates."""
+        # Arrange
+        project_root = temp_session_dir.parent
+
+        # Act
+        with patch("solokit.session.validate.QualityGates") as mock_qg_class:
+            _validator = SessionValidator(project_root=project_root, use_cache=False)
+
+        # Assert
+        mock_qg_class.assert_called_once_with(
+            temp_session_dir / "config.json", incremental=None, use_cache=False
+        )
 
 
 class TestCheckGitStatus:
@@ -124,19 +155,15 @@ class TestCheckGitStatus:
             validator = SessionValidator(project_root=project_root)
 
         mock_status = CommandResult(
-            returncode=0, stdout="", stderr="", command=["git", "status"], duration_seconds=0.1
-        )
-
-        mock_branch = CommandResult(
             returncode=0,
-            stdout="main\n",
+            stdout=f"# branch.oid {SHA}\x00# branch.head main\x00",
             stderr="",
-            command=["git", "branch"],
+            command=["git", "status"],
             duration_seconds=0.1,
         )
 
         # Act
-        with patch.object(validator.runner, "run", side_effect=[mock_status, mock_branch]):
+        with patch.object(validator.runner, "run", return_value=mock_status) as mock_run:
             result = validator.check_git_status()
 
         # Assert
@@ -144,6 +171,7 @@ class TestCheckGitStatus:
         assert "main" in result["message"]
         assert result["details"]["branch"] == "main"
         assert result["details"]["changes"] == 0
+        mock_run.assert_called_once()
 
     def test_check_git_status_returns_success_with_non_tracking_changes(self, temp_session_dir):
         """Test check_git_status returns passed=True when changes don't include tracking files."""
@@ -154,22 +182,18 @@ class TestCheckGitStatus:
 
         mock_status = CommandResult(
             returncode=0,
-            stdout=" M src/main.py\n M tests/test_foo.py\n",
+            stdout=(
+                "# branch.head feature-branch\x00"
+                f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/main.py\x00"
+                f"1 .M N... 100644 100644 100644 {SHA} {SHA} tests/test_foo.py\x00"
+            ),
             stderr="",
             command=["git", "status"],
             duration_seconds=0.1,
         )
 
-        mock_branch = CommandResult(
-            returncode=0,
-            stdout="feature-branch\n",
-            stderr="",
-            command=["git", "branch"],
-            duration_seconds=0.1,
-        )
-
         # Act
-        with patch.object(validator.runner, "run", side_effect=[mock_status, mock_branch]):
+        with patch.object(validator.runner, "run", return_value=mock_status):
             result = validator.check_git_status()
 
         # Assert
@@ -186,7 +210,11 @@ class TestCheckGitStatus:
 
         mock_status = CommandResult(
             returncode=0,
-            stdout=" M .session/tracking/status_update.json\n M .session/tracking/work_items.json\n",
+            stdout=(
+                "# branch.head main\x00"
+                f"1 .M N... 100644 100644 100644 {SHA} {SHA} .session/tracking/status_update.json\x00"
+                f"1 .M N... 100644 100644 100644 {SHA} {SHA} .session/tracking/work_items.json\x00"
+            ),
             stderr="",
             command=["git", "status"],
             duration_seconds=0.1,
@@ -222,34 +250,30 @@ class TestCheckGitStatus:
                 validator.check_git_status()
 
         # Verify exception details
-        assert str(temp_session_dir.parent) in str(exc_info.value.context)
+        assert str(temp_session_dir.parent.resolve()) in str(exc_info.value.context)
 
-    def test_check_git_status_raises_git_error_on_branch_failure(self, temp_session_dir):
-        """Test check_git_status raises GitError when branch command fails."""
+    def test_check_git_status_detached_head(self, temp_session_dir):
+        """Test check_git_status reports an empty branch name when HEAD is detached."""
         # Arrange
         project_root = temp_session_dir.parent
         with patch("solokit.session.validate.QualityGates"):
             validator = SessionValidator(project_root=project_root)
 
         mock_status = CommandResult(
-            returncode=0, stdout="", stderr="", command=["git", "status"], duration_seconds=0.1
-        )
-
-        mock_branch_fail = CommandResult(
-            returncode=1,
-            stdout="",
-            stderr="fatal: not a valid object name",
-            command=["git", "branch"],
+            returncode=0,
+            stdout=f"# branch.oid {SHA}\x00# branch.head (detached)\x00",
+            stderr="",
+            command=["git", "status"],
             duration_seconds=0.1,
         )
 
-        # Act & Assert
-        with patch.object(validator.runner, "run", side_effect=[mock_status, mock_branch_fail]):
-            with pytest.raises(GitError) as exc_info:
-                validator.check_git_status()
+        # Act
+        with patch.object(validator.runner, "run", return_value=mock_status):
+            result = validator.check_git_status()
 
-        # Verify exception
-        assert "Failed to get current branch" in exc_info.value.message
+        # Assert
+        assert result["passed"] is True
+        assert result["details"]["branch"] == ""
 
 
 class TestPreviewQualityGates:
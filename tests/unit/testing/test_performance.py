@@ -379,15 +379,19 @@ class TestResourceMeasurement:
 
         mock_runner = Mock()
 
-        # Mock container ID lookup
-        def run_side_effect(cmd, **kwargs):
-            if "ps" in cmd:
-                return Mock(success=True, stdout="abc123\n", stderr="")
-            elif "stats" in cmd:
-                return Mock(success=True, stdout="25.5%,100MiB / 2GiB\n", stderr="")
-            return Mock(success=False, stdout="", stderr="")
-
-        mock_runner.run.side_effect = run_side_effect
+        # Mock container ID lookup and stats batches
+        def run_many_side_effect(commands, **kwargs):
+            results = []
+            for cmd in commands:
+                if "ps" in cmd:
+                    results.append(Mock(success=True, stdout="abc123\n", stderr=""))
+                elif "stats" in cmd:
+                    results.append(Mock(success=True, stdout="25.5%,100MiB / 2GiB\n", stderr=""))
+                else:
+                    results.append(Mock(success=False, stdout="", stderr=""))
+            return results
+
+        mock_runner.run_many.side_effect = run_many_side_effect
         mock_runner_class.return_value = mock_runner
 
         benchmark = PerformanceBenchmark(work_item)
@@ -810,13 +810,17 @@ class TestMeasureResourceUsage:
         benchmark = PerformanceBenchmark(work_item)
 
         # Act
-        with patch("subprocess.run") as mock_run:
-            # First call returns container ID, second returns stats
-            mock_run.side_effect = [
-                Mock(returncode=0, stdout="container123\n"),
-                Mock(returncode=0, stdout="25.5%,512MB / 2GB\n"),
-                Mock(returncode=0, stdout="container456\n"),
-                Mock(returncode=0, stdout="10.2%,256MB / 1GB\n"),
+        with patch.object(benchmark.runner, "run_many") as mock_run_many:
+            # First batch returns container IDs, second batch returns stats
+            mock_run_many.side_effect = [
+                [
+                    Mock(success=True, stdout="container123\n"),
+                    Mock(success=True, stdout="container456\n"),
+                ],
+                [
+                    Mock(success=True, stdout="25.5%,512MB / 2GB\n"),
+                    Mock(success=True, stdout="10.2%,256MB / 1GB\n"),
+                ],
             ]
 
             result = benchmark._measure_resource_usage()
@@ -825,6 +829,9 @@ class TestMeasureResourceUsage:
         assert "postgres" in result
         assert "redis" in result
         assert result["postgres"]["cpu_percent"] == "25.5"
+        assert result["redis"]["memory_usage"] == "256MB / 1GB"
+        stats_commands = mock_run_many.call_args_list[1].args[0]
+        assert [command[2] for command in stats_commands] == ["container123", "container456"]
 
     def test_measure_resource_usage_empty_container_id(self):
         """Test _measure_resource_usage when container ID not found."""
@@ -836,8 +843,8 @@ class TestMeasureResourceUsage:
         benchmark = PerformanceBenchmark(work_item)
 
         # Act
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout="")
+        with patch.object(benchmark.runner, "run_many") as mock_run_many:
+            mock_run_many.side_effect = [[Mock(success=True, stdout="")], []]
 
             result = benchmark._measure_resource_usage()
 
@@ -855,12 +862,16 @@ class TestMeasureResourceUsage:
         benchmark = PerformanceBenchmark(work_item)
 
         # Act
-        with patch("subprocess.run", side_effect=Exception("Docker error")):
+        with patch.object(benchmark.runner, "run_many") as mock_run_many:
+            mock_run_many.side_effect = [
+                [Mock(success=True, stdout="container123\n")],
+                [Mock(success=True, stdout="malformed")],
+            ]
+
             result = benchmark._measure_resource_usage()
 
         # Assert
-        assert result == {}  # Command failed, no resource data collected
-        # With CommandRunner, error details are logged but not returned in results dict
+        assert "error" in result["failing_service"]
 
 
 class TestStoreBaseline:
@@ -0,0 +1,208 @@
+"""Unit tests for spec_batch module.
+
+Tests batch spec validation: target collection, parallel validation and reporting.
+"""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from solokit.core.exceptions import ValidationError
+from solokit.work_items import spec_batch
+from solokit.work_items.spec_cache import get_spec_cache
+
+VALID_BUG_SPEC = """# Bug: Broken Login
+
+## Description
+Login fails.
+
+## Steps to Reproduce
+1. Log in
+
+## Root Cause Analysis
+Bad check.
+
+## Fix Approach
+Fix the check.
+"""
+
+INVALID_BUG_SPEC = """# Bug: Incomplete
+
+## Description
+Only a description.
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with three work items and one orphan spec."""
+    monkeypatch.chdir(tmp_path)
+    specs_dir = tmp_path / ".session" / "specs"
+    specs_dir.mkdir(parents=True)
+    tracking_dir = tmp_path / ".session" / "tracking"
+    tracking_dir.mkdir(parents=True)
+
+    (specs_dir / "bug_ok.md").write_text(VALID_BUG_SPEC)
+    (specs_dir / "bug_bad.md").write_text(INVALID_BUG_SPEC)
+    (specs_dir / "orphan.md").write_text(VALID_BUG_SPEC)
+
+    work_items = {
+        "work_items": {
+            "bug_ok": {"id": "bug_ok", "type": "bug", "spec_file": ".session/specs/bug_ok.md"},
+            "bug_bad": {"id": "bug_bad", "type": "bug", "spec_file": ".session/specs/bug_bad.md"},
+            "bug_missing": {"id": "bug_missing", "type": "bug"},
+        }
+    }
+    (tracking_dir / "work_items.json").write_text(json.dumps(work_items))
+    get_spec_cache().clear()
+    yield tmp_path
+    get_spec_cache().clear()
+
+
+class TestDetectSpecType:
+    """Tests for detect_spec_type."""
+
+    @pytest.mark.parametrize(
+        "heading,expected",
+        [
+            ("# Feature: X", "feature"),
+            ("# Integration Test: X", "integration_test"),
+            ("# Security Task: X", "security"),
+            ("# Unknown: X", None),
+            ("No heading", None),
+        ],
+    )
+    def test_detect_spec_type(self, tmp_path, heading, expected):
+        """Test that spec types are derived from template H1 headings."""
+        spec = tmp_path / "spec.md"
+        spec.write_text(f"{heading}\n")
+        assert spec_batch.detect_spec_type(spec) == expected
+
+    def test_detect_spec_type_missing_file(self, tmp_path):
+        """Test that a missing file has no type."""
+        assert spec_batch.detect_spec_type(tmp_path / "missing.md") is None
+
+
+class TestCollectSpecTargets:
+    """Tests for collect_spec_targets."""
+
+    def test_collects_work_items_and_orphans(self, project):
+        """Test that work item specs and orphan spec files are all collected."""
+        # Act
+        targets = spec_batch.collect_spec_targets()
+
+        # Assert
+        by_id = {t.work_item_id: t for t in targets}
+        assert sorted(by_id) == ["bug_bad", "bug_missing", "bug_ok", "orphan"]
+        assert by_id["orphan"].work_item_type == "bug"
+        assert by_id["bug_missing"].spec_path.endswith("bug_missing.md")
+
+    def test_loads_work_items_once(self, project):
+        """Test that work_items.json is read a single time."""
+        with patch.object(spec_batch, "load_json", wraps=spec_batch.load_json) as loader:
+            spec_batch.collect_spec_targets()
+        assert loader.call_count == 1
+
+
+class TestValidateSpecs:
+    """Tests for validate_target and validate_specs."""
+
+    def test_validate_target_results(self, project):
+        """Test valid, invalid and missing specs produce matching results."""
+        # Arrange
+        targets = {t.work_item_id: t for t in spec_batch.collect_spec_targets()}
+
+        # Act
+        ok = spec_batch.validate_target(targets["bug_ok"])
+        bad = spec_batch.validate_target(targets["bug_bad"])
+        missing = spec_batch.validate_target(targets["bug_missing"])
+
+        # Assert
+        assert ok.valid and ok.errors == []
+        assert not bad.valid
+        assert "Missing required section: 'Steps to Reproduce'" in bad.errors
+        assert not missing.valid
+        assert "bug_missing.md" in missing.errors[0]
+
+    def test_validate_target_unknown_type(self, project):
+        """Test that a spec with no determinable type is reported invalid."""
+        spec = project / ".session" / "specs" / "odd.md"
+        spec.write_text("no heading")
+        result = spec_batch.validate_target(spec_batch.SpecTarget("odd", None, str(spec)))
+        assert not result.valid
+        assert "Cannot determine work item type" in result.errors[0]
+
+    def test_parallel_matches_serial(self, project):
+        """Test that worker processes produce the same ordered results as serial runs."""
+        # Arrange
+        targets = spec_batch.collect_spec_targets()
+
+        # Act
+        serial = [r.to_dict() for r in spec_batch.validate_specs(targets, jobs=1)]
+        parallel = [r.to_dict() for r in spec_batch.validate_specs(targets, jobs=2)]
+
+        # Assert
+        assert parallel == serial
+
+    def test_falls_back_to_serial_without_process_pool(self, project):
+        """Test that validation still runs when a process pool cannot be created."""
+        targets = spec_batch.collect_spec_targets()
+        with patch.object(spec_batch, "ProcessPoolExecutor", side_effect=OSError("no sem")):
+            results = list(spec_batch.validate_specs(targets, jobs=4))
+        assert len(results) == len(targets)
+
+
+class TestRunBatch:
+    """Tests for run_batch reporting."""
+
+    def test_json_lines_output(self, project, capsys):
+        """Test that JSON mode emits one object per spec and a summary."""
+        # Act
+        summary = spec_batch.run_batch(
+            spec_batch.validate_specs(spec_batch.collect_spec_targets()), as_json=True
+        )
+
+        # Assert
+        lines = [json.loads(line) for line in capsys.readouterr().out.strip().splitlines()]
+        assert len(lines) == 5
+        assert lines[-1]["summary"]["invalid"] == 2
+        assert summary["valid"] == 2
+
+    def test_errors_only_console_output(self, project, capsys):
+        """Test that --errors-only hides valid specs from console output."""
+        spec_batch.run_batch(
+            spec_batch.validate_specs(spec_batch.collect_spec_targets()), verbose=False
+        )
+        out = capsys.readouterr().out
+        assert "bug_bad" in out
+        assert "✅ bug_ok" not in out
+        assert "Validated 4 spec(s): 2 valid, 2 invalid" in out
+
+
+class TestMain:
+    """Tests for the spec-validate CLI entry point."""
+
+    def test_all_returns_failure_when_invalid(self, project):
+        """Test that --all exits non-zero when any spec is invalid."""
+        with patch.object(sys, "argv", ["spec-validate", "--all", "--jobs", "1"]):
+            assert spec_batch.main() == 1
+
+    def test_selected_ids_only(self, project):
+        """Test that explicit IDs restrict validation to those specs."""
+        with patch.object(sys, "argv", ["spec-validate", "bug_ok", "--jobs", "1"]):
+            assert spec_batch.main() == 0
+
+    def test_requires_selection(self, project):
+        """Test that running without IDs or --all is an error."""
+        with patch.object(sys, "argv", ["spec-validate"]):
+            with pytest.raises(ValidationError):
+                spec_batch.main()
+
+    def test_changed_filters_to_git_changes(self, project):
+        """Test that --changed validates only specs reported as changed."""
+        changed = {(project / ".session" / "specs" / "bug_ok.md").resolve()}
+        with patch.object(spec_batch, "get_changed_spec_paths", return_value=changed):
+            with patch.object(sys, "argv", ["spec-validate", "--all", "--changed", "-j", "1"]):
+                assert spec_batch.main() == 0
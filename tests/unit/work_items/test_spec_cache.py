@@ -0,0 +1,155 @@
+"""Unit tests for spec_cache module.
+
+Tests the content-hash keyed cache shared by spec parsing and validation.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from solokit.core.exceptions import SpecValidationError
+from solokit.work_items import spec_parser, spec_validator
+from solokit.work_items.spec_cache import (
+    PARSED_KEY,
+    SpecCache,
+    compute_content_hash,
+    get_spec_cache,
+    validation_key,
+)
+
+FEATURE_SPEC = """# Feature: Cached Feature
+
+## Overview
+Cached overview.
+
+## Rationale
+Because.
+
+## Acceptance Criteria
+- [ ] One
+- [ ] Two
+- [ ] Three
+
+## Implementation Details
+Details.
+
+## Testing Strategy
+Tests.
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a minimal project with a .session directory and chdir into it."""
+    monkeypatch.chdir(tmp_path)
+    specs_dir = tmp_path / ".session" / "specs"
+    specs_dir.mkdir(parents=True)
+    get_spec_cache().clear()
+    yield tmp_path
+    get_spec_cache().clear()
+
+
+class TestSpecCache:
+    """Tests for SpecCache."""
+
+    def test_miss_returns_none(self, project):
+        """Test that an unknown spec returns None."""
+        cache = SpecCache()
+        assert cache.get(".session/specs/x.md", "abc", PARSED_KEY) is None
+
+    def test_set_then_get_returns_copy(self, project):
+        """Test that cached values are returned as independent copies."""
+        # Arrange
+        cache = SpecCache()
+        cache.set(".session/specs/x.md", "abc", PARSED_KEY, {"items": [1]})
+
+        # Act
+        first = cache.get(".session/specs/x.md", "abc", PARSED_KEY)
+        first["items"].append(2)
+        second = cache.get(".session/specs/x.md", "abc", PARSED_KEY)
+
+        # Assert
+        assert second == {"items": [1]}
+
+    def test_content_hash_change_misses(self, project):
+        """Test that a different content hash does not return stale data."""
+        cache = SpecCache()
+        cache.set(".session/specs/x.md", "abc", PARSED_KEY, {"v": 1})
+        assert cache.get(".session/specs/x.md", "def", PARSED_KEY) is None
+
+    def test_entries_persist_across_instances(self, project):
+        """Test that entries are persisted under .session/cache and reloaded."""
+        # Arrange
+        SpecCache().set(".session/specs/x.md", "abc", validation_key("feature"), ["err"])
+
+        # Act
+        value = SpecCache().get(".session/specs/x.md", "abc", validation_key("feature"))
+
+        # Assert
+        assert value == ["err"]
+        cache_files = list((project / ".session" / "cache" / "specs").glob("*.json"))
+        assert len(cache_files) == 1
+        assert json.loads(cache_files[0].read_text())["content_hash"] == "abc"
+
+    def test_no_persistence_without_session_dir(self, tmp_path, monkeypatch):
+        """Test that the cache never creates a .session directory on its own."""
+        monkeypatch.chdir(tmp_path)
+        SpecCache().set("spec.md", "abc", PARSED_KEY, {"v": 1})
+        assert not (tmp_path / ".session").exists()
+
+    def test_corrupt_cache_file_is_ignored(self, project):
+        """Test that an unreadable cache file is treated as a miss."""
+        # Arrange
+        SpecCache().set(".session/specs/x.md", "abc", PARSED_KEY, {"v": 1})
+        for cache_file in (project / ".session" / "cache" / "specs").glob("*.json"):
+            cache_file.write_text("{not json")
+
+        # Act & Assert
+        assert SpecCache().get(".session/specs/x.md", "abc", PARSED_KEY) is None
+
+    def test_compute_content_hash_is_stable(self):
+        """Test that the content hash depends only on content."""
+        assert compute_content_hash("a") == compute_content_hash("a")
+        assert compute_content_hash("a") != compute_content_hash("b")
+
+
+class TestSpecCacheConsumers:
+    """Tests that parse_spec_file and validate_spec_file go through the cache."""
+
+    def test_parse_spec_file_parses_once_per_content(self, project):
+        """Test that unchanged specs are parsed once and re-parsed after edits."""
+        # Arrange
+        spec_file = project / ".session" / "specs" / "feat.md"
+        spec_file.write_text(FEATURE_SPEC)
+
+        # Act
+        with patch.object(
+            spec_parser, "parse_feature_spec", wraps=spec_parser.parse_feature_spec
+        ) as parser:
+            first = spec_parser.parse_spec_file("feat")
+            second = spec_parser.parse_spec_file({"id": "other", "spec_file": str(spec_file)})
+            spec_file.write_text(FEATURE_SPEC.replace("Cached overview.", "Edited."))
+            third = spec_parser.parse_spec_file("feat")
+
+        # Assert
+        assert parser.call_count == 2
+        assert first["overview"] == "Cached overview."
+        assert second["_meta"]["work_item_id"] == "other"
+        assert third["overview"] == "Edited."
+
+    def test_validate_spec_file_caches_errors(self, project):
+        """Test that validation errors are cached and still raised."""
+        # Arrange
+        spec_file = project / ".session" / "specs" / "feat.md"
+        spec_file.write_text("# Feature: Broken\n\n## Overview\nOnly overview.\n")
+
+        # Act & Assert
+        with patch.object(
+            spec_validator, "collect_spec_errors", wraps=spec_validator.collect_spec_errors
+        ) as collect:
+            for _ in range(2):
+                with pytest.raises(SpecValidationError):
+                    spec_validator.validate_spec_file("feat", "feature")
+
+        assert collect.call_count == 1
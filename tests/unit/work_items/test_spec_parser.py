@@ -1152,3 +1152,125 @@ Just an overview.
         assert result["documentation_updates"] == []
         assert result["dependencies"] is None
         assert result["estimated_effort"] is None
+
+
+class TestSpecSectionIndex:
+    """Tests for the single-pass SpecSectionIndex."""
+
+    CONTENT = """# Feature: Indexed
+
+## Overview
+Overview text.
+
+## Implementation Details
+Intro.
+
+### Approach
+Use an index.
+
+### API Changes
+None.
+
+## Acceptance Criteria
+- [ ] One
+"""
+
+    def test_builds_heading_tree(self):
+        """Test that H2 headings are indexed with nested H3 children and offsets."""
+        # Act
+        index = spec_parser.SpecSectionIndex(self.CONTENT)
+
+        # Assert
+        assert [h.title for h in index.headings] == [
+            "Overview",
+            "Implementation Details",
+            "Acceptance Criteria",
+        ]
+        impl = index.headings[1]
+        assert [c.title for c in impl.children] == ["Approach", "API Changes"]
+        assert self.CONTENT[impl.offset :].startswith("## Implementation Details")
+        assert self.CONTENT[impl.children[0].offset :].startswith("### Approach")
+        assert impl.end_offset == index.headings[2].offset
+        assert impl.children[-1].end_offset == impl.end_offset
+
+    def test_section_matches_parse_section(self):
+        """Test that section lookups match parse_section output."""
+        # Arrange
+        index = spec_parser.SpecSectionIndex(self.CONTENT)
+
+        # Act & Assert
+        for name in ["Overview", "implementation details", "Acceptance Criteria", "Missing"]:
+            assert index.section(name) == spec_parser.parse_section(self.CONTENT, name)
+
+    def test_subsection_matches_extract_subsection(self):
+        """Test that subsection lookups match extract_subsection over parse_section."""
+        # Arrange
+        index = spec_parser.SpecSectionIndex(self.CONTENT)
+        section = spec_parser.parse_section(self.CONTENT, "Implementation Details")
+
+        # Act & Assert
+        for name in ["Approach", "api changes", "Database Changes"]:
+            assert index.subsection("Implementation Details", name) == (
+                spec_parser.extract_subsection(section, name)
+            )
+        assert index.subsection("Missing", "Approach") is None
+
+    def test_duplicate_headings_are_merged(self):
+        """Test that consecutive same-named headings are merged like the line scanner."""
+        # Arrange
+        content = "## A\nfirst\n## a\nsecond\n## B\nthird"
+
+        # Act
+        index = spec_parser.SpecSectionIndex(content)
+
+        # Assert
+        assert index.section("A") == "first\nsecond"
+        assert index.section("A") == spec_parser.parse_section(content, "A")
+
+    def test_indented_first_subsection_heading(self):
+        """Test that an indented H3 at the start of a section is found after stripping."""
+        # Arrange
+        content = "## A\n   ### X\nbody\n### Y\nother"
+        section = spec_parser.parse_section(content, "A")
+
+        # Act
+        index = spec_parser.SpecSectionIndex(content)
+
+        # Assert
+        assert index.subsection("A", "X") == "body"
+        assert index.subsection("A", "X") == spec_parser.extract_subsection(section, "X")
+
+    def test_empty_section_returns_none(self):
+        """Test that a heading immediately followed by another heading resolves to None."""
+        # Act
+        index = spec_parser.SpecSectionIndex("## A\n## B\ncontent")
+
+        # Assert
+        assert index.section("A") is None
+        assert not index.has_section("A")
+        assert index.has_section("B")
+
+    def test_section_by_prefix(self):
+        """Test raw-prefix lookups used by briefing summaries."""
+        # Arrange
+        content = "# Summary\n\n## Commits Made\n- abc\n\n## Quality Gates\n- passed"
+
+        # Act
+        index = spec_parser.SpecSectionIndex(content)
+
+        # Assert
+        assert index.section_by_prefix("## Commits Made") == "- abc"
+        assert index.section_by_prefix("## Missing") == ""
+
+    def test_get_section_index_strips_comments_and_memoizes(self):
+        """Test that get_section_index strips HTML comments and reuses the index."""
+        # Arrange
+        content = "## A\n<!-- hidden -->\nvisible"
+
+        # Act
+        first = spec_parser.get_section_index(content)
+        second = spec_parser.get_section_index(content)
+
+        # Assert
+        assert first is second
+        assert first.section("A") == "visible"